@@ -257,6 +257,13 @@ def get_project_configuration():
             sources=["src/silx/image/shapes.pyx"],
             language="c",
         ),
+        Extension(
+            name="silx.image._radon",
+            sources=["src/silx/image/_radon.pyx"],
+            language="c",
+            extra_link_args=["-fopenmp"],
+            extra_compile_args=["-fopenmp"],
+        ),
         # silx.io
         Extension(
             name="silx.io.specfile",
@@ -293,18 +300,24 @@ def get_project_configuration():
             ],
             include_dirs=["src/silx/math/histogramnd/include"],
             language="c",
+            extra_link_args=["-fopenmp"],
+            extra_compile_args=["-fopenmp"],
         ),
         Extension(
             name="silx.math.chistogramnd_lut",
             sources=["src/silx/math/chistogramnd_lut.pyx"],
             include_dirs=["src/silx/math/histogramnd/include"],
             language="c",
+            extra_link_args=["-fopenmp"],
+            extra_compile_args=["-fopenmp"],
         ),
         Extension(
             name="silx.math.combo",
             sources=["src/silx/math/combo.pyx"],
             include_dirs=["src/silx/math/include"],
             language="c",
+            extra_link_args=["-fopenmp"],
+            extra_compile_args=["-fopenmp"],
         ),
         Extension(
             name="silx.math.interpolate",
@@ -166,6 +166,17 @@ class Config(object):
     .. versionadded:: 2.0
     """
 
+    DEFAULT_SPECFILE_INDEX_DIRECTORY = None
+    """Default directory where :class:`silx.io.specfile.SpecFile` stores
+    the index of the scans of the files it opens.
+
+    Reopening a file which was indexed, or to which scans were appended since
+    it was indexed, then only requires to parse the new content.
+    If None (default), no index is stored.
+
+    .. versionadded:: 2.2
+    """
+
     _MPL_TIGHT_LAYOUT = False
     """If true the matplotlib backend will use the
     experimental tight layout.
@@ -32,6 +32,7 @@ import argparse
 from glob import glob
 import logging
 import re
+import sys
 import time
 import numpy
 
@@ -193,6 +194,29 @@ def are_all_fiofile(filenames):
     return True
 
 
+class _ProgressReport(object):
+    """Print the progress and the throughput of the conversion"""
+
+    def __init__(self, stream=None):
+        if stream is None:
+            stream = sys.stdout
+        self.__stream = stream
+        self.__start_time = time.time()
+
+    def __call__(self, name, written, total):
+        elapsed = max(time.time() - self.__start_time, 1e-6)
+        message = "%.1f MB" % (written / 1024**2)
+        if total:
+            message += " / %.1f MB (%d%%)" % (total / 1024**2, 100 * written // total)
+        message += ", %.1f MB/s" % (written / 1024**2 / elapsed)
+        self.__stream.write("\r" + message.ljust(60))
+        self.__stream.flush()
+
+    def done(self):
+        self.__stream.write("\n")
+        self.__stream.flush()
+
+
 def main(argv):
     """
     Main function to launch the converter as an application
@@ -324,6 +348,35 @@ def main(argv):
         action="store_true",
         help="Adds a checksum to each chunk to detect data corruption.",
     )
+    parser.add_argument(
+        "--prefetch-workers",
+        type=int,
+        default=fabioh5.DEFAULT_PREFETCH_WORKERS,
+        help="Number of threads used to read the image files of a file "
+        "series in advance (default %d). Use 0 to read the files "
+        "sequentially." % fabioh5.DEFAULT_PREFETCH_WORKERS,
+    )
+    parser.add_argument(
+        "--compression-workers",
+        type=int,
+        default=1,
+        help="Number of threads used to compress the chunks of the datasets "
+        "before writing them directly to the file (default 1: the "
+        "compression is done by the HDF5 library). This is only used for "
+        "the GZIP compression, optionally with --shuffle.",
+    )
+    parser.add_argument(
+        "--block-size",
+        type=int,
+        help="Maximum size in MB of the blocks read at once from the input "
+        "datasets (default 64 MB). Large datasets are copied block by "
+        "block to limit the memory usage.",
+    )
+    parser.add_argument(
+        "--progress",
+        action="store_true",
+        help="Display the progress and the throughput of the conversion",
+    )
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -515,6 +568,15 @@ def main(argv):
     if options.fletcher32:
         create_dataset_args["fletcher32"] = True
 
+    progress = _ProgressReport() if options.progress else None
+    write_args = {
+        "max_workers": options.compression_workers,
+        "block_size": None,
+        "progress_callback": progress,
+    }
+    if options.block_size is not None:
+        write_args["block_size"] = max(1, options.block_size) * 1024**2
+
     if (
         len(options.input_files) > 1
         and not contains_specfile(options.input_files)
@@ -522,7 +584,10 @@ def main(argv):
         and not options.add_root_group
     ) or options.file_pattern is not None:
         # File series -> stack of images
-        input_group = fabioh5.File(file_series=options.input_files)
+        input_group = fabioh5.File(
+            file_series=options.input_files,
+            prefetch_workers=options.prefetch_workers,
+        )
         if hdf5_path != "/":
             # we want to append only data and headers to an existing file
             input_group = input_group["/scan_0/instrument/detector_0"]
@@ -534,6 +599,7 @@ def main(argv):
                 overwrite_data=options.overwrite_data,
                 create_dataset_args=create_dataset_args,
                 min_size=options.min_size,
+                **write_args,
             )
 
     elif (
@@ -573,6 +639,7 @@ def main(argv):
                     overwrite_data=options.overwrite_data,
                     create_dataset_args=create_dataset_args,
                     min_size=options.min_size,
+                    **write_args,
                 )
 
     else:
@@ -584,6 +651,9 @@ def main(argv):
         )
         return -1
 
+    if progress is not None:
+        progress.done()
+
     with h5py.File(output_name, mode="r+") as h5f:
         # append "silx convert" to the creator attribute, for NeXus files
         previous_creator = h5f.attrs.get("creator", "")
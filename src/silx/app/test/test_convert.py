@@ -143,3 +143,44 @@ class TestConvertCommand(unittest.TestCase):
         os.unlink(specname)
         os.unlink(h5name)
         os.rmdir(tempdir)
+
+    def testFileSeries(self):
+        import fabio.edfimage
+        import numpy
+
+        tempdir = tempfile.mkdtemp()
+        filenames = []
+        for i in range(5):
+            filename = os.path.join(tempdir, "image_%04d.edf" % i)
+            data = numpy.full((3, 4), i, dtype=numpy.int32)
+            fabio.edfimage.EdfImage(data=data).write(filename)
+            filenames.append(filename)
+
+        h5name = os.path.join(tempdir, "output.h5")
+        command_list = [
+            "convert",
+            "--prefetch-workers",
+            "2",
+            "--compression",
+            "--chunks",
+            "(2, 3, 4)",
+            "--compression-workers",
+            "2",
+            "--progress",
+            "-o",
+            h5name,
+        ]
+        result = convert.main(command_list + filenames)
+        self.assertEqual(result, 0)
+
+        with h5py.File(h5name, "r") as h5f:
+            dataset = h5f["/scan_0/instrument/detector_0/data"]
+            self.assertEqual(dataset.compression, "gzip")
+            data = dataset[()]
+            self.assertEqual(data.shape, (5, 3, 4))
+            self.assertEqual(list(data[:, 0, 0]), list(range(5)))
+
+        gc.collect()
+        for filename in filenames + [h5name]:
+            os.unlink(filename)
+        os.rmdir(tempdir)
@@ -334,7 +334,11 @@ class Colormap(qt.QObject):
     PERCENTILE_1_99 = "percentile_1_99"
     """constant for autoscale using 1st and 99th percentile of data"""
 
-    AUTOSCALE_MODES = (MINMAX, STDDEV3, PERCENTILE_1_99)
+    PERCENTILE_1_99_HISTOGRAM = "percentile_1_99_histogram"
+    """constant for autoscale using 1st and 99th percentile of data estimated
+    from its histogram"""
+
+    AUTOSCALE_MODES = (MINMAX, STDDEV3, PERCENTILE_1_99, PERCENTILE_1_99_HISTOGRAM)
     """Tuple of managed auto scale algorithms"""
 
     sigChanged = qt.Signal()
@@ -235,6 +235,10 @@ class _AutoscaleModeComboBox(qt.QComboBox):
         Colormap.MINMAX: ("Min/max", "Use the data min/max"),
         Colormap.STDDEV3: ("Mean±3std", "Use the data mean ± 3 × standard deviation"),
         Colormap.PERCENTILE_1_99: ("Percentile 1-99", "Use 1st to 99th percentile of data"),
+        Colormap.PERCENTILE_1_99_HISTOGRAM: (
+            "Percentile 1-99 (fast)",
+            "Use 1st to 99th percentile of data estimated from its histogram",
+        ),
     }
 
     def __init__(self, parent: qt.QWidget):
@@ -432,6 +432,10 @@ class TestObjectAPI(ParametricTestCase):
         self.assertEqual(colormap.getAutoscaleMode(), Colormap.MINMAX)
         colormap.setAutoscaleMode(Colormap.PERCENTILE_1_99)
         self.assertEqual(colormap.getAutoscaleMode(), Colormap.PERCENTILE_1_99)
+        colormap.setAutoscaleMode(Colormap.PERCENTILE_1_99_HISTOGRAM)
+        self.assertEqual(
+            colormap.getAutoscaleMode(), Colormap.PERCENTILE_1_99_HISTOGRAM
+        )
 
     def testStoreRestore(self):
         colormaps = [Colormap(name="viridis"), Colormap(normalization=Colormap.SQRT)]
@@ -0,0 +1,227 @@
+# /*##########################################################################
+#
+# Copyright (c) 2026 European Synchrotron Radiation Facility
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# ############################################################################*/
+"""Multithreaded (OpenMP) parallel-beam projector and backprojector.
+
+These kernels are the CPU counterparts of the `forward_kernel_cpu` and
+`backproj_cpu_kernel` OpenCL kernels of :mod:`silx.opencl` and use the same
+geometry conventions.
+"""
+
+__license__ = "MIT"
+__date__ = "18/10/2026"
+
+
+import cython
+from cython.parallel import prange
+
+cimport cython
+from libc.math cimport floor, ceil, fabs, cos, sin
+
+from ..utils._openmp import get_num_threads
+
+
+@cython.initializedcheck(False)
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef inline float _bilinear(float[:, ::1] image, float x, float y) noexcept nogil:
+    """Bilinear interpolation of the padded slice at (column x, row y),
+    the position being clipped to the image."""
+    cdef:
+        float xc, yc
+        int xm, xp, ym, yp
+    yc = min(max(y, 0.0), image.shape[0] - 1.0)
+    ym = <int> floor(yc)
+    yp = <int> ceil(yc)
+    xc = min(max(x, 0.0), image.shape[1] - 1.0)
+    xm = <int> floor(xc)
+    xp = <int> ceil(xc)
+    if ym == yp and xm == xp:
+        return image[ym, xm]
+    elif ym == yp:
+        return image[ym, xm] * (xp - xc) + image[ym, xp] * (xc - xm)
+    elif xm == xp:
+        return image[ym, xm] * (yp - yc) + image[yp, xm] * (yc - ym)
+    return (image[ym, xm] * (yp - yc) * (xp - xc)
+            + image[yp, xm] * (yc - ym) * (xp - xc)
+            + image[ym, xp] * (yp - yc) * (xc - xm)
+            + image[yp, xp] * (yc - ym) * (xc - xm))
+
+
+@cython.initializedcheck(False)
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def project(float[:, ::1] padded_slice,
+            float[::1] angles,
+            float axis_position,
+            float offset_x,
+            float scale,
+            float[:, ::1] sino,
+            num_threads=None):
+    """Joseph forward projection of a slice (Radon transform).
+
+    :param padded_slice: Square slice of dimension (n+2, n+2), the
+        image being stored from the position (1, 1) and surrounded by zeros
+    :param angles: Projection angles in radian
+    :param axis_position: Center of the (non-padded) slice: (n-1)/2
+    :param offset_x: Shift of the detector bins
+    :param scale: Factor applied to the projections
+    :param sino: Output sinogram of shape (n_angles, n_bins)
+    :param Union[int,None] num_threads: Number of OpenMP threads.
+        Default: OMP_NUM_THREADS or the number of available CPUs
+    """
+    cdef:
+        int dimslice = padded_slice.shape[0] - 2
+        int n_angles = sino.shape[0]
+        int n_bins = sino.shape[1]
+        int n_threads = get_num_threads(num_threads)
+        int proj, bin_, j
+        int begin_a, begin_b, stl_a, stl_b, stl_aj, stl_bj
+        float angle, cos_angle, sin_angle, tmp, shift, posx, res
+
+    assert padded_slice.shape[1] == dimslice + 2
+    assert angles.shape[0] >= n_angles
+
+    for proj in prange(n_angles, nogil=True, num_threads=n_threads):
+        angle = angles[proj]
+        cos_angle = cos(angle)
+        sin_angle = sin(angle)
+        # Iterate along the slice axis which is the most orthogonal to the ray
+        if fabs(cos_angle) > 0.70710678:
+            if cos_angle > 0:
+                begin_a = 0
+                begin_b = 0
+                stl_a = 1
+                stl_b = 0
+                stl_aj = 0
+                stl_bj = 1
+            else:
+                cos_angle = -cos_angle
+                sin_angle = -sin_angle
+                begin_a = dimslice - 1
+                begin_b = dimslice - 1
+                stl_a = -1
+                stl_b = 0
+                stl_aj = 0
+                stl_bj = -1
+        else:
+            if sin_angle > 0:
+                tmp = cos_angle
+                cos_angle = sin_angle
+                sin_angle = -tmp
+                begin_a = 0
+                begin_b = dimslice - 1
+                stl_a = 0
+                stl_b = -1
+                stl_aj = 1
+                stl_bj = 0
+            else:
+                tmp = cos_angle
+                cos_angle = -sin_angle
+                sin_angle = tmp
+                begin_a = dimslice - 1
+                begin_b = 0
+                stl_a = 0
+                stl_b = 1
+                stl_aj = -1
+                stl_bj = 0
+        shift = sin_angle / cos_angle
+
+        for bin_ in range(n_bins):
+            posx = (axis_position * (1.0 - shift)
+                    + (bin_ - offset_x - axis_position) / cos_angle)
+            res = 0
+            for j in range(dimslice):
+                res = res + _bilinear(
+                    padded_slice,
+                    begin_a + posx * stl_a + j * stl_aj + 1.0,
+                    begin_b + posx * stl_b + j * stl_bj + 1.0)
+                posx = posx + shift
+            sino[proj, bin_] = res * scale / cos_angle
+
+
+@cython.initializedcheck(False)
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def backproject(float[:, :, ::1] sinos,
+                float[::1] cos_angles,
+                float[::1] sin_angles,
+                float[::1] axes,
+                float axis_position,
+                float offset_x,
+                float offset_y,
+                float[:, :, ::1] slices,
+                num_threads=None):
+    """Backprojection of a stack of sinograms, with a linear interpolation
+    along the detector.
+
+    :param sinos: Stack of sinograms of shape (n_slices, n_angles, n_bins)
+    :param cos_angles: Cosine of the projection angles
+    :param sin_angles: Sine of the projection angles
+    :param axes: Position of the rotation axis for each projection
+    :param axis_position: Position of the rotation axis of the slice
+    :param offset_x: Shift of the slice along the columns
+    :param offset_y: Shift of the slice along the rows
+    :param slices: Output stack of slices of shape (n_slices, n_rows, n_cols)
+    :param Union[int,None] num_threads: Number of OpenMP threads.
+        Default: OMP_NUM_THREADS or the number of available CPUs
+    """
+    cdef:
+        int n_slices = sinos.shape[0]
+        int n_angles = sinos.shape[1]
+        int n_bins = sinos.shape[2]
+        int n_rows = slices.shape[1]
+        int n_cols = slices.shape[2]
+        int n_threads = get_num_threads(num_threads)
+        Py_ssize_t index
+        int slice_idx, row, col, proj, xm, xp
+        float bx, by, h, res
+
+    assert slices.shape[0] == n_slices
+    assert cos_angles.shape[0] >= n_angles
+    assert sin_angles.shape[0] >= n_angles
+    assert axes.shape[0] >= n_angles
+
+    # Each thread processes whole rows of the slices
+    for index in prange(n_slices * n_rows, nogil=True, num_threads=n_threads):
+        slice_idx = index // n_rows
+        row = index % n_rows
+        by = row + offset_y - axis_position
+        for col in range(n_cols):
+            bx = col + offset_x - axis_position
+            res = 0
+            for proj in range(n_angles):
+                h = axes[proj] + bx * cos_angles[proj] - by * sin_angles[proj]
+                if h >= 0 and h < n_bins:
+                    h = min(h, n_bins - 1.0)
+                    xm = <int> floor(h)
+                    xp = <int> ceil(h)
+                    if xm == xp:
+                        res = res + sinos[slice_idx, proj, xm]
+                    else:
+                        res = res + (sinos[slice_idx, proj, xm] * (xp - h)
+                                     + sinos[slice_idx, proj, xp] * (h - xm))
+            slices[slice_idx, row, col] = res
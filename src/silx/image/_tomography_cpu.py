@@ -0,0 +1,799 @@
+# /*##########################################################################
+#
+# Copyright (c) 2026 European Synchrotron Radiation Facility
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# ############################################################################*/
+"""CPU implementation of the tomographic projector, backprojector and
+iterative reconstruction algorithms.
+
+The classes of this module have the same API and geometry conventions as
+their OpenCL counterparts of :mod:`silx.opencl.backprojection`,
+:mod:`silx.opencl.projection` and :mod:`silx.opencl.reconstruction`.
+They are used by :mod:`silx.image.backprojection`,
+:mod:`silx.image.projection` and :mod:`silx.image.reconstruction` when
+OpenCL is not available.
+
+The projection and backprojection are multithreaded with OpenMP. The number of
+threads can be set with the `num_threads` argument or with the
+`OMP_NUM_THREADS` environment variable.
+"""
+
+__license__ = "MIT"
+__date__ = "18/10/2026"
+
+
+import logging
+import time
+from math import pi
+
+import numpy as np
+
+from . import _radon
+from .tomography import compute_fourier_filter, get_next_power
+
+logger = logging.getLogger(__name__)
+
+
+class Backprojection(object):
+    """A class for performing the (filtered) backprojection on the CPU
+
+    :param sino_shape: shape of the sinogram. The sinogram is in the format
+                       (n_a, n_b) where n_a is the number of angles and n_b
+                       is the number of detector bins.
+    :param slice_shape: Optional, shape of the reconstructed slice. By
+                        default, it is a square slice where the dimension
+                        is the "x dimension" of the sinogram (number of
+                        bins).
+    :param axis_position: Optional, axis position. Default is
+                          `(shape[1]-1)/2.0`.
+    :param angles: Optional, a list of custom angles in radian.
+    :param filter_name: Optional, name of the filter for FBP. Default is
+                        the Ram-Lak filter.
+    :param ctx: Ignored, for compatibility with the OpenCL implementation
+    :param devicetype: Ignored, for compatibility with the OpenCL
+                       implementation
+    :param platformid: Ignored, for compatibility with the OpenCL
+                       implementation
+    :param deviceid: Ignored, for compatibility with the OpenCL
+                     implementation
+    :param profile: Ignored, for compatibility with the OpenCL
+                    implementation
+    :param extra_options: Advanced extra options in the form of a dict.
+        Current options are: cutoff, gpu_offset_x, gpu_offset_y
+    :param num_threads: Number of threads. Default: OMP_NUM_THREADS or the
+                        number of available CPUs
+    """
+
+    is_cpu = True
+
+    def __init__(
+        self,
+        sino_shape,
+        slice_shape=None,
+        axis_position=None,
+        angles=None,
+        filter_name=None,
+        ctx=None,
+        devicetype="all",
+        platformid=None,
+        deviceid=None,
+        profile=False,
+        extra_options=None,
+        num_threads=None,
+    ):
+        self.num_threads = num_threads
+        self.profile = profile
+        self.stack_stats = None
+        """Statistics of the last call to :meth:`backprojection_stack`"""
+
+        self.shape = sino_shape
+        self.num_bins = np.int32(sino_shape[1])
+        self.num_projs = np.int32(sino_shape[0])
+        if slice_shape is None:
+            self.slice_shape = (self.num_bins, self.num_bins)
+        else:
+            self.slice_shape = slice_shape
+        if axis_position:
+            self.axis_pos = np.float32(axis_position)
+        else:
+            self.axis_pos = np.float32((sino_shape[1] - 1.0) / 2)
+        self.axis_array = None
+        self.extra_options = {
+            "cutoff": 1.0,
+            "use_numpy_fft": True,
+            # It is  axis_pos - (num_bins-1)/2  in PyHST
+            "gpu_offset_x": 0.0,
+            "gpu_offset_y": 0.0,
+        }
+        if extra_options is not None:
+            self.extra_options.update(extra_options)
+
+        if angles is None:
+            angles = np.linspace(0, np.pi, self.num_projs, False)
+        self.angles = angles
+        self._cos = np.ascontiguousarray(np.cos(self.angles), dtype=np.float32)
+        self._sin = np.ascontiguousarray(np.sin(self.angles), dtype=np.float32)
+        self._axes = np.ones(self.num_projs, dtype=np.float32) * self.axis_pos
+
+        self._init_filter(filter_name)
+
+    def _init_filter(self, filter_name):
+        """Compute the Fourier filter of the FBP
+
+        :param str filter_name: filter name
+        """
+        self.filter_name = filter_name or "ram-lak"
+        self.dwidth_padded = get_next_power(2 * int(self.num_bins))
+        filter_f = compute_fourier_filter(
+            self.dwidth_padded,
+            self.filter_name,
+            cutoff=self.extra_options["cutoff"],
+        )[: self.dwidth_padded // 2 + 1]
+        self.filter_f = (filter_f * (pi / self.num_projs)).astype(np.complex64)
+
+    def _check_sinos(self, sinos):
+        """Returns a C-contiguous float32 stack of sinograms
+
+        :param sinos: Stack of sinograms of shape (n_slices, n_a, n_b)
+        """
+        sinos = np.ascontiguousarray(sinos, dtype=np.float32)
+        if sinos.shape[1:] != (self.num_projs, self.num_bins):
+            raise ValueError(
+                "Expected sinograms of shape %s, got %s"
+                % ((int(self.num_projs), int(self.num_bins)), sinos.shape[1:])
+            )
+        return sinos
+
+    def filter_sino(self, sino, output=None):
+        """Filter sinograms in the Fourier domain, row by row
+
+        :param sino: Sinogram of shape (n_a, n_b), or a stack of sinograms
+        :param output: Optional, output array
+        :return: The filtered sinogram(s)
+        """
+        sino = np.asarray(sino, dtype=np.float32)
+        sino_f = np.fft.rfft(sino, n=self.dwidth_padded, axis=-1)
+        sino_f *= self.filter_f
+        res = np.fft.irfft(sino_f, n=self.dwidth_padded, axis=-1)
+        res = res[..., : self.num_bins]
+        if output is None:
+            return res.astype(np.float32)
+        output[...] = res
+        return output
+
+    def _backproject(self, sinos, output=None):
+        """Backproject a stack of sinograms
+
+        :param numpy.ndarray sinos: C-contiguous float32 stack of sinograms
+        :param output: Optional, stack of slices where to write the result
+        """
+        slice_shape = (len(sinos),) + tuple(int(i) for i in self.slice_shape)
+        if (
+            isinstance(output, np.ndarray)
+            and output.dtype == np.float32
+            and output.flags["C_CONTIGUOUS"]
+            and output.size == np.prod(slice_shape)
+        ):
+            res = output.reshape(slice_shape)
+        else:
+            res = np.empty(slice_shape, dtype=np.float32)
+        _radon.backproject(
+            sinos,
+            self._cos,
+            self._sin,
+            self._axes,
+            self.axis_pos,
+            self.extra_options["gpu_offset_x"],
+            self.extra_options["gpu_offset_y"],
+            res,
+            num_threads=self.num_threads,
+        )
+        if output is not None and not np.shares_memory(res, output):
+            output[...] = res.reshape(output.shape)
+        return res
+
+    def backprojection(self, sino, output=None):
+        """Perform the backprojection on an input sinogram
+
+        :param sino: sinogram.
+        :param output: optional, output slice.
+            If provided, the result will be written in this array.
+        :return: backprojection of sinogram
+        """
+        sinos = self._check_sinos(np.asarray(sino)[np.newaxis])
+        res = self._backproject(sinos, output=output)
+        if output is not None:
+            return output
+        return res[0]
+
+    def filtered_backprojection(self, sino, output=None):
+        """
+        Compute the filtered backprojection (FBP) on a sinogram.
+
+        :param sino: sinogram (`np.ndarray`) with the shape
+            (n_projections, n_bins)
+        :param output: output (`np.ndarray`).
+            If nothing is provided, a new numpy array is returned.
+        """
+        return self.backprojection(self.filter_sino(sino), output=output)
+
+    __call__ = filtered_backprojection
+
+    def backprojection_stack(self, sinos, output=None, batch_size=None, filtered=True):
+        """Reconstruct a stack of slices, processing several slices at once.
+
+        The number of reconstructed slices per second is logged and stored in
+        :attr:`stack_stats`.
+
+        :param sinos: Stack of sinograms with the shape
+            (n_slices, n_projections, n_bins): a 3D `numpy.ndarray`, a
+            `h5py.Dataset` or any iterable of 2D sinograms
+        :param output: Optional, array-like of shape
+            (n_slices,) + slice_shape where the slices are written, for
+            example a 3D `numpy.ndarray` or a `h5py.Dataset`.
+            If nothing is provided, a new numpy array is returned.
+        :param Union[int,None] batch_size: Number of slices processed at once.
+            Default is 16.
+        :param bool filtered: True (default) for a filtered backprojection
+        :return: The reconstructed volume
+        """
+        sino_shape = (int(self.num_projs), int(self.num_bins))
+        slice_shape = tuple(int(i) for i in self.slice_shape)
+        shape = getattr(sinos, "shape", None)
+        if shape is not None:
+            if len(shape) != 3 or tuple(shape[1:]) != sino_shape:
+                raise ValueError(
+                    "Expected a stack of sinograms of shape %s, got %s"
+                    % (sino_shape, shape)
+                )
+            n_slices = int(shape[0])
+        else:
+            n_slices = None
+        if output is not None and n_slices is not None:
+            if tuple(output.shape) != (n_slices,) + slice_shape:
+                raise ValueError(
+                    "Expected output of shape %s, got %s"
+                    % ((n_slices,) + slice_shape, output.shape)
+                )
+        if batch_size is None:
+            batch_size = 16
+            if n_slices is not None:
+                batch_size = max(1, min(batch_size, n_slices))
+
+        def iter_batches():
+            if n_slices is not None:
+                for start in range(0, n_slices, batch_size):
+                    yield sinos[start : start + batch_size]
+            else:
+                chunk = []
+                for sino in sinos:
+                    chunk.append(sino)
+                    if len(chunk) == batch_size:
+                        yield chunk
+                        chunk = []
+                if chunk:
+                    yield chunk
+
+        t0 = time.perf_counter()
+        results = []
+        start = 0
+        for chunk in iter_batches():
+            chunk = self._check_sinos(chunk)
+            if filtered:
+                chunk = self.filter_sino(chunk)
+            res = self._backproject(chunk)
+            stop = start + len(res)
+            if output is None:
+                results.append(res)
+            elif n_slices is None and stop > len(output):
+                raise ValueError("Too many sinograms for the output")
+            else:
+                output[start:stop] = res
+            start = stop
+        elapsed = time.perf_counter() - t0
+
+        self.stack_stats = {
+            "slices": start,
+            "batch_size": batch_size,
+            "time": elapsed,
+            "slices_per_second": start / elapsed if elapsed > 0 else float("inf"),
+        }
+        logger.info(
+            "Reconstructed %d slices in %.3fs (%.1f slices/s)",
+            start,
+            elapsed,
+            self.stack_stats["slices_per_second"],
+        )
+        if output is not None:
+            return output
+        if results:
+            return np.concatenate(results)
+        return np.zeros((0,) + slice_shape, dtype=np.float32)
+
+
+class Projection(object):
+    """A class for performing a tomographic projection (Radon Transform) on
+    the CPU, using the Joseph method.
+
+    :param slice_shape: shape of the slice: (num_rows, num_columns).
+    :param angles: Either an integer number of angles, or a list of custom
+                   angles values in radian.
+    :param axis_position: Optional, axis position. Default is
+                          `(shape[1]-1)/2.0`.
+    :param detector_width: Optional, detector width in pixels.
+                           If detector_width > slice_shape[1], the
+                           projection data will be surrounded with zeros.
+                           Using detector_width < slice_shape[1] might
+                           result in a local tomography setup.
+    :param normalize: Optional, normalization. If set, the sinograms are
+                      multiplied by the factor pi/(2*nprojs).
+    :param ctx: Ignored, for compatibility with the OpenCL implementation
+    :param devicetype: Ignored, for compatibility with the OpenCL
+                       implementation
+    :param platformid: Ignored, for compatibility with the OpenCL
+                       implementation
+    :param deviceid: Ignored, for compatibility with the OpenCL
+                     implementation
+    :param profile: Ignored, for compatibility with the OpenCL
+                    implementation
+    :param num_threads: Number of threads. Default: OMP_NUM_THREADS or the
+                        number of available CPUs
+    """
+
+    is_cpu = True
+
+    def __init__(
+        self,
+        slice_shape,
+        angles,
+        axis_position=None,
+        detector_width=None,
+        normalize=False,
+        ctx=None,
+        devicetype="all",
+        platformid=None,
+        deviceid=None,
+        profile=False,
+        num_threads=None,
+    ):
+        self.num_threads = num_threads
+        self.profile = profile
+        self.shape = slice_shape
+        if self.shape[0] > self.shape[1]:
+            # The slice is processed as a square of dimension shape[1]
+            raise ValueError(
+                "Slices with more rows than columns are not supported, got %s"
+                % (tuple(self.shape),)
+            )
+        self.axis_pos = axis_position
+        self.angles = angles
+        self.dwidth = detector_width
+        self.normalize = normalize
+
+        # Default values
+        if self.axis_pos is None:
+            self.axis_pos = (self.shape[1] - 1) / 2.0
+        if self.dwidth is None:
+            self.dwidth = self.shape[1]
+        if not (np.iterable(self.angles)):
+            if self.angles is None:
+                self.nprojs = self.shape[0]
+            else:
+                self.nprojs = self.angles
+            self.angles = np.linspace(
+                start=0, stop=np.pi, num=self.nprojs, endpoint=False
+            ).astype(dtype=np.float32)
+        else:
+            self.nprojs = len(self.angles)
+        self.offset_x = -np.float32((self.shape[1] - 1) / 2.0 - self.axis_pos)
+        self.offset_y = -np.float32((self.shape[0] - 1) / 2.0 - self.axis_pos)
+        # Reset axis_pos once offset are computed
+        self.axis_pos0 = np.float64((self.shape[1] - 1) / 2.0)
+
+        self._angles = np.ascontiguousarray(self.angles, dtype=np.float32)
+        self._padded_slice = np.zeros(
+            (self.shape[1] + 2, self.shape[1] + 2), dtype=np.float32
+        )
+
+    def transfer_to_slice(self, image):
+        """Set the slice to project
+
+        :param numpy.ndarray image: Slice of shape `slice_shape`
+        """
+        self._padded_slice[1 : image.shape[0] + 1, 1:-1] = image
+
+    def projection(self, image=None, dst=None):
+        """Perform the projection on an input image
+
+        :param image: Image to project. If None, the previous image is
+            projected.
+        :param dst: Optional, output array of shape (n_angles, detector_width)
+        :return: A sinogram
+        """
+        if image is not None:
+            assert image.ndim == 2, "Treat only 2D images"
+            assert image.shape[0] == self.shape[0], "image shape is OK"
+            assert image.shape[1] == self.shape[1], "image shape is OK"
+            self.transfer_to_slice(image)
+        sino_shape = (int(self.nprojs), int(self.dwidth))
+        if (
+            isinstance(dst, np.ndarray)
+            and dst.dtype == np.float32
+            and dst.flags["C_CONTIGUOUS"]
+            and dst.shape == sino_shape
+        ):
+            res = dst
+        else:
+            res = np.empty(sino_shape, dtype=np.float32)
+        scale = pi * 0.5 / self.nprojs if self.normalize else 1.0
+        _radon.project(
+            self._padded_slice,
+            self._angles,
+            self.axis_pos0,
+            self.offset_x,
+            scale,
+            res,
+            num_threads=self.num_threads,
+        )
+        if dst is not None and res is not dst:
+            dst[...] = res
+            return dst
+        return res
+
+    __call__ = projection
+
+
+def gradient(image):
+    """Spatial gradient of an image, with the conventions of
+    :meth:`silx.opencl.linalg.LinAlg.gradient`.
+
+    :param numpy.ndarray image: 2D image
+    :return: Array of shape image.shape + (2,) with the differences along the
+        rows, then along the columns
+    """
+    res = np.zeros(image.shape + (2,), dtype=np.float32)
+    res[:-1, :, 0] = image[1:] - image[:-1]
+    res[:, :-1, 1] = image[:, 1:] - image[:, :-1]
+    return res
+
+
+def divergence(grad):
+    """Spatial divergence of a gradient-like image, with the conventions of
+    :meth:`silx.opencl.linalg.LinAlg.divergence`.
+
+    :param numpy.ndarray grad: Array of shape image.shape + (2,)
+    :return: The divergence image
+    """
+    res = np.array(grad[..., 0], dtype=np.float32)
+    res[1:] -= grad[:-1, :, 0]
+    res += grad[..., 1]
+    res[:, 1:] -= grad[:, :-1, 1]
+    return res
+
+
+class ReconstructionAlgorithm(object):
+    """
+    A parent class for all iterative tomographic reconstruction algorithms
+
+    :param sino_shape: shape of the sinogram. The sinogram is in the format
+                       (n_a, n_b) where n_a is the number of angles and n_b
+                       is the number of detector bins.
+    :param slice_shape: Optional, shape of the reconstructed slice.
+                        By default, it is a square slice where the dimension
+                        is the "x dimension" of the sinogram (number of bins).
+    :param axis_position: Optional, axis position. Default is `(shape[1]-1)/2.0`.
+    :param angles: Optional, a list of custom angles in radian.
+    :param ctx: Ignored, for compatibility with the OpenCL implementation
+    :param devicetype: Ignored, for compatibility with the OpenCL
+                       implementation
+    :param platformid: Ignored, for compatibility with the OpenCL
+                       implementation
+    :param deviceid: Ignored, for compatibility with the OpenCL
+                     implementation
+    :param profile: Ignored, for compatibility with the OpenCL
+                    implementation
+    :param num_threads: Number of threads. Default: OMP_NUM_THREADS or the
+                        number of available CPUs
+    """
+
+    is_cpu = True
+
+    def __init__(
+        self,
+        sino_shape,
+        slice_shape=None,
+        axis_position=None,
+        angles=None,
+        ctx=None,
+        devicetype="all",
+        platformid=None,
+        deviceid=None,
+        profile=False,
+        num_threads=None,
+    ):
+        # Create a backprojector
+        self.backprojector = Backprojection(
+            sino_shape,
+            slice_shape=slice_shape,
+            axis_position=axis_position,
+            angles=angles,
+            profile=profile,
+            num_threads=num_threads,
+        )
+        # Create a projector
+        self.projector = Projection(
+            self.backprojector.slice_shape,
+            self.backprojector.angles,
+            axis_position=axis_position,
+            detector_width=self.backprojector.num_bins,
+            normalize=False,
+            profile=profile,
+            num_threads=num_threads,
+        )
+        self.sino_shape = sino_shape
+        slice_shape = tuple(int(i) for i in self.backprojector.slice_shape)
+        self.d_data = np.zeros(sino_shape, dtype=np.float32)
+        self.d_sino = np.zeros_like(self.d_data)
+        self.d_x = np.zeros(slice_shape, dtype=np.float32)
+        self.d_x_old = np.zeros_like(self.d_x)
+
+    def proj(self, d_slice, d_sino):
+        """
+        Project d_slice to d_sino
+        """
+        self.projector.projection(d_slice, dst=d_sino)
+
+    def backproj(self, d_sino, d_slice):
+        """
+        Backproject d_sino to d_slice
+        """
+        self.backprojector.backprojection(d_sino, output=d_slice)
+
+
+class SIRT(ReconstructionAlgorithm):
+    """
+    A class for the SIRT algorithm
+
+    :param sino_shape: shape of the sinogram. The sinogram is in the format
+                       (n_a, n_b) where n_a is the number of angles and n_b
+                       is the number of detector bins.
+    :param slice_shape: Optional, shape of the reconstructed slice.
+                        By default, it is a square slice where the dimension is
+                        the "x dimension" of the sinogram (number of bins).
+    :param axis_position: Optional, axis position. Default is `(shape[1]-1)/2.0`.
+    :param angles: Optional, a list of custom angles in radian.
+    :param ctx: Ignored, for compatibility with the OpenCL implementation
+    :param devicetype: Ignored, for compatibility with the OpenCL
+                       implementation
+    :param platformid: Ignored, for compatibility with the OpenCL
+                       implementation
+    :param deviceid: Ignored, for compatibility with the OpenCL
+                     implementation
+    :param profile: Ignored, for compatibility with the OpenCL
+                    implementation
+    :param num_threads: Number of threads. Default: OMP_NUM_THREADS or the
+                        number of available CPUs
+    """
+
+    def __init__(
+        self,
+        sino_shape,
+        slice_shape=None,
+        axis_position=None,
+        angles=None,
+        ctx=None,
+        devicetype="all",
+        platformid=None,
+        deviceid=None,
+        profile=False,
+        num_threads=None,
+    ):
+        ReconstructionAlgorithm.__init__(
+            self,
+            sino_shape,
+            slice_shape=slice_shape,
+            axis_position=axis_position,
+            angles=angles,
+            profile=profile,
+            num_threads=num_threads,
+        )
+        self.compute_preconditioners()
+
+    def compute_preconditioners(self):
+        """
+        Create a diagonal preconditioner for the projection and backprojection
+        operator.
+        Each term of the diagonal is the sum of the projector/backprojector
+        along rows [1], i.e the projection/backprojection of an array of ones.
+
+        [1] Jens Gregor and Thomas Benson,
+            Computational Analysis and Improvement of SIRT,
+            IEEE transactions on medical imaging, vol. 27, no. 7,  2008
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # r_{i,i} = 1/(sum_j a_{i,j})
+            slice_ones = np.ones(self.backprojector.slice_shape, dtype=np.float32)
+            R = 1.0 / self.projector.projection(slice_ones)
+            # In the case where the rotation axis is excentred
+            R[np.logical_not(np.isfinite(R))] = 1.0
+            self.d_R = R
+            # c_{j,j} = 1/(sum_i a_{i,j})
+            sino_ones = np.ones(self.sino_shape, dtype=np.float32)
+            C = 1.0 / self.backprojector.backprojection(sino_ones)
+            C[np.logical_not(np.isfinite(C))] = 1.0
+            self.d_C = C
+
+    def run(self, data, n_it):
+        """
+        Run n_it iterations of the SIRT algorithm.
+
+        :return: The reconstructed slice as a `numpy.ndarray`
+        """
+        self.d_data[:] = data
+
+        d_x_old = self.d_x_old
+        d_x = self.d_x
+        d_sino = self.d_sino
+        d_x[:] = 0
+
+        for k in range(n_it):
+            d_x_old[:] = d_x
+            # x{k+1} = x{k} - C A^T R (A x{k} - b)
+            self.proj(d_x, d_sino)
+            d_sino -= self.d_data
+            d_sino *= self.d_R
+            self.backproj(d_sino, d_x)
+            d_x *= -self.d_C
+            d_x += d_x_old
+
+        return d_x.copy()
+
+    __call__ = run
+
+
+class TV(ReconstructionAlgorithm):
+    """
+    A class for reconstruction with Total Variation regularization using the
+    Chambolle-Pock TV reconstruction algorithm.
+
+    :param sino_shape: shape of the sinogram. The sinogram is in the format
+                       (n_a, n_b) where n_a is the number of angles and n_b
+                       is the number of detector bins.
+    :param slice_shape: Optional, shape of the reconstructed slice. By default,
+                        it is a square slice where the dimension is the
+                        "x dimension" of the sinogram (number of bins).
+    :param axis_position: Optional, axis position. Default is
+                          `(shape[1]-1)/2.0`.
+    :param angles: Optional, a list of custom angles in radian.
+    :param ctx: Ignored, for compatibility with the OpenCL implementation
+    :param devicetype: Ignored, for compatibility with the OpenCL
+                       implementation
+    :param platformid: Ignored, for compatibility with the OpenCL
+                       implementation
+    :param deviceid: Ignored, for compatibility with the OpenCL
+                     implementation
+    :param profile: Ignored, for compatibility with the OpenCL
+                    implementation
+    :param num_threads: Number of threads. Default: OMP_NUM_THREADS or the
+                        number of available CPUs
+    """
+
+    def __init__(
+        self,
+        sino_shape,
+        slice_shape=None,
+        axis_position=None,
+        angles=None,
+        ctx=None,
+        devicetype="all",
+        platformid=None,
+        deviceid=None,
+        profile=False,
+        num_threads=None,
+    ):
+        ReconstructionAlgorithm.__init__(
+            self,
+            sino_shape,
+            slice_shape=slice_shape,
+            axis_position=axis_position,
+            angles=angles,
+            profile=profile,
+            num_threads=num_threads,
+        )
+        self.compute_preconditioners()
+        self.d_tmp = np.zeros_like(self.d_x)
+        self.theta = 1.0
+
+    def compute_preconditioners(self):
+        """
+        Create a diagonal preconditioner for the projection and backprojection
+        operator.
+        Each term of the diagonal is the sum of the projector/backprojector
+        along rows [2],
+        i.e the projection/backprojection of an array of ones.
+
+        [2] T. Pock, A. Chambolle,
+            Diagonal preconditioning for first order primal-dual algorithms in
+            convex optimization,
+            International Conference on Computer Vision, 2011
+        """
+        # Compute the diagonal preconditioner "Sigma"
+        slice_ones = np.ones(self.backprojector.slice_shape, dtype=np.float32)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            Sigma_k = 1.0 / self.projector.projection(slice_ones)
+        Sigma_k[np.logical_not(np.isfinite(Sigma_k))] = 1.0
+        self.d_Sigma_k = Sigma_k
+        self.d_Sigma_kp1 = self.d_Sigma_k + 1
+        # For discrete gradient, sum|D_i,j| = 2 along lines or cols
+        self.Sigma_grad = 1 / 2.0
+
+        # Compute the diagonal preconditioner "Tau"
+        sino_ones = np.ones(self.sino_shape, dtype=np.float32)
+        C = self.backprojector.backprojection(sino_ones)
+        self.d_Tau = 1.0 / (C + 2.0)
+
+    def run(self, data, n_it, Lambda, pos_constraint=False):
+        """
+        Run n_it iterations of the TV-regularized reconstruction,
+        with the regularization parameter Lambda.
+
+        :return: The reconstructed slice as a `numpy.ndarray`
+        """
+        self.d_data[:] = data
+
+        d_x = self.d_x
+        d_x_old = self.d_x_old
+        d_tmp = self.d_tmp
+        d_sino = self.d_sino
+        d_p = np.zeros(d_x.shape + (2,), dtype=np.float32)
+        d_q = np.zeros_like(self.d_data)
+        d_x[:] = 0
+
+        for k in range(0, n_it):
+            # Update primal variables
+            d_x_old[:] = d_x
+            # x = x + Tau*div(p) - Tau*Kadj(q)
+            self.backproj(d_q, d_tmp)
+            d_g = divergence(d_p)
+            d_g -= d_tmp
+            d_g *= self.d_Tau
+            d_x += d_g
+
+            if pos_constraint:
+                np.maximum(d_x, 0, out=d_x)
+
+            # Update dual variables
+            # p = proj_linf(p + Sigma_grad*gradient(x + theta*(x - x_old)), Lambda)
+            d_tmp[:] = d_x
+            d_tmp *= 1 + self.theta
+            d_tmp -= self.theta * d_x_old
+            d_p += self.Sigma_grad * gradient(d_tmp)
+            np.clip(d_p, -Lambda, Lambda, out=d_p)
+
+            # q = (q + Sigma_k*K(x + theta*(x - x_old)) - Sigma_k*data)/(1.0 + Sigma_k)
+            self.proj(d_tmp, d_sino)
+            d_sino -= self.d_data
+            d_sino *= self.d_Sigma_k
+            d_q += d_sino
+            d_q /= self.d_Sigma_kp1
+        return d_x.copy()
+
+    __call__ = run
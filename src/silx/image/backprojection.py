@@ -21,4 +21,20 @@
 #
 # ############################################################################*/
 
-from silx.opencl.backprojection import *  # noqa
+"""Tomographic (filtered) backprojection.
+
+:class:`Backprojection` is the OpenCL implementation of
+:mod:`silx.opencl.backprojection` if an OpenCL device is available, else a
+multithreaded CPU implementation with the same API and geometry conventions.
+"""
+
+__license__ = "MIT"
+__date__ = "18/10/2026"
+
+
+from silx.opencl.common import ocl
+
+if ocl is not None:
+    from silx.opencl.backprojection import *  # noqa
+else:
+    from ._tomography_cpu import Backprojection  # noqa
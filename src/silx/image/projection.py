@@ -21,4 +21,20 @@
 #
 # ############################################################################*/
 
-from silx.opencl.projection import *  # noqa
+"""Tomographic projection (Radon transform).
+
+:class:`Projection` is the OpenCL implementation of
+:mod:`silx.opencl.projection` if an OpenCL device is available, else a
+multithreaded CPU implementation with the same API and geometry conventions.
+"""
+
+__license__ = "MIT"
+__date__ = "18/10/2026"
+
+
+from silx.opencl.common import ocl
+
+if ocl is not None:
+    from silx.opencl.projection import *  # noqa
+else:
+    from ._tomography_cpu import Projection  # noqa
@@ -21,4 +21,21 @@
 #
 # ############################################################################*/
 
-from silx.opencl.reconstruction import *  # noqa
+"""Iterative tomographic reconstruction algorithms.
+
+:class:`ReconstructionAlgorithm`, :class:`SIRT` and :class:`TV` are the OpenCL
+implementations of :mod:`silx.opencl.reconstruction` if an OpenCL device is
+available, else multithreaded CPU implementations with the same API and
+geometry conventions.
+"""
+
+__license__ = "MIT"
+__date__ = "18/10/2026"
+
+
+from silx.opencl.common import ocl
+
+if ocl is not None:
+    from silx.opencl.reconstruction import *  # noqa
+else:
+    from ._tomography_cpu import ReconstructionAlgorithm, SIRT, TV  # noqa
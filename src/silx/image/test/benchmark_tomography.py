@@ -0,0 +1,168 @@
+# /*##########################################################################
+#
+# Copyright (c) 2026 European Synchrotron Radiation Facility
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# ############################################################################*/
+"""Benchmarks of the CPU tomography against the OpenCL one on a CPU device
+(e.g. pocl).
+
+Run it with::
+
+    python -m silx.image.test.benchmark_tomography
+"""
+
+__license__ = "MIT"
+__date__ = "18/10/2026"
+
+
+import logging
+import time
+import unittest
+
+import numpy
+
+from silx.image import _tomography_cpu
+from silx.opencl.common import ocl
+
+if ocl is not None:
+    from silx.opencl import backprojection as ocl_backprojection
+    from silx.opencl import projection as ocl_projection
+    from silx.opencl import reconstruction as ocl_reconstruction
+else:
+    ocl_backprojection = ocl_projection = ocl_reconstruction = None
+
+_logger = logging.getLogger(__name__)
+_logger.setLevel(logging.INFO)
+
+
+def phantom(size):
+    """Returns a phantom made of two disks"""
+    y, x = numpy.mgrid[:size, :size] - (size - 1) / 2.0
+    image = (x**2 + y**2 < (size / 3.0) ** 2).astype(numpy.float32)
+    image[(x - size / 10.0) ** 2 + (y + size / 8.0) ** 2 < (size / 12.0) ** 2] += 1
+    return image
+
+
+class TestBenchmarkTomography(unittest.TestCase):
+    """Benchmark of the projection, FBP and SIRT on the CPU with OpenMP and
+    with OpenCL on a CPU device"""
+
+    SIZES = 256, 512, 1024
+
+    NB_ITER = 3
+
+    SIRT_ITERATIONS = 10
+
+    def timeit(self, function, *args):
+        """Returns the best duration of NB_ITER runs of function(*args)"""
+        function(*args)  # Warm-up
+        durations = []
+        for _ in range(self.NB_ITER):
+            start = time.perf_counter()
+            function(*args)
+            durations.append(time.perf_counter() - start)
+        return min(durations)
+
+    def get_implementations(self, factory_name, module, *args, **kwargs):
+        """Returns a dict of instances of each available implementation"""
+        implementations = {
+            "openmp": getattr(_tomography_cpu, factory_name)(*args, **kwargs)
+        }
+        if module is not None:
+            try:
+                implementations["opencl"] = getattr(module, factory_name)(
+                    *args, devicetype="CPU", **kwargs
+                )
+            except Exception as e:
+                _logger.warning("OpenCL %s not available: %s", factory_name, e)
+        return implementations
+
+    def show_results(self, name, size, durations):
+        """Log the durations and the speed-up of OpenMP against OpenCL"""
+        _logger.info(
+            "%s %dx%d: %s",
+            name,
+            size,
+            size,
+            ", ".join("%s %.3fs" % item for item in durations.items()),
+        )
+        if "opencl" in durations:
+            _logger.info(
+                "%s %dx%d: OpenMP speed-up x%.2f",
+                name,
+                size,
+                size,
+                durations["opencl"] / durations["openmp"],
+            )
+
+    def test_benchmark_projection(self):
+        for size in self.SIZES:
+            image = phantom(size)
+            projectors = self.get_implementations(
+                "Projection", ocl_projection, image.shape, size
+            )
+            durations = {}
+            for name, projector in projectors.items():
+                durations[name] = self.timeit(projector.projection, image)
+            self.show_results("Projection", size, durations)
+
+    def test_benchmark_fbp(self):
+        for size in self.SIZES:
+            sino = _tomography_cpu.Projection((size, size), size).projection(
+                phantom(size)
+            )
+            backprojectors = self.get_implementations(
+                "Backprojection", ocl_backprojection, sino.shape
+            )
+            durations = {}
+            results = {}
+            for name, backprojector in backprojectors.items():
+                fbp = backprojector.filtered_backprojection
+                durations[name] = self.timeit(fbp, sino)
+                results[name] = fbp(sino)
+            self.show_results("FBP", size, durations)
+            if "opencl" in results:
+                numpy.testing.assert_allclose(
+                    results["openmp"], results["opencl"], atol=1e-2 * sino.max()
+                )
+
+    def test_benchmark_sirt(self):
+        for size in self.SIZES[:2]:
+            sino = _tomography_cpu.Projection((size, size), size).projection(
+                phantom(size)
+            )
+            algorithms = self.get_implementations(
+                "SIRT", ocl_reconstruction, sino.shape
+            )
+            durations = {}
+            for name, sirt in algorithms.items():
+                try:
+                    durations[name] = self.timeit(sirt.run, sino, self.SIRT_ITERATIONS)
+                except Exception as e:
+                    _logger.warning("%s SIRT failed: %s", name, e)
+            if "openmp" not in durations:
+                self.fail("OpenMP SIRT failed")
+            self.show_results("SIRT (%d it)" % self.SIRT_ITERATIONS, size, durations)
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    unittest.main()
@@ -0,0 +1,231 @@
+# /*##########################################################################
+#
+# Copyright (c) 2026 European Synchrotron Radiation Facility
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# ############################################################################*/
+"""Tests of the CPU projector, backprojector and iterative reconstructions"""
+
+__license__ = "MIT"
+__date__ = "18/10/2026"
+
+import unittest
+import numpy
+
+from .._tomography_cpu import Backprojection, Projection, SIRT, TV
+from .._tomography_cpu import gradient, divergence
+
+
+def phantom(size):
+    """Returns a phantom made of two disks"""
+    y, x = numpy.mgrid[:size, :size] - (size - 1) / 2.0
+    image = (x**2 + y**2 < (size / 3.0) ** 2).astype(numpy.float32)
+    image[(x - size / 10.0) ** 2 + (y + size / 8.0) ** 2 < (size / 12.0) ** 2] += 1
+    return image
+
+
+def inner_disk(size):
+    """Returns the mask of the reconstruction zone (inscribed circle)"""
+    y, x = numpy.mgrid[:size, :size] - (size - 1) / 2.0
+    return x**2 + y**2 < (size / 2.0 - 2) ** 2
+
+
+def reference_backprojection(sino, backprojector):
+    """Backprojection implemented with numpy"""
+    n_rows, n_cols = backprojector.slice_shape
+    n_bins = sino.shape[1]
+    rows, cols = numpy.mgrid[:n_rows, :n_cols].astype(numpy.float32)
+    bx = cols - backprojector.axis_pos
+    by = rows - backprojector.axis_pos
+    res = numpy.zeros((n_rows, n_cols))
+    for proj, angle in enumerate(backprojector.angles):
+        h = backprojector.axis_pos + bx * numpy.cos(angle) - by * numpy.sin(angle)
+        inside = (h >= 0) & (h < n_bins)
+        h = numpy.clip(h, 0, n_bins - 1)
+        xm = numpy.floor(h).astype(int)
+        xp = numpy.ceil(h).astype(int)
+        values = numpy.where(
+            xm == xp,
+            sino[proj, xm],
+            sino[proj, xm] * (xp - h) + sino[proj, xp] * (h - xm),
+        )
+        res += numpy.where(inside, values, 0)
+    return res
+
+
+class TestProjection(unittest.TestCase):
+    def test_disk(self):
+        """The projection of a centered disk is the chord length"""
+        size = 64
+        y, x = numpy.mgrid[:size, :size] - (size - 1) / 2.0
+        radius = 20
+        disk = (x**2 + y**2 < radius**2).astype(numpy.float32)
+        projector = Projection(disk.shape, 32)
+        sino = projector.projection(disk)
+        self.assertEqual(sino.shape, (32, size))
+        bins = numpy.arange(size) - (size - 1) / 2.0
+        chords = 2 * numpy.sqrt(numpy.clip(radius**2 - bins**2, 0, None))
+        for proj in sino:
+            numpy.testing.assert_allclose(proj, chords, atol=2.5)
+
+    def test_adjoint(self):
+        """The projector and the backprojector are adjoint operators"""
+        size = 48
+        projector = Projection((size, size), 60)
+        backprojector = Backprojection((60, size), angles=projector.angles)
+        rng = numpy.random.default_rng(0)
+        image = rng.random((size, size), dtype=numpy.float32)
+        sino = rng.random((60, size), dtype=numpy.float32)
+        proj_dot = numpy.vdot(projector.projection(image), sino)
+        backproj_dot = numpy.vdot(image, backprojector.backprojection(sino))
+        self.assertAlmostEqual(proj_dot / backproj_dot, 1, delta=5e-3)
+
+    def test_dst_and_threads(self):
+        """Writing the result in an array and the number of threads"""
+        image = phantom(32)
+        ref = Projection(image.shape, 20, num_threads=1).projection(image)
+        projector = Projection(image.shape, 20, normalize=True, num_threads=3)
+        dst = numpy.zeros((20, 32), dtype=numpy.float32)
+        self.assertIs(projector.projection(image, dst=dst), dst)
+        numpy.testing.assert_allclose(dst, ref * numpy.pi / 2 / 20, rtol=1e-5)
+        # Projects the previous image
+        numpy.testing.assert_array_equal(projector.projection(), dst)
+
+    def test_rectangular_slice(self):
+        with self.assertRaises(ValueError):
+            Projection((40, 32), 10)
+
+
+class TestBackprojection(unittest.TestCase):
+    def setUp(self):
+        self.size = 64
+        self.image = phantom(self.size)
+        self.projector = Projection(self.image.shape, 90)
+        self.sino = self.projector.projection(self.image)
+
+    def test_backprojection(self):
+        """Compares with a numpy implementation"""
+        backprojector = Backprojection(self.sino.shape)
+        res = backprojector.backprojection(self.sino)
+        ref = reference_backprojection(self.sino, backprojector)
+        numpy.testing.assert_allclose(res, ref, rtol=1e-4, atol=1e-3)
+
+        # Off-centered axis and rectangular slice
+        backprojector = Backprojection(
+            self.sino.shape, slice_shape=(40, 64), axis_position=30.5
+        )
+        res = backprojector.backprojection(self.sino)
+        self.assertEqual(res.shape, (40, 64))
+        ref = reference_backprojection(self.sino, backprojector)
+        numpy.testing.assert_allclose(res, ref, rtol=1e-4, atol=1e-3)
+
+    def test_fbp(self):
+        backprojector = Backprojection(self.sino.shape)
+        res = backprojector(self.sino)
+        mask = inner_disk(self.size)
+        error = numpy.abs(res - self.image)[mask].mean()
+        self.assertLess(error, 0.05)
+
+        output = numpy.zeros(self.image.shape, dtype=numpy.float64)
+        self.assertIs(backprojector(self.sino, output=output), output)
+        numpy.testing.assert_allclose(output, res, rtol=1e-6)
+
+    def test_filters(self):
+        mask = inner_disk(self.size)
+        for filter_name in ("ram-lak", "shepp-logan", "hann"):
+            with self.subTest(filter_name=filter_name):
+                backprojector = Backprojection(
+                    self.sino.shape, filter_name=filter_name
+                )
+                res = backprojector(self.sino)
+                error = numpy.abs(res - self.image)[mask].mean()
+                self.assertLess(error, 0.1)
+
+    def test_stack(self):
+        backprojector = Backprojection(self.sino.shape)
+        ref = backprojector(self.sino)
+        sinos = numpy.array([self.sino, 2 * self.sino, 3 * self.sino])
+        res = backprojector.backprojection_stack(sinos, batch_size=2)
+        self.assertEqual(res.shape, (3, self.size, self.size))
+        for i in range(3):
+            numpy.testing.assert_allclose(res[i], (i + 1) * ref, rtol=1e-4, atol=1e-4)
+        self.assertEqual(backprojector.stack_stats["slices"], 3)
+
+        # From an iterator, in an output array
+        output = numpy.zeros_like(res)
+        backprojector.backprojection_stack(iter(sinos), output=output)
+        numpy.testing.assert_array_equal(output, res)
+
+        # Unfiltered
+        res = backprojector.backprojection_stack(sinos[:1], filtered=False)
+        numpy.testing.assert_allclose(
+            res[0], backprojector.backprojection(self.sino), rtol=1e-6
+        )
+
+        with self.assertRaises(ValueError):
+            backprojector.backprojection_stack(numpy.zeros((2, 10, 10)))
+
+
+class TestReconstruction(unittest.TestCase):
+    def setUp(self):
+        self.size = 48
+        self.image = phantom(self.size)
+        self.sino = Projection(self.image.shape, 60).projection(self.image)
+        self.mask = inner_disk(self.size)
+
+    def test_gradient_divergence(self):
+        """-divergence is the adjoint of the gradient"""
+        image = numpy.random.random((20, 30)).astype(numpy.float32)
+        grad = numpy.random.random((20, 30, 2)).astype(numpy.float32)
+        grad[-1, :, 0] = 0
+        grad[:, -1, 1] = 0
+        self.assertAlmostEqual(
+            numpy.vdot(gradient(image), grad) / numpy.vdot(image, -divergence(grad)),
+            1,
+            places=4,
+        )
+
+    def test_sirt(self):
+        sirt = SIRT(self.sino.shape)
+        error_5 = numpy.abs(sirt.run(self.sino, 5) - self.image)[self.mask].mean()
+        error_50 = numpy.abs(sirt(self.sino, 50) - self.image)[self.mask].mean()
+        self.assertLess(error_50, error_5)
+        self.assertLess(error_50, 0.05)
+
+    def test_tv(self):
+        tv = TV(self.sino.shape)
+        res = tv.run(self.sino, 100, 0.05, pos_constraint=True)
+        self.assertGreaterEqual(res.min(), 0)
+        error = numpy.abs(res - self.image)[self.mask].mean()
+        self.assertLess(error, 0.05)
+
+
+class TestSelection(unittest.TestCase):
+    def test_fallback(self):
+        """The CPU implementation is used when OpenCL is not available"""
+        from silx.opencl.common import ocl
+        from .. import backprojection, projection, reconstruction
+
+        if ocl is not None:
+            self.skipTest("OpenCL is available")
+        self.assertIs(backprojection.Backprojection, Backprojection)
+        self.assertIs(projection.Projection, Projection)
+        self.assertIs(reconstruction.SIRT, SIRT)
+        self.assertIs(reconstruction.TV, TV)
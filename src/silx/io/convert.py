@@ -28,6 +28,11 @@ Read the documentation of :mod:`silx.io.spech5`, :mod:`silx.io.fioh5` and :mod:`
 information on the structure of the output HDF5 files.
 
 Text strings are written to the HDF5 datasets as variable-length utf-8.
+
+Large numerical datasets are copied block by block, so that the memory used
+does not depend on the size of the datasets. GZIP compressed chunks can be
+compressed by a pool of threads and written directly in the file
+(see `max_workers` in :func:`write_to_h5`).
 """
 
 __authors__ = ["P. Knobel"]
@@ -35,12 +40,15 @@ __license__ = "MIT"
 __date__ = "17/07/2018"
 
 
+import itertools
 import logging
+import zlib
 
 import h5py
 import numpy
 
 import silx.io
+from silx.utils.concurrency import prefetch
 from .utils import is_dataset, is_group, is_softlink, visitall
 from . import fabioh5
 
@@ -48,6 +56,11 @@ from . import fabioh5
 _logger = logging.getLogger(__name__)
 
 
+DEFAULT_BLOCK_SIZE = 64 * 1024**2
+"""Default maximum number of bytes read at once from a dataset when it is
+copied block by block"""
+
+
 def _create_link(h5f, link_name, target_name, link_type="soft", overwrite_data=False):
     """Create a link in a HDF5 file
 
@@ -94,6 +107,65 @@ def _attr_utf8(attr_value):
     return out_attr_value
 
 
+def _nbytes(obj):
+    """Returns the number of bytes of a dataset"""
+    return int(numpy.prod(obj.shape, dtype=numpy.int64)) * obj.dtype.itemsize
+
+
+def _shuffle(data):
+    """Apply the HDF5 byte shuffle filter to a contiguous array.
+
+    :param numpy.ndarray data: C-contiguous array
+    :rtype: bytes
+    """
+    itemsize = data.dtype.itemsize
+    if itemsize == 1:
+        return data.tobytes()
+    data = data.reshape(-1).view(numpy.uint8).reshape(-1, itemsize)
+    return numpy.ascontiguousarray(data.T).tobytes()
+
+
+def _direct_chunk_encoder(ds):
+    """Returns a function encoding a chunk of a dataset like its HDF5
+    filter pipeline, in order to write it with ``write_direct_chunk``.
+
+    Only the GZIP compression, optionally preceded by the shuffle filter,
+    is supported.
+
+    :param h5py.Dataset ds: Chunked dataset
+    :returns: A function encoding a chunk (a numpy array with the shape of
+        the chunks of the dataset) to bytes, or None if the filters of the
+        dataset are not supported
+    """
+    if ds.chunks is None or ds.dtype.kind not in "biufc":
+        return None
+    if not hasattr(ds.id, "write_direct_chunk"):
+        return None
+
+    dcpl = ds.id.get_create_plist()
+    filters = [dcpl.get_filter(i)[0] for i in range(dcpl.get_nfilters())]
+    if filters == [h5py.h5z.FILTER_DEFLATE]:
+        shuffle = False
+    elif filters == [h5py.h5z.FILTER_SHUFFLE, h5py.h5z.FILTER_DEFLATE]:
+        shuffle = True
+    else:
+        return None
+
+    dtype = ds.dtype
+    level = ds.compression_opts
+
+    def encode(chunk):
+        chunk = numpy.ascontiguousarray(chunk, dtype=dtype)
+        if shuffle:
+            data = _shuffle(chunk)
+        else:
+            data = chunk.tobytes()
+        # zlib releases the GIL, which allows to compress in threads
+        return zlib.compress(data, level)
+
+    return encode
+
+
 class Hdf5Writer(object):
     """Converter class to write the content of a data file to a HDF5 file."""
 
@@ -104,6 +176,9 @@ class Hdf5Writer(object):
         link_type="soft",
         create_dataset_args=None,
         min_size=500,
+        max_workers=None,
+        block_size=None,
+        progress_callback=None,
     ):
         """
 
@@ -117,6 +192,12 @@ class Hdf5Writer(object):
             See documentation of :func:`write_to_h5`
         :param int min_size:
             See documentation of :func:`write_to_h5`
+        :param Union[int,None] max_workers:
+            See documentation of :func:`write_to_h5`
+        :param Union[int,None] block_size:
+            See documentation of :func:`write_to_h5`
+        :param Union[callable,None] progress_callback:
+            See documentation of :func:`write_to_h5`
         """
         self.h5path = h5path
         if not h5path.startswith("/"):
@@ -134,6 +215,19 @@ class Hdf5Writer(object):
 
         self.min_size = min_size
 
+        self.max_workers = max_workers
+        """Number of threads used to compress the chunks"""
+
+        if block_size is None:
+            block_size = DEFAULT_BLOCK_SIZE
+        self.block_size = block_size
+        """Maximum number of bytes read at once from a dataset"""
+
+        self.progress_callback = progress_callback
+
+        self._nbytes_written = 0
+        self._nbytes_total = None
+
         self.overwrite_data = overwrite_data  # boolean
 
         self.link_type = link_type
@@ -156,7 +250,17 @@ class Hdf5Writer(object):
         """
         # Recurse through all groups and datasets to add them to the HDF5
         self._h5f = h5f
-        for name, item in visitall(infile):
+        members = visitall(infile)
+        self._nbytes_written = 0
+        self._nbytes_total = None
+        if self.progress_callback is not None:
+            members = list(members)
+            self._nbytes_total = sum(
+                _nbytes(item)
+                for _, item in members
+                if not is_softlink(item) and is_dataset(item)
+            )
+        for name, item in members:
             self.append_member_to_h5(name, item)
 
         # Handle the attributes of the root group
@@ -194,17 +298,21 @@ class Hdf5Writer(object):
                 del self._h5f[h5_name]
 
             if self.overwrite_data or not member_initially_exists:
-                if isinstance(obj, fabioh5.FrameData) and len(obj.shape) > 2:
-                    # special case of multiframe data
-                    # write frame by frame to save memory usage low
+                is_frame_stack = (
+                    isinstance(obj, fabioh5.FrameData) and len(obj.shape) > 2
+                )
+                if obj.dtype.kind in "biufc" and (
+                    obj.size >= self.min_size or is_frame_stack
+                ):
+                    # write block by block to keep memory usage low
+                    # (frame by frame for stacks of images)
                     ds = self._h5f.create_dataset(
                         h5_name,
                         shape=obj.shape,
                         dtype=obj.dtype,
                         **self.create_dataset_args,
                     )
-                    for i, frame in enumerate(obj):
-                        ds[i] = frame
+                    self._write_blocks(h5_name, ds, obj)
                 else:
                     # fancy arguments don't apply to small dataset
                     if obj.size < self.min_size:
@@ -213,8 +321,10 @@ class Hdf5Writer(object):
                         ds = self._h5f.create_dataset(
                             h5_name, data=obj[()], **self.create_dataset_args
                         )
+                    self._report_progress(h5_name, _nbytes(obj))
             else:
                 ds = self._h5f[h5_name]
+                self._report_progress(h5_name, _nbytes(obj))
 
             # add HDF5 attributes
             for key in obj.attrs:
@@ -238,6 +348,74 @@ class Hdf5Writer(object):
         else:
             _logger.warning("Unsuppored entity, ignoring: %s", h5_name)
 
+    def _report_progress(self, h5_name, nbytes):
+        """Call the progress callback after `nbytes` were processed"""
+        self._nbytes_written += nbytes
+        if self.progress_callback is not None:
+            self.progress_callback(h5_name, self._nbytes_written, self._nbytes_total)
+
+    def _write_blocks(self, h5_name, ds, obj):
+        """Copy a dataset block by block along its first axis.
+
+        The blocks are aligned on the chunks of the output dataset. If
+        :attr:`max_workers` allows it and the filters of the dataset are
+        supported, the chunks are compressed in a pool of threads and
+        written directly.
+
+        :param str h5_name: Name of the output dataset
+        :param h5py.Dataset ds: Output dataset
+        :param obj: Input dataset
+        """
+        if ds.ndim == 0:
+            ds[()] = obj[()]
+            self._report_progress(h5_name, _nbytes(ds))
+            return
+
+        row_nbytes = _nbytes(ds) // max(1, ds.shape[0])
+        rows = max(1, self.block_size // max(1, row_nbytes))
+        if ds.chunks is not None:
+            rows = max(ds.chunks[0], rows - rows % ds.chunks[0])
+
+        encode = None
+        if self.max_workers is not None and self.max_workers >= 2:
+            encode = _direct_chunk_encoder(ds)
+
+        for start in range(0, ds.shape[0], rows):
+            block = numpy.asarray(obj[start : start + rows], dtype=ds.dtype)
+            if encode is None:
+                ds[start : start + len(block)] = block
+            else:
+                self._write_direct_chunks(ds, block, start, encode)
+            self._report_progress(h5_name, block.nbytes)
+
+    def _write_direct_chunks(self, ds, block, start, encode):
+        """Compress the chunks of a block in a pool of threads and write
+        them directly in the dataset.
+
+        :param h5py.Dataset ds: Output dataset
+        :param numpy.ndarray block: Block of rows of the dataset
+        :param int start: Index of the first row of the block, aligned on
+            the chunks
+        :param callable encode: Function encoding a chunk
+        """
+        chunks = ds.chunks
+        offsets = itertools.product(
+            *[range(0, size, chunk) for size, chunk in zip(block.shape, chunks)]
+        )
+
+        def encode_chunk(offset):
+            chunk = block[tuple(slice(o, o + c) for o, c in zip(offset, chunks))]
+            if chunk.shape != chunks:
+                # edge chunks are stored with the full chunk shape
+                padded = numpy.full(chunks, ds.fillvalue, dtype=ds.dtype)
+                padded[tuple(slice(0, size) for size in chunk.shape)] = chunk
+                chunk = padded
+            return offset, encode(chunk)
+
+        encoded_chunks = prefetch(encode_chunk, offsets, max_workers=self.max_workers)
+        for offset, data in encoded_chunks:
+            ds.id.write_direct_chunk((start + offset[0],) + offset[1:], data)
+
 
 def write_to_h5(
     infile,
@@ -248,6 +426,9 @@ def write_to_h5(
     link_type="soft",
     create_dataset_args=None,
     min_size=500,
+    max_workers=None,
+    block_size=None,
+    progress_callback=None,
 ):
     """Write content of a h5py-like object into a HDF5 file.
 
@@ -273,6 +454,18 @@ def write_to_h5(
         These arguments are only applied to datasets larger than 1MB.
     :param int min_size: Minimum number of elements in a dataset to apply
         chunking and compression. Default is 500.
+    :param Union[int,None] max_workers: Number of threads used to compress
+        the chunks of the datasets, which are then written with
+        ``write_direct_chunk``. This is only used for GZIP compression,
+        optionally with the shuffle filter. Default is None: the chunks
+        are compressed by the HDF5 library.
+    :param Union[int,None] block_size: Maximum number of bytes read at once
+        from a dataset which is copied block by block.
+        Default is :data:`DEFAULT_BLOCK_SIZE`.
+    :param Union[callable,None] progress_callback: Function called while
+        the datasets are written with the name of the current dataset, the
+        number of bytes already processed and the total number of bytes to
+        process, e.g. ``callback("/1.1/measurement/mca_0/data", 1024, 4096)``.
 
     The structure of the spec data in an HDF5 file is described in the
     documentation of :mod:`silx.io.spech5`.
@@ -283,6 +476,9 @@ def write_to_h5(
         link_type=link_type,
         create_dataset_args=create_dataset_args,
         min_size=min_size,
+        max_workers=max_workers,
+        block_size=block_size,
+        progress_callback=progress_callback,
     )
 
     # both infile and h5file can be either file handle or a file name: 4 cases
@@ -300,7 +496,15 @@ def write_to_h5(
         writer.write(infile, h5file)
 
 
-def convert(infile, h5file, mode="w-", create_dataset_args=None):
+def convert(
+    infile,
+    h5file,
+    mode="w-",
+    create_dataset_args=None,
+    max_workers=None,
+    block_size=None,
+    progress_callback=None,
+):
     """Convert a supported file into an HDF5 file, write scans into the
     root group (``/``).
 
@@ -318,6 +522,12 @@ def convert(infile, h5file, mode="w-", create_dataset_args=None):
     :param create_dataset_args: Dictionary of args you want to pass to
         ``h5py.File.create_dataset``. This allows you to specify filters and
         compression parameters. Don't specify ``name`` and ``data``.
+    :param Union[int,None] max_workers: Number of threads used to compress
+        the chunks. See :func:`write_to_h5`.
+    :param Union[int,None] block_size: Maximum number of bytes read at once
+        from a dataset. See :func:`write_to_h5`.
+    :param Union[callable,None] progress_callback: Function called while
+        the datasets are written. See :func:`write_to_h5`.
     """
     if mode not in ["w", "w-"]:
         raise IOError(
@@ -325,5 +535,12 @@ def convert(infile, h5file, mode="w-", create_dataset_args=None):
             + " to append data to an existing HDF5 file."
         )
     write_to_h5(
-        infile, h5file, h5path="/", mode=mode, create_dataset_args=create_dataset_args
+        infile,
+        h5file,
+        h5path="/",
+        mode=mode,
+        create_dataset_args=create_dataset_args,
+        max_workers=max_workers,
+        block_size=block_size,
+        progress_callback=progress_callback,
     )
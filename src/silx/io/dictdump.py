@@ -24,11 +24,12 @@
 by text strings to following file formats: `HDF5, INI, JSON`
 """
 
-from collections.abc import Mapping
+from collections.abc import Mapping, MutableMapping
 import json
 import logging
 import numpy
 import os.path
+import re
 import h5py
 
 try:
@@ -546,6 +547,151 @@ def _handle_error(mode: str, exception, msg: str, *args) -> None:
         raise ValueError("Unsupported error handling: %s" % mode)
 
 
+def _dataset_nbytes(h5obj):
+    """Returns the number of bytes of a dataset"""
+    return int(numpy.prod(h5obj.shape, dtype=numpy.int64)) * h5obj.dtype.itemsize
+
+
+def _read_dataset_value(h5obj, asarray):
+    """Read the full content of a dataset as returned by :func:`h5todict`"""
+    data = h5py_read_dataset(h5obj)
+    if asarray:  # Convert HDF5 dataset to numpy array
+        data = numpy.asarray(data)
+    return data
+
+
+class DatasetProxy:
+    """Lightweight proxy to a HDF5 dataset which is read on demand.
+
+    It is returned by :func:`h5todict` and :func:`iter_h5todict` in place of
+    the datasets larger than `proxy_size`. The data is only read when the
+    proxy is indexed, e.g. ``proxy[()]`` or ``proxy[0, 10:20]``, or
+    converted to a numpy array.
+
+    If the proxy was created from a file name, the file is opened again
+    for each read, else the provided h5py-like object must still be open.
+
+    :param h5file: File name or h5py-like File
+    :param str name: Path of the dataset in the file
+    :param Tuple[int] shape: Shape of the dataset
+    :param numpy.dtype dtype: Type of the dataset
+    """
+
+    def __init__(self, h5file, name, shape, dtype):
+        self.__h5file = h5file
+        self.__name = name
+        self.__shape = tuple(shape)
+        self.__dtype = numpy.dtype(dtype)
+
+    @property
+    def name(self):
+        """Path of the dataset in the file"""
+        return self.__name
+
+    @property
+    def shape(self):
+        return self.__shape
+
+    @property
+    def dtype(self):
+        return self.__dtype
+
+    @property
+    def ndim(self):
+        return len(self.__shape)
+
+    @property
+    def size(self):
+        return int(numpy.prod(self.__shape, dtype=numpy.int64))
+
+    @property
+    def nbytes(self):
+        return self.size * self.__dtype.itemsize
+
+    def __len__(self):
+        if self.ndim == 0:
+            raise TypeError("Attempt to take len() of scalar dataset")
+        return self.__shape[0]
+
+    def __getitem__(self, item):
+        with _SafeH5FileRead(self.__h5file) as h5f:
+            return h5py_read_dataset(h5f[self.__name], index=item)
+
+    def __array__(self, dtype=None):
+        return numpy.asarray(self[()], dtype=dtype)
+
+    def __repr__(self):
+        return '<DatasetProxy "%s": shape %s, type "%s">' % (
+            self.__name,
+            self.__shape,
+            self.__dtype.str,
+        )
+
+
+class _DeferredDataset:
+    """Content of a dataset read on first access of a :class:`H5LazyDict`"""
+
+    def __init__(self, h5file, name, asarray):
+        self.h5file = h5file
+        self.name = name
+        self.asarray = asarray
+
+    def read(self):
+        with _SafeH5FileRead(self.h5file) as h5f:
+            return _read_dataset_value(h5f[self.name], self.asarray)
+
+
+class H5LazyDict(MutableMapping):
+    """Dictionary returned by :func:`h5todict` in lazy mode.
+
+    The structure of the HDF5 tree and the attributes are read when the
+    dictionary is created, but the content of the datasets is only read
+    at the first access of each value, and then cached.
+
+    If it was created from a file name, the file is opened again to read a
+    dataset, else the provided h5py-like object must still be open.
+    """
+
+    def __init__(self):
+        self.__data = {}
+
+    def __getitem__(self, key):
+        value = self.__data[key]
+        if isinstance(value, _DeferredDataset):
+            value = value.read()
+            self.__data[key] = value
+        return value
+
+    def __setitem__(self, key, value):
+        self.__data[key] = value
+
+    def __delitem__(self, key):
+        del self.__data[key]
+
+    def __iter__(self):
+        return iter(self.__data)
+
+    def __len__(self):
+        return len(self.__data)
+
+    def is_loaded(self, key):
+        """Returns True if the value of `key` was already read.
+
+        :raises KeyError: If the key is not in the dictionary
+        """
+        return not isinstance(self.__data[key], _DeferredDataset)
+
+    def __repr__(self):
+        items = []
+        for key, value in self.__data.items():
+            if isinstance(value, _DeferredDataset):
+                value = "<not loaded>"
+            else:
+                value = repr(value)
+            items.append("%r: %s" % (key, value))
+        return "%s({%s})" % (self.__class__.__name__, ", ".join(items))
+
+
 def h5todict(
     h5file,
     path="/",
@@ -554,6 +700,8 @@ def h5todict(
     dereference_links=True,
     include_attributes=False,
     errors="raise",
+    lazy=False,
+    proxy_size=None,
 ):
     """Read a HDF5 file and return a nested dictionary with the complete file
     structure and all data.
@@ -573,6 +721,16 @@ def h5todict(
                                              "/94.1/measurement",
                                              exclude_names="mca_")
 
+    To only read the metadata of a file containing large datasets, use the
+    lazy mode or a `proxy_size`::
+
+        # the datasets are read when accessed
+        entry = h5todict("scan.h5", "/entry", lazy=True)
+        title = entry["title"]
+
+        # the datasets larger than 1MB are not read
+        entry = h5todict("scan.h5", "/entry", proxy_size=2**20)
+        frame = entry["instrument"]["detector"]["data"][0]
 
     .. note:: This function requires `h5py <http://www.h5py.org/>`_ to be
         installed.
@@ -597,14 +755,173 @@ def h5todict(
         - 'raise' (default): Raise an exception
         - 'log': Log as errors
         - 'ignore': Ignore errors
+    :param bool lazy: If True, return :class:`H5LazyDict` dictionaries whose
+        datasets are read at first access. Errors while reading a dataset
+        are then raised at this access.
+    :param Union[int,None] proxy_size: If provided, the datasets larger than
+        this number of bytes are not read, and a :class:`DatasetProxy` is
+        returned instead.
     :return: Nested dictionary
     """
     h5file, path = _normalize_h5_path(h5file, path)
     with _SafeH5FileRead(h5file) as h5f:
-        ddict = {}
+        return _h5todict(
+            h5f,
+            path,
+            h5file,
+            exclude_names=exclude_names,
+            asarray=asarray,
+            dereference_links=dereference_links,
+            include_attributes=include_attributes,
+            errors=errors,
+            lazy=lazy,
+            proxy_size=proxy_size,
+        )
+
+
+def _h5todict(
+    h5f,
+    path,
+    file_reference,
+    exclude_names,
+    asarray,
+    dereference_links,
+    include_attributes,
+    errors,
+    lazy,
+    proxy_size,
+):
+    """Implementation of :func:`h5todict` on an opened file.
+
+    :param h5f: Opened h5py-like File
+    :param file_reference: File name or h5py-like File used to read the
+        datasets after the return of :func:`h5todict`
+    """
+    ddict = H5LazyDict() if lazy else {}
+    if path not in h5f:
+        _handle_error(errors, KeyError, 'Path "%s" does not exist in file.', path)
+        return ddict
+
+    try:
+        root = h5f[path]
+    except KeyError as e:
+        if not isinstance(h5f.get(path, getlink=True), h5py.HardLink):
+            _handle_error(
+                errors, KeyError, 'Cannot retrieve path "%s" (broken link)', path
+            )
+        else:
+            _handle_error(errors, KeyError, ", ".join(e.args))
+        return ddict
+
+    # Read the attributes of the group
+    if include_attributes:
+        attrs = H5pyAttributesReadWrapper(root.attrs)
+        for aname, avalue in attrs.items():
+            ddict[("", aname)] = avalue
+    # Read the children of the group
+    for key in root:
+        if _name_contains_string_in_list(key, exclude_names):
+            continue
+        h5name = path + "/" + key
+        # Preserve HDF5 link when requested
+        if not dereference_links:
+            lnk = h5f.get(h5name, getlink=True)
+            if is_link(lnk):
+                ddict[key] = lnk
+                continue
+
+        try:
+            h5obj = h5f[h5name]
+        except KeyError as e:
+            if not isinstance(h5f.get(h5name, getlink=True), h5py.HardLink):
+                _handle_error(
+                    errors,
+                    KeyError,
+                    'Cannot retrieve path "%s" (broken link)',
+                    h5name,
+                )
+            else:
+                _handle_error(errors, KeyError, ", ".join(e.args))
+            continue
+
+        if is_group(h5obj):
+            # Child is an HDF5 group
+            ddict[key] = _h5todict(
+                h5f,
+                h5name,
+                file_reference,
+                exclude_names=exclude_names,
+                asarray=asarray,
+                dereference_links=dereference_links,
+                include_attributes=include_attributes,
+                errors=errors,
+                lazy=lazy,
+                proxy_size=proxy_size,
+            )
+        else:
+            # Child is an HDF5 dataset
+            dataset_name = re.sub("/+", "/", h5name)
+            if proxy_size is not None and _dataset_nbytes(h5obj) > proxy_size:
+                data = DatasetProxy(
+                    file_reference, dataset_name, h5obj.shape, h5obj.dtype
+                )
+            elif lazy:
+                data = _DeferredDataset(file_reference, dataset_name, asarray)
+            else:
+                try:
+                    data = _read_dataset_value(h5obj, asarray)
+                except OSError:
+                    _handle_error(
+                        errors, OSError, 'Cannot retrieve dataset "%s"', h5name
+                    )
+                    continue
+            ddict[key] = data
+            # Read the attributes of the child
+            if include_attributes:
+                attrs = H5pyAttributesReadWrapper(h5obj.attrs)
+                for aname, avalue in attrs.items():
+                    ddict[(key, aname)] = avalue
+    return ddict
+
+
+def iter_h5todict(
+    h5file,
+    path="/",
+    exclude_names=None,
+    asarray=True,
+    dereference_links=True,
+    include_attributes=False,
+    errors="raise",
+    proxy_size=None,
+):
+    """Iterate over the content of a HDF5 file as `(path, value)` pairs.
+
+    This is a streaming version of :func:`h5todict`: the datasets are read
+    one by one while iterating, and the whole tree is never held in memory.
+    The file is kept open during the iteration.
+
+    The paths are the absolute paths of the datasets in the file, e.g.
+    ``"/entry/title"``. Attributes are provided with a
+    `(path, attribute name)` tuple as key, e.g.
+    ``(("/entry", "NX_class"), "NXentry")``. Preserved links (see
+    `dereference_links`) are provided as their link object.
+
+    Example of usage::
+
+        from silx.io.dictdump import iter_h5todict
+
+        for path, value in iter_h5todict("scan.h5", "/entry", proxy_size=2**20):
+            print(path, value)
+
+    The parameters are the same as :func:`h5todict`.
+
+    :rtype: Iterator[Tuple[Union[str,Tuple[str,str]],object]]
+    """
+    h5file, path = _normalize_h5_path(h5file, path)
+    with _SafeH5FileRead(h5file) as h5f:
         if path not in h5f:
             _handle_error(errors, KeyError, 'Path "%s" does not exist in file.', path)
-            return ddict
+            return
 
         try:
             root = h5f[path]
@@ -615,68 +932,97 @@ def h5todict(
                 )
             else:
                 _handle_error(errors, KeyError, ", ".join(e.args))
-            return ddict
+            return
+
+        yield from _iter_h5todict(
+            h5f,
+            root,
+            path,
+            h5file,
+            exclude_names=exclude_names,
+            asarray=asarray,
+            dereference_links=dereference_links,
+            include_attributes=include_attributes,
+            errors=errors,
+            proxy_size=proxy_size,
+        )
 
-        # Read the attributes of the group
-        if include_attributes:
-            attrs = H5pyAttributesReadWrapper(root.attrs)
-            for aname, avalue in attrs.items():
-                ddict[("", aname)] = avalue
-        # Read the children of the group
-        for key in root:
-            if _name_contains_string_in_list(key, exclude_names):
-                continue
-            h5name = path + "/" + key
-            # Preserve HDF5 link when requested
-            if not dereference_links:
-                lnk = h5f.get(h5name, getlink=True)
-                if is_link(lnk):
-                    ddict[key] = lnk
-                    continue
 
-            try:
-                h5obj = h5f[h5name]
-            except KeyError as e:
-                if not isinstance(h5f.get(h5name, getlink=True), h5py.HardLink):
-                    _handle_error(
-                        errors,
-                        KeyError,
-                        'Cannot retrieve path "%s" (broken link)',
-                        h5name,
-                    )
-                else:
-                    _handle_error(errors, KeyError, ", ".join(e.args))
+def _iter_h5todict(
+    h5f,
+    group,
+    path,
+    file_reference,
+    exclude_names,
+    asarray,
+    dereference_links,
+    include_attributes,
+    errors,
+    proxy_size,
+):
+    """Implementation of :func:`iter_h5todict` for a group of an opened file
+
+    :param str path: Path of `group` in `h5f`, which can differ from
+        `group.name` when it is reached through an external link
+    """
+    group_name = path.rstrip("/")
+    if include_attributes:
+        attrs = H5pyAttributesReadWrapper(group.attrs)
+        for aname, avalue in attrs.items():
+            yield (group_name or "/", aname), avalue
+
+    for key in group:
+        if _name_contains_string_in_list(key, exclude_names):
+            continue
+        h5name = group_name + "/" + key
+        if not dereference_links:
+            lnk = h5f.get(h5name, getlink=True)
+            if is_link(lnk):
+                yield h5name, lnk
                 continue
 
-            if is_group(h5obj):
-                # Child is an HDF5 group
-                ddict[key] = h5todict(
-                    h5f,
+        try:
+            h5obj = h5f[h5name]
+        except KeyError as e:
+            if not isinstance(h5f.get(h5name, getlink=True), h5py.HardLink):
+                _handle_error(
+                    errors,
+                    KeyError,
+                    'Cannot retrieve path "%s" (broken link)',
                     h5name,
-                    exclude_names=exclude_names,
-                    asarray=asarray,
-                    dereference_links=dereference_links,
-                    include_attributes=include_attributes,
-                    errors=errors,
                 )
             else:
-                # Child is an HDF5 dataset
-                try:
-                    data = h5py_read_dataset(h5obj)
-                except OSError:
-                    _handle_error(
-                        errors, OSError, 'Cannot retrieve dataset "%s"', h5name
-                    )
-                else:
-                    if asarray:  # Convert HDF5 dataset to numpy array
-                        data = numpy.asarray(data)
-                    ddict[key] = data
-                    # Read the attributes of the child
-                    if include_attributes:
-                        attrs = H5pyAttributesReadWrapper(h5obj.attrs)
-                        for aname, avalue in attrs.items():
-                            ddict[(key, aname)] = avalue
-    return ddict
+                _handle_error(errors, KeyError, ", ".join(e.args))
+            continue
+
+        if is_group(h5obj):
+            yield from _iter_h5todict(
+                h5f,
+                h5obj,
+                h5name,
+                file_reference,
+                exclude_names=exclude_names,
+                asarray=asarray,
+                dereference_links=dereference_links,
+                include_attributes=include_attributes,
+                errors=errors,
+                proxy_size=proxy_size,
+            )
+            continue
+
+        if proxy_size is not None and _dataset_nbytes(h5obj) > proxy_size:
+            data = DatasetProxy(file_reference, h5name, h5obj.shape, h5obj.dtype)
+        else:
+            try:
+                data = _read_dataset_value(h5obj, asarray)
+            except OSError:
+                _handle_error(errors, OSError, 'Cannot retrieve dataset "%s"', h5name)
+                continue
+        yield h5name, data
+        if include_attributes:
+            attrs = H5pyAttributesReadWrapper(h5obj.attrs)
+            for aname, avalue in attrs.items():
+                yield (h5name, aname), avalue
 
 
 def dicttonx(treedict, h5file, h5path="/", add_nx_class=None, **kw):
@@ -32,15 +32,19 @@
 """
 
 import datetime
+import json
 import logging
 import numbers
 import os
 
+import fabio.edfimage
+import fabio.fabioutils
 import fabio.file_series
 import numpy
 
 from . import commonh5
 from silx import version as silx_version
+from silx.utils.concurrency import prefetch
 import silx.utils.number
 import h5py
 
@@ -50,6 +54,13 @@ _logger = logging.getLogger(__name__)
 
 _fabio_extensions = set([])
 
+DEFAULT_PREFETCH_WORKERS = 4
+"""Default number of threads used to read files of a file series in
+advance"""
+
+_METADATA_CACHE_VERSION = 1
+"""Version of the format of the metadata cache files"""
+
 
 def supported_extensions():
     """Returns all extensions supported by fabio.
@@ -76,9 +87,27 @@ def supported_extensions():
     return _fabio_extensions
 
 
+def _frame_location(frame_shape, ndim):
+    """Returns the location of a frame stored at the origin of a bigger
+    frame of `ndim` dimensions.
+
+    :param Tuple[int] frame_shape: Shape of the stored frame
+    :param int ndim: Number of dimensions of the bigger frame
+    :rtype: Tuple
+    """
+    location = [slice(0, i) for i in frame_shape]
+    while len(location) < ndim:
+        location.append(0)
+    return tuple(location)
+
+
 class FrameData(commonh5.LazyLoadableDataset):
     """Expose a cube of image from a Fabio file using `FabioReader` as
-    cache."""
+    cache.
+
+    Until the whole cube is requested (for example with `[()]`), indexing
+    along the first axis only reads the frames which are reached.
+    """
 
     def __init__(self, name, fabio_reader, parent=None):
         if fabio_reader.is_spectrum():
@@ -94,14 +123,11 @@ class FrameData(commonh5.LazyLoadableDataset):
         return self.__fabio_reader.get_data()
 
     def _update_cache(self):
-        if isinstance(self.__fabio_reader.fabio_file(), fabio.file_series.file_series):
-            # Reading all the files is taking too much time
-            # Reach the information from the only first frame
-            first_image = self.__fabio_reader.fabio_file().first_image()
-            self._dtype = first_image.data.dtype
-            shape0 = self.__fabio_reader.frame_count()
-            shape1, shape2 = first_image.data.shape
-            self._shape = shape0, shape1, shape2
+        info = self.__fabio_reader.get_data_info()
+        if info is not None:
+            # Reading all the frames is taking too much time
+            # Reach the information without reading the data
+            self._dtype, self._shape = info
         else:
             self._dtype = super(commonh5.LazyLoadableDataset, self).dtype
             self._shape = super(commonh5.LazyLoadableDataset, self).shape
@@ -118,22 +144,90 @@ class FrameData(commonh5.LazyLoadableDataset):
             self._update_cache()
         return self._shape
 
+    @property
+    def size(self):
+        return int(numpy.prod(self.shape, dtype=numpy.int64))
+
+    def __len__(self):
+        if len(self.shape) == 0:
+            raise TypeError("Attempt to take len() of scalar dataset")
+        return self.shape[0]
+
     def __iter__(self):
         for frame in self.__fabio_reader.iter_frames():
             yield frame.data
 
     def __getitem__(self, item):
-        # optimization for fetching a single frame if data not already loaded
+        # optimization for fetching frames if data not already loaded
         if not self._is_initialized:
-            if isinstance(item, int) and isinstance(
-                self.__fabio_reader.fabio_file(), fabio.file_series.file_series
-            ):
-                if item < 0:
-                    # negative indexing
-                    item += len(self)
-                return self.__fabio_reader.fabio_file().jump_image(item).data
+            data = self.__read_frames(item)
+            if data is not None:
+                return data
         return super(FrameData, self).__getitem__(item)
 
+    def __fit_frame(self, frame):
+        """Returns a frame fitted to the shape of the cube."""
+        frame_shape = self.shape[1:]
+        if frame.shape == frame_shape:
+            return frame
+        normalized_frame = numpy.zeros(frame_shape, dtype=frame.dtype)
+        normalized_frame[_frame_location(frame.shape, len(frame_shape))] = frame
+        return normalized_frame
+
+    def __read_frames(self, item):
+        """Read a selection by only reading the frames it reaches.
+
+        :returns: The selected data, or None if the selection can't be
+            processed frame by frame.
+        """
+        shape = self.shape
+        if self._is_initialized or len(shape) < 2:
+            # The shape was only reachable by loading the data
+            return None
+
+        if not isinstance(item, tuple):
+            item = (item,)
+        if len(item) == 0:
+            return None
+        selection, frame_selection = item[0], item[1:]
+        frame_count = shape[0]
+
+        if isinstance(selection, numbers.Integral) and not isinstance(
+            selection, (bool, numpy.bool_)
+        ):
+            index = int(selection)
+            if index < 0:
+                # negative indexing
+                index += frame_count
+            if not 0 <= index < frame_count:
+                raise IndexError(
+                    "Index (%d) out of range for axis 0 of size %d"
+                    % (selection, frame_count)
+                )
+            frame = self.__fit_frame(self.__fabio_reader.get_frame(index))
+            return numpy.array(frame[frame_selection], dtype=self.dtype)
+
+        if isinstance(selection, slice):
+            indices = range(*selection.indices(frame_count))
+        elif isinstance(selection, (list, numpy.ndarray)):
+            indices = numpy.asarray(selection)
+            if indices.ndim != 1 or indices.dtype.kind not in "iu":
+                return None
+            indices = numpy.where(indices < 0, indices + frame_count, indices)
+            if numpy.any((indices < 0) | (indices >= frame_count)):
+                raise IndexError("Index out of range for axis 0")
+        else:
+            return None
+
+        # Compute the shape of the selection without allocating a frame
+        empty_frame = numpy.broadcast_to(numpy.zeros((), self.dtype), shape[1:])
+        selection_shape = empty_frame[frame_selection].shape
+        data = numpy.empty((len(indices),) + selection_shape, dtype=self.dtype)
+        frames = self.__fabio_reader.iter_frame_data([int(i) for i in indices])
+        for i, frame in enumerate(frames):
+            data[i] = self.__fit_frame(frame)[frame_selection]
+        return data
+
 
 class RawHeaderData(commonh5.LazyLoadableDataset):
     """Lazy loadable raw header"""
@@ -323,28 +417,48 @@ class FabioReader(object):
     COUNTER = 1
     POSITIONER = 2
 
-    def __init__(self, file_name=None, fabio_image=None, file_series=None):
+    def __init__(
+        self,
+        file_name=None,
+        fabio_image=None,
+        file_series=None,
+        prefetch_workers=None,
+        metadata_cache=None,
+    ):
         """
         Constructor
 
+        The metadata of the frames are only read when they are requested
+        for the first time.
+
         :param str file_name: File name of the image file to read
         :param fabio.fabioimage.FabioImage fabio_image: An already openned
             :class:`fabio.fabioimage.FabioImage` instance.
         :param Union[list[str],fabio.file_series.file_series] file_series: An
             list of file name or a :class:`fabio.file_series.file_series`
             instance
+        :param Union[int,None] prefetch_workers: Number of threads used to
+            read the files of a file series in advance. If 0 or 1, the files
+            are read sequentially. Default: :data:`DEFAULT_PREFETCH_WORKERS`
+        :param Union[str,None] metadata_cache: Name of a file used to cache
+            the parsed metadata. It is used instead of reading the headers if
+            it is up-to-date with the image files, else it is (re)written.
         """
         self.__at_least_32bits = False
         self.__signed_type = False
+        if prefetch_workers is None:
+            prefetch_workers = DEFAULT_PREFETCH_WORKERS
+        self.__prefetch_workers = prefetch_workers
+        self.__metadata_cache = metadata_cache
 
         self.__load(file_name, fabio_image, file_series)
         self.__counters = {}
         self.__positioners = {}
         self.__measurements = {}
+        self.__metadata_loaded = False
         self.__key_filters = set([])
         self.__data = None
         self.__frame_count = self.frame_count()
-        self._read()
 
     def __load(self, file_name=None, fabio_image=None, file_series=None):
         if file_name is not None and fabio_image:
@@ -407,10 +521,35 @@ class FabioReader(object):
         """Iter all the available frames.
 
         A frame provides at least `data` and `header` attributes.
+
+        The files of a file series are read in advance using a pool of
+        threads.
+        """
+        return self._iter_frames(load_data=True)
+
+    def _iter_frames(self, load_data):
+        """Iter all the available frames.
+
+        :param bool load_data: If true, the data of the files of a file
+            series are decoded in advance, else only the headers are read
         """
         if isinstance(self.__fabio_file, fabio.file_series.file_series):
-            for file_number in range(len(self.__fabio_file)):
-                with self.__fabio_file.jump_image(file_number) as fabio_image:
+
+            def open_image(filename):
+                fabio_image = fabio.open(filename)
+                if load_data:
+                    # decode the data in the thread
+                    fabio_image.data
+                return fabio_image
+
+            images = prefetch(
+                open_image,
+                list(self.__fabio_file),
+                max_workers=self.__prefetch_workers,
+                discard=lambda fabio_image: fabio_image.close(),
+            )
+            for fabio_image in images:
+                with fabio_image:
                     # return the first frame only
                     assert fabio_image.nframes == 1
                     yield fabio_image
@@ -423,6 +562,66 @@ class FabioReader(object):
         else:
             raise TypeError("Unsupported type %s", self.__fabio_file.__class__)
 
+    def iter_frame_data(self, indices=None):
+        """Iter the data of frames.
+
+        The files of a file series are read in advance using a pool of
+        threads.
+
+        :param Union[List[int],None] indices: Indices of the frames to read,
+            default to all the frames
+        :rtype: Iterator[numpy.ndarray]
+        """
+        if indices is None:
+            indices = range(self.__frame_count)
+        if isinstance(self.__fabio_file, fabio.file_series.file_series):
+            return prefetch(
+                self.get_frame, indices, max_workers=self.__prefetch_workers
+            )
+        return map(self.get_frame, indices)
+
+    def get_frame(self, frame_index):
+        """Returns the data of a single frame without reading the others.
+
+        :param int frame_index: Index of the frame
+        :rtype: numpy.ndarray
+        """
+        if isinstance(self.__fabio_file, fabio.file_series.file_series):
+            # Avoid jump_image which is not thread-safe
+            with fabio.open(self.__fabio_file[frame_index]) as fabio_image:
+                return self._get_frame_data(fabio_image, 0)
+        elif isinstance(self.__fabio_file, fabio.fabioimage.FabioImage):
+            return self._get_frame_data(self.__fabio_file, frame_index)
+        else:
+            raise TypeError("Unsupported type %s", self.__fabio_file.__class__)
+
+    def _get_frame_data(self, fabio_image, frame_index):
+        """Read the data of a frame from a fabio image.
+
+        :param fabio.fabioimage.FabioImage fabio_image: The image container
+        :param int frame_index: Index of the frame in this container
+        :rtype: numpy.ndarray
+        """
+        if fabio_image.nframes == 1:
+            return fabio_image.data
+        return fabio_image.getframe(frame_index).data
+
+    def get_data_info(self):
+        """Returns the dtype and the shape of the cube provided by
+        :meth:`get_data` without reading the data of the frames.
+
+        :returns: A tuple containing the dtype and the shape, else None if
+            this information can't be reached without reading the data
+        :rtype: Union[Tuple[numpy.dtype,Tuple[int]],None]
+        """
+        if isinstance(self.__fabio_file, fabio.file_series.file_series):
+            # Reading all the files is taking too much time
+            # Reach the information from the only first frame
+            first_image = self.__fabio_file.first_image()
+            dtype = first_image.data.dtype
+            return dtype, (self.__frame_count,) + first_image.data.shape
+        return None
+
     def _create_data(self):
         """Initialize hold data by merging all frames into a single cube.
 
@@ -431,14 +630,27 @@ class FabioReader(object):
 
         The computation is cached into the class, and only done ones.
         """
+        if self.__frame_count == 1:
+            # returns the data without extra dim in case of single frame
+            data = self.get_frame(0)
+            if not data.dtype.isnative:
+                data = data.astype(data.dtype.newbyteorder("="))
+            return data
+
+        info = self.get_data_info()
+        if info is not None:
+            # Fill the cube frame by frame to avoid an intermediate copy
+            dtype, shape = info
+            data = numpy.zeros(shape, dtype=dtype)
+            for index, image in enumerate(self.iter_frame_data()):
+                location = _frame_location(image.shape, len(shape) - 1)
+                data[(index,) + location] = image
+            return data
+
         images = []
         for fabio_frame in self.iter_frames():
             images.append(fabio_frame.data)
 
-        # returns the data without extra dim in case of single frame
-        if len(images) == 1:
-            return images[0]
-
         # get the max size
         max_dim = max([i.ndim for i in images])
         max_shape = [0] * max_dim
@@ -452,11 +664,8 @@ class FabioReader(object):
         for index, image in enumerate(images):
             if image.shape == max_shape:
                 continue
-            location = [slice(0, i) for i in image.shape]
-            while len(location) < max_dim:
-                location.append(0)
             normalized_image = numpy.zeros(max_shape, dtype=image.dtype)
-            normalized_image[tuple(location)] = image
+            normalized_image[_frame_location(image.shape, max_dim)] = image
             images[index] = normalized_image
 
         # create a cube
@@ -464,6 +673,8 @@ class FabioReader(object):
 
     def __get_dict(self, kind):
         """Returns a dictionary from according to an expected kind"""
+        if not self.__metadata_loaded:
+            self.__load_metadata()
         if kind == self.DEFAULT:
             return self.__measurements
         elif kind == self.COUNTER:
@@ -534,6 +745,102 @@ class FabioReader(object):
             for key in fabio_file.RESERVED_HEADER_KEYS:
                 self.__key_filters.add(key.lower())
 
+    def __load_metadata(self):
+        """Read the metadata of all the frames, or load them from the cache
+        file if it is up-to-date."""
+        self.__metadata_loaded = True
+        if self.__metadata_cache is None:
+            self._read()
+        elif not self.__load_metadata_cache():
+            self._read()
+            self.__save_metadata_cache()
+
+    def __metadata_signature(self):
+        """Returns a string identifying the image files and this reader,
+        used to check that a metadata cache is up-to-date.
+
+        :rtype: str
+        """
+        if isinstance(self.__fabio_file, fabio.file_series.file_series):
+            filenames = list(self.__fabio_file)
+        else:
+            filenames = [self.__fabio_file.filename]
+        files = []
+        for filename in filenames:
+            stat = os.stat(filename)
+            files.append([os.path.abspath(filename), stat.st_mtime_ns, stat.st_size])
+        signature = {
+            "version": _METADATA_CACHE_VERSION,
+            "reader": type(self).__name__,
+            "files": files,
+        }
+        return json.dumps(signature)
+
+    def __load_metadata_cache(self):
+        """Load the metadata from the cache file.
+
+        :returns: True if the metadata was loaded, False if the cache does not
+            exist or is outdated
+        :rtype: bool
+        """
+        filename = self.__metadata_cache
+        if not os.path.exists(filename):
+            return False
+        try:
+            signature = self.__metadata_signature()
+            with numpy.load(filename, allow_pickle=False) as cache:
+                if str(cache["signature"]) != signature:
+                    _logger.debug("Metadata cache %s is outdated", filename)
+                    return False
+                keys = zip(cache["kinds"], cache["names"])
+                for index, (kind, name) in enumerate(keys):
+                    value = cache["value_%d" % index]
+                    self.__get_dict(int(kind))[str(name)] = value
+        except Exception as e:
+            _logger.warning("Error while reading metadata cache %s: %s", filename, e)
+            _logger.debug("Backtrace", exc_info=True)
+            self.__counters.clear()
+            self.__positioners.clear()
+            self.__measurements.clear()
+            return False
+        return True
+
+    def __save_metadata_cache(self):
+        """Save the metadata into the cache file.
+
+        All the metadata are converted to numpy arrays first.
+        """
+        filename = self.__metadata_cache
+        try:
+            arrays = {"signature": numpy.array(self.__metadata_signature())}
+        except OSError:
+            # Not a file from the file system
+            _logger.debug("Backtrace", exc_info=True)
+            return
+        kinds, names = [], []
+        for kind in (self.DEFAULT, self.COUNTER, self.POSITIONER):
+            for name in list(self.get_keys(kind)):
+                value = self.get_value(kind, name)
+                if value.dtype.hasobject:
+                    _logger.debug("Metadata %s can't be cached", name)
+                    return
+                arrays["value_%d" % len(names)] = value
+                kinds.append(kind)
+                names.append(name)
+        arrays["kinds"] = numpy.array(kinds, dtype=numpy.int8)
+        arrays["names"] = numpy.array(names, dtype=str)
+
+        tmp_filename = "%s.%d.tmp" % (filename, os.getpid())
+        try:
+            with open(tmp_filename, "wb") as f:
+                numpy.savez(f, **arrays)
+            os.replace(tmp_filename, filename)
+        except OSError as e:
+            _logger.warning("Error while writing metadata cache %s: %s", filename, e)
+            _logger.debug("Backtrace", exc_info=True)
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
+
     def _read(self):
         """Read all metadata from the fabio file and store it into this
         object."""
@@ -542,7 +849,7 @@ class FabioReader(object):
         if not file_series:
             self._enable_key_filters(self.__fabio_file)
 
-        for frame_id, fabio_frame in enumerate(self.iter_frames()):
+        for frame_id, fabio_frame in enumerate(self._iter_frames(load_data=False)):
             if file_series:
                 self._enable_key_filters(fabio_frame)
             self._read_frame(frame_id, fabio_frame.header)
@@ -595,6 +902,10 @@ class FabioReader(object):
     def _convert_metadata_vector(self, values):
         """Convert a list of numpy data into a numpy array with the better
         fitting type."""
+        result = self._convert_numerical_vector(values)
+        if result is not None:
+            return result
+
         converted = []
         types = set([])
         has_none = False
@@ -665,6 +976,35 @@ class FabioReader(object):
                 return numpy.array(values, dtype=result_type)
         return numpy.array(result, dtype=result_type)
 
+    def _convert_numerical_vector(self, values):
+        """Convert a list of strings representing numerical scalars into a
+        numpy array, all at once.
+
+        It provides the same result as the generic conversion, but the types
+        are checked on all the values together.
+
+        :returns: The converted array, else None if the values are not all
+            numerical scalar strings
+        :rtype: Union[numpy.ndarray,None]
+        """
+        if len(values) == 0:
+            return None
+        for value in values:
+            if not isinstance(value, str) or " " in value:
+                return None
+        try:
+            types = silx.utils.number.min_numerical_convertible_types(values)
+        except ValueError:
+            return None
+
+        dtypes = [numpy.dtype(t) for t in types]
+        result_type = self._normalize_vector_type(numpy.result_type(*dtypes))
+        if len(dtypes) > 1 and len(values) > 1:
+            # Catch numerical precision
+            return numpy.array(values, dtype=result_type)
+        # Like the conversion of each value, then the normalization
+        return numpy.array(values, dtype=dtypes[0]).astype(result_type)
+
     def _convert_value(self, value):
         """Convert a string into a numpy object (scalar or array).
 
@@ -771,8 +1111,17 @@ class EdfFabioReader(FabioReader):
     motor_mne are parsed using a special way.
     """
 
-    def __init__(self, file_name=None, fabio_image=None, file_series=None):
-        FabioReader.__init__(self, file_name, fabio_image, file_series)
+    def __init__(
+        self,
+        file_name=None,
+        fabio_image=None,
+        file_series=None,
+        prefetch_workers=None,
+        metadata_cache=None,
+    ):
+        FabioReader.__init__(
+            self, file_name, fabio_image, file_series, prefetch_workers, metadata_cache
+        )
         self.__unit_cell_abc = None
         self.__unit_cell_alphabetagamma = None
         self.__ub_matrix = None
@@ -835,6 +1184,69 @@ class EdfFabioReader(FabioReader):
             else:
                 raise Exception("State unexpected (base_key: %s)" % base_key)
 
+    def _get_frame_data(self, fabio_image, frame_index):
+        """Overwrite the method to memory-map uncompressed frames."""
+        data = self._memmap_frame(fabio_image, frame_index)
+        if data is not None:
+            return data
+        return FabioReader._get_frame_data(self, fabio_image, frame_index)
+
+    def _memmap_frame(self, fabio_image, frame_index):
+        """Returns a copy-on-write memory-map of an uncompressed EDF frame.
+
+        The returned array is writable: modifications are kept in memory and
+        are not written to the file.
+        It uses the byte order of the file.
+
+        :returns: A `numpy.memmap`, else None if the frame can't be mapped
+            (data already loaded, compressed or external data block,
+            compressed file...)
+        """
+        if not isinstance(fabio_image, fabio.edfimage.EdfImage):
+            return None
+        try:
+            frame = fabio_image.get_frame(frame_index)
+            if frame._data is not None:
+                # Already in memory
+                return None
+            if frame._data_compression is not None or frame.bfname is not None:
+                return None
+            if frame.start is None or type(frame.file) is not fabio.fabioutils.File:
+                # Compressed or in-memory file
+                return None
+            filename = frame.file.name
+            shape = tuple(frame.shape)
+            dtype = numpy.dtype(frame.dtype)
+            if frame.swap_needed():
+                dtype = dtype.newbyteorder()
+            size = dtype.itemsize * int(numpy.prod(shape, dtype=numpy.int64))
+            if frame.blobsize is None or frame.blobsize < size:
+                return None
+            if os.path.getsize(filename) < frame.start + size:
+                # Incomplete file
+                return None
+            return numpy.memmap(
+                filename, dtype=dtype, mode="c", offset=frame.start, shape=shape
+            )
+        except (AttributeError, TypeError, ValueError, OSError):
+            _logger.debug("Backtrace", exc_info=True)
+            return None
+
+    def get_data_info(self):
+        """Overwrite the method to read the shape and the dtype of multi-frame
+        images from the EDF headers."""
+        fabio_file = self.fabio_file()
+        if isinstance(fabio_file, fabio.edfimage.EdfImage) and fabio_file.nframes > 1:
+            frames = [fabio_file.get_frame(i) for i in range(fabio_file.nframes)]
+            dtype = numpy.result_type(*[f.dtype for f in frames])
+            max_dim = max([len(f.shape) for f in frames])
+            max_shape = [0] * max_dim
+            for frame in frames:
+                for dim, size in enumerate(frame.shape):
+                    max_shape[dim] = max(max_shape[dim], size)
+            return dtype, (len(frames),) + tuple(max_shape)
+        return FabioReader.get_data_info(self)
+
     def _get_first_header(self):
         """
         ..note:: This function can be cached
@@ -935,7 +1347,14 @@ class EdfFabioReader(FabioReader):
 class File(commonh5.File):
     """Class which handle a fabio image as a mimick of a h5py.File."""
 
-    def __init__(self, file_name=None, fabio_image=None, file_series=None):
+    def __init__(
+        self,
+        file_name=None,
+        fabio_image=None,
+        file_series=None,
+        prefetch_workers=None,
+        metadata_cache=None,
+    ):
         """
         Constructor
 
@@ -945,9 +1364,19 @@ class File(commonh5.File):
         :param Union[list[str],fabio.file_series.file_series] file_series: An
             list of file name or a :class:`fabio.file_series.file_series`
             instance
+        :param Union[int,None] prefetch_workers: Number of threads used to
+            read the files of a file series in advance. If 0 or 1, the files
+            are read sequentially. Default: :data:`DEFAULT_PREFETCH_WORKERS`
+        :param Union[str,None] metadata_cache: Name of a file used to cache
+            the metadata parsed from the headers, making the next opening of
+            the same images faster.
         """
         self.__fabio_reader = self.create_fabio_reader(
-            file_name, fabio_image, file_series
+            file_name,
+            fabio_image,
+            file_series,
+            prefetch_workers=prefetch_workers,
+            metadata_cache=metadata_cache,
         )
         if fabio_image is not None:
             file_name = fabio_image.filename
@@ -1005,7 +1434,14 @@ class File(commonh5.File):
 
         return scan
 
-    def create_fabio_reader(self, file_name, fabio_image, file_series):
+    def create_fabio_reader(
+        self,
+        file_name,
+        fabio_image,
+        file_series,
+        prefetch_workers=None,
+        metadata_cache=None,
+    ):
         """Factory to create fabio reader.
 
         :rtype: FabioReader"""
@@ -1038,9 +1474,16 @@ class File(commonh5.File):
             assert False
 
         if use_edf_reader:
-            reader = EdfFabioReader(file_name, fabio_image, file_series)
+            reader_class = EdfFabioReader
         else:
-            reader = FabioReader(file_name, fabio_image, file_series)
+            reader_class = FabioReader
+        reader = reader_class(
+            file_name,
+            fabio_image,
+            file_series,
+            prefetch_workers=prefetch_workers,
+            metadata_cache=metadata_cache,
+        )
         return reader
 
     def close(self):
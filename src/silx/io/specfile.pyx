@@ -73,6 +73,15 @@ provided by :class:`Scan`::
     for mca_data in first_scan.mca:
         print(sum(mca_data))
 
+Opening a large SPEC file requires parsing it entirely to locate its scans.
+This index can be stored in a file, so that reopening the SPEC file only
+requires to parse the scans appended since then::
+
+    sf = SpecFile("test.dat", index_filename="/tmp/test.dat.idx")
+
+The index can be stored by default in a directory with
+:attr:`silx.config.DEFAULT_SPECFILE_INDEX_DIRECTORY`.
+
 Classes
 =======
 
@@ -106,15 +115,19 @@ __authors__ = ["P. Knobel"]
 __license__ = "MIT"
 __date__ = "11/08/2017"
 
+import hashlib
 import os.path
 import logging
 import numpy
 import re
 
+import silx
+
 _logger = logging.getLogger(__name__)
 
 cimport cython
 from libc.stdlib cimport free
+from libc.string cimport memcpy
 
 cimport silx.io.specfile_wrapper as specfile_wrapper
 
@@ -122,6 +135,7 @@ cimport silx.io.specfile_wrapper as specfile_wrapper
 SF_ERR_NO_ERRORS = 0
 SF_ERR_FILE_OPEN = 2
 SF_ERR_SCAN_NOT_FOUND = 7
+SF_ERR_COL_NOT_FOUND = 14
 
 
 # custom errors
@@ -268,14 +282,24 @@ class MCA(object):
         return self._scan._specfile.number_of_mca(self._scan.index)
 
     def __getitem__(self, key):
-        """Return a single MCA data line
+        """Return a single MCA data line, or several MCA data lines if
+        `key` is a slice.
 
-        :param key: 0-based index of MCA within Scan
-        :type key: int
+        All the spectra of a slice are parsed in a single pass over the
+        scan, see :meth:`SpecFile.get_mca_block`.
 
-        :return: Single MCA
-        :rtype: 1D numpy array
+        :param key: 0-based index of MCA within Scan, or slice of indices
+        :type key: int or slice
+
+        :return: Single MCA, or 2D array with one MCA per row
+        :rtype: 1D or 2D numpy array
         """
+        if isinstance(key, slice):
+            return self._scan._specfile.get_mca_block(self._scan.index,
+                                                      key.start,
+                                                      key.stop,
+                                                      key.step)
+
         if not len(self):
             raise IndexError("No MCA spectrum found in this scan")
 
@@ -400,6 +424,7 @@ class Scan(object):
         self._motor_positions = self._specfile.motor_positions(self._index)
 
         self._data = None
+        self._data_shape = None
         self._mca = None
 
     @cython.embedsignature(False)
@@ -497,6 +522,21 @@ class Scan(object):
 
         return self._data
 
+    @cython.embedsignature(False)
+    @property
+    def data_shape(self):
+        """Shape of :attr:`data`, reached without converting the values
+        of the data lines.
+
+        :rtype: Tuple[int,int]
+        """
+        if self._data is not None:
+            return self._data.shape
+        if self._data_shape is None:
+            nlines, ncolumns = self._specfile.data_shape(self._index)
+            self._data_shape = ncolumns, nlines
+        return self._data_shape
+
     @cython.embedsignature(False)
     @property
     def mca(self):
@@ -575,7 +615,7 @@ class Scan(object):
         :rtype: numpy.ndarray
         """
         try:
-            ret = self._specfile.data_column_by_name(self._index, label)
+            ret = self.data_columns([label])[0]
         except SfErrLineNotFound:
             # Could be a "#C Scan aborted after 0 points"
             _logger.warning("Cannot get data column %s in scan %d.%d",
@@ -583,6 +623,45 @@ class Scan(object):
             ret = numpy.empty((0, ), numpy.double)
         return ret
 
+    def data_columns(self, columns, start=None, stop=None, dtype=numpy.double):
+        """Returns some data columns of this scan.
+
+        Only the values of the requested columns of the requested lines
+        are parsed from the file, unless :attr:`data` is already loaded.
+
+        :param columns: Indices of the columns (starting with 0) or labels
+            of the columns, as defined on the ``#L`` line of the scan header.
+        :type columns: List[Union[int,str]]
+        :param start: Index of the first data line
+        :param stop: Index of the data line after the last one
+        :param dtype: Type of the returned array, ``numpy.float64`` or
+            ``numpy.float32``
+        :return: Data as a 2D array with one row per requested column, like
+            :attr:`data`
+        :rtype: numpy.ndarray
+        """
+        indices = []
+        for column in columns:
+            if isinstance(column, str):
+                if column not in self.labels:
+                    raise SfErrColNotFound(
+                        "Column %s not found in scan %d.%d" %
+                        (column, self.number, self.order))
+                column = self.labels.index(column)
+            indices.append(column)
+
+        if self._data is not None:
+            data = self._data[:, slice(start, stop)]
+            try:
+                data = data[indices]
+            except IndexError:
+                raise SfErrColNotFound(
+                    "Column not found in scan %d.%d" % (self.number, self.order))
+            return numpy.asarray(data, dtype=dtype)
+
+        return numpy.transpose(self._specfile.data_columns(
+            self._index, indices, start, stop, dtype))
+
     def motor_position_by_name(self, name):
         """Returns the position for a given motor
 
@@ -624,10 +703,109 @@ def is_specfile(filename):
     return False
 
 
+_INDEX_MAGIC = b"SILX_SPECFILE_INDEX_1\n"
+
+
+def default_index_filename(filename):
+    """Returns the name of the index file used by default by
+    :class:`SpecFile` for a SPEC file.
+
+    The index is stored in the directory defined by
+    :attr:`silx.config.DEFAULT_SPECFILE_INDEX_DIRECTORY`.
+
+    :param str filename: Path of the SPEC file
+    :return: Path of the index file, or None if no directory is defined
+    :rtype: Union[str,None]
+    """
+    directory = silx.config.DEFAULT_SPECFILE_INDEX_DIRECTORY
+    if directory is None:
+        return None
+    if isinstance(filename, bytes):
+        filename = filename.decode()
+    key = hashlib.sha1(os.path.abspath(filename).encode("utf-8")).hexdigest()
+    return os.path.join(directory, key + ".sfidx")
+
+
+def _read_index(index_filename, filename):
+    """Read an index file written by :func:`_write_index`.
+
+    :return: Tuple (cursor, scans, resume) where cursor and scans are the
+        raw records of the C library and resume is True if the SPEC file has
+        grown since it was indexed; None if the index can't be used.
+    """
+    try:
+        with open(index_filename, "rb") as f:
+            content = f.read()
+    except OSError:
+        return None
+    if not content.startswith(_INDEX_MAGIC):
+        return None
+    content = content[len(_INDEX_MAGIC):]
+
+    header_size = 6 * 8
+    header = numpy.frombuffer(content[:header_size], dtype="<i8")
+    if len(header) != 6:
+        return None
+    cursor_size, scan_size, nbytes, mtime_ns, no_scans, last_offset = header
+    if (cursor_size != sizeof(specfile_wrapper.SfCursor) or
+            scan_size != sizeof(specfile_wrapper.SpecScan)):
+        # Index written on another platform
+        return None
+    if len(content) != header_size + cursor_size + no_scans * scan_size:
+        return None
+
+    stat = os.stat(filename)
+    if stat.st_size < nbytes:
+        # The file was truncated or rewritten
+        return None
+    if stat.st_size == nbytes:
+        if stat.st_mtime_ns != mtime_ns:
+            # The file was rewritten
+            return None
+        resume = False
+    else:
+        # The file has grown: check the last indexed scan is still there
+        with open(filename, "rb") as f:
+            f.seek(last_offset)
+            if not f.read(3) == b"#S ":
+                return None
+        resume = True
+
+    cursor = content[header_size:header_size + cursor_size]
+    scans = content[header_size + cursor_size:]
+    return cursor, scans, resume
+
+
+def _write_index(index_filename, bytes cursor, bytes scans, long no_scans,
+                 long nbytes, long mtime_ns, long last_offset):
+    """Write the raw records of the index of a SPEC file.
+
+    The file is written atomically.
+    """
+    header = numpy.array([sizeof(specfile_wrapper.SfCursor),
+                          sizeof(specfile_wrapper.SpecScan),
+                          nbytes, mtime_ns, no_scans, last_offset],
+                         dtype="<i8")
+    directory = os.path.dirname(os.path.abspath(index_filename))
+    os.makedirs(directory, exist_ok=True)
+    tmp_filename = "%s.%d.tmp" % (index_filename, os.getpid())
+    with open(tmp_filename, "wb") as f:
+        f.write(_INDEX_MAGIC)
+        f.write(header.tobytes())
+        f.write(cursor)
+        f.write(scans)
+    os.replace(tmp_filename, index_filename)
+
+
 cdef class SpecFile(object):
     """
 
     :param filename: Path of the SpecFile to read
+    :param index_filename: Path of a file used to store the index of the
+        scans of the SpecFile. If the SpecFile was indexed before, only the
+        content appended since then is parsed. By default, the index is
+        stored in :attr:`silx.config.DEFAULT_SPECFILE_INDEX_DIRECTORY` if
+        defined, else it is not stored.
 
     This class wraps the main data and header access functions of the C
     SpecFile library.
@@ -637,21 +815,83 @@ cdef class SpecFile(object):
         specfile_wrapper.SpecFileHandle *handle
         str filename
 
-    def __cinit__(self, filename):
+    def __cinit__(self, filename, index_filename=None):
         cdef int error = 0
         self.handle = NULL
 
         if is_specfile(filename):
+            if index_filename is None:
+                index_filename = default_index_filename(filename)
             filename = _string_to_char_star(filename)
-            self.handle = specfile_wrapper.SfOpen(filename, &error)
-            if error:
-                self._handle_error(error)
+            if index_filename is not None:
+                self.handle = self._open_indexed(filename, index_filename)
+            else:
+                self.handle = specfile_wrapper.SfOpen(filename, &error)
+                if error:
+                    self._handle_error(error)
         else:
             # handle_error takes care of raising the correct error,
             # this causes the destructor to be called
             self._handle_error(SF_ERR_FILE_OPEN)
 
-    def __init__(self, filename):
+    cdef specfile_wrapper.SpecFileHandle* _open_indexed(self, bytes filename,
+                                                        index_filename):
+        """Open the file using an index file, and update this index."""
+        cdef:
+            int error = 0
+            long no_scans
+            short resume = 0
+            specfile_wrapper.SfCursor cursor
+            specfile_wrapper.SpecScan *scans = NULL
+            specfile_wrapper.SpecFileHandle *handle = NULL
+            bytes index_scans
+
+        mtime_ns = os.stat(filename).st_mtime_ns
+        try:
+            index = _read_index(index_filename, filename)
+        except Exception:
+            _logger.debug("Backtrace", exc_info=True)
+            index = None
+
+        if index is None:
+            handle = specfile_wrapper.SfOpen(filename, &error)
+        else:
+            index_cursor, index_scans, resume = index
+            memcpy(&cursor, <char*> index_cursor, sizeof(cursor))
+            no_scans = len(index_scans) // sizeof(specfile_wrapper.SpecScan)
+            handle = specfile_wrapper.SfOpenIndexed(
+                filename, &cursor, <specfile_wrapper.SpecScan*> (<char*> index_scans),
+                no_scans, resume, &error)
+        if error:
+            if handle:
+                specfile_wrapper.SfClose(handle)
+            self._handle_error(error)
+        if index is not None and not resume:
+            # The index is up to date
+            return handle
+
+        no_scans = specfile_wrapper.SfGetIndex(handle, &cursor, &scans, &error)
+        if no_scans < 0:
+            _logger.warning("Error while retrieving the index of %s", filename)
+            return handle
+        try:
+            raw_cursor = (<char*> &cursor)[:sizeof(cursor)]
+            raw_scans = b""
+            last_offset = -1
+            if no_scans > 0:
+                raw_scans = (<char*> scans)[:no_scans * sizeof(specfile_wrapper.SpecScan)]
+                last_offset = scans[no_scans - 1].offset
+            # cursor.bytecnt is the number of bytes parsed
+            _write_index(index_filename, raw_cursor, raw_scans, no_scans,
+                         cursor.bytecnt, mtime_ns, last_offset)
+        except Exception:
+            _logger.warning("Cannot write SpecFile index %s", index_filename)
+            _logger.debug("Backtrace", exc_info=True)
+        finally:
+            free(scans)
+        return handle
+
+    def __init__(self, filename, index_filename=None):
         if not isinstance(filename, str):
             # decode bytes to str in python 3, str to unicode in python 2
             self.filename = filename.decode()
@@ -906,6 +1146,8 @@ cdef class SpecFile(object):
     def data_column_by_name(self, scan_index, label):
         """Returns data column for the specified scan index and column label.
 
+        Only this column is parsed from the data lines of the scan.
+
         :param scan_index: Unique scan index between ``0`` and
             ``len(self)-1``.
         :type scan_index: int
@@ -916,34 +1158,132 @@ cdef class SpecFile(object):
         :return: Data column as a 1D array of doubles
         :rtype: numpy.ndarray
         """
+        return self.data_columns(scan_index, [label])[:, 0]
+
+    def data_shape(self, scan_index):
+        """Returns the shape of the data of the specified scan index,
+        without converting the values of the data lines.
+
+        :param scan_index: Unique scan index between ``0`` and
+            ``len(self)-1``.
+        :type scan_index: int
+
+        :return: Number of data lines and number of columns, as the
+            shape of the array returned by :meth:`data`
+        :rtype: Tuple[int,int]
+        """
         cdef:
-            double* data_column
-            long i, nlines
             int error = SF_ERR_NO_ERRORS
-            double[:] ret_array
-
-        label = _string_to_char_star(label)
+            long nlines
+            long ncolumns = 0
 
-        nlines = specfile_wrapper.SfDataColByName(self.handle,
-                                                  scan_index + 1,
-                                                  label,
-                                                  &data_column,
-                                                  &error)
+        nlines = specfile_wrapper.SfDataColumns(self.handle,
+                                                scan_index + 1,
+                                                NULL, 0, 0, -1, NULL, 0,
+                                                &ncolumns,
+                                                &error)
         self._handle_error(error)
-
         if nlines == -1:
-            # this can happen on empty scans in some situations (see #1759)
-            _logger.warning("SfDataColByName returned -1 without an error."
+            # this can happen on empty scans (see #1759)
+            _logger.warning("SfDataColumns returned -1 without an error."
                             " Assuming aborted scan.")
-            nlines = 0
+        if nlines <= 0:
+            return 0, 0
+        return nlines, ncolumns
 
-        ret_array = numpy.empty((nlines,), dtype=numpy.double)
+    def data_columns(self, scan_index, columns, start=None, stop=None,
+                     dtype=numpy.double):
+        """Returns some data columns of the specified scan index.
 
-        for i in range(nlines):
-            ret_array[i] = data_column[i]
+        Only the values of the requested columns of the requested lines
+        are parsed, directly into the returned array. The lines after the
+        last requested one are not parsed at all.
 
-        free(data_column)
-        return numpy.asarray(ret_array)
+        :param scan_index: Unique scan index between ``0`` and
+            ``len(self)-1``.
+        :type scan_index: int
+        :param columns: Indices of the columns (starting with 0) or labels
+            of the columns, as defined in the ``#L`` line of the scan header.
+        :type columns: List[Union[int,str]]
+        :param start: Index of the first data line
+        :param stop: Index of the data line after the last one
+        :param dtype: Type of the returned array, ``numpy.float64`` or
+            ``numpy.float32``
+        :return: Data as a 2D array with one row per data line and one
+            column per requested column, like the array returned by
+            :meth:`data`
+        :rtype: numpy.ndarray
+        :raise SfErrColNotFound: if a column does not exist
+        """
+        cdef:
+            int error = SF_ERR_NO_ERRORS
+            long ncolumns = 0
+            long nlines, nread
+            long[::1] column_indices
+            double[:, ::1] double_array
+            float[:, ::1] float_array
+            void *buffer = NULL
+
+        dtype = numpy.dtype(dtype)
+        if dtype not in (numpy.dtype(numpy.float64), numpy.dtype(numpy.float32)):
+            raise TypeError("Unsupported dtype %s" % dtype)
+
+        indices = []
+        labels = None
+        for column in columns:
+            if isinstance(column, str):
+                if labels is None:
+                    labels = self.labels(scan_index)
+                if column not in labels:
+                    self._handle_error(SF_ERR_COL_NOT_FOUND)
+                column = labels.index(column)
+            indices.append(int(column))
+
+        need_shape = any(index < 0 for index in indices)
+        if start is None:
+            start = 0
+        need_shape |= start < 0 or stop is None or stop < 0
+        # Avoid allocating a huge buffer for a stop far beyond the data
+        need_shape |= not need_shape and stop - start > 65536
+        if need_shape:
+            nlines, ncolumns = self.data_shape(scan_index)
+            start, stop, _ = slice(start, stop).indices(nlines)
+            for i, index in enumerate(indices):
+                if index < 0:
+                    indices[i] = index + ncolumns
+        # Number of lines read, at most
+        nlines = max(0, stop - start)
+
+        if any(index < 0 for index in indices):
+            self._handle_error(SF_ERR_COL_NOT_FOUND)
+        column_indices = numpy.array(indices, dtype=numpy.dtype("l"))
+
+        result = numpy.empty((nlines, len(indices)), dtype=dtype)
+        if nlines == 0 or len(indices) == 0:
+            return result
+        if dtype == numpy.float32:
+            float_array = result
+            buffer = &float_array[0, 0]
+        else:
+            double_array = result
+            buffer = &double_array[0, 0]
+
+        nread = specfile_wrapper.SfDataColumns(self.handle,
+                                               scan_index + 1,
+                                               &column_indices[0],
+                                               len(indices),
+                                               start,
+                                               nlines,
+                                               buffer,
+                                               dtype == numpy.float32,
+                                               &ncolumns,
+                                               &error)
+        self._handle_error(error)
+        if nread == -1:
+            _logger.warning("SfDataColumns returned -1 without an error."
+                            " Assuming aborted scan.")
+            nread = 0
+        return result[:nread]
 
     def scan_header(self, scan_index):
         """Return list of scan header lines.
@@ -1264,3 +1604,61 @@ cdef class SpecFile(object):
 
         free(mca_data)
         return numpy.asarray(ret_array)
+
+    def get_mca_block(self, scan_index, start=None, stop=None, step=None):
+        """Return several MCA spectra of a scan as a 2D array.
+
+        The spectra are selected like a ``slice(start, stop, step)`` of
+        the MCA indices. They are parsed in a single pass over the scan
+        into a preallocated array, and the spectra which are not selected
+        are skipped without being parsed.
+
+        All the selected spectra must have the same length.
+
+        :param scan_index: Unique scan index between ``0`` and ``len(self)-1``.
+        :type scan_index: int
+        :param start: Index of the first MCA
+        :param stop: Index of the MCA after the last one
+        :param step: Step between two consecutive MCA
+        :return: MCA spectra, one per row
+        :rtype: 2D numpy array
+        :raise ValueError: if the spectra have different lengths
+        """
+        cdef:
+            int error = SF_ERR_NO_ERRORS
+            long count
+            long channels
+            long nread
+            double[:, ::1] ret_array
+
+        indices = range(*slice(start, stop, step).indices(
+            self.number_of_mca(scan_index)))
+        if len(indices) == 0:
+            return numpy.empty((0, 0), dtype=numpy.double)
+        if indices.step < 0:
+            # Read in increasing order and reverse
+            return self.get_mca_block(scan_index,
+                                      indices[-1],
+                                      indices[0] + 1,
+                                      -indices.step)[::-1]
+
+        count = len(indices)
+        channels = len(self.get_mca(scan_index, indices[0]))
+        ret_array = numpy.empty((count, channels), dtype=numpy.double)
+        if channels == 0:
+            return numpy.asarray(ret_array)
+
+        nread = specfile_wrapper.SfGetMcaBlock(self.handle,
+                                               scan_index + 1,
+                                               indices.start + 1,
+                                               indices.step,
+                                               count,
+                                               channels,
+                                               &ret_array[0, 0],
+                                               &error)
+        self._handle_error(error)
+        if nread != count:
+            raise ValueError(
+                "MCA %d does not have the same length as MCA %d (%d)" %
+                (indices[nread], indices[0], channels))
+        return numpy.asarray(ret_array)
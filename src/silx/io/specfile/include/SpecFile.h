@@ -173,6 +173,11 @@ typedef struct _SpecScan {
 DllExport extern    SpecFile  *SfOpen        ( char *name, int *error );
 DllExport extern    short      SfUpdate      ( SpecFile *sf,int *error );
 DllExport extern    int        SfClose       ( SpecFile *sf );
+DllExport extern    SpecFile  *SfOpenIndexed ( char *name, SfCursor *cursor,
+                                               SpecScan *scans, long no_scans,
+                                               short resume, int *error );
+DllExport extern    long       SfGetIndex    ( SpecFile *sf, SfCursor *cursor,
+                                               SpecScan **scans, int *error );
 
 /*
  * indexes
@@ -245,6 +250,10 @@ DllExport extern  long  SfDataCol       ( SpecFile *sf, long index, long col,
                                              double **data_col, int *error );
 DllExport extern  long  SfDataColByName ( SpecFile *sf, long index,
                                   char *label, double **data_col, int *error );
+DllExport extern  long  SfDataColumns   ( SpecFile *sf, long index,
+                                  long *columns, long ncolumns, long first,
+                                  long nlines, void *retdata, int single,
+                                  long *retcols, int *error );
 
   /*
    * MCA functions
@@ -254,6 +263,9 @@ DllExport extern int  SfGetMca  ( SpecFile *sf, long index, long mcano,
                                           double **retdata, int *error );
 DllExport extern long SfMcaCalib ( SpecFile *sf, long index, double **calib,
                                           int *error );
+DllExport extern long SfGetMcaBlock ( SpecFile *sf, long index, long first,
+                                 long step, long count, long channels,
+                                 double *retdata, int *error );
 
   /*
    * Write and write related functions
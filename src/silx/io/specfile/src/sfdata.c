@@ -103,6 +103,10 @@ DllExport long SfDataCol      ( SpecFile *sf, long index, long col,
                                           double **data_col, int *error );
 DllExport long SfDataColByName( SpecFile *sf, long index,
                                   char *label, double **data_col, int *error );
+DllExport long SfDataColumns  ( SpecFile *sf, long index, long *columns,
+                                  long ncolumns, long first, long nlines,
+                                  void *retdata, int single, long *retcols,
+                                  int *error );
 
 
 /*********************************************************************
@@ -649,6 +653,294 @@ SfDataColByName( SpecFile *sf, long index, char *label, double **retdata, int *e
 }
 
 
+/*********************************************************************
+ *   Function:        long SfDataColumns(sf, index, columns, ncolumns,
+ *                                       first, nlines, retdata, single,
+ *                                       retcols, error)
+ *
+ *   Description:    Gets a block of data lines restricted to some columns.
+ *                   The data lines are parsed like SfData does, but only
+ *                   the values of the selected columns of the selected
+ *                   lines are converted. The parsing stops after the last
+ *                   selected line.
+ *
+ *   Parameters:
+ *        Input :    (1) File pointer
+ *                   (2) Index
+ *                   (3) Indices of the columns to read (starting at 0)
+ *                   (4) Number of columns to read
+ *                   (5) Index of the first line to read (starting at 0)
+ *                   (6) Maximum number of lines to read, -1 for all
+ *                   (7) Preallocated array of nlines * ncolumns values
+ *                       filled line by line, or NULL to only count lines
+ *                   (8) If not 0, retdata is an array of float instead of
+ *                       an array of double
+ *        Output:
+ *                   (9) Number of columns of the data lines
+ *                  (10) error number
+ *   Returns:
+ *            Number of lines read,
+ *            ( -1 ) => errors occured, or no data lines (as SfData)
+ *   Possible errors:
+ *            SF_ERR_SCAN_NOT_FOUND
+ *            SF_ERR_COL_NOT_FOUND
+ *
+ *********************************************************************/
+static void
+sfStoreColumns( void *retdata, int single, long row, double *values,
+                long *columns, long ncolumns )
+{
+     long j;
+
+     if (single) {
+          float *dest = (float *) retdata + row * ncolumns;
+          for (j = 0; j < ncolumns; j++)
+               dest[j] = (float) values[columns[j]];
+     } else {
+          double *dest = (double *) retdata + row * ncolumns;
+          for (j = 0; j < ncolumns; j++)
+               dest[j] = values[columns[j]];
+     }
+}
+
+
+DllExport long
+SfDataColumns( SpecFile *sf, long index, long *columns, long ncolumns,
+               long first, long nlines, void *retdata, int single,
+               long *retcols, int *error )
+{
+     long      headersize;
+
+     char *ptr,
+          *from,
+          *to;
+
+     char    strval[100];
+     char    selected[512];
+     double  valline[512];
+     long    cols,
+             maxcol=512;
+     long    rows,
+             ncol = 0,
+             count = 0;
+     long    j;
+     int     i,
+             convert,
+             status = 0;
+#ifndef _GNU_SOURCE
+#ifdef PYMCA_POSIX
+	char *currentLocaleBuffer;
+	char localeBuffer[21];
+#endif
+#endif
+
+     *retcols = 0;
+
+     if (index <= 0 ){
+        return(-1);
+     }
+
+     if (sfSetCurrent(sf,index,error) == -1 )
+             return(-1);
+
+     if (first < 0)
+          first = 0;
+
+     memset(selected, 0, sizeof(selected));
+     for (j = 0; j < ncolumns; j++) {
+          if (columns[j] < 0 || columns[j] >= maxcol) {
+               *error = SF_ERR_COL_NOT_FOUND;
+               return(-1);
+          }
+          selected[columns[j]] = 1;
+     }
+
+     /*
+      * Use the data already parsed by SfData
+      */
+     if (sf->data_info != (long *)NULL) {
+          ncol = sf->data_info[COL];
+          *retcols = ncol;
+          for (j = 0; j < ncolumns; j++) {
+               if (columns[j] >= ncol) {
+                    *error = SF_ERR_COL_NOT_FOUND;
+                    return(-1);
+               }
+          }
+          for (rows = first; rows < sf->data_info[ROW]; rows++) {
+               if (nlines >= 0 && count >= nlines)
+                    break;
+               if (retdata != NULL)
+                    sfStoreColumns(retdata, single, count, sf->data[rows],
+                                   columns, ncolumns);
+               count++;
+          }
+          return(count);
+     }
+
+     if ( ((SpecScan *)sf->current->contents)->data_offset == -1 ) {
+          /* no data lines, as SfData */
+          return(-1);
+     }
+
+     if (nlines == 0) {
+          return(0);
+     }
+
+     headersize = ((SpecScan *)sf->current->contents)->data_offset
+                - ((SpecScan *)sf->current->contents)->offset;
+
+     from = sf->scanbuffer + headersize;
+     to   = sf->scanbuffer + ((SpecScan *)sf->current->contents)->size;
+     if (to > sf->scanbuffer+sf->scansize){
+          /* the -32 found "experimentaly" */
+          ptr = sf->scanbuffer+sf->scansize - 32;
+          while (*ptr != '\n') ptr--;
+          to=ptr;
+     }
+     ptr = from;
+     rows = -1;
+
+#ifndef _GNU_SOURCE
+#ifdef PYMCA_POSIX
+	currentLocaleBuffer = setlocale(LC_NUMERIC, NULL);
+	strcpy(localeBuffer, currentLocaleBuffer);
+	setlocale(LC_NUMERIC, "C\0");
+#endif
+#endif
+    /*
+     * Same parsing as SfData, but the values are only converted
+     * for the selected columns of the selected lines
+     */
+    for ( ; ptr < to; ptr++) {
+        /* get a complete line */
+        i=0;
+        cols=0;
+        convert = (retdata != NULL) && (rows + 1 >= first);
+        /*I should be at the start of a line */
+        while(*(ptr) != '\n'){
+            if (*(ptr-1) == '\n'){
+                /*I am at the start of a line */
+                while(*ptr == '#'){
+                    if (ptr >= to)
+                        break;
+                    for (; ptr < to; ptr++){
+                        if (*ptr == '\n'){
+                            break;
+                        }
+                    };
+                    /* on exit is equal to newline */
+                    if (ptr < to) {
+                        ptr++;
+                    }
+                }
+                if (*ptr == '@') {
+                    /*
+                    * read all mca block: go while in buffer ( ptr < to - 1 )
+                    * and while a newline is preceded by a slash
+                    */
+                    for (    ptr = ptr + 2;
+                        (*ptr != '\n' || (*(ptr-1) == MCA_CONT)) && ptr < to ;
+                        ptr++);
+                    if (ptr >= to){
+                        break;
+                    }
+                }
+                while(*ptr == '#'){
+                    if (ptr >= to)
+                        break;
+                    for (; ptr < to; ptr++){
+                        if (*ptr == '\n'){
+                            break;
+                        }
+                    };
+                    /* on exit is equal to newline */
+                    if (ptr < to) {
+                        ptr++;
+                    }
+                }
+                /* first characters of buffer
+                */
+                while (*ptr == ' ' && ptr < to) ptr++;  /* get rid of empty spaces */
+            }
+           /*
+            * in the middle of a line
+            */
+            if (*ptr == ' ' || *ptr == '\t' ) {
+                strval[i] = '\0';
+                i = 0;
+                if (convert && selected[cols])
+                    valline[cols] = PyMcaAtof(strval);
+                cols++;
+                if (cols >= maxcol) {
+                    status = -1;
+                    break;
+                }
+                while(*(ptr+1) == ' ' || *(ptr+1) == '\t') ptr++;
+            } else {
+                if (isnumber(*ptr) && i < (int) sizeof(strval) - 1){
+                    strval[i] = *ptr;
+                    i++;
+                }
+            }
+            if (ptr >= (to-1)){
+                break;
+            }
+            ptr++;
+        }
+        if (status == -1)
+            break;
+        if ((*(ptr)== '\n') && (i != 0)){
+                strval[i] = '\0';
+                if (convert && selected[cols])
+                    valline[cols] = PyMcaAtof(strval);
+                cols++;
+                if (cols >= maxcol) {
+                    status = -1;
+                    break;
+                }
+        }
+        if ((ptr < to) && (cols >0)) {
+            rows++;
+            if (ncol != 0 && cols != ncol) {
+                /* just ignore the irregular line, as SfData does */
+                rows--;
+                continue;
+            }
+            if (ncol == 0) {
+                ncol = cols;
+                *retcols = ncol;
+                for (j = 0; j < ncolumns; j++) {
+                    if (columns[j] >= ncol) {
+                        *error = SF_ERR_COL_NOT_FOUND;
+                        status = -1;
+                    }
+                }
+                if (status == -1)
+                    break;
+            }
+            if (rows >= first) {
+                if (retdata != NULL)
+                    sfStoreColumns(retdata, single, count, valline,
+                                   columns, ncolumns);
+                count++;
+                if (nlines >= 0 && count >= nlines)
+                    break;
+            }
+        }
+    }
+
+#ifndef _GNU_SOURCE
+#ifdef PYMCA_POSIX
+    setlocale(LC_NUMERIC, localeBuffer);
+#endif
+#endif
+    if (status == -1)
+        return(-1);
+    return(count);
+}
+
+
 DllExport long
 SfDataAsString( SpecFile *sf, long index, char ***retdata, int *error )
 {
@@ -135,6 +135,11 @@
 
 DllExport SpecFile * SfOpen   ( char *name,int *error);
 DllExport SpecFile * SfOpen2  ( int fd, char *name,int *error);
+DllExport SpecFile * SfOpenIndexed ( char *name, SfCursor *cursor,
+                                     SpecScan *scans, long no_scans,
+                                     short resume, int *error);
+DllExport long       SfGetIndex ( SpecFile *sf, SfCursor *cursor,
+                                  SpecScan **scans, int *error);
 DllExport int        SfClose  ( SpecFile *sf);
 DllExport short      SfUpdate ( SpecFile *sf, int *error);
 DllExport char     * SfError  ( int error);
@@ -155,7 +160,9 @@ static void  sfNewLine     ( SpecFile *sf, SfCursor *cursor, char c0,char c1,int
 static void  sfHeaderLine  ( SpecFile *sf, SfCursor *cursor, char c,int *error);
 static void  sfNewBlock    ( SpecFile *sf, SfCursor *cursor, short how,int *error);
 static void  sfSaveScan    ( SpecFile *sf, SfCursor *cursor, int *error);
-static void  sfAssignScanNumbers (SpecFile *sf);
+static void  sfAssignScanNumbers (SpecFile *sf, long first);
+static SpecFile *sfNew     ( int fd, char *name, int *error);
+static void  sfInitCursor  ( SfCursor *cursor);
 static void  sfReadFile    ( SpecFile *sf, SfCursor *cursor, int *error);
 static void  sfResumeRead  ( SpecFile *sf, SfCursor *cursor, int *error);
 #ifdef SPECFILE_USE_INDEX_FILE
@@ -255,60 +262,16 @@ SfOpen2(int fd, char *name,int *error) {
    SpecFile   *sf;
    short       idxret;
    SfCursor      cursor;
-   struct stat mystat;
 
-   if ( fd == -1 ) {
-      *error = SF_ERR_FILE_OPEN;
+   sf = sfNew(fd, name, error);
+   if ( sf == (SpecFile *)NULL ) {
       return ( (SpecFile *) NULL );
    }
 
-  /*
-   * Init specfile strucure
-   */
-#ifdef _WINDOWS
-   static HANDLE hglb;
-   hglb = GlobalAlloc(GPTR,sizeof(SpecFile));
-   sf   = (SpecFile * ) GlobalLock(hglb);
-#else
-   sf = (SpecFile *) malloc ( sizeof(SpecFile ));
-#endif
-   stat(name,&mystat);
-
-   sf->fd     = fd;
-   sf->m_time = mystat.st_mtime;
-   sf->sfname = (char *)strdup(name);
-
-   sf->list.first      = (ObjectList *)NULL;
-   sf->list.last       = (ObjectList *)NULL;
-   sf->no_scans        = 0;
-   sf->current         = (ObjectList *)NULL;
-   sf->scanbuffer      = (char *)NULL;
-   sf->scanheadersize  = 0;
-   sf->filebuffer      = (char *)NULL;
-   sf->filebuffersize  = 0;
-
-   sf->no_labels       = -1;
-   sf->labels          = (char **)NULL;
-   sf->no_motor_names  = -1;
-   sf->motor_names     = (char **)NULL;
-   sf->no_motor_pos    = -1;
-   sf->motor_pos       = (double *)NULL;
-   sf->data            = (double **)NULL;
-   sf->data_info       = (long *)NULL;
-   sf->updating        = 0;
-
   /*
    * Init cursor
    */
-   cursor.bytecnt      = 0;
-   cursor.cursor       = 0;
-   cursor.scanno       = 0;
-   cursor.hdafoffset   = -1;
-   cursor.dataoffset   = -1;
-   cursor.mcaspectra   = 0;
-   cursor.what         = 0;
-   cursor.data         = 0;
-   cursor.file_header  = 0;
+   sfInitCursor(&cursor);
 
 
 #ifdef SPECFILE_USE_INDEX_FILE
@@ -343,7 +306,7 @@ SfOpen2(int fd, char *name,int *error) {
   /*
    * Once is all done assign scan numbers and orders
    */
-   sfAssignScanNumbers(sf);
+   sfAssignScanNumbers(sf, 1);
 
 #ifdef SPECFILE_USE_INDEX_FILE
    if (idxret != SF_READY) sfWriteIndex(sf,&cursor,error);
@@ -354,6 +317,120 @@ SfOpen2(int fd, char *name,int *error) {
 
 
 
+/*********************************************************************
+ *   Function:          SpecFile *SfOpenIndexed( name, cursor, scans,
+ *                                               no_scans, resume, error)
+ *
+ *   Description:       Opens connection to Spec data file using an index
+ *                      previously retrieved with SfGetIndex.
+ *                      If resume is set, the file is parsed again from
+ *                      the beginning of the last indexed scan, to take
+ *                      into account data appended to the file.
+ *
+ *   Parameters:
+ *              Input :
+ *                      (1) Filename
+ *                      (2) Cursor of the index
+ *                      (3) Scans of the index
+ *                      (4) Number of scans of the index
+ *                      (5) Resume parsing flag
+ *              Output:
+ *                      (6) error number
+ *   Returns:
+ *                      SpecFile pointer.
+ *                      NULL if not successful.
+ *
+ *   Possible errors:
+ *                      SF_ERR_FILE_OPEN
+ *                      SF_ERR_MEMORY_ALLOC
+ *
+ *********************************************************************/
+DllExport SpecFile *
+SfOpenIndexed(char *name, SfCursor *cursor, SpecScan *scans, long no_scans,
+              short resume, int *error) {
+   SpecFile   *sf;
+   long        i;
+   int         fd;
+
+   if ( no_scans <= 0 ) {
+      /*
+       * Nothing to resume from
+       */
+      return ( SfOpen(name, error) );
+   }
+
+   fd = open(name,SF_OPENFLAG);
+   sf = sfNew(fd, name, error);
+   if ( sf == (SpecFile *)NULL ) {
+      return ( (SpecFile *) NULL );
+   }
+
+   for ( i = 0; i < no_scans; i++ ) {
+      if ( addToList(&(sf->list), (void *)&(scans[i]), (long)sizeof(SpecScan)) ) {
+         *error = SF_ERR_MEMORY_ALLOC;
+         SfClose(sf);
+         return ( (SpecFile *) NULL );
+      }
+   }
+   sf->no_scans = no_scans;
+   sf->cursor   = *cursor;
+
+   if ( resume ) {
+      sfResumeRead(sf,&(sf->cursor),error);
+      sfReadFile(sf,&(sf->cursor),error);
+     /*
+      * The last indexed scan was parsed again
+      */
+      sfAssignScanNumbers(sf, no_scans);
+   }
+   return(sf);
+}
+
+
+/*********************************************************************
+ *   Function:          long SfGetIndex( sf, cursor, scans, error)
+ *
+ *   Description:       Retrieves the index of a Spec data file, to be
+ *                      used later with SfOpenIndexed.
+ *
+ *   Parameters:
+ *              Input :
+ *                      (1) SpecFile pointer
+ *              Output:
+ *                      (2) Cursor of the index
+ *                      (3) Allocated array of scans (to be freed)
+ *                      (4) error number
+ *   Returns:
+ *                      Number of scans, -1 if not successful.
+ *
+ *   Possible errors:
+ *                      SF_ERR_MEMORY_ALLOC
+ *
+ *********************************************************************/
+DllExport long
+SfGetIndex(SpecFile *sf, SfCursor *cursor, SpecScan **scans, int *error) {
+   ObjectList *obj;
+   long        i;
+
+   *cursor = sf->cursor;
+   *scans  = (SpecScan *)NULL;
+   if ( sf->no_scans <= 0 ) {
+      return(0);
+   }
+
+   *scans = (SpecScan *) malloc(sizeof(SpecScan) * sf->no_scans);
+   if ( *scans == (SpecScan *)NULL ) {
+      *error = SF_ERR_MEMORY_ALLOC;
+      return(-1);
+   }
+
+   for ( i = 0, obj = sf->list.first; obj && i < sf->no_scans; obj = obj->next, i++ ) {
+      (*scans)[i] = *((SpecScan *) obj->contents);
+   }
+   return(i);
+}
+
+
 /*********************************************************************
  *
  *   Function:		int SfClose( sf )
@@ -437,7 +514,7 @@ SfUpdate ( SpecFile *sf, int *error )
        sfReadFile   (sf,&(sf->cursor),error);
 
        sf->m_time = mtime;
-       sfAssignScanNumbers(sf);
+       sfAssignScanNumbers(sf, 1);
 #ifdef SPECFILE_USE_INDEX_FILE
        sfWriteIndex (sf,&(sf->cursor),error);
 #endif
@@ -469,6 +546,69 @@ SfError(int code ) {
 }
 
 
+static SpecFile *
+sfNew(int fd, char *name, int *error) {
+   SpecFile   *sf;
+   struct stat mystat;
+
+   if ( fd == -1 ) {
+      *error = SF_ERR_FILE_OPEN;
+      return ( (SpecFile *) NULL );
+   }
+
+  /*
+   * Init specfile strucure
+   */
+#ifdef _WINDOWS
+   static HANDLE hglb;
+   hglb = GlobalAlloc(GPTR,sizeof(SpecFile));
+   sf   = (SpecFile * ) GlobalLock(hglb);
+#else
+   sf = (SpecFile *) malloc ( sizeof(SpecFile ));
+#endif
+   stat(name,&mystat);
+
+   sf->fd     = fd;
+   sf->m_time = mystat.st_mtime;
+   sf->sfname = (char *)strdup(name);
+
+   sf->list.first      = (ObjectList *)NULL;
+   sf->list.last       = (ObjectList *)NULL;
+   sf->no_scans        = 0;
+   sf->current         = (ObjectList *)NULL;
+   sf->scanbuffer      = (char *)NULL;
+   sf->scanheadersize  = 0;
+   sf->filebuffer      = (char *)NULL;
+   sf->filebuffersize  = 0;
+
+   sf->no_labels       = -1;
+   sf->labels          = (char **)NULL;
+   sf->no_motor_names  = -1;
+   sf->motor_names     = (char **)NULL;
+   sf->no_motor_pos    = -1;
+   sf->motor_pos       = (double *)NULL;
+   sf->data            = (double **)NULL;
+   sf->data_info       = (long *)NULL;
+   sf->updating        = 0;
+
+   return(sf);
+}
+
+
+static void
+sfInitCursor(SfCursor *cursor) {
+   cursor->bytecnt      = 0;
+   cursor->cursor       = 0;
+   cursor->scanno       = 0;
+   cursor->hdafoffset   = -1;
+   cursor->dataoffset   = -1;
+   cursor->mcaspectra   = 0;
+   cursor->what         = 0;
+   cursor->data         = 0;
+   cursor->file_header  = 0;
+}
+
+
 static void
 sfReadFile(SpecFile *sf,SfCursor *cursor,int *error) {
 
@@ -789,7 +929,7 @@ sfSaveScan(SpecFile *sf, SfCursor *cursor,int *error) {
 
 
 static void
-sfAssignScanNumbers(SpecFile *sf) {
+sfAssignScanNumbers(SpecFile *sf, long first) {
 
   int i;
   long bytesread;
@@ -804,6 +944,12 @@ sfAssignScanNumbers(SpecFile *sf) {
 
   for ( object = (sf->list).first; object; object=object->next) {
         scan = (SpecScan *) object->contents;
+        if (scan->index < first) {
+            /*
+             * Already assigned
+             */
+            continue;
+        }
 
         lseek(sf->fd,scan->offset,SEEK_SET);
         bytesread = read(sf->fd,buffer,sizeof(buffer));
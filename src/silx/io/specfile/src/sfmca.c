@@ -84,6 +84,9 @@ DllExport int  SfGetMca   ( SpecFile *sf, long index, long mcano,
                                           double **retdata, int *error );
 DllExport long SfMcaCalib ( SpecFile *sf, long index, double **calib,
                                           int *error );
+DllExport long SfGetMcaBlock ( SpecFile *sf, long index, long first,
+                                 long step, long count, long channels,
+                                 double *retdata, int *error );
 
 
 /*********************************************************************
@@ -344,3 +347,140 @@ SfMcaCalib ( SpecFile *sf, long index, double **calib, int *error )
      *calib = retdata;
      return(0);
 }
+
+
+/*********************************************************************
+ *   Function:        long SfGetMcaBlock(sf, index, first, step, count,
+ *                                       channels, retdata, error)
+ *
+ *   Description:    Gets several spectra in a single pass over the scan.
+ *
+ *                   The spectra first, first+step, ... are parsed into
+ *                   the preallocated retdata array (count rows of
+ *                   channels values). The other spectra are skipped
+ *                   without being parsed.
+ *
+ *   Parameters:
+ *        Input :    (1) File pointer
+ *            (2) Index
+ *            (3) Number of the first spectrum (starting at 1)
+ *            (4) Step between two spectra ( >= 1 )
+ *            (5) Number of spectra to read
+ *            (6) Number of values of each spectrum
+ *            (7) Data array of at least count * channels values
+ *        Output:
+ *            (8) error number
+ *   Returns:
+ *            Number of spectra read. It is lower than count if a
+ *            spectrum does not contain exactly channels values,
+ *            ( -1 ) => errors occured
+ *   Possible errors:
+ *            SF_ERR_FILE_READ
+ *            SF_ERR_SCAN_NOT_FOUND
+ *            SF_ERR_MCA_NOT_FOUND
+ *
+ *********************************************************************/
+DllExport long
+SfGetMcaBlock( SpecFile *sf, long index, long first, long step, long count,
+               long channels, double *retdata, int *error )
+{
+     long     headersize;
+     char    *ptr,
+             *to;
+     char     strval[100];
+     double  *data;
+     int      i;
+     long     n,
+              vals,
+              number,
+              spect_no = 0;
+#ifndef _GNU_SOURCE
+#ifdef PYMCA_POSIX
+	char *currentLocaleBuffer;
+	char localeBuffer[21];
+#endif
+#endif
+
+     if (sfSetCurrent(sf,index,error) == -1 )
+             return(-1);
+
+     if (first < 1 || step < 1) {
+         *error = SF_ERR_MCA_NOT_FOUND;
+          return(-1);
+     }
+
+     headersize = ((SpecScan *)sf->current->contents)->data_offset
+                - ((SpecScan *)sf->current->contents)->offset;
+
+     ptr = sf->scanbuffer + headersize;
+     to  = sf->scanbuffer + ((SpecScan *)sf->current->contents)->size;
+
+#ifndef _GNU_SOURCE
+#ifdef PYMCA_POSIX
+	currentLocaleBuffer = setlocale(LC_NUMERIC, NULL);
+	strcpy(localeBuffer, currentLocaleBuffer);
+	setlocale(LC_NUMERIC, "C\0");
+#endif
+#endif
+     for (n = 0; n < count; n++) {
+         number = first + n * step;
+        /*
+         * go and find the beginning of spectrum
+         */
+         while ( spect_no != number  && ptr < to ) {
+                if (*ptr == '@') spect_no++;
+                ptr++;
+         }
+         ptr++;
+
+         if ( spect_no != number ) {
+             *error = SF_ERR_MCA_NOT_FOUND;
+             n = -1;
+             break;
+         }
+
+         data = retdata + n * channels;
+         i    = 0;
+         vals = 0;
+         for ( ;(*(ptr+1) != '\n' || (*ptr == MCA_CONT)) && ptr < to - 1 ; ptr++)
+         {
+             if (*ptr == ' ' || *ptr == '\t' || *ptr == '\\' || *ptr == '\n') {
+                 if ( i ) {
+                    strval[i] = '\0';
+                    i = 0;
+                    if (vals < channels)
+                        data[vals] = PyMcaAtof(strval);
+                    vals++;
+                 }
+             } else if (isnumber(*ptr) && i < 98) {
+                 strval[i] = *ptr;
+                 i++;
+             }
+         }
+
+         if (isnumber(*ptr)) {
+           strval[i]    = *ptr;
+           strval[i+1]  = '\0';
+           i++;
+         } else if (i>0) {
+           strval[i] = '\0';
+         }
+         if ( i ) {
+             if (vals < channels)
+                 data[vals] = PyMcaAtof(strval);
+             vals++;
+         }
+
+         if (vals != channels) {
+             /* Inconsistent spectrum length */
+             break;
+         }
+     }
+#ifndef _GNU_SOURCE
+#ifdef PYMCA_POSIX
+	setlocale(LC_NUMERIC, localeBuffer);
+#endif
+#endif
+
+     return( n );
+}
@@ -33,9 +33,18 @@ cdef extern from "SpecFileCython.h":
 # Renaming struct because we have too many SpecFile items (files, classes…)
 ctypedef _SpecFile SpecFileHandle
 
+cdef extern from "SpecFileCython.h":
+    # Mostly used as raw index records
+    ctypedef struct SfCursor:
+        long bytecnt
+    ctypedef struct SpecScan:
+        long offset
+
 cdef extern from "SpecFileCython.h":
     # sfinit
     SpecFileHandle* SfOpen(char*, int*)
+    SpecFileHandle* SfOpenIndexed(char*, SfCursor*, SpecScan*, long, short, int*)
+    long SfGetIndex(SpecFileHandle*, SfCursor*, SpecScan**, int*)
     int SfClose(SpecFileHandle*)
     char* SfError(int)
     
@@ -50,6 +59,7 @@ cdef extern from "SpecFileCython.h":
     int SfData(SpecFileHandle*, long, double***, long**, int*)
     long SfDataLine(SpecFileHandle*, long, long, double**, int*)
     long SfDataColByName(SpecFileHandle*, long, char*, double**, int*)
+    long SfDataColumns(SpecFileHandle*, long, long*, long, long, long, void*, int, long*, int*)
     
     # sfheader
     #char* SfTitle(SpecFileHandle*, long, int*)
@@ -73,4 +83,5 @@ cdef extern from "SpecFileCython.h":
     long SfNoMca(SpecFileHandle*, long, int*)
     int  SfGetMca(SpecFileHandle*, long, long , double**, int*)
     long SfMcaCalib(SpecFileHandle*, long, double**, int*)
+    long SfGetMcaBlock(SpecFileHandle*, long, long, long, long, long, double*, int*)
 
@@ -166,7 +166,7 @@ import h5py
 import numpy
 
 from silx import version as silx_version
-from .specfile import SpecFile, SfErrColNotFound
+from .specfile import SpecFile, SfErrColNotFound, SfErrLineNotFound
 from . import commonh5
 
 __authors__ = ["P. Knobel", "D. Naudet"]
@@ -195,7 +195,7 @@ def _get_number_of_mca_analysers(scan):
     """
     number_of_mca_spectra = len(scan.mca)
     # Scan.data is transposed
-    number_of_data_lines = scan.data.shape[1]
+    number_of_data_lines = scan.data_shape[1]
 
     if not number_of_data_lines == 0:
         # Number of MCA spectra must be a multiple of number of data lines
@@ -431,7 +431,7 @@ def spec_date_to_iso8601(date, zone=None):
     return full_date
 
 
-def _demultiplex_mca(scan, analyser_index):
+def _demultiplex_mca(scan, analyser_index, selection=slice(None)):
     """Return MCA data for a single analyser.
 
     Each MCA spectrum is a 1D array. For each analyser, there is one
@@ -440,22 +440,30 @@ def _demultiplex_mca(scan, analyser_index):
     there are 3 analysers, the consecutive spectra for the first analyser must
     be accessed as ``mca[0], mca[3], mca[6]…``.
 
+    The selected spectra are parsed in a single pass over the scan, the
+    others are skipped.
+
     :param scan: :class:`Scan` instance containing the MCA data
     :param analyser_index: 0-based index referencing the analyser
     :type analyser_index: int
-    :return: 2D numpy array containing all spectra for one analyser
+    :param slice selection: Spectra of this analyser to read, default to all
+    :return: 2D numpy array containing the spectra for one analyser
     """
     number_of_analysers = _get_number_of_mca_analysers(scan)
     number_of_spectra = len(scan.mca)
     number_of_spectra_per_analyser = number_of_spectra // number_of_analysers
-    len_spectrum = len(scan.mca[analyser_index])
-
-    mca_array = numpy.empty((number_of_spectra_per_analyser, len_spectrum))
 
-    for i in range(number_of_spectra_per_analyser):
-        mca_array[i, :] = scan.mca[analyser_index + i * number_of_analysers]
+    indices = range(number_of_spectra_per_analyser)[selection]
+    if len(indices) == 0:
+        len_spectrum = len(scan.mca[analyser_index])
+        return numpy.empty((0, len_spectrum))
 
-    return mca_array
+    # Convert the indices of the analyser spectra to indices of the scan MCA
+    first = analyser_index + indices[0] * number_of_analysers
+    last = analyser_index + indices[-1] * number_of_analysers
+    step = indices.step * number_of_analysers
+    stop = last + (1 if step > 0 else -1)
+    return scan.mca[first : stop if stop >= 0 else None : step]
 
 
 # Node classes
@@ -710,14 +718,14 @@ class PositionersGroup(commonh5.Group, SpecH5Group):
             attrs={"NX_class": to_h5py_utf8("NXcollection")},
         )
 
-        dataset_info = []  # Store list of positioner's (name, value)
+        dataset_info = []  # Store list of positioner's (name, value, label)
         is_error = False  # True if error encountered
 
         for motor_name in scan.motor_names:
             safe_motor_name = motor_name.replace("/", "%")
-            if motor_name in scan.labels and scan.data.shape[0] > 0:
-                # return a data column if one has the same label as the motor
-                motor_value = scan.data_column_by_name(motor_name)
+            if motor_name in scan.labels and scan.data_shape[0] > 0:
+                # use the data column if one has the same label as the motor
+                motor_value = None
             else:
                 # Take value from #P scan header.
                 # (may return float("inf") if #P line is missing from scan hdr)
@@ -726,18 +734,22 @@ class PositionersGroup(commonh5.Group, SpecH5Group):
                 except SfErrColNotFound:
                     is_error = True
                     motor_value = float("inf")
-            dataset_info.append((safe_motor_name, motor_value))
+            dataset_info.append((safe_motor_name, motor_value, motor_name))
 
         if is_error:  # Filter-out scalar values
             logger1.warning("Mismatching number of elements in #P and #O: Ignoring")
             dataset_info = [
-                (name, value)
-                for name, value in dataset_info
+                (name, value, label)
+                for name, value, label in dataset_info
                 if not isinstance(value, float)
             ]
 
-        for name, value in dataset_info:
-            self.add_node(SpecH5NodeDataset(name=name, data=value, parent=self))
+        for name, value, label in dataset_info:
+            if value is None:
+                node = DataColumnDataset(name=name, parent=self, scan=scan, label=label)
+            else:
+                node = SpecH5NodeDataset(name=name, data=value, parent=self)
+            self.add_node(node)
 
 
 class InstrumentMcaGroup(commonh5.Group, SpecH5Group):
@@ -850,6 +862,17 @@ class McaDataDataset(SpecH5LazyNodeDataset):
     def __getitem__(self, item):
         # optimization for fetching a single spectrum if data not already loaded
         if not self._is_initialized:
+            # optimization for fetching a range of spectra [i:j, ...]
+            if isinstance(item, slice):
+                return _demultiplex_mca(self._scan, self._analyser_index, item)
+            if (
+                isinstance(item, tuple)
+                and len(item) > 0
+                and isinstance(item[0], slice)
+            ):
+                data = _demultiplex_mca(self._scan, self._analyser_index, item[0])
+                return data[(slice(None),) + item[1:]]
+
             if isinstance(item, int):
                 if item < 0:
                     # negative indexing
@@ -863,13 +886,92 @@ class McaDataDataset(SpecH5LazyNodeDataset):
                 pass
             else:
                 if spectrum_idx < 0:
-                    item += len(self)
+                    spectrum_idx += len(self)
                 idx = self._analyser_index + spectrum_idx * self._num_analysers
                 return self._scan.mca[idx][channel_idx_or_slice]
 
         return super(McaDataDataset, self).__getitem__(item)
 
 
+class DataColumnDataset(SpecH5LazyNodeDataset):
+    """Lazy loadable dataset for a column of the scan data.
+
+    Only this column is parsed from the file, as 32 bits floats. Until the
+    whole column is requested, indexing it only parses the selected lines.
+    """
+
+    def __init__(self, name, parent, scan, label):
+        commonh5.LazyLoadableDataset.__init__(self, name=name, parent=parent)
+        self._scan = scan
+        self._label = label
+        self._shape = None
+
+    def _read_lines(self, start, stop):
+        try:
+            data = self._scan.data_columns(
+                [self._label], start, stop, dtype=numpy.float32
+            )
+        except SfErrLineNotFound:
+            # Could be a "#C Scan aborted after 0 points"
+            logger1.warning(
+                "Cannot get data column %s in scan %d.%d",
+                self._label,
+                self._scan.number,
+                self._scan.order,
+            )
+            return numpy.empty((0,), dtype=numpy.float32)
+        return data[0]
+
+    def _create_data(self):
+        if self.shape[0] == 0:
+            return numpy.empty((0,), dtype=numpy.float32)
+        return self._read_lines(None, None)
+
+    @property
+    def shape(self):
+        if self._shape is None:
+            if self._is_initialized:
+                self._shape = self._get_data().shape
+            else:
+                # Scan.data is transposed
+                self._shape = (self._scan.data_shape[1],)
+        return self._shape
+
+    @property
+    def size(self):
+        return self.shape[0]
+
+    @property
+    def dtype(self):
+        return numpy.dtype(numpy.float32)
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, item):
+        # optimization for fetching a few lines if data not already loaded
+        if not self._is_initialized:
+            if isinstance(item, tuple) and len(item) == 1:
+                item = item[0]
+            if isinstance(item, int):
+                index = item + len(self) if item < 0 else item
+                if not 0 <= index < len(self):
+                    raise IndexError(
+                        "Index (%d) out of range for axis 0 of size %d"
+                        % (item, len(self))
+                    )
+                return self._read_lines(index, index + 1)[0]
+            if isinstance(item, slice):
+                indices = range(*item.indices(len(self)))
+                if len(indices) == 0:
+                    return numpy.empty((0,), dtype=numpy.float32)
+                first = min(indices[0], indices[-1])
+                data = self._read_lines(first, max(indices[0], indices[-1]) + 1)
+                return data[indices.start - first :: indices.step][: len(indices)]
+
+        return super(DataColumnDataset, self).__getitem__(item)
+
+
 class MeasurementGroup(commonh5.Group, SpecH5Group):
     def __init__(self, parent, scan):
         """
@@ -888,9 +990,7 @@ class MeasurementGroup(commonh5.Group, SpecH5Group):
         for label in scan.labels:
             safe_label = label.replace("/", "%")
             self.add_node(
-                SpecH5NodeDataset(
-                    name=safe_label, data=scan.data_column_by_name(label), parent=self
-                )
+                DataColumnDataset(name=safe_label, parent=self, scan=scan, label=label)
             )
 
         num_analysers = _get_number_of_mca_analysers(scan)
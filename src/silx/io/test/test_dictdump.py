@@ -596,6 +596,66 @@ class TestH5ToDict(H5DictTestCase):
             ddict[("", "attr_2utf8")], adict[("", "attr_2utf8")]
         )
 
+    def testLazy(self):
+        ddict = h5todict(self.h5_fname, path="/Europe/France", lazy=True)
+        self.assertIsInstance(ddict, dictdump.H5LazyDict)
+        grenoble = ddict["Grenoble"]
+        self.assertFalse(grenoble.is_loaded("inhabitants"))
+        self.assertEqual(grenoble["inhabitants"], inhabitants)
+        self.assertTrue(grenoble.is_loaded("inhabitants"))
+        self.assertFalse(grenoble.is_loaded("area"))
+        self.assertEqual(set(grenoble.keys()), {"area", "inhabitants", "coordinates"})
+
+    def testLazyWithFileObject(self):
+        with h5py.File(self.h5_fname, mode="r") as h5file:
+            ddict = h5todict(h5file["/Europe/France/Grenoble"], lazy=True)
+            numpy.testing.assert_array_equal(ddict["coordinates"], [45.1830, 5.7196])
+
+    def testProxySize(self):
+        ddict = h5todict(self.h5_fname, path="/Europe/France/Grenoble", proxy_size=8)
+        proxy = ddict["coordinates"]
+        self.assertIsInstance(proxy, dictdump.DatasetProxy)
+        self.assertEqual(proxy.shape, (2,))
+        self.assertEqual(proxy.name, "/Europe/France/Grenoble/coordinates")
+        self.assertEqual(proxy[1], 5.7196)
+        numpy.testing.assert_array_equal(proxy, [45.1830, 5.7196])
+        self.assertEqual(ddict["inhabitants"], inhabitants)
+
+    def testIter(self):
+        items = dict(
+            dictdump.iter_h5todict(
+                self.h5_fname,
+                path="/Europe/France",
+                include_attributes=True,
+                exclude_names=["coordinates"],
+            )
+        )
+        self.assertEqual(
+            set(items.keys()),
+            {
+                "/Europe/France/Grenoble/area",
+                "/Europe/France/Grenoble/inhabitants",
+            },
+        )
+        self.assertEqual(items["/Europe/France/Grenoble/inhabitants"], inhabitants)
+
+        items = dict(dictdump.iter_h5todict(self.h5_fname, proxy_size=8))
+        proxy = items["/Europe/France/Grenoble/coordinates"]
+        self.assertIsInstance(proxy, dictdump.DatasetProxy)
+        self.assertEqual(items["/links/group/dataset"], 10)
+
+    def testIterExternalGroup(self):
+        """Iterate through an external link to a group"""
+        with h5py.File(self.h5_fname, "a") as h5file:
+            h5file["links/external_group"] = h5py.ExternalLink(
+                ext_filename, "/ext_group"
+            )
+        items = dict(dictdump.iter_h5todict(self.h5_fname, path="/links"))
+        self.assertEqual(items["/links/external_group/dataset"], 10)
+        self.assertEqual(
+            h5todict(self.h5_fname, path="/links")["external_group"]["dataset"], 10
+        )
+
 
 class TestDictToNx(H5DictTestCase):
     def setUp(self):
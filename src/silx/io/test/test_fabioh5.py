@@ -30,6 +30,7 @@ import os
 import logging
 import numpy
 import unittest
+import unittest.mock
 import tempfile
 import shutil
 
@@ -625,3 +626,117 @@ class TestFabioH5WithFileSeries(unittest.TestCase):
         frameData = _TestableFrameData("foo", reader)
         self.assertEqual(frameData.dtype.kind, "i")
         self.assertEqual(frameData.shape, (10, 3, 2))
+        self.assertEqual(frameData[5][0, 0], 5)
+        self.assertEqual(list(frameData[2:8:2, 0, 0]), [2, 4, 6])
+
+    def testDeferredMetadata(self):
+        with unittest.mock.patch.object(
+            fabioh5.FabioReader,
+            "_read",
+            autospec=True,
+            side_effect=fabioh5.FabioReader._read,
+        ) as read:
+            h5_image = fabioh5.File(file_series=self.edf_filenames)
+            data = h5_image["/scan_0/instrument/detector_0/data"]
+            self.assertEqual(data.shape, (10, 3, 2))
+            read.assert_not_called()
+            dataset = h5_image["/scan_0/instrument/detector_0/others/image_id"]
+            self.assertEqual(list(dataset[...]), list(range(10)))
+            read.assert_called_once()
+
+    def testMetadataCache(self):
+        cache = os.path.join(self.tmp_directory, "metadata.npz")
+        self.addCleanup(os.remove, cache)
+        h5_image = fabioh5.File(file_series=self.edf_filenames, metadata_cache=cache)
+        self._testH5Image(h5_image)
+        others = h5_image["/scan_0/instrument/detector_0/others"]
+        expected = {name: others[name][()] for name in others}
+        h5_image.close()
+        self.assertTrue(os.path.exists(cache))
+
+        # The headers are not read anymore
+        with unittest.mock.patch.object(fabioh5.FabioReader, "_read") as read:
+            h5_image = fabioh5.File(
+                file_series=self.edf_filenames, metadata_cache=cache
+            )
+            self._testH5Image(h5_image)
+            others = h5_image["/scan_0/instrument/detector_0/others"]
+            self.assertEqual(list(others), list(expected))
+            for name, value in expected.items():
+                self.assertEqual(others[name].dtype, value.dtype)
+                numpy.testing.assert_array_equal(others[name][()], value)
+            h5_image.close()
+            read.assert_not_called()
+
+        # The cache is not used for other files
+        with unittest.mock.patch.object(fabioh5.FabioReader, "_read") as read:
+            fabioh5.File(file_series=self.edf_filenames[:5], metadata_cache=cache)[
+                "/scan_0/instrument/detector_0/others"
+            ].keys()
+            read.assert_called_once()
+
+
+class TestFabioH5WithMultiFrameEdf(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_directory = tempfile.mkdtemp()
+        cls.edf_filename = os.path.join(cls.tmp_directory, "test.edf")
+
+        cls.data = numpy.arange(8 * 3 * 4, dtype=numpy.float32).reshape(8, 3, 4)
+        fabio_image = fabio.edfimage.EdfImage(data=cls.data[0])
+        for frame in cls.data[1:]:
+            fabio_image.append_frame(data=frame)
+        fabio_image.write(cls.edf_filename)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmp_directory)
+
+    def _createFrameData(self):
+        reader = fabioh5.EdfFabioReader(file_name=self.edf_filename)
+        self.addCleanup(reader.close)
+        return _TestableFrameData("foo", reader)
+
+    def testShape(self):
+        frameData = self._createFrameData()
+        self.assertEqual(frameData.dtype, numpy.float32)
+        self.assertEqual(frameData.shape, (8, 3, 4))
+        self.assertEqual(len(frameData), 8)
+        self.assertEqual(frameData.size, self.data.size)
+
+    def testReadFrame(self):
+        frameData = self._createFrameData()
+        numpy.testing.assert_array_equal(frameData[3], self.data[3])
+        numpy.testing.assert_array_equal(frameData[-1], self.data[-1])
+        numpy.testing.assert_array_equal(frameData[2, 1:, ::2], self.data[2, 1:, ::2])
+        with self.assertRaises(IndexError):
+            frameData[8]
+
+    def testReadFrames(self):
+        frameData = self._createFrameData()
+        numpy.testing.assert_array_equal(frameData[1:5], self.data[1:5])
+        numpy.testing.assert_array_equal(frameData[::-3], self.data[::-3])
+        numpy.testing.assert_array_equal(
+            frameData[:, 1:3, 0:2], self.data[:, 1:3, 0:2]
+        )
+        numpy.testing.assert_array_equal(frameData[[0, 7, -2]], self.data[[0, 7, -2]])
+
+    def testMemoryMapped(self):
+        reader = fabioh5.EdfFabioReader(file_name=self.edf_filename)
+        self.addCleanup(reader.close)
+        frame = reader.get_frame(4)
+        self.assertIsInstance(frame, numpy.memmap)
+        numpy.testing.assert_array_equal(frame, self.data[4])
+
+        # Copy-on-write: the frame can be modified but not the file
+        frame[0, 0] = -1
+        self.assertEqual(frame[0, 0], -1)
+        reader2 = fabioh5.EdfFabioReader(file_name=self.edf_filename)
+        self.addCleanup(reader2.close)
+        numpy.testing.assert_array_equal(reader2.get_frame(4), self.data[4])
+
+    def testFullData(self):
+        reader = fabioh5.EdfFabioReader(file_name=self.edf_filename)
+        self.addCleanup(reader.close)
+        frameData = fabioh5.FrameData("foo", reader)
+        numpy.testing.assert_array_equal(frameData[()], self.data)
@@ -283,6 +283,36 @@ class TestSpecFile(unittest.TestCase):
         with self.assertRaises(specfile.SfErrColNotFound):
             self.scan25.data_column_by_name("ygfxgfyxg")
 
+    def test_data_columns(self):
+        data = self.sf.data(self.scan25.index)
+        self.assertEqual(self.sf.data_shape(self.scan25.index), data.shape)
+        columns = self.sf.data_columns(self.scan25.index, ["col3", 1, -4])
+        numpy.testing.assert_array_equal(columns, data[:, [3, 1, 0]])
+        lines = self.sf.data_columns(self.scan25.index, [2], 1, 3)
+        numpy.testing.assert_array_equal(lines, data[1:3, [2]])
+        lines = self.sf.data_columns(self.scan25.index, [2], -2, None)
+        numpy.testing.assert_array_equal(lines, data[-2:, [2]])
+        lines = self.sf.data_columns(self.scan25.index, [2], 2, 100)
+        numpy.testing.assert_array_equal(lines, data[2:, [2]])
+        single = self.sf.data_columns(self.scan25.index, [2], dtype=numpy.float32)
+        self.assertEqual(single.dtype, numpy.float32)
+        numpy.testing.assert_array_equal(single, data[:, [2]].astype(numpy.float32))
+        with self.assertRaises(specfile.SfErrColNotFound):
+            self.sf.data_columns(self.scan25.index, [4])
+        with self.assertRaises(specfile.SfErrColNotFound):
+            self.sf.data_columns(self.scan25.index, ["ygfxgfyxg"])
+
+    def test_scan_data_columns(self):
+        self.assertEqual(self.scan25.data_shape, (4, 4))
+        columns = self.scan25.data_columns(["col2", 0], 1, 3)
+        numpy.testing.assert_array_equal(columns, [[1.2, 2.2], [1.0, 2.0]])
+        # Same result once the whole data is loaded
+        self.assertEqual(self.scan25.data.shape, (4, 4))
+        numpy.testing.assert_array_equal(
+            self.scan25.data_columns(["col2", 0], 1, 3), columns
+        )
+        self.assertEqual(self.empty_scan.data_shape, (0, 0))
+
     def test_motors(self):
         self.assertEqual(len(self.scan1.motor_names), 6)
         self.assertEqual(len(self.scan1.motor_positions), 6)
@@ -336,6 +366,13 @@ class TestSpecFile(unittest.TestCase):
         self.assertEqual(line_count, 3)
         self.assertAlmostEqual(total_sum, 36.8)
 
+        # Test slicing
+        expected = numpy.array(list(self.scan1_2.mca))
+        numpy.testing.assert_array_equal(self.scan1_2.mca[:], expected)
+        numpy.testing.assert_array_equal(self.scan1_2.mca[1:], expected[1:])
+        numpy.testing.assert_array_equal(self.scan1_2.mca[::-2], expected[::-2])
+        self.assertEqual(self.scan1_2.mca[5:].shape, (0, 0))
+
     def test_mca_header(self):
         self.assertEqual(self.scan1.mca_header_dict, {})
         self.assertEqual(len(self.scan1_2.mca_header_dict), 4)
@@ -355,6 +392,99 @@ class TestSpecFile(unittest.TestCase):
         self.assertEqual(col1.shape, (0,))
 
 
+class TestSpecFileIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.fname = os.path.join(self.tmpdir.name, "sf.dat")
+        self.index_fname = os.path.join(self.tmpdir.name, "sf.idx")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _write(self, text, mode="w"):
+        with open(self.fname, mode) as f:
+            f.write(text)
+
+    def _assertSameContent(self, sf, expected):
+        self.assertEqual(sf.keys(), expected.keys())
+        for key in expected.keys():
+            self.assertEqual(sf[key].header, expected[key].header)
+            numpy.testing.assert_array_equal(sf[key].data, expected[key].data)
+            self.assertEqual(len(sf[key].mca), len(expected[key].mca))
+
+    def testIndexCreated(self):
+        self._write(sftext)
+        sf = SpecFile(self.fname, index_filename=self.index_fname)
+        self.assertTrue(os.path.exists(self.index_fname))
+        expected = SpecFile(self.fname)
+        self._assertSameContent(sf, expected)
+        sf.close()
+
+        sf = SpecFile(self.fname, index_filename=self.index_fname)
+        self._assertSameContent(sf, expected)
+        sf.close()
+        expected.close()
+
+    def testAppendedFile(self):
+        split = sftext.index("#F /tmp/sf.dat", 10)
+        # Cut the last scan before the end of its data
+        self._write(sftext[: split - 50])
+        sf = SpecFile(self.fname, index_filename=self.index_fname)
+        self.assertEqual(len(sf), 3)
+        sf.close()
+
+        self._write(sftext[split - 50 :], mode="a")
+        sf = SpecFile(self.fname, index_filename=self.index_fname)
+        expected = SpecFile(self.fname)
+        self.assertEqual(len(sf), 4)
+        self._assertSameContent(sf, expected)
+        self.assertEqual(sf["1.2"].mca[2][1], 7.7)
+        sf.close()
+        expected.close()
+
+    def testRewrittenFile(self):
+        self._write(sftext)
+        SpecFile(self.fname, index_filename=self.index_fname).close()
+        stat = os.stat(self.fname)
+        self._write(sftext.replace("#S 25 ", "#S 27 "))
+        # Same size, ensure a different modification time
+        os.utime(self.fname, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        sf = SpecFile(self.fname, index_filename=self.index_fname)
+        self.assertEqual(sf.keys(), ["1.1", "27.1", "26.1", "1.2"])
+        sf.close()
+
+        self._write(sftext[: sftext.index("#S 26")])
+        sf = SpecFile(self.fname, index_filename=self.index_fname)
+        self.assertEqual(sf.keys(), ["1.1", "25.1"])
+        sf.close()
+
+    def testCorruptedIndex(self):
+        self._write(sftext)
+        with open(self.index_fname, "wb") as f:
+            f.write(b"foo")
+        sf = SpecFile(self.fname, index_filename=self.index_fname)
+        self.assertEqual(len(sf), 4)
+        sf.close()
+
+    def testDefaultIndexDirectory(self):
+        import silx
+
+        self._write(sftext)
+        directory = os.path.join(self.tmpdir.name, "index")
+        previous = silx.config.DEFAULT_SPECFILE_INDEX_DIRECTORY
+        silx.config.DEFAULT_SPECFILE_INDEX_DIRECTORY = directory
+        try:
+            index_fname = specfile.default_index_filename(self.fname)
+            self.assertTrue(index_fname.startswith(directory))
+            sf = SpecFile(self.fname)
+            self.assertEqual(len(sf), 4)
+            sf.close()
+            self.assertTrue(os.path.exists(index_fname))
+        finally:
+            silx.config.DEFAULT_SPECFILE_INDEX_DIRECTORY = previous
+        self.assertIsNone(specfile.default_index_filename(self.fname))
+
+
 class TestSFLocale(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
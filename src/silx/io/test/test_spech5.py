@@ -254,6 +254,26 @@ class TestSpecH5(unittest.TestCase):
             sum(self.sfh5["1.1"]["measurement"]["MRTSlit UP"]), 87.891, places=4
         )
 
+    def testDataColumnLazy(self):
+        dataset = self.sfh5["1.1"]["measurement"]["MRTSlit UP"]
+        self.assertIsInstance(dataset, spech5.DataColumnDataset)
+        self.assertEqual(dataset.shape, (4,))
+        self.assertEqual(dataset.dtype, numpy.float32)
+        # Reading lines before loading the whole column
+        first = dataset[0]
+        last = dataset[-1]
+        reversed_lines = dataset[::-1]
+        sliced = dataset[1:]
+        self.assertFalse(dataset._is_initialized)
+        data = dataset[()]
+        self.assertEqual(data.dtype, numpy.float32)
+        self.assertEqual(first, data[0])
+        self.assertEqual(last, data[-1])
+        numpy.testing.assert_array_equal(reversed_lines, data[::-1])
+        numpy.testing.assert_array_equal(sliced, data[1:])
+        with self.assertRaises(IndexError):
+            self.sfh5["1.1"]["measurement"]["MRTSlit UP"][4]
+
     def testDate(self):
         # start time is in Iso8601 format
         self.assertEqual(self.sfh5["/1.1/start_time"], "2016-02-11T09:55:20")
@@ -755,6 +775,18 @@ class TestSpecH5NoDataCols(unittest.TestCase):
 
         self.assertNotIn("mca_3", self.sfh5["3.1/instrument/"])
 
+    def testScan3McaSlicing(self):
+        # Reading a range of spectra must not load the whole dataset
+        expected = numpy.array([[7.0, 6.0, 5.0], [4.0, 3.0, 2.0]])
+        data = self.sfh5["3.1/instrument/mca_1/data"]
+        numpy.testing.assert_array_equal(data[1:], expected)
+        numpy.testing.assert_array_equal(data[:0:-1], expected[::-1])
+        numpy.testing.assert_array_equal(data[1:, 1], expected[:, 1])
+        self.assertEqual(data[3:].shape, (0, 3))
+        self.assertEqual(data[-1, 0], 4.0)
+        self.assertFalse(data._is_initialized)
+        numpy.testing.assert_array_equal(data[()][1:], expected)
+
 
 sf_text_slash = r"""#F /data/id09/archive/logspecfiles/laue/2016/scan_231_laue_16-11-29.dat
 #D Sat Dec 10 22:20:59 2016
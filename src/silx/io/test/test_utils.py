@@ -28,7 +28,10 @@ import os
 import re
 import shutil
 import tempfile
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 
 from .. import utils
 from ..._version import calc_hexversion
@@ -669,6 +672,213 @@ class TestGetData(unittest.TestCase):
         self.assertRaises(IOError, utils.get_data, url)
 
 
+class TestGetDataBatch(TestGetData):
+    """Test `silx.io.utils.get_data_batch` and `DataReader`."""
+
+    def setUp(self):
+        self.reader = utils.DataReader(max_open_files=2)
+        # Run the tests of get_data with the reader
+        self.patcher = mock.patch.object(utils, "get_data", self.reader.get_data)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+        self.reader.close()
+
+    def test_batch(self):
+        array2d = "silx:%s?path=/group/group/array2d&slice=%s" % (
+            self.h5_filename,
+            "%s",
+        )
+        urls = [
+            array2d % "1",
+            "fabio:%s?slice=1" % self.edf_multiframe_filename,
+            array2d % "0",
+            array2d % "1,2",
+            array2d % "0,2",
+            array2d % "1",
+            "silx:%s?/group/group/scalar" % self.h5_filename,
+            "fabio:%s?slice=0" % self.edf_filename,
+        ]
+        expected = [utils.get_data(url) for url in urls]
+        for max_workers in (None, 2):
+            with self.subTest(max_workers=max_workers):
+                result = utils.get_data_batch(urls, max_workers=max_workers)
+                self.assertEqual(len(result), len(expected))
+                for data, expected_data in zip(result, expected):
+                    numpy.testing.assert_array_equal(data, expected_data)
+                # duplicated URLs do not share memory
+                self.assertFalse(numpy.shares_memory(result[0], result[5]))
+
+    def test_batch_out_of_range(self):
+        urls = [
+            "silx:%s?path=/group/group/array2d&slice=%d" % (self.h5_filename, i)
+            for i in range(3)
+        ]
+        with self.assertRaises((ValueError, IndexError)):
+            self.reader.get_data_batch(urls)
+
+    def test_coalesced_read(self):
+        urls = [
+            "silx:%s?path=/group/group/array&slice=%d" % (self.h5_filename, i)
+            for i in (4, 0, 1, 2)
+        ]
+        with mock.patch.object(
+            utils, "h5py_read_dataset", wraps=utils.h5py_read_dataset
+        ) as read_dataset:
+            result = self.reader.get_data_batch(urls)
+        self.assertEqual(result, [5, 1, 2, 3])
+        self.assertEqual(read_dataset.call_count, 2)
+
+    def test_file_kept_open(self):
+        url = "silx:%s?/group/group/scalar" % self.h5_filename
+        with mock.patch.object(
+            utils, "_open_local_file", wraps=utils._open_local_file
+        ) as open_:
+            for _ in range(3):
+                self.assertEqual(self.reader.get_data(url), 50)
+        self.assertEqual(open_.call_count, 1)
+
+    def test_serialized_reads(self):
+        readers = []
+        max_readers = []
+        read_silx_data = utils._read_silx_data
+
+        def read(h5, url):
+            readers.append(url)
+            max_readers.append(len(readers))
+            time.sleep(0.01)
+            readers.remove(url)
+            return read_silx_data(h5, url)
+
+        url = "silx:%s?/group/group/scalar" % self.h5_filename
+        with mock.patch.object(utils, "_read_silx_data", side_effect=read):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(
+                    executor.map(lambda _: self.reader.get_data(url), range(8))
+                )
+        self.assertEqual(results, [50] * 8)
+        self.assertEqual(max(max_readers), 1)
+
+
+class TestFilePool(unittest.TestCase):
+    """Test `silx.io.utils.FilePool`."""
+
+    def setUp(self):
+        self.tmp_directory = tempfile.mkdtemp()
+        self.filenames = []
+        for i in range(3):
+            filename = os.path.join(self.tmp_directory, "test%d.h5" % i)
+            with h5py.File(filename, mode="w") as h5:
+                h5["data"] = numpy.arange(10) + i
+            self.filenames.append(filename)
+        self.pool = utils.FilePool(max_size=2)
+
+    def tearDown(self):
+        self.pool.close()
+        shutil.rmtree(self.tmp_directory)
+
+    def testSharedFile(self):
+        with mock.patch.object(
+            utils, "_open_local_file", wraps=utils._open_local_file
+        ) as open_:
+            h5 = utils.open(self.filenames[0], pool=self.pool)
+            dataset = utils.open(self.filenames[0] + "::/data", pool=self.pool)
+            sliced = self.pool.open(
+                "silx:%s?path=/data&slice=2:4" % self.filenames[0]
+            )
+            self.assertEqual(open_.call_count, 1)
+        self.assertTrue(utils.is_file(h5))
+        self.assertTrue(utils.is_dataset(dataset))
+        self.assertEqual(list(sliced[()]), [2, 3])
+
+        h5.close()
+        dataset.close()
+        sliced.close()
+        # The file is kept open for the next users
+        self.assertEqual(len(self.pool), 1)
+        url = "silx:%s?path=/data&slice=5" % self.filenames[0]
+        self.assertEqual(utils.get_data(url, pool=self.pool), 5)
+
+    def testLeastRecentlyUsed(self):
+        for filename in self.filenames:
+            with self.pool.open(filename) as h5:
+                self.assertEqual(h5["data"][0], int(filename[-4]))
+        self.assertEqual(len(self.pool), 2)
+
+    def testInUseFilesAreNotClosed(self):
+        files = [self.pool.open(filename) for filename in self.filenames]
+        self.assertEqual(len(self.pool), 3)
+        for h5 in files:
+            self.assertEqual(len(h5["data"]), 10)
+            h5.close()
+        self.assertEqual(len(self.pool), 2)
+
+    def testIdleTimeout(self):
+        pool = utils.FilePool(idle_timeout=0)
+        with pool:
+            with pool.open(self.filenames[0]) as h5:
+                self.assertEqual(h5["data"][0], 0)
+            time.sleep(0.01)
+            with pool.open(self.filenames[1]) as h5:
+                self.assertEqual(h5["data"][0], 1)
+                self.assertEqual(len(pool), 1)
+
+    def testModifiedFile(self):
+        filename = os.path.join(self.tmp_directory, "test.npy")
+        numpy.save(filename, numpy.arange(10))
+        dataset = self.pool.open(filename + "::/data")
+
+        numpy.save(filename, numpy.arange(10) + 1)
+        stat = os.stat(filename)
+        os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        with self.pool.open(filename + "::/data") as dataset2:
+            self.assertEqual(dataset2[0], 1)
+        # The stale file is still usable until it is released
+        self.assertEqual(dataset[0], 0)
+        dataset.close()
+        self.assertEqual(len(self.pool), 1)
+
+    def testSharedRootNode(self):
+        h5 = self.pool.open(self.filenames[0])
+        h5bis = self.pool.open(self.filenames[0])
+        h5.close()
+        self.assertEqual(h5bis["data"][1], 1)
+        h5bis.close()
+        self.assertEqual(len(self.pool), 1)
+
+    def testSerializedReads(self):
+        readers = []
+        max_readers = []
+        read_silx_data = utils._read_silx_data
+
+        def read(h5, url):
+            readers.append(url)
+            max_readers.append(len(readers))
+            time.sleep(0.01)
+            readers.remove(url)
+            return read_silx_data(h5, url)
+
+        url = "silx:%s?path=/data&slice=5" % self.filenames[0]
+        with mock.patch.object(utils, "_read_silx_data", side_effect=read):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(
+                    executor.map(
+                        lambda _: utils.get_data(url, pool=self.pool), range(8)
+                    )
+                )
+        self.assertEqual(results, [5] * 8)
+        self.assertEqual(max(max_readers), 1)
+
+    def testMissingPath(self):
+        with self.assertRaises(IOError):
+            self.pool.open(self.filenames[0] + "::/foo")
+        # The file was released
+        with self.pool.open(self.filenames[0] + "::/data") as dataset:
+            self.assertEqual(dataset[0], 0)
+
+
 def _h5_py_version_older_than(version):
     v_majeur, v_mineur, v_micro = [int(i) for i in h5py.version.version.split(".")[:3]]
     r_majeur, r_mineur, r_micro = [int(i) for i in version.split(".")]
@@ -24,6 +24,7 @@
 
 
 import h5py
+import pytest
 import numpy
 from silx.io import spech5
 
@@ -118,3 +119,39 @@ def test_with_spech5(tmp_path):
             },
         },
     )
+
+
+@pytest.mark.parametrize("max_workers", [None, 4])
+@pytest.mark.parametrize("shuffle", [False, True])
+def test_block_by_block(tmp_path, max_workers, shuffle):
+    """Test write_to_h5 of compressed datasets copied block by block"""
+    data = numpy.arange(7 * 9 * 11, dtype=numpy.uint16).reshape(7, 9, 11)
+    fobj = commonh5.File("filename.txt", mode="w")
+    fobj.create_dataset("dataset", data=data)
+
+    progress = []
+    output_filepath = tmp_path / "output.h5"
+    write_to_h5(
+        fobj,
+        str(output_filepath),
+        create_dataset_args={
+            "chunks": (2, 4, 11),
+            "compression": "gzip",
+            "shuffle": shuffle,
+        },
+        max_workers=max_workers,
+        block_size=data[:3].nbytes,
+        progress_callback=lambda *args: progress.append(args),
+    )
+
+    with h5py.File(output_filepath, mode="r") as h5file:
+        dataset = h5file["dataset"]
+        assert dataset.compression == "gzip"
+        assert dataset.shuffle == shuffle
+        numpy.testing.assert_array_equal(dataset[()], data)
+
+    # blocks aligned on the chunks: 2 rows per block
+    assert [args[1] for args in progress] == [
+        data[:i].nbytes for i in (2, 4, 6, 7)
+    ]
+    assert set(args[2] for args in progress) == {data.nbytes}
@@ -26,12 +26,17 @@ __authors__ = ["P. Knobel", "V. Valls"]
 __license__ = "MIT"
 __date__ = "03/12/2020"
 
+import collections
+import contextlib
 import enum
 import fnmatch
+import numbers
 import os
 import sys
+import threading
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Generator, Union, Optional
 import urllib.parse
 
@@ -56,6 +61,9 @@ logger = logging.getLogger(__name__)
 NEXUS_HDF5_EXT = [".h5", ".nx5", ".nxs", ".hdf", ".hdf5", ".cxi"]
 """List of possible extensions for HDF5 file formats."""
 
+DEFAULT_MAX_OPEN_FILES = 16
+"""Default maximum number of files kept open by a :class:`DataReader`"""
+
 
 class H5Type(enum.Enum):
     """Identify a set of HDF5 concepts"""
@@ -637,9 +645,11 @@ class _MainNode(Proxy):
 
     def __init__(self, h5_node, h5_file):
         super(_MainNode, self).__init__(h5_node)
-        self.__node = h5_node
-        self.__file = h5_file
-        self.__class = get_h5_class(h5_node)
+        # Store the attributes in the proxy rather than in the node, which can
+        # be shared by several proxies (see FilePool)
+        object.__setattr__(self, "_MainNode__node", h5_node)
+        object.__setattr__(self, "_MainNode__file", h5_file)
+        object.__setattr__(self, "_MainNode__class", get_h5_class(h5_node))
 
     @property
     def h5_class(self):
@@ -667,10 +677,10 @@ class _MainNode(Proxy):
     def close(self):
         """Close the file"""
         self.__file.close()
-        self.__file = None
+        object.__setattr__(self, "_MainNode__file", None)
 
 
-def open(filename):  # pylint:disable=redefined-builtin
+def open(filename, pool=None):  # pylint:disable=redefined-builtin
     """
     Open a file as an `h5py`-like object.
 
@@ -689,9 +699,14 @@ def open(filename):  # pylint:disable=redefined-builtin
 
     :param str filename: A filename which can containt an HDF5 path by using
         `::` separator.
+    :param Union[FilePool,None] pool: If provided, the file is shared with
+        the other users of this pool, see :meth:`FilePool.open`.
     :raises: IOError if the file can't be loaded or path can't be found
     :rtype: h5py-like node
     """
+    if pool is not None:
+        return pool.open(filename)
+
     url = DataUrl(filename)
 
     if url.scheme() in [None, "file", "silx"]:
@@ -704,10 +719,26 @@ def open(filename):  # pylint:disable=redefined-builtin
     else:
         raise IOError(f"Unsupported URL scheme {url.scheme}: {filename}")
 
+    return _get_url_node(filename, url, h5_file, h5_file)
+
+
+def _get_url_node(filename, url, h5_file, owner):
+    """Returns the node of an opened file targeted by an URL.
+
+    :param str filename: The URL as provided by the user
+    :param DataUrl url: The parsed URL
+    :param h5_file: The opened file
+    :param owner: Object closed when the returned node is closed. If it is
+        `h5_file` itself, the file is returned as it is when the full file
+        is requested.
+    :raises: IOError if the path can't be found
+    """
     if url.data_path() in [None, "/", ""]:  # The full file is requested
         if url.data_slice():
             raise IOError(f"URL '{filename}' containing slicing is not supported")
-        return h5_file
+        if owner is h5_file:
+            return h5_file
+        return _MainNode(h5_file, owner)
     else:
         # Only a children is requested
         if url.data_path() not in h5_file:
@@ -719,16 +750,251 @@ def open(filename):  # pylint:disable=redefined-builtin
             from . import _sliceh5  # Lazy-import to avoid circular dependency
 
             try:
-                return _sliceh5.DatasetSlice(node, url.data_slice(), attrs=node.attrs)
+                node = _sliceh5.DatasetSlice(node, url.data_slice(), attrs=node.attrs)
             except ValueError:
                 raise IOError(
                     f"URL {filename} contains slicing, but it is not a dataset"
                 )
+            if owner is h5_file:
+                return node
 
-        proxy = _MainNode(node, h5_file)
+        proxy = _MainNode(node, owner)
         return proxy
 
 
+class _PooledFile:
+    """A file opened by a :class:`FilePool`"""
+
+    __slots__ = ("file", "lock", "signature", "users", "last_used", "stale")
+
+    def __init__(self, opened_file, signature):
+        self.file = opened_file
+        self.lock = threading.RLock()
+        """Lock serializing the reads of the file"""
+        self.signature = signature
+        self.users = 0
+        self.last_used = time.monotonic()
+        self.stale = False
+        """True if the file was removed from the pool while in use"""
+
+
+class _FileLease:
+    """Use of a file of a :class:`FilePool`, which is released by
+    :meth:`close`."""
+
+    def __init__(self, pool, entry):
+        self.__pool = pool
+        self.__entry = entry
+
+    @property
+    def file(self):
+        return self.__entry.file
+
+    @property
+    def lock(self):
+        """Lock to hold while reading the file, which can be shared with
+        other threads"""
+        return self.__entry.lock
+
+    def close(self):
+        """Release the file"""
+        if self.__entry is not None:
+            self.__pool._release(self.__entry)
+            self.__entry = None
+
+
+class FilePool:
+    """Pool of opened files shared between the calls to :meth:`open`.
+
+    :meth:`open` behaves like :func:`silx.io.open`, but it returns a proxy
+    to a file which is kept open and shared with the other users of the
+    pool. Closing the proxy releases the file without closing it.
+
+    A file which is not in use is closed when:
+
+    - more than `max_size` files are open, the least recently used first,
+    - it was not used for more than `idle_timeout` seconds,
+    - it was modified on disk (its modification time or its size changed).
+      The next call to :meth:`open` opens it again.
+
+    The pool can be used from several threads, but the files are shared
+    between them: :func:`get_data` and :class:`DataReader` hold a lock per
+    file while reading, while the objects returned by :meth:`open` are not
+    protected against concurrent reads.
+    Like :func:`silx.io.open`, the files are opened in read-only mode.
+
+    >>> pool = FilePool(max_size=32, idle_timeout=60)
+    >>> with pool.open("data.h5::/entry/data") as dataset:
+    ...     frame = dataset[0]
+    >>> data = silx.io.get_data("data.h5::/entry/data[1]", pool=pool)
+
+    :param int max_size: Maximum number of files kept open when not in use
+    :param Union[float,None] idle_timeout: Delay in seconds after which a
+        file which is not in use is closed. The delay is checked each time
+        the pool is used. If None, the files are kept open.
+    """
+
+    def __init__(self, max_size=DEFAULT_MAX_OPEN_FILES, idle_timeout=None):
+        self.__max_size = max(1, max_size)
+        self.__idle_timeout = idle_timeout
+        self.__lock = threading.Lock()
+        self.__files = collections.OrderedDict()
+        """Opened files from least to most recently used:
+        (scheme, path) -> _PooledFile"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self):
+        """Returns the number of files in the pool"""
+        with self.__lock:
+            return len(self.__files)
+
+    def close(self):
+        """Close all the files of the pool.
+
+        The files which are in use are closed when they are released.
+        """
+        to_close = []
+        with self.__lock:
+            for entry in self.__files.values():
+                entry.stale = True
+                if entry.users == 0:
+                    to_close.append(entry.file)
+            self.__files.clear()
+        self.__close_files(to_close)
+
+    def open(self, filename):
+        """Open a file as an `h5py`-like object, like :func:`silx.io.open`.
+
+        The returned object is a proxy which must be closed (or used as a
+        context manager) to release the file.
+
+        :param str filename: A filename which can containt an HDF5 path by
+            using `::` separator.
+        :raises: IOError if the file can't be loaded or path can't be found
+        :rtype: h5py-like node
+        """
+        url = DataUrl(filename)
+        if url.scheme() not in [None, "file", "silx"]:
+            # Remote files are not shared
+            return open(filename)
+        if not url.is_valid():
+            raise IOError("URL '%s' is not valid" % filename)
+
+        lease = self._acquire("silx", url.file_path())
+        try:
+            return _get_url_node(filename, url, lease.file, lease)
+        except Exception:
+            lease.close()
+            raise
+
+    @staticmethod
+    def __close_files(files):
+        for opened_file in files:
+            try:
+                opened_file.close()
+            except Exception:
+                logger.debug("Error while closing %s", opened_file, exc_info=True)
+
+    def __remove(self, key):
+        """Remove a file from the pool.
+
+        Must be called with the lock held.
+
+        :returns: The list of files to close
+        """
+        entry = self.__files.pop(key)
+        entry.stale = True
+        if entry.users == 0:
+            return [entry.file]
+        return []
+
+    def __evict(self):
+        """Remove the expired and least recently used files which are not
+        in use.
+
+        Must be called with the lock held.
+
+        :returns: The list of files to close
+        """
+        now = time.monotonic()
+        to_close = []
+        for key, entry in list(self.__files.items()):
+            if entry.users > 0:
+                continue
+            expired = (
+                self.__idle_timeout is not None
+                and now - entry.last_used > self.__idle_timeout
+            )
+            if expired or len(self.__files) > self.__max_size:
+                to_close.extend(self.__remove(key))
+        return to_close
+
+    def _acquire(self, scheme, file_path):
+        """Returns a lease on an opened file, opening it if needed.
+
+        :param str scheme: "silx" to open the file with
+            :func:`silx.io.open`, or "fabio" to open it with
+            :func:`fabio.open`
+        :param str file_path: Path of the file
+        :rtype: _FileLease
+        """
+        key = scheme, os.path.abspath(file_path)
+        stat = os.stat(file_path)
+        signature = stat.st_mtime_ns, stat.st_size
+
+        to_close = []
+        with self.__lock:
+            entry = self.__files.get(key)
+            if entry is not None and entry.signature != signature:
+                # The file was modified
+                to_close.extend(self.__remove(key))
+                entry = None
+            if entry is not None:
+                entry.users += 1
+                self.__files.move_to_end(key)
+        self.__close_files(to_close)
+
+        if entry is None:
+            if scheme == "silx":
+                opened_file = _open_local_file(file_path)
+            else:
+                opened_file = _open_fabio_file(file_path)
+            to_close = []
+            with self.__lock:
+                entry = self.__files.get(key)
+                if entry is not None and entry.signature == signature:
+                    # The same file was opened concurrently
+                    to_close.append(opened_file)
+                else:
+                    if entry is not None:
+                        to_close.extend(self.__remove(key))
+                    entry = _PooledFile(opened_file, signature)
+                    self.__files[key] = entry
+                entry.users += 1
+                self.__files.move_to_end(key)
+                to_close.extend(self.__evict())
+            self.__close_files(to_close)
+
+        return _FileLease(self, entry)
+
+    def _release(self, entry):
+        """Release a file acquired with :meth:`_acquire`"""
+        with self.__lock:
+            entry.users -= 1
+            entry.last_used = time.monotonic()
+            if entry.stale and entry.users == 0:
+                to_close = [entry.file]
+            else:
+                to_close = []
+            to_close.extend(self.__evict())
+        self.__close_files(to_close)
+
+
 def _get_classes_type():
     """Returns a mapping between Python classes and HDF5 concepts.
 
@@ -959,7 +1225,78 @@ def match(group, path_pattern: str) -> Generator[str, None, None]:
                 yield f"{matching_path}/{matching_subpath}"
 
 
-def get_data(url: Union[str, DataUrl]):
+def _read_silx_data(h5, url: DataUrl):
+    """Returns the data targeted by a `silx` URL from an opened file.
+
+    :param h5: File opened with :meth:`silx.io.open`
+    :param url: A data URL
+    :raises ValueError: If the data path do not match a dataset
+    """
+    data_path = url.data_path()
+    data_slice = url.data_slice()
+    if data_path not in h5:
+        raise ValueError("Data path from URL '%s' not found" % url.path())
+    data = h5[data_path]
+
+    if not is_dataset(data):
+        raise ValueError("Data path from URL '%s' is not a dataset" % url.path())
+
+    if data_slice is not None:
+        return h5py_read_dataset(data, index=data_slice)
+    # works for scalar and array
+    return h5py_read_dataset(data)
+
+
+def _get_fabio_frame_index(url: DataUrl) -> int:
+    """Returns the index of the frame targeted by a `fabio` URL.
+
+    :raises ValueError: If the slicing of the URL is not a single integer
+    """
+    data_slice = url.data_slice()
+    if data_slice is None:
+        data_slice = (0,)
+    if data_slice is None or len(data_slice) != 1:
+        raise ValueError("Fabio slice expect a single frame, but %s found" % data_slice)
+    index = data_slice[0]
+    if not isinstance(index, int):
+        raise ValueError(
+            "Fabio slice expect a single integer, but %s found" % data_slice
+        )
+    return index
+
+
+def _open_fabio_file(file_path: str):
+    """Open a file with :meth:`fabio.open`.
+
+    :raises IOError: In case of internal error of :meth:`fabio.open`
+    """
+    import fabio
+
+    try:
+        return fabio.open(file_path)
+    except Exception:
+        logger.debug("Error while opening %s with fabio", file_path, exc_info=True)
+        raise IOError(
+            "Error while opening %s with fabio (use debug for more information)"
+            % file_path
+        )
+
+
+def _read_fabio_frame(fabio_file, index: int):
+    """Returns the data of a frame from an opened fabio file.
+
+    :raises ValueError: If the frame is out of range
+    """
+    if fabio_file.nframes == 1:
+        if index != 0:
+            raise ValueError(
+                "Only a single frame available. Slice %s out of range" % index
+            )
+        return fabio_file.data
+    return fabio_file.getframe(index).data
+
+
+def get_data(url: Union[str, DataUrl], pool: Optional[FilePool] = None):
     """Returns a numpy data from an URL.
 
     Examples:
@@ -985,6 +1322,8 @@ def get_data(url: Union[str, DataUrl]):
     .. seealso:: :class:`silx.io.url.DataUrl`
 
     :param url: A data URL
+    :param pool: If provided, the file is kept open in this pool of files
+        for the next reads
     :rtype: Union[numpy.ndarray, numpy.generic]
     :raises ImportError: If the mandatory library to read the file is not
         available.
@@ -1003,63 +1342,31 @@ def get_data(url: Union[str, DataUrl]):
         raise IOError("File '%s' not found" % url.file_path())
 
     if url.scheme() == "silx":
-        data_path = url.data_path()
-        data_slice = url.data_slice()
-
-        with open(url.file_path()) as h5:
-            if data_path not in h5:
-                raise ValueError("Data path from URL '%s' not found" % url.path())
-            data = h5[data_path]
-
-            if not is_dataset(data):
-                raise ValueError(
-                    "Data path from URL '%s' is not a dataset" % url.path()
-                )
-
-            if data_slice is not None:
-                data = h5py_read_dataset(data, index=data_slice)
-            else:
-                # works for scalar and array
-                data = h5py_read_dataset(data)
+        if pool is None:
+            with open(url.file_path()) as h5:
+                data = _read_silx_data(h5, url)
+        else:
+            lease = pool._acquire("silx", url.file_path())
+            try:
+                with lease.lock:
+                    data = _read_silx_data(lease.file, url)
+            finally:
+                lease.close()
 
     elif url.scheme() == "fabio":
-        import fabio
-
-        data_slice = url.data_slice()
-        if data_slice is None:
-            data_slice = (0,)
-        if data_slice is None or len(data_slice) != 1:
-            raise ValueError(
-                "Fabio slice expect a single frame, but %s found" % data_slice
-            )
-        index = data_slice[0]
-        if not isinstance(index, int):
-            raise ValueError(
-                "Fabio slice expect a single integer, but %s found" % data_slice
-            )
-
-        try:
-            fabio_file = fabio.open(url.file_path())
-        except Exception:
-            logger.debug(
-                "Error while opening %s with fabio", url.file_path(), exc_info=True
-            )
-            raise IOError(
-                "Error while opening %s with fabio (use debug for more information)"
-                % url.path()
-            )
-
-        if fabio_file.nframes == 1:
-            if index != 0:
-                raise ValueError(
-                    "Only a single frame available. Slice %s out of range" % index
-                )
-            data = fabio_file.data
+        index = _get_fabio_frame_index(url)
+        if pool is None:
+            fabio_file = _open_fabio_file(url.file_path())
+            data = _read_fabio_frame(fabio_file, index)
+            # There is no explicit close
+            fabio_file = None
         else:
-            data = fabio_file.getframe(index).data
-
-        # There is no explicit close
-        fabio_file = None
+            lease = pool._acquire("fabio", url.file_path())
+            try:
+                with lease.lock:
+                    data = _read_fabio_frame(lease.file, index)
+            finally:
+                lease.close()
 
     elif url.scheme() is None:
         for scheme in ("silx", "fabio"):
@@ -1070,7 +1377,7 @@ def get_data(url: Union[str, DataUrl]):
                 scheme=scheme,
             )
             try:
-                data = get_data(specificUrl)
+                data = get_data(specificUrl, pool=pool)
             except Exception:
                 logger.debug(
                     "Error while trying to loading %s as %s", url, scheme, exc_info=True
@@ -1085,6 +1392,254 @@ def get_data(url: Union[str, DataUrl]):
     return data
 
 
+def _consecutive_ranges(indices):
+    """Returns the ranges of consecutive values of a sorted sequence of
+    unique integers as a list of `(start, stop)`."""
+    ranges = []
+    for index in indices:
+        if ranges and ranges[-1][1] == index:
+            ranges[-1][1] = index + 1
+        else:
+            ranges.append([index, index + 1])
+    return ranges
+
+
+def _slicing_key(data_slice):
+    """Returns a hashable version of a data slice"""
+    return tuple(
+        (item.start, item.stop, item.step) if isinstance(item, slice) else item
+        for item in data_slice
+    )
+
+
+class DataReader:
+    """Read data from URLs, keeping the files open between the reads.
+
+    The files are kept open in a :class:`FilePool` of at most
+    `max_open_files` files, the least recently used files being closed
+    first. The reader should be closed (or used as a context manager) to
+    close the remaining files.
+
+    >>> with DataReader() as reader:
+    ...     frames = reader.get_data_batch(
+    ...         [f"silx:/users/foo/data.h5::/entry/data[{i}]" for i in range(500)]
+    ...     )
+
+    The files are opened with the same schemes as :func:`get_data`.
+    The reads of the same file from several threads are serialized.
+
+    :param int max_open_files: Maximum number of files kept open
+    :param Union[int,None] max_workers: Number of threads used by
+        :meth:`get_data_batch` to read from different files at the same
+        time. If None or lower than 2, the files are read sequentially.
+    """
+
+    def __init__(self, max_open_files=DEFAULT_MAX_OPEN_FILES, max_workers=None):
+        self.__pool = FilePool(max_size=max_open_files)
+        self.__max_workers = max_workers
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Close all the files opened by the reader"""
+        self.__pool.close()
+
+    @contextlib.contextmanager
+    def _open(self, url: DataUrl, scheme: str):
+        """Context manager providing the opened file of an URL.
+
+        :param url: A data URL
+        :param scheme: Either "silx" or "fabio"
+        """
+        lease = self.__pool._acquire(scheme, url.file_path())
+        try:
+            with lease.lock:
+                yield lease.file
+        finally:
+            lease.close()
+
+    def get_data(self, url: Union[str, DataUrl]):
+        """Returns a numpy data from an URL.
+
+        This is the same as :func:`get_data`, except that the file is kept
+        open for the next reads.
+
+        :param url: A data URL
+        :rtype: Union[numpy.ndarray, numpy.generic]
+        """
+        if not isinstance(url, DataUrl):
+            url = DataUrl(url)
+
+        if not url.is_valid():
+            raise ValueError("URL '%s' is not valid" % url.path())
+
+        if not os.path.exists(url.file_path()):
+            raise IOError("File '%s' not found" % url.file_path())
+
+        if url.scheme() == "silx":
+            with self._open(url, "silx") as h5:
+                return _read_silx_data(h5, url)
+
+        if url.scheme() == "fabio":
+            index = _get_fabio_frame_index(url)
+            with self._open(url, "fabio") as fabio_file:
+                return _read_fabio_frame(fabio_file, index)
+
+        if url.scheme() is None:
+            for scheme in ("silx", "fabio"):
+                specificUrl = DataUrl(
+                    file_path=url.file_path(),
+                    data_slice=url.data_slice(),
+                    data_path=url.data_path(),
+                    scheme=scheme,
+                )
+                try:
+                    return self.get_data(specificUrl)
+                except Exception:
+                    logger.debug(
+                        "Error while trying to loading %s as %s",
+                        url,
+                        scheme,
+                        exc_info=True,
+                    )
+            raise ValueError(f"Data from '{url}' is not readable as silx nor fabio")
+
+        raise ValueError("Scheme '%s' not supported" % url.scheme())
+
+    def get_data_batch(self, urls):
+        """Returns the numpy data of many URLs.
+
+        The URLs are grouped by file, so that each file is opened once.
+        URLs selecting consecutive items of the first axis of the same
+        dataset (e.g. ``data.h5::/data[0]``, ``data.h5::/data[1]``...) are
+        read with a single request.
+
+        :param urls: Sequence of data URLs
+        :returns: The data of each URL, in the same order
+        :rtype: List[Union[numpy.ndarray, numpy.generic]]
+        :raises: The same errors as :func:`get_data`
+        """
+        urls = [url if isinstance(url, DataUrl) else DataUrl(url) for url in urls]
+        results = [None] * len(urls)
+
+        groups = collections.OrderedDict()
+        for index, url in enumerate(urls):
+            file_path = url.file_path()
+            if file_path is not None:
+                file_path = os.path.abspath(file_path)
+            groups.setdefault(file_path, []).append(index)
+
+        def read_group(indices):
+            self.__read_file_urls(urls, indices, results)
+
+        max_workers = self.__max_workers
+        if max_workers is not None and max_workers >= 2 and len(groups) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # list() propagates the exceptions
+                list(executor.map(read_group, groups.values()))
+        else:
+            for indices in groups.values():
+                read_group(indices)
+        return results
+
+    def __read_file_urls(self, urls, indices, results):
+        """Read the data of URLs of the same file.
+
+        :param List[DataUrl] urls: All the URLs
+        :param List[int] indices: Indices of the URLs of the file
+        :param list results: List where to store the data of each URL
+        """
+        # (scheme, data path, slicing of the other axes) -> {row: [url indices]}
+        datasets = collections.OrderedDict()
+        others = []
+        for index in indices:
+            url = urls[index]
+            data_slice = url.data_slice()
+            if (
+                url.scheme() in (None, "silx")
+                and url.is_valid()
+                and url.data_path() is not None
+                and data_slice
+                and isinstance(data_slice[0], numbers.Integral)
+                and data_slice[0] >= 0
+            ):
+                key = url.scheme(), url.data_path(), _slicing_key(data_slice[1:])
+                rows = datasets.setdefault(key, {})
+                rows.setdefault(data_slice[0], []).append(index)
+            else:
+                others.append(index)
+
+        for rows in datasets.values():
+            if len(rows) == 1:
+                others.extend(next(iter(rows.values())))
+                continue
+            try:
+                self.__read_rows(urls, rows, results)
+            except Exception:
+                # Let get_data raise the appropriate error
+                logger.debug("Backtrace", exc_info=True)
+                for row_indices in rows.values():
+                    others.extend(row_indices)
+
+        for index in others:
+            results[index] = self.get_data(urls[index])
+
+    def __read_rows(self, urls, rows, results):
+        """Read rows of the same dataset, merging consecutive rows in a
+        single request.
+
+        :param List[DataUrl] urls: All the URLs
+        :param dict rows: Mapping from rows to indices of URLs
+        :param list results: List where to store the data of each URL
+        """
+        url = urls[next(iter(rows.values()))[0]]
+        other_axes = url.data_slice()[1:]
+        with self._open(url, "silx") as h5:
+            if url.data_path() not in h5:
+                raise ValueError("Data path from URL '%s' not found" % url.path())
+            dataset = h5[url.data_path()]
+            if not is_dataset(dataset):
+                raise ValueError(
+                    "Data path from URL '%s' is not a dataset" % url.path()
+                )
+            for start, stop in _consecutive_ranges(sorted(rows.keys())):
+                block = h5py_read_dataset(
+                    dataset, index=(slice(start, stop),) + other_axes
+                )
+                if len(block) != stop - start:
+                    raise IndexError("Index out of range")
+                for row in range(start, stop):
+                    for count, index in enumerate(rows[row]):
+                        data = block[row - start]
+                        if count > 0:
+                            # Do not share the memory between duplicated URLs
+                            data = numpy.array(data, copy=True)
+                        results[index] = data
+
+
+def get_data_batch(
+    urls, max_open_files=DEFAULT_MAX_OPEN_FILES, max_workers=None
+) -> list:
+    """Returns the numpy data of many URLs.
+
+    Each file is opened once, and consecutive items of the same dataset
+    are read in a single request. See :meth:`DataReader.get_data_batch`.
+
+    :param urls: Sequence of data URLs
+    :param int max_open_files: Maximum number of files kept open at once
+    :param Union[int,None] max_workers: Number of threads used to read from
+        different files at the same time
+    :returns: The data of each URL, in the same order
+    :rtype: List[Union[numpy.ndarray, numpy.generic]]
+    """
+    with DataReader(max_open_files=max_open_files, max_workers=max_workers) as reader:
+        return reader.get_data_batch(urls)
+
+
 def rawfile_to_h5_external_dataset(bin_file, output_url, shape, dtype, overwrite=False):
     """
     Create a HDF5 dataset at `output_url` pointing to the given vol_file.
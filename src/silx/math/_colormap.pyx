@@ -31,10 +31,9 @@
 
 __authors__ = ["T. Vincent"]
 __license__ = "MIT"
-__date__ = "21/12/2023"
+__date__ = "18/10/2026"
 
 
-import os
 cimport cython
 from cython.parallel import prange
 from libc.math cimport frexp, sinh, sqrt
@@ -47,19 +46,15 @@ import numbers
 
 import numpy
 
+from ..utils._openmp import get_num_threads
+
 __all__ = ['cmap']
 
 _logger = logging.getLogger(__name__)
 
 
-cdef int DEFAULT_NUM_THREADS
-if hasattr(os, 'sched_getaffinity'):
-    DEFAULT_NUM_THREADS = min(4, len(os.sched_getaffinity(0)))
-elif os.cpu_count() is not None:
-    DEFAULT_NUM_THREADS = min(4, os.cpu_count())
-else:  # Fallback
-    DEFAULT_NUM_THREADS = 1
-# Number of threads to use for the computation (initialized to up to 4)
+cdef int MAX_NUM_THREADS = 4
+# Maximum number of threads used by default for the computation
 
 cdef int USE_OPENMP_THRESHOLD = 1000
 """OpenMP is not used for arrays with less elements than this threshold"""
@@ -301,13 +296,14 @@ cdef class PowerNormalization(Normalization):
 @cython.boundscheck(False)
 @cython.nonecheck(False)
 @cython.cdivision(True)
-cdef image_types[:, ::1] compute_cmap(
+cdef void compute_cmap(
            default_types[:] data,
            image_types[:, ::1] colors,
            Normalization normalization,
            double vmin,
            double vmax,
-           image_types[::1] nan_color):
+           image_types[::1] nan_color,
+           image_types[:, ::1] output) except *:
     """Apply colormap to data.
 
     :param data: Input data
@@ -316,19 +312,16 @@ cdef image_types[:, ::1] compute_cmap(
     :param vmax: Upper bound of the colormap range
     :param nan_color: Color to use for NaN value
     :param normalization: Normalization to apply
-    :return: Data converted to colors
+    :param output: Buffer where to store data converted to colors
     """
-    cdef image_types[:, ::1] output
     cdef double scale, value, normalized_vmin, normalized_vmax
-    cdef int length, nb_channels, nb_colors
-    cdef int channel, index, lut_index, num_threads
+    cdef Py_ssize_t length, index
+    cdef int nb_channels, nb_colors
+    cdef int channel, lut_index, num_threads
 
     nb_colors = <int> colors.shape[0]
     nb_channels = <int> colors.shape[1]
-    length = <int> data.size
-
-    output = numpy.empty((length, nb_channels),
-                         dtype=numpy.asarray(colors).dtype)
+    length = data.size
 
     normalized_vmin = normalization.apply_double(vmin, vmin, vmax)
     normalized_vmax = normalization.apply_double(vmax, vmin, vmax)
@@ -344,9 +337,7 @@ cdef image_types[:, ::1] compute_cmap(
     if length < USE_OPENMP_THRESHOLD:
         num_threads = 1
     else:
-        num_threads = min(
-            DEFAULT_NUM_THREADS,
-            int(os.environ.get("OMP_NUM_THREADS", DEFAULT_NUM_THREADS)))
+        num_threads = get_num_threads(max_threads=MAX_NUM_THREADS)
 
     with nogil:
         for index in prange(length, num_threads=num_threads):
@@ -372,19 +363,18 @@ cdef image_types[:, ::1] compute_cmap(
             for channel in range(nb_channels):
                 output[index, channel] = colors[lut_index, channel]
 
-    return output
-
 @cython.wraparound(False)
 @cython.boundscheck(False)
 @cython.nonecheck(False)
 @cython.cdivision(True)
-cdef image_types[:, ::1] compute_cmap_with_lut(
+cdef void compute_cmap_with_lut(
                lut_types[:] data,
                image_types[:, ::1] colors,
                Normalization normalization,
                double vmin,
                double vmax,
-               image_types[::1] nan_color):
+               image_types[::1] nan_color,
+               image_types[:, ::1] output) except *:
     """Convert data to colors using look-up table to speed the process.
 
     Only supports data of types: uint8, uint16, int8, int16.
@@ -395,16 +385,16 @@ cdef image_types[:, ::1] compute_cmap_with_lut(
     :param vmax: Upper bound of the colormap range
     :param nan_color: Color to use for NaN values
     :param normalization: Normalization to apply
-    :return: The generated image
+    :param output: Buffer where to store the generated image
     """
-    cdef image_types[:, ::1] output
     cdef double[:] values
     cdef image_types[:, ::1] lut
     cdef int type_min, type_max
-    cdef int nb_channels, length
-    cdef int channel, index, lut_index, num_threads
+    cdef int nb_channels
+    cdef Py_ssize_t length, index
+    cdef int channel, lut_index, num_threads
 
-    length = <int> data.size
+    length = data.size
     nb_channels = <int> colors.shape[1]
 
     if lut_types is int8_t:
@@ -423,17 +413,14 @@ cdef image_types[:, ::1] compute_cmap_with_lut(
     colors_dtype = numpy.array(colors).dtype
 
     values = numpy.arange(type_min, type_max + 1, dtype=numpy.float64)
-    lut = compute_cmap(
-        values, colors, normalization, vmin, vmax, nan_color)
-
-    output = numpy.empty((length, nb_channels), dtype=colors_dtype)
+    lut = numpy.empty((values.shape[0], nb_channels), dtype=colors_dtype)
+    compute_cmap(
+        values, colors, normalization, vmin, vmax, nan_color, lut)
 
     if length < USE_OPENMP_THRESHOLD:
         num_threads = 1
     else:
-        num_threads = min(
-            DEFAULT_NUM_THREADS,
-            int(os.environ.get("OMP_NUM_THREADS", DEFAULT_NUM_THREADS)))
+        num_threads = get_num_threads(max_threads=MAX_NUM_THREADS)
 
     with nogil:
         # Apply LUT
@@ -442,8 +429,6 @@ cdef image_types[:, ::1] compute_cmap_with_lut(
             for channel in range(nb_channels):
                 output[index, channel] = lut[lut_index, channel]
 
-    return output
-
 
 # Normalizations without parameters
 _BASIC_NORMALIZATIONS = {
@@ -463,7 +448,8 @@ def _cmap(data_types[:] data,
           Normalization normalization,
           double vmin,
           double vmax,
-          image_types[::1] nan_color):
+          image_types[::1] nan_color,
+          image_types[:, ::1] output):
     """Implementation of colormap.
 
     Use :func:`cmap`.
@@ -474,31 +460,28 @@ def _cmap(data_types[:] data,
     :param vmin: Lower bound of the colormap range
     :param vmax: Upper bound of the colormap range
     :param nan_color: Color to use for NaN value.
-    :return: The generated image
+    :param output: Buffer where to store the generated image
     """
-    cdef image_types[:, ::1] output
-
     # Proxy for calling the right implementation depending on data type
     if data_types in lut_types:  # Use LUT implementation
-        output = compute_cmap_with_lut(
-            data, colors, normalization, vmin, vmax, nan_color)
+        compute_cmap_with_lut(
+            data, colors, normalization, vmin, vmax, nan_color, output)
 
     elif data_types in default_types:  # Use default implementation
-        output = compute_cmap(
-            data, colors, normalization, vmin, vmax, nan_color)
+        compute_cmap(
+            data, colors, normalization, vmin, vmax, nan_color, output)
 
     else:
         raise ValueError('Unsupported data type')
 
-    return numpy.array(output, copy=False)
-
 
 def cmap(data not None,
          colors not None,
          double vmin,
          double vmax,
          normalization='linear',
-         nan_color=None):
+         nan_color=None,
+         output=None):
     """Convert data to colors with provided colors look-up table.
 
     :param numpy.ndarray data: The input data
@@ -517,11 +500,16 @@ def cmap(data not None,
 
     :param nan_color: Color to use for NaN value.
         Default: A color with all channels set to 0
+    :param Union[numpy.ndarray,None] output:
+        C-contiguous array where to store the colors.
+        It MUST have the shape and the dtype of the returned array.
+        Default: A new array is allocated
     :return: Array of colors. The shape of the
         returned array is that of data array + the last dimension of colors.
         The dtype of the returned array is that of the colors array.
     :rtype: numpy.ndarray
     :raises ValueError: If data of colors dtype is not supported
+        or if output is not compatible
     """
     cdef int nb_channels
     cdef Normalization norm
@@ -566,13 +554,25 @@ def cmap(data not None,
             nan_color, dtype=colors.dtype).reshape(-1)
     assert nan_color.shape == (nb_channels,)
 
-    image = _cmap(
+    shape = data.shape + (nb_channels,)
+    if output is None:
+        output = numpy.empty(shape, dtype=colors.dtype)
+    elif (not isinstance(output, numpy.ndarray) or
+            output.shape != shape or
+            output.dtype != colors.dtype or
+            not output.flags.c_contiguous or
+            not output.flags.writeable):
+        raise ValueError(
+            "output must be a writable C-contiguous array of shape %s and dtype %s" %
+            (shape, colors.dtype))
+
+    _cmap(
         data.reshape(-1),
         colors.reshape(-1, nb_channels),
         norm,
         vmin,
         vmax,
-        nan_color)
-    image.shape = data.shape + (nb_channels,)
+        nan_color,
+        output.reshape(-1, nb_channels))
 
-    return image
+    return output
@@ -23,7 +23,7 @@
 
 __authors__ = ["D. Naudet"]
 __license__ = "MIT"
-__date__ = "02/10/2017"
+__date__ = "18/10/2026"
 
 cimport cython
 from libc.stdint cimport int32_t, uint32_t
@@ -41,7 +41,8 @@ def chistogramnd(sample,
                  last_bin_closed=False,
                  histo=None,
                  weighted_histo=None,
-                 wh_dtype=None):
+                 wh_dtype=None,
+                 num_threads=None):
     """Computes the multidimensional histogram of some data.
 
     :param sample:
@@ -143,6 +144,14 @@ def chistogramnd(sample,
         *weights*. Allowed values are : `numpu.double` and `numpy.float32`.
     :type wh_dtype: *optional*, numpy data type
 
+    :param num_threads: Number of threads used to compute the histogram.
+        Each thread accumulates a private histogram which are summed at the
+        end (or updates the shared histogram with atomic operations if the
+        private histograms would be too big).
+        Default: 1, i.e., no multithreading.
+        Ignored if silx was compiled without OpenMP support.
+    :type num_threads: *optional*, int
+
     :return: Histogram (bin counts, always returned), weighted histogram of
         the sample (or *None* if weights is *None*) and bin edges for each
         dimension.
@@ -150,6 +159,10 @@ def chistogramnd(sample,
         (:class:`numpy.array`, None, `tuple`)
     """
 
+    if num_threads is None:
+        num_threads = 1
+    num_threads = max(1, int(num_threads))
+
     if wh_dtype is None:
         wh_dtype = np.double
     elif wh_dtype not in (np.double, np.float32):
@@ -342,7 +355,8 @@ def chistogramnd(sample,
                                                        bin_edges_c,
                                                        option_flags,
                                                        weight_min=weight_min,
-                                                       weight_max=weight_max)
+                                                       weight_max=weight_max,
+                                                       num_threads=num_threads)
 
             elif weights_type == np.float32:
 
@@ -357,7 +371,8 @@ def chistogramnd(sample,
                                                       bin_edges_c,
                                                       option_flags,
                                                       weight_min=weight_min,
-                                                      weight_max=weight_max)
+                                                      weight_max=weight_max,
+                                                      num_threads=num_threads)
 
             elif weights_type == np.int32:
 
@@ -372,7 +387,8 @@ def chistogramnd(sample,
                                                         bin_edges_c,
                                                         option_flags,
                                                         weight_min=weight_min,
-                                                        weight_max=weight_max)
+                                                        weight_max=weight_max,
+                                                        num_threads=num_threads)
 
             else:
                 raise_unsupported_type()
@@ -393,7 +409,8 @@ def chistogramnd(sample,
                                                       bin_edges_c,
                                                       option_flags,
                                                       weight_min=weight_min,
-                                                      weight_max=weight_max)
+                                                      weight_max=weight_max,
+                                                      num_threads=num_threads)
 
             elif weights_type == np.float32:
 
@@ -408,7 +425,8 @@ def chistogramnd(sample,
                                                      bin_edges_c,
                                                      option_flags,
                                                      weight_min=weight_min,
-                                                     weight_max=weight_max)
+                                                     weight_max=weight_max,
+                                                     num_threads=num_threads)
 
             elif weights_type == np.int32:
 
@@ -423,7 +441,8 @@ def chistogramnd(sample,
                                                        bin_edges_c,
                                                        option_flags,
                                                        weight_min=weight_min,
-                                                       weight_max=weight_max)
+                                                       weight_max=weight_max,
+                                                       num_threads=num_threads)
 
             else:
                 raise_unsupported_type()
@@ -444,7 +463,8 @@ def chistogramnd(sample,
                                                         bin_edges_c,
                                                         option_flags,
                                                         weight_min=weight_min,
-                                                        weight_max=weight_max)
+                                                        weight_max=weight_max,
+                                                        num_threads=num_threads)
 
             elif weights_type == np.float32:
 
@@ -459,7 +479,8 @@ def chistogramnd(sample,
                                                        bin_edges_c,
                                                        option_flags,
                                                        weight_min=weight_min,
-                                                       weight_max=weight_max)
+                                                       weight_max=weight_max,
+                                                       num_threads=num_threads)
 
             elif weights_type == np.int32:
 
@@ -474,7 +495,8 @@ def chistogramnd(sample,
                                                          bin_edges_c,
                                                          option_flags,
                                                          weight_min=weight_min,
-                                                         weight_max=weight_max)
+                                                         weight_max=weight_max,
+                                                         num_threads=num_threads)
 
             else:
                 raise_unsupported_type()
@@ -501,7 +523,8 @@ def chistogramnd(sample,
                                                       bin_edges_c,
                                                       option_flags,
                                                       weight_min=weight_min,
-                                                      weight_max=weight_max)
+                                                      weight_max=weight_max,
+                                                      num_threads=num_threads)
 
             elif weights_type == np.float32:
 
@@ -516,7 +539,8 @@ def chistogramnd(sample,
                                                      bin_edges_c,
                                                      option_flags,
                                                      weight_min=weight_min,
-                                                     weight_max=weight_max)
+                                                     weight_max=weight_max,
+                                                     num_threads=num_threads)
 
             elif weights_type == np.int32:
 
@@ -531,7 +555,8 @@ def chistogramnd(sample,
                                                        bin_edges_c,
                                                        option_flags,
                                                        weight_min=weight_min,
-                                                       weight_max=weight_max)
+                                                       weight_max=weight_max,
+                                                       num_threads=num_threads)
 
             else:
                 raise_unsupported_type()
@@ -552,7 +577,8 @@ def chistogramnd(sample,
                                                      bin_edges_c,
                                                      option_flags,
                                                      weight_min=weight_min,
-                                                     weight_max=weight_max)
+                                                     weight_max=weight_max,
+                                                     num_threads=num_threads)
 
             elif weights_type == np.float32:
 
@@ -567,7 +593,8 @@ def chistogramnd(sample,
                                                     bin_edges_c,
                                                     option_flags,
                                                     weight_min=weight_min,
-                                                    weight_max=weight_max)
+                                                    weight_max=weight_max,
+                                                    num_threads=num_threads)
 
             elif weights_type == np.int32:
 
@@ -582,7 +609,8 @@ def chistogramnd(sample,
                                                       bin_edges_c,
                                                       option_flags,
                                                       weight_min=weight_min,
-                                                      weight_max=weight_max)
+                                                      weight_max=weight_max,
+                                                      num_threads=num_threads)
 
             else:
                 raise_unsupported_type()
@@ -603,7 +631,8 @@ def chistogramnd(sample,
                                                        bin_edges_c,
                                                        option_flags,
                                                        weight_min=weight_min,
-                                                       weight_max=weight_max)
+                                                       weight_max=weight_max,
+                                                       num_threads=num_threads)
 
             elif weights_type == np.float32:
 
@@ -618,7 +647,8 @@ def chistogramnd(sample,
                                                       bin_edges_c,
                                                       option_flags,
                                                       weight_min=weight_min,
-                                                      weight_max=weight_max)
+                                                      weight_max=weight_max,
+                                                      num_threads=num_threads)
 
             elif weights_type == np.int32:
 
@@ -633,7 +663,8 @@ def chistogramnd(sample,
                                                         bin_edges_c,
                                                         option_flags,
                                                         weight_min=weight_min,
-                                                        weight_max=weight_max)
+                                                        weight_max=weight_max,
+                                                        num_threads=num_threads)
 
             else:
                 raise_unsupported_type()
@@ -682,20 +713,23 @@ cdef int _histogramnd_double_double_double(double[:] sample,
                                            double[:] bin_edges,
                                            int option_flags,
                                            double weight_min,
-                                           double weight_max) nogil:
-
-    return histogramnd_c.histogramnd_double_double_double(&sample[0],
-                                                          &weights[0],
-                                                          n_dims,
-                                                          n_elem,
-                                                          &histo_range[0],
-                                                          &n_bins[0],
-                                                          &histo[0],
-                                                          &cumul[0],
-                                                          &bin_edges[0],
-                                                          option_flags,
-                                                          weight_min,
-                                                          weight_max)
+                                           double weight_max,
+                                           int num_threads):
+
+    with nogil:
+        return histogramnd_c.histogramnd_double_double_double(&sample[0],
+                                                              &weights[0],
+                                                              n_dims,
+                                                              n_elem,
+                                                              &histo_range[0],
+                                                              &n_bins[0],
+                                                              &histo[0],
+                                                              &cumul[0],
+                                                              &bin_edges[0],
+                                                              option_flags,
+                                                              weight_min,
+                                                              weight_max,
+                                                              num_threads)
 
 
 @cython.wraparound(False)
@@ -713,20 +747,23 @@ cdef int _histogramnd_double_float_double(double[:] sample,
                                           double[:] bin_edges,
                                           int option_flags,
                                           float weight_min,
-                                          float weight_max) nogil:
-
-    return histogramnd_c.histogramnd_double_float_double(&sample[0],
-                                                         &weights[0],
-                                                         n_dims,
-                                                         n_elem,
-                                                         &histo_range[0],
-                                                         &n_bins[0],
-                                                         &histo[0],
-                                                         &cumul[0],
-                                                         &bin_edges[0],
-                                                         option_flags,
-                                                         weight_min,
-                                                         weight_max)
+                                          float weight_max,
+                                          int num_threads):
+
+    with nogil:
+        return histogramnd_c.histogramnd_double_float_double(&sample[0],
+                                                             &weights[0],
+                                                             n_dims,
+                                                             n_elem,
+                                                             &histo_range[0],
+                                                             &n_bins[0],
+                                                             &histo[0],
+                                                             &cumul[0],
+                                                             &bin_edges[0],
+                                                             option_flags,
+                                                             weight_min,
+                                                             weight_max,
+                                                             num_threads)
 
 
 @cython.wraparound(False)
@@ -744,20 +781,23 @@ cdef int _histogramnd_double_int32_t_double(double[:] sample,
                                             double[:] bin_edges,
                                             int option_flags,
                                             int32_t weight_min,
-                                            int32_t weight_max) nogil:
-
-    return histogramnd_c.histogramnd_double_int32_t_double(&sample[0],
-                                                           &weights[0],
-                                                           n_dims,
-                                                           n_elem,
-                                                           &histo_range[0],
-                                                           &n_bins[0],
-                                                           &histo[0],
-                                                           &cumul[0],
-                                                           &bin_edges[0],
-                                                           option_flags,
-                                                           weight_min,
-                                                           weight_max)
+                                            int32_t weight_max,
+                                            int num_threads):
+
+    with nogil:
+        return histogramnd_c.histogramnd_double_int32_t_double(&sample[0],
+                                                               &weights[0],
+                                                               n_dims,
+                                                               n_elem,
+                                                               &histo_range[0],
+                                                               &n_bins[0],
+                                                               &histo[0],
+                                                               &cumul[0],
+                                                               &bin_edges[0],
+                                                               option_flags,
+                                                               weight_min,
+                                                               weight_max,
+                                                               num_threads)
 
 
 # =====================
@@ -780,20 +820,23 @@ cdef int _histogramnd_float_double_double(float[:] sample,
                                           double[:] bin_edges,
                                           int option_flags,
                                           double weight_min,
-                                          double weight_max) nogil:
-
-    return histogramnd_c.histogramnd_float_double_double(&sample[0],
-                                                         &weights[0],
-                                                         n_dims,
-                                                         n_elem,
-                                                         &histo_range[0],
-                                                         &n_bins[0],
-                                                         &histo[0],
-                                                         &cumul[0],
-                                                         &bin_edges[0],
-                                                         option_flags,
-                                                         weight_min,
-                                                         weight_max)
+                                          double weight_max,
+                                          int num_threads):
+
+    with nogil:
+        return histogramnd_c.histogramnd_float_double_double(&sample[0],
+                                                             &weights[0],
+                                                             n_dims,
+                                                             n_elem,
+                                                             &histo_range[0],
+                                                             &n_bins[0],
+                                                             &histo[0],
+                                                             &cumul[0],
+                                                             &bin_edges[0],
+                                                             option_flags,
+                                                             weight_min,
+                                                             weight_max,
+                                                             num_threads)
 
 
 @cython.wraparound(False)
@@ -811,20 +854,23 @@ cdef int _histogramnd_float_float_double(float[:] sample,
                                          double[:] bin_edges,
                                          int option_flags,
                                          float weight_min,
-                                         float weight_max) nogil:
+                                         float weight_max,
+                                         int num_threads):
 
-    return histogramnd_c.histogramnd_float_float_double(&sample[0],
-                                                        &weights[0],
-                                                        n_dims,
-                                                        n_elem,
-                                                        &histo_range[0],
-                                                        &n_bins[0],
-                                                        &histo[0],
-                                                        &cumul[0],
-                                                        &bin_edges[0],
-                                                        option_flags,
-                                                        weight_min,
-                                                        weight_max)
+    with nogil:
+        return histogramnd_c.histogramnd_float_float_double(&sample[0],
+                                                            &weights[0],
+                                                            n_dims,
+                                                            n_elem,
+                                                            &histo_range[0],
+                                                            &n_bins[0],
+                                                            &histo[0],
+                                                            &cumul[0],
+                                                            &bin_edges[0],
+                                                            option_flags,
+                                                            weight_min,
+                                                            weight_max,
+                                                            num_threads)
 
 
 @cython.wraparound(False)
@@ -842,20 +888,23 @@ cdef int _histogramnd_float_int32_t_double(float[:] sample,
                                            double[:] bin_edges,
                                            int option_flags,
                                            int32_t weight_min,
-                                           int32_t weight_max) nogil:
-
-    return histogramnd_c.histogramnd_float_int32_t_double(&sample[0],
-                                                          &weights[0],
-                                                          n_dims,
-                                                          n_elem,
-                                                          &histo_range[0],
-                                                          &n_bins[0],
-                                                          &histo[0],
-                                                          &cumul[0],
-                                                          &bin_edges[0],
-                                                          option_flags,
-                                                          weight_min,
-                                                          weight_max)
+                                           int32_t weight_max,
+                                           int num_threads):
+
+    with nogil:
+        return histogramnd_c.histogramnd_float_int32_t_double(&sample[0],
+                                                              &weights[0],
+                                                              n_dims,
+                                                              n_elem,
+                                                              &histo_range[0],
+                                                              &n_bins[0],
+                                                              &histo[0],
+                                                              &cumul[0],
+                                                              &bin_edges[0],
+                                                              option_flags,
+                                                              weight_min,
+                                                              weight_max,
+                                                              num_threads)
 
 
 # =====================
@@ -878,20 +927,23 @@ cdef int _histogramnd_int32_t_double_double(int32_t[:] sample,
                                             double[:] bin_edges,
                                             int option_flags,
                                             double weight_min,
-                                            double weight_max) nogil:
-
-    return histogramnd_c.histogramnd_int32_t_double_double(&sample[0],
-                                                           &weights[0],
-                                                           n_dims,
-                                                           n_elem,
-                                                           &histo_range[0],
-                                                           &n_bins[0],
-                                                           &histo[0],
-                                                           &cumul[0],
-                                                           &bin_edges[0],
-                                                           option_flags,
-                                                           weight_min,
-                                                           weight_max)
+                                            double weight_max,
+                                            int num_threads):
+
+    with nogil:
+        return histogramnd_c.histogramnd_int32_t_double_double(&sample[0],
+                                                               &weights[0],
+                                                               n_dims,
+                                                               n_elem,
+                                                               &histo_range[0],
+                                                               &n_bins[0],
+                                                               &histo[0],
+                                                               &cumul[0],
+                                                               &bin_edges[0],
+                                                               option_flags,
+                                                               weight_min,
+                                                               weight_max,
+                                                               num_threads)
 
 
 @cython.wraparound(False)
@@ -909,20 +961,23 @@ cdef int _histogramnd_int32_t_float_double(int32_t[:] sample,
                                            double[:] bin_edges,
                                            int option_flags,
                                            float weight_min,
-                                           float weight_max) nogil:
-
-    return histogramnd_c.histogramnd_int32_t_float_double(&sample[0],
-                                                          &weights[0],
-                                                          n_dims,
-                                                          n_elem,
-                                                          &histo_range[0],
-                                                          &n_bins[0],
-                                                          &histo[0],
-                                                          &cumul[0],
-                                                          &bin_edges[0],
-                                                          option_flags,
-                                                          weight_min,
-                                                          weight_max)
+                                           float weight_max,
+                                           int num_threads):
+
+    with nogil:
+        return histogramnd_c.histogramnd_int32_t_float_double(&sample[0],
+                                                              &weights[0],
+                                                              n_dims,
+                                                              n_elem,
+                                                              &histo_range[0],
+                                                              &n_bins[0],
+                                                              &histo[0],
+                                                              &cumul[0],
+                                                              &bin_edges[0],
+                                                              option_flags,
+                                                              weight_min,
+                                                              weight_max,
+                                                              num_threads)
 
 
 @cython.wraparound(False)
@@ -940,20 +995,23 @@ cdef int _histogramnd_int32_t_int32_t_double(int32_t[:] sample,
                                              double[:] bin_edges,
                                              int option_flags,
                                              int32_t weight_min,
-                                             int32_t weight_max) nogil:
-
-    return histogramnd_c.histogramnd_int32_t_int32_t_double(&sample[0],
-                                                            &weights[0],
-                                                            n_dims,
-                                                            n_elem,
-                                                            &histo_range[0],
-                                                            &n_bins[0],
-                                                            &histo[0],
-                                                            &cumul[0],
-                                                            &bin_edges[0],
-                                                            option_flags,
-                                                            weight_min,
-                                                            weight_max)
+                                             int32_t weight_max,
+                                             int num_threads):
+
+    with nogil:
+        return histogramnd_c.histogramnd_int32_t_int32_t_double(&sample[0],
+                                                                &weights[0],
+                                                                n_dims,
+                                                                n_elem,
+                                                                &histo_range[0],
+                                                                &n_bins[0],
+                                                                &histo[0],
+                                                                &cumul[0],
+                                                                &bin_edges[0],
+                                                                option_flags,
+                                                                weight_min,
+                                                                weight_max,
+                                                                num_threads)
 
 
 # =====================
@@ -976,20 +1034,23 @@ cdef int _histogramnd_double_double_float(double[:] sample,
                                           double[:] bin_edges,
                                           int option_flags,
                                           double weight_min,
-                                          double weight_max) nogil:
-
-    return histogramnd_c.histogramnd_double_double_float(&sample[0],
-                                                         &weights[0],
-                                                         n_dims,
-                                                         n_elem,
-                                                         &histo_range[0],
-                                                         &n_bins[0],
-                                                         &histo[0],
-                                                         &cumul[0],
-                                                         &bin_edges[0],
-                                                         option_flags,
-                                                         weight_min,
-                                                         weight_max)
+                                          double weight_max,
+                                          int num_threads):
+
+    with nogil:
+        return histogramnd_c.histogramnd_double_double_float(&sample[0],
+                                                             &weights[0],
+                                                             n_dims,
+                                                             n_elem,
+                                                             &histo_range[0],
+                                                             &n_bins[0],
+                                                             &histo[0],
+                                                             &cumul[0],
+                                                             &bin_edges[0],
+                                                             option_flags,
+                                                             weight_min,
+                                                             weight_max,
+                                                             num_threads)
 
 
 @cython.wraparound(False)
@@ -1007,20 +1068,23 @@ cdef int _histogramnd_double_float_float(double[:] sample,
                                          double[:] bin_edges,
                                          int option_flags,
                                          float weight_min,
-                                         float weight_max) nogil:
+                                         float weight_max,
+                                         int num_threads):
 
-    return histogramnd_c.histogramnd_double_float_float(&sample[0],
-                                                        &weights[0],
-                                                        n_dims,
-                                                        n_elem,
-                                                        &histo_range[0],
-                                                        &n_bins[0],
-                                                        &histo[0],
-                                                        &cumul[0],
-                                                        &bin_edges[0],
-                                                        option_flags,
-                                                        weight_min,
-                                                        weight_max)
+    with nogil:
+        return histogramnd_c.histogramnd_double_float_float(&sample[0],
+                                                            &weights[0],
+                                                            n_dims,
+                                                            n_elem,
+                                                            &histo_range[0],
+                                                            &n_bins[0],
+                                                            &histo[0],
+                                                            &cumul[0],
+                                                            &bin_edges[0],
+                                                            option_flags,
+                                                            weight_min,
+                                                            weight_max,
+                                                            num_threads)
 
 
 @cython.wraparound(False)
@@ -1038,20 +1102,23 @@ cdef int _histogramnd_double_int32_t_float(double[:] sample,
                                            double[:] bin_edges,
                                            int option_flags,
                                            int32_t weight_min,
-                                           int32_t weight_max) nogil:
-
-    return histogramnd_c.histogramnd_double_int32_t_float(&sample[0],
-                                                          &weights[0],
-                                                          n_dims,
-                                                          n_elem,
-                                                          &histo_range[0],
-                                                          &n_bins[0],
-                                                          &histo[0],
-                                                          &cumul[0],
-                                                          &bin_edges[0],
-                                                          option_flags,
-                                                          weight_min,
-                                                          weight_max)
+                                           int32_t weight_max,
+                                           int num_threads):
+
+    with nogil:
+        return histogramnd_c.histogramnd_double_int32_t_float(&sample[0],
+                                                              &weights[0],
+                                                              n_dims,
+                                                              n_elem,
+                                                              &histo_range[0],
+                                                              &n_bins[0],
+                                                              &histo[0],
+                                                              &cumul[0],
+                                                              &bin_edges[0],
+                                                              option_flags,
+                                                              weight_min,
+                                                              weight_max,
+                                                              num_threads)
 
 
 # =====================
@@ -1074,20 +1141,23 @@ cdef int _histogramnd_float_double_float(float[:] sample,
                                          double[:] bin_edges,
                                          int option_flags,
                                          double weight_min,
-                                         double weight_max) nogil:
+                                         double weight_max,
+                                         int num_threads):
 
-    return histogramnd_c.histogramnd_float_double_float(&sample[0],
-                                                        &weights[0],
-                                                        n_dims,
-                                                        n_elem,
-                                                        &histo_range[0],
-                                                        &n_bins[0],
-                                                        &histo[0],
-                                                        &cumul[0],
-                                                        &bin_edges[0],
-                                                        option_flags,
-                                                        weight_min,
-                                                        weight_max)
+    with nogil:
+        return histogramnd_c.histogramnd_float_double_float(&sample[0],
+                                                            &weights[0],
+                                                            n_dims,
+                                                            n_elem,
+                                                            &histo_range[0],
+                                                            &n_bins[0],
+                                                            &histo[0],
+                                                            &cumul[0],
+                                                            &bin_edges[0],
+                                                            option_flags,
+                                                            weight_min,
+                                                            weight_max,
+                                                            num_threads)
 
 
 @cython.wraparound(False)
@@ -1105,20 +1175,23 @@ cdef int _histogramnd_float_float_float(float[:] sample,
                                         double[:] bin_edges,
                                         int option_flags,
                                         float weight_min,
-                                        float weight_max) nogil:
+                                        float weight_max,
+                                        int num_threads):
 
-    return histogramnd_c.histogramnd_float_float_float(&sample[0],
-                                                       &weights[0],
-                                                       n_dims,
-                                                       n_elem,
-                                                       &histo_range[0],
-                                                       &n_bins[0],
-                                                       &histo[0],
-                                                       &cumul[0],
-                                                       &bin_edges[0],
-                                                       option_flags,
-                                                       weight_min,
-                                                       weight_max)
+    with nogil:
+        return histogramnd_c.histogramnd_float_float_float(&sample[0],
+                                                           &weights[0],
+                                                           n_dims,
+                                                           n_elem,
+                                                           &histo_range[0],
+                                                           &n_bins[0],
+                                                           &histo[0],
+                                                           &cumul[0],
+                                                           &bin_edges[0],
+                                                           option_flags,
+                                                           weight_min,
+                                                           weight_max,
+                                                           num_threads)
 
 
 @cython.wraparound(False)
@@ -1136,20 +1209,23 @@ cdef int _histogramnd_float_int32_t_float(float[:] sample,
                                           double[:] bin_edges,
                                           int option_flags,
                                           int32_t weight_min,
-                                          int32_t weight_max) nogil:
-
-    return histogramnd_c.histogramnd_float_int32_t_float(&sample[0],
-                                                         &weights[0],
-                                                         n_dims,
-                                                         n_elem,
-                                                         &histo_range[0],
-                                                         &n_bins[0],
-                                                         &histo[0],
-                                                         &cumul[0],
-                                                         &bin_edges[0],
-                                                         option_flags,
-                                                         weight_min,
-                                                         weight_max)
+                                          int32_t weight_max,
+                                          int num_threads):
+
+    with nogil:
+        return histogramnd_c.histogramnd_float_int32_t_float(&sample[0],
+                                                             &weights[0],
+                                                             n_dims,
+                                                             n_elem,
+                                                             &histo_range[0],
+                                                             &n_bins[0],
+                                                             &histo[0],
+                                                             &cumul[0],
+                                                             &bin_edges[0],
+                                                             option_flags,
+                                                             weight_min,
+                                                             weight_max,
+                                                             num_threads)
 
 
 # =====================
@@ -1172,20 +1248,23 @@ cdef int _histogramnd_int32_t_double_float(int32_t[:] sample,
                                            double[:] bin_edges,
                                            int option_flags,
                                            double weight_min,
-                                           double weight_max) nogil:
-
-    return histogramnd_c.histogramnd_int32_t_double_float(&sample[0],
-                                                          &weights[0],
-                                                          n_dims,
-                                                          n_elem,
-                                                          &histo_range[0],
-                                                          &n_bins[0],
-                                                          &histo[0],
-                                                          &cumul[0],
-                                                          &bin_edges[0],
-                                                          option_flags,
-                                                          weight_min,
-                                                          weight_max)
+                                           double weight_max,
+                                           int num_threads):
+
+    with nogil:
+        return histogramnd_c.histogramnd_int32_t_double_float(&sample[0],
+                                                              &weights[0],
+                                                              n_dims,
+                                                              n_elem,
+                                                              &histo_range[0],
+                                                              &n_bins[0],
+                                                              &histo[0],
+                                                              &cumul[0],
+                                                              &bin_edges[0],
+                                                              option_flags,
+                                                              weight_min,
+                                                              weight_max,
+                                                              num_threads)
 
 
 @cython.wraparound(False)
@@ -1203,20 +1282,23 @@ cdef int _histogramnd_int32_t_float_float(int32_t[:] sample,
                                           double[:] bin_edges,
                                           int option_flags,
                                           float weight_min,
-                                          float weight_max) nogil:
-
-    return histogramnd_c.histogramnd_int32_t_float_float(&sample[0],
-                                                         &weights[0],
-                                                         n_dims,
-                                                         n_elem,
-                                                         &histo_range[0],
-                                                         &n_bins[0],
-                                                         &histo[0],
-                                                         &cumul[0],
-                                                         &bin_edges[0],
-                                                         option_flags,
-                                                         weight_min,
-                                                         weight_max)
+                                          float weight_max,
+                                          int num_threads):
+
+    with nogil:
+        return histogramnd_c.histogramnd_int32_t_float_float(&sample[0],
+                                                             &weights[0],
+                                                             n_dims,
+                                                             n_elem,
+                                                             &histo_range[0],
+                                                             &n_bins[0],
+                                                             &histo[0],
+                                                             &cumul[0],
+                                                             &bin_edges[0],
+                                                             option_flags,
+                                                             weight_min,
+                                                             weight_max,
+                                                             num_threads)
 
 
 @cython.wraparound(False)
@@ -1234,17 +1316,20 @@ cdef int _histogramnd_int32_t_int32_t_float(int32_t[:] sample,
                                             double[:] bin_edges,
                                             int option_flags,
                                             int32_t weight_min,
-                                            int32_t weight_max) nogil:
-
-    return histogramnd_c.histogramnd_int32_t_int32_t_float(&sample[0],
-                                                           &weights[0],
-                                                           n_dims,
-                                                           n_elem,
-                                                           &histo_range[0],
-                                                           &n_bins[0],
-                                                           &histo[0],
-                                                           &cumul[0],
-                                                           &bin_edges[0],
-                                                           option_flags,
-                                                           weight_min,
-                                                           weight_max)
+                                            int32_t weight_max,
+                                            int num_threads):
+
+    with nogil:
+        return histogramnd_c.histogramnd_int32_t_int32_t_float(&sample[0],
+                                                               &weights[0],
+                                                               n_dims,
+                                                               n_elem,
+                                                               &histo_range[0],
+                                                               &n_bins[0],
+                                                               &histo[0],
+                                                               &cumul[0],
+                                                               &bin_edges[0],
+                                                               option_flags,
+                                                               weight_min,
+                                                               weight_max,
+                                                               num_threads)
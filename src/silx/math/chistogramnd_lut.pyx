@@ -23,13 +23,21 @@
 
 __authors__ = ["D. Naudet"]
 __license__ = "MIT"
-__date__ = "15/05/2016"
+__date__ = "18/10/2026"
 
 
 cimport cython
+from cython.parallel import prange
 from libc.stdint cimport int16_t, uint16_t, int32_t, uint32_t, int64_t
 import numpy as np
 
+
+MIN_PARALLEL_SIZE = 65536
+"""Minimum number of weights to use several threads"""
+
+MAX_PRIVATE_BINS = 1 << 24
+"""Maximum total number of bins of the per-thread private histograms"""
+
 ctypedef fused sample_t:
     double
     float
@@ -215,9 +223,13 @@ def histogramnd_from_lut(weights,
                          shape=None,
                          dtype=None,
                          weight_min=None,
-                         weight_max=None):
+                         weight_max=None,
+                         num_threads=None):
     """
     dtype ignored if weighted_histo provided
+
+    num_threads is the number of threads to use (default: 1).
+    Each thread accumulates private histograms which are summed at the end.
     """
 
     if histo is None and weighted_histo is None:
@@ -301,16 +313,40 @@ def histogramnd_from_lut(weights,
     else:
         filt_max_weights = True
 
+    if num_threads is None:
+        num_threads = 1
+    num_threads = max(1, int(num_threads))
+    if (weights.size < MIN_PARALLEL_SIZE or
+            h_c.size * num_threads > MAX_PRIVATE_BINS):
+        num_threads = 1
+
     try:
-        _histogramnd_from_lut_fused(w_c,
-                                    h_lut_c,
-                                    h_c,
-                                    w_h_c,
-                                    weights.size,
-                                    filt_min_weights,
-                                    w_dtype.type(weight_min),
-                                    filt_max_weights,
-                                    w_dtype.type(weight_max))
+        if num_threads == 1:
+            _histogramnd_from_lut_fused(w_c,
+                                        h_lut_c,
+                                        h_c,
+                                        w_h_c,
+                                        weights.size,
+                                        filt_min_weights,
+                                        w_dtype.type(weight_min),
+                                        filt_max_weights,
+                                        w_dtype.type(weight_max))
+        else:
+            # Per-thread private histograms
+            histos = np.zeros((num_threads, h_c.size), dtype=h_c.dtype)
+            w_histos = np.zeros((num_threads, w_h_c.size), dtype=w_h_c.dtype)
+            _histogramnd_from_lut_fused_parallel(w_c,
+                                                 h_lut_c,
+                                                 histos,
+                                                 w_histos,
+                                                 weights.size,
+                                                 filt_min_weights,
+                                                 w_dtype.type(weight_min),
+                                                 filt_max_weights,
+                                                 w_dtype.type(weight_max),
+                                                 num_threads)
+            h_c += histos.sum(axis=0, dtype=h_c.dtype)
+            w_h_c += w_histos.sum(axis=0, dtype=w_h_c.dtype)
     except TypeError as ex:
         print(ex)
         raise TypeError('Case not supported - weights:{0} '
@@ -349,6 +385,44 @@ def _histogramnd_from_lut_fused(weights_t[:] i_weights,
                 o_weighted_histo[i_lut[i]] += <cumul_t>i_weights[i]  # noqa
 
 
+@cython.wraparound(False)
+@cython.boundscheck(False)
+@cython.initializedcheck(False)
+@cython.nonecheck(False)
+@cython.cdivision(True)
+def _histogramnd_from_lut_fused_parallel(weights_t[:] i_weights,
+                                         lut_t[:] i_lut,
+                                         uint32_t[:, ::1] o_histos,
+                                         cumul_t[:, ::1] o_weighted_histos,
+                                         size_t i_n_elems,
+                                         bint i_filt_min_weights,
+                                         weights_t i_weight_min,
+                                         bint i_filt_max_weights,
+                                         weights_t i_weight_max,
+                                         int i_n_threads):
+    """Same as _histogramnd_from_lut_fused with one histogram per thread.
+
+    Each thread processes a contiguous range of elements and accumulates it
+    in its own row of o_histos and o_weighted_histos.
+    """
+    cdef:
+        int thread_idx
+        size_t i, first, last
+
+    for thread_idx in prange(i_n_threads, nogil=True,
+                             num_threads=i_n_threads, schedule='static'):
+        first = (i_n_elems * thread_idx) // i_n_threads
+        last = (i_n_elems * (thread_idx + 1)) // i_n_threads
+        for i in range(first, last):
+            if (i_lut[i] >= 0):
+                if i_filt_min_weights and i_weights[i] < i_weight_min:
+                    continue
+                if i_filt_max_weights and i_weights[i] > i_weight_max:
+                    continue
+                o_histos[thread_idx, i_lut[i]] += 1
+                o_weighted_histos[thread_idx, i_lut[i]] += <cumul_t>i_weights[i]  # noqa
+
+
 # =====================
 # =====================
 
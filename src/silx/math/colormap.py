@@ -25,22 +25,25 @@
 
 __authors__ = ["T. Vincent"]
 __license__ = "MIT"
-__date__ = "25/08/2021"
+__date__ = "18/10/2026"
 
 
 import collections
+import contextlib
 import numbers
+import threading
 from typing import NamedTuple
-import warnings
+import weakref
 import numpy
 
 from ..resources import resource_filename as _resource_filename
 from .combo import min_max as _min_max
+from .combo import statistics as _statistics
 from . import _colormap
 from ._colormap import cmap  # noqa
 
 
-__all__ = ["apply_colormap", "cmap"]
+__all__ = ["apply_colormap", "apply_colormap_stack", "cmap"]
 
 
 _LUT_DESCRIPTION = collections.namedtuple(
@@ -213,6 +216,155 @@ def get_colormap_lut(name):
     return _COLORMAP_CACHE[name]
 
 
+# Autoscale cache
+
+
+class _AutoscaleCache:
+    """Cache of autoscale information of arrays.
+
+    Entries are associated to array objects, so that autoscaling the same
+    array several times (e.g., with different normalizations or LUTs)
+    only computes statistics once.
+    The cache is only used when autoscaling with ``cache=True``, see
+    :meth:`_NormalizationMixIn.autoscale`.
+    An entry is dropped when its array is garbage collected or when its
+    stamp changes.
+    The stamp is made of the address, shape, strides and dtype of the array
+    and of a sample of its values.
+    Thus, in-place modifications of large arrays which do not change the
+    sampled values are not detected: use :meth:`clear` in this case.
+
+    :param int max_size: Maximum number of arrays in the cache
+    """
+
+    SAMPLE_SIZE = 1024
+    """Number of values of the array used in the stamp"""
+
+    def __init__(self, max_size=8):
+        self._max_size = max_size
+        self._entries = collections.OrderedDict()
+        self._lock = threading.RLock()
+        self._local = threading.local()
+
+    @property
+    def active(self):
+        """True if the cache is used by the current thread"""
+        return getattr(self._local, "active", False)
+
+    @contextlib.contextmanager
+    def activate(self):
+        """Context manager using the cache in the current thread"""
+        previous = self.active
+        self._local.active = True
+        try:
+            yield
+        finally:
+            self._local.active = previous
+
+    @classmethod
+    def _stamp(cls, data):
+        """Returns the stamp of an array, see :class:`_AutoscaleCache`"""
+        if data.size <= cls.SAMPLE_SIZE:
+            sample = data.tobytes()
+        else:
+            indices = numpy.linspace(
+                0, data.size - 1, cls.SAMPLE_SIZE, dtype=numpy.intp
+            )
+            sample = data.flat[indices].tobytes()
+        return (
+            data.__array_interface__["data"][0],
+            data.shape,
+            data.strides,
+            data.dtype.str,
+            sample,
+        )
+
+    def get(self, data):
+        """Returns the cache entry of an array.
+
+        :param numpy.ndarray data:
+        :returns: dict storing the autoscale information of this array
+        :rtype: dict
+        """
+        key = id(data)
+        stamp = self._stamp(data)
+        with self._lock:
+            item = self._entries.get(key)
+            if item is not None and item[0]() is data and item[1] == stamp:
+                self._entries.move_to_end(key)
+                return item[2]
+
+            entry = {}
+            self._entries[key] = weakref.ref(data, self._discard(key)), stamp, entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+            return entry
+
+    def _discard(self, key):
+        """Returns a weakref callback removing the entry of key"""
+
+        def callback(ref):
+            with self._lock:
+                item = self._entries.get(key)
+                if item is not None and item[0] is ref:
+                    del self._entries[key]
+
+        return callback
+
+    def clear(self):
+        """Remove all entries from the cache"""
+        with self._lock:
+            self._entries.clear()
+
+
+_AUTOSCALE_CACHE = _AutoscaleCache()
+
+
+def _cached_statistics(data):
+    """Returns :func:`silx.math.combo.statistics` of finite values of data,
+    including the strictly positive minimum.
+
+    The result is cached in :data:`_AUTOSCALE_CACHE` if it is active.
+
+    :param numpy.ndarray data:
+    """
+    if not _AUTOSCALE_CACHE.active:
+        return _statistics(data, min_positive=True, finite=True)
+    entry = _AUTOSCALE_CACHE.get(data)
+    result = entry.get("statistics")
+    if result is None:
+        result = _statistics(data, min_positive=True, finite=True)
+        entry["statistics"] = result
+    return result
+
+
+def _histogram_percentiles(histogram, edges, percentiles):
+    """Returns percentiles estimated from a histogram.
+
+    Values are assumed to be uniformly distributed within each bin.
+
+    :param numpy.ndarray histogram: Count of values in each bin
+    :param numpy.ndarray edges: Edges of the bins
+    :param percentiles: Percentiles to compute in [0, 100]
+    :returns: Estimated percentiles or None if the histogram is empty
+    """
+    cumsum = numpy.cumsum(histogram)
+    total = cumsum[-1]
+    if total == 0:
+        return None
+
+    result = []
+    for percentile in percentiles:
+        target = total * percentile / 100.0
+        index = min(int(numpy.searchsorted(cumsum, target)), len(histogram) - 1)
+        previous = cumsum[index - 1] if index > 0 else 0
+        count = histogram[index]
+        fraction = (target - previous) / count if count > 0 else 0.0
+        result.append(edges[index] + fraction * (edges[index + 1] - edges[index]))
+    return result
+
+
 # Normalizations
 
 
@@ -222,6 +374,9 @@ class _NormalizationMixIn:
     DEFAULT_RANGE = 0, 1
     """Fallback for (vmin, vmax)"""
 
+    HISTOGRAM_NBINS = 1024
+    """Number of bins used by the histogram-based percentile autoscale"""
+
     def is_valid(self, value):
         """Check if a value is in the valid range for this normalization.
 
@@ -235,23 +390,38 @@ class _NormalizationMixIn:
         else:
             return True
 
-    def autoscale(self, data, mode):
+    def autoscale(self, data, mode, cache=False):
         """Returns range for given data and autoscale mode.
 
         :param Union[None,numpy.ndarray] data:
-        :param str mode: Autoscale mode: 'minmax' or 'stddev3'
+        :param str mode: Autoscale mode: 'minmax', 'stddev3', 'percentile_1_99'
+            or 'percentile_1_99_histogram'
+        :param bool cache:
+            True to cache the range for the given array, see
+            :class:`_AutoscaleCache`. Only use it for arrays which are not
+            modified in place. Default: False
         :returns: Range as (min, max)
         :rtype: Tuple[float,float]
         """
         data = None if data is None else numpy.asarray(data)
         if data is None or data.size == 0:
             return self.DEFAULT_RANGE
-
+        if not cache:
+            return self._autoscale(data, mode)
+
+        entry = _AUTOSCALE_CACHE.get(data)
+        key = type(self), mode
+        if key not in entry:
+            with _AUTOSCALE_CACHE.activate():
+                entry[key] = self._autoscale(data, mode)
+        return entry[key]
+
+    def _autoscale(self, data, mode):
+        """Compute range for given data and autoscale mode, see :meth:`autoscale`"""
         if mode == "minmax":
             vmin, vmax = self.autoscale_minmax(data)
         elif mode == "stddev3":
-            dmin, dmax = self.autoscale_minmax(data)
-            stdmin, stdmax = self.autoscale_mean3std(data)
+            (dmin, dmax), (stdmin, stdmax) = self.autoscale_minmax_mean3std(data)
             if dmin is None:
                 vmin = stdmin
             elif stdmin is None:
@@ -267,6 +437,8 @@ class _NormalizationMixIn:
                 vmax = min(dmax, stdmax)
         elif mode == "percentile_1_99":
             vmin, vmax = self.autoscale_percentile_1_99(data)
+        elif mode == "percentile_1_99_histogram":
+            vmin, vmax = self.autoscale_percentile_1_99_histogram(data)
 
         else:
             raise ValueError("Unsupported mode: %s" % mode)
@@ -306,21 +478,30 @@ class _NormalizationMixIn:
         """
         # Use [0, 1] as data range for normalization not using range
         normdata = self.apply(data, 0.0, 1.0)
-        if normdata.dtype.kind == "f":  # Replaces inf by NaN
-            normdata[numpy.isfinite(normdata) == False] = numpy.nan
         if normdata.size == 0:  # Fallback
             return None, None
 
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", category=RuntimeWarning)
-            # Ignore nanmean "Mean of empty slice" warning and
-            # nanstd "Degrees of freedom <= 0 for slice" warning
-            mean, std = numpy.nanmean(normdata), numpy.nanstd(normdata)
+        # Mean and std of finite values in a single pass
+        result = _statistics(normdata, finite=True)
+        if result.mean is None:  # No finite value
+            return None, None
+        mean, std = result.mean, result.std
 
         return self.revert(mean - 3 * std, 0.0, 1.0), self.revert(
             mean + 3 * std, 0.0, 1.0
         )
 
+    def autoscale_minmax_mean3std(self, data):
+        """Autoscale using both min/max and mean+/-3std
+
+        Override this method to compute both ranges at once.
+
+        :param numpy.ndarray data:
+        :returns: ((vmin, vmax) from min/max, (vmin, vmax) from mean+/-3std)
+        :rtype: Tuple[Tuple[float,float],Tuple[float,float]]
+        """
+        return self.autoscale_minmax(data), self.autoscale_mean3std(data)
+
     def autoscale_percentile_1_99(self, data):
         """Autoscale using [1st, 99th] percentiles"""
         data = data[self.is_valid(data)]
@@ -330,10 +511,58 @@ class _NormalizationMixIn:
             return None, None
         return numpy.nanpercentile(data, (1, 99))
 
+    def autoscale_percentile_1_99_histogram(self, data):
+        """Autoscale using [1st, 99th] percentiles estimated from a histogram
+
+        This is an approximation of :meth:`autoscale_percentile_1_99`
+        which does not sort the data.
+        The histogram bins are evenly spaced in the normalized space
+        between the min/max range.
+
+        :param numpy.ndarray data:
+        :returns: (vmin, vmax)
+        :rtype: Tuple[float,float]
+        """
+        vmin, vmax = self.autoscale_minmax(data)
+        if vmin is None or vmax is None or vmin >= vmax:
+            return vmin, vmax
+        # Use [0, 1] as data range for normalization not using range
+        edges = self.revert(
+            numpy.linspace(
+                self.apply(float(vmin), 0.0, 1.0),
+                self.apply(float(vmax), 0.0, 1.0),
+                self.HISTOGRAM_NBINS + 1,
+            ),
+            0.0,
+            1.0,
+        )
+        edges[0], edges[-1] = vmin, vmax
+        return self._percentile_1_99_from_histogram(data, edges)
+
+    def _percentile_1_99_from_histogram(self, data, bins, range_=None):
+        """Returns [1st, 99th] percentiles from the histogram of data
+
+        Values out of the range of the histogram, NaNs and infinite values
+        are ignored.
+        """
+        with numpy.errstate(invalid="ignore"):
+            histogram, edges = numpy.histogram(data, bins=bins, range=range_)
+        percentiles = _histogram_percentiles(histogram, edges, (1, 99))
+        if percentiles is None:
+            return None, None
+        return percentiles
+
 
 class _LinearNormalizationMixIn(_NormalizationMixIn):
     """Colormap normalization mix-in class specific to autoscale taken from initial range"""
 
+    def autoscale_minmax(self, data):
+        # All values are valid: no need to filter data
+        if data.size == 0:
+            return None, None
+        result = _cached_statistics(data)
+        return result.minimum, result.maximum
+
     def autoscale_mean3std(self, data):
         """Autoscale using mean+/-3std
 
@@ -343,17 +572,33 @@ class _LinearNormalizationMixIn(_NormalizationMixIn):
         :returns: (vmin, vmax)
         :rtype: Tuple[float,float]
         """
-        if data.dtype.kind == "f":  # Replaces inf by NaN
-            data = numpy.array(data, copy=True)  # Work on a copy
-            data[numpy.isfinite(data) == False] = numpy.nan
         if data.size == 0:  # Fallback
             return None, None
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore", category=RuntimeWarning)
-            # Ignore nanmean "Mean of empty slice" warning and
-            # nanstd "Degrees of freedom <= 0 for slice" warning
-            mean, std = numpy.nanmean(data), numpy.nanstd(data)
-        return mean - 3 * std, mean + 3 * std
+        return self._mean3std(_cached_statistics(data))
+
+    def autoscale_minmax_mean3std(self, data):
+        # Compute min/max, mean and std of finite values in a single pass
+        if data.size == 0:  # Fallback
+            return (None, None), (None, None)
+        result = _cached_statistics(data)
+        return (result.minimum, result.maximum), self._mean3std(result)
+
+    def autoscale_percentile_1_99_histogram(self, data):
+        # Use evenly spaced bins on the data itself
+        vmin, vmax = self.autoscale_minmax(data)
+        if vmin is None or vmax is None or vmin >= vmax:
+            return vmin, vmax
+        return self._percentile_1_99_from_histogram(
+            data, self.HISTOGRAM_NBINS, (vmin, vmax)
+        )
+
+    @staticmethod
+    def _mean3std(result):
+        """Returns mean+/-3std range from :func:`silx.math.combo.statistics`
+        result"""
+        if result.mean is None:  # No finite value
+            return None, None
+        return result.mean - 3 * result.std, result.mean + 3 * result.std
 
 
 class LinearNormalization(_colormap.LinearNormalization, _LinearNormalizationMixIn):
@@ -377,7 +622,7 @@ class LogarithmicNormalization(_colormap.LogarithmicNormalization, _Normalizatio
         return value > 0.0
 
     def autoscale_minmax(self, data):
-        result = _min_max(data, min_positive=True, finite=True)
+        result = _cached_statistics(data)
         return result.min_positive, result.maximum
 
 
@@ -436,10 +681,10 @@ def _get_normalizer(norm, gamma):
     return _BASIC_NORMALIZATIONS[norm]
 
 
-def _get_range(normalizer, data, autoscale, vmin, vmax):
+def _get_range(normalizer, data, autoscale, vmin, vmax, cache=False):
     """Returns effective range"""
     if vmin is None or vmax is None:
-        auto_vmin, auto_vmax = normalizer.autoscale(data, autoscale)
+        auto_vmin, auto_vmax = normalizer.autoscale(data, autoscale, cache)
         if vmin is None:  # Set vmin respecting provided vmax
             vmin = auto_vmin if vmax is None else min(auto_vmin, vmax)
         if vmax is None:
@@ -458,22 +703,31 @@ def apply_colormap(
     vmin=None,
     vmax=None,
     gamma=1.0,
+    output=None,
+    cache: bool = False,
 ):
     """Apply colormap to data with given normalization and autoscale.
 
     :param numpy.ndarray data: Data on which to apply the colormap
     :param str colormap: Name of the colormap to use
     :param str norm: Normalization to use
-    :param str autoscale: Autoscale mode: "minmax" (default) or "stddev3"
+    :param str autoscale: Autoscale mode: "minmax" (default), "stddev3",
+        "percentile_1_99" or "percentile_1_99_histogram"
     :param vmin: Lower bound, None (default) to autoscale
     :param vmax: Upper bound, None (default) to autoscale
     :param float gamma:
         Gamma correction parameter (used only for "gamma" normalization)
+    :param Union[numpy.ndarray,None] output:
+        C-contiguous uint8 array of shape data.shape + (4,) where to store the
+        colors. Default: A new array is allocated
+    :param bool cache:
+        True to cache the autoscale range for data, which must not be
+        modified in place afterwards. Default: False
     :returns: Array of colors
     """
     colors = get_colormap_lut(colormap)
     normalizer = _get_normalizer(norm, gamma)
-    vmin, vmax = _get_range(normalizer, data, autoscale, vmin, vmax)
+    vmin, vmax = _get_range(normalizer, data, autoscale, vmin, vmax, cache)
     return _colormap.cmap(
         data,
         colors,
@@ -481,9 +735,118 @@ def apply_colormap(
         vmax,
         normalizer,
         _DEFAULT_NAN_COLOR,
+        output=output,
     )
 
 
+_STACK_TILE_SIZE = 2**22
+"""Maximum number of data elements processed at once by
+:func:`apply_colormap_stack` when sharing the range"""
+
+
+def apply_colormap_stack(
+    frames,
+    colormap: str,
+    norm: str = "linear",
+    autoscale: str = "minmax",
+    vmin=None,
+    vmax=None,
+    gamma=1.0,
+    shared_range: bool = True,
+    output=None,
+):
+    """Apply colormap to a stack of frames with given normalization and
+    autoscale.
+
+    The frames are processed by tiles of consecutive frames, the pixels of
+    each tile being processed in parallel.
+
+    Example to colormap a stack of images with the range of the whole stack
+    while reusing the same buffer:
+
+    >>> buffer = numpy.empty(stack.shape + (4,), dtype=numpy.uint8)
+    >>> apply_colormap_stack(stack, "viridis", output=buffer)
+
+    :param frames:
+        Either an array where the first dimension is the frame index
+        (e.g., a 3D stack of images) or an iterable of arrays of the same
+        shape.
+        If frames is an iterable and the range is shared and autoscaled,
+        all frames are loaded in memory before being processed.
+    :param str colormap: Name of the colormap to use
+    :param str norm: Normalization to use
+    :param str autoscale: Autoscale mode: "minmax" (default), "stddev3",
+        "percentile_1_99" or "percentile_1_99_histogram"
+    :param vmin: Lower bound, None (default) to autoscale
+    :param vmax: Upper bound, None (default) to autoscale
+    :param float gamma:
+        Gamma correction parameter (used only for "gamma" normalization)
+    :param bool shared_range:
+        True (default) to autoscale once from the whole stack,
+        False to autoscale each frame independently
+    :param Union[numpy.ndarray,None] output:
+        C-contiguous uint8 array of shape (number of frames,) + frame shape +
+        (4,) where to store the colors. Default: A new array is allocated
+    :returns: Array of colors of shape
+        (number of frames,) + frame shape + (4,)
+    :rtype: numpy.ndarray
+    :raises ValueError: If output is not compatible with frames
+    """
+    if not isinstance(frames, numpy.ndarray) and shared_range:
+        if vmin is None or vmax is None:
+            # The whole stack is needed to compute the range
+            frames = numpy.array([numpy.asarray(frame) for frame in frames])
+
+    if not isinstance(frames, numpy.ndarray):
+        results = []
+        for index, frame in enumerate(frames):
+            if output is None:
+                frame_output = None
+            elif index < len(output):
+                frame_output = output[index]
+            else:
+                raise ValueError("output has less frames than the stack")
+            results.append(
+                apply_colormap(
+                    frame, colormap, norm, autoscale, vmin, vmax, gamma, frame_output
+                )
+            )
+        if output is None:
+            return numpy.array(results)
+        return output[: len(results)]
+
+    if frames.ndim < 2:
+        raise ValueError("frames must have at least 2 dimensions")
+    colors = get_colormap_lut(colormap)
+    shape = frames.shape + (colors.shape[-1],)
+    if output is None:
+        output = numpy.empty(shape, dtype=colors.dtype)
+    elif output.shape != shape:
+        raise ValueError("output shape must be %s, got %s" % (shape, output.shape))
+
+    if shared_range:
+        normalizer = _get_normalizer(norm, gamma)
+        vmin, vmax = _get_range(normalizer, frames, autoscale, vmin, vmax)
+        frame_size = max(1, int(numpy.prod(frames.shape[1:])))
+        nb_frames = max(1, _STACK_TILE_SIZE // frame_size)
+    else:
+        nb_frames = 1
+
+    for start in range(0, len(frames), nb_frames):
+        end = start + nb_frames
+        apply_colormap(
+            frames[start:end],
+            colormap,
+            norm,
+            autoscale,
+            vmin,
+            vmax,
+            gamma,
+            output[start:end],
+        )
+    return output
+
+
 _UINT8_LUT = numpy.arange(256, dtype=numpy.uint8).reshape(-1, 1)
 
 
@@ -500,20 +863,25 @@ def normalize(
     vmin=None,
     vmax=None,
     gamma=1.0,
+    cache: bool = False,
 ):
     """Normalize data to an array of uint8.
 
     :param numpy.ndarray data: Data to normalize
     :param str norm: Normalization to apply
-    :param str autoscale: Autoscale mode: "minmax" (default) or "stddev3"
+    :param str autoscale: Autoscale mode: "minmax" (default), "stddev3",
+        "percentile_1_99" or "percentile_1_99_histogram"
     :param vmin: Lower bound, None (default) to autoscale
     :param vmax: Upper bound, None (default) to autoscale
     :param float gamma:
         Gamma correction parameter (used only for "gamma" normalization)
+    :param bool cache:
+        True to cache the autoscale range for data, which must not be
+        modified in place afterwards. Default: False
     :returns: Array of normalized values, vmin, vmax
     """
     normalizer = _get_normalizer(norm, gamma)
-    vmin, vmax = _get_range(normalizer, data, autoscale, vmin, vmax)
+    vmin, vmax = _get_range(normalizer, data, autoscale, vmin, vmax, cache)
     norm_data = _colormap.cmap(
         data,
         _UINT8_LUT,
@@ -23,19 +23,37 @@
 # ###########################################################################*/
 """This module provides combination of statistics as single operation.
 
-For now it provides min/max (and optionally positive min) and indices
-of first occurrences (i.e., argmin/argmax) in a single pass.
+It provides min/max (and optionally positive min) and indices
+of first occurrences (i.e., argmin/argmax) in a single pass with
+:func:`min_max`.
+
+:func:`statistics` also computes the number of NaNs, the sum, the mean and
+the standard deviation during the same pass.
+
+Large arrays are processed by chunks in parallel with OpenMP.
 """
 
 __authors__ = ["T. Vincent"]
 __license__ = "MIT"
-__date__ = "24/04/2018"
+__date__ = "18/10/2026"
 
 cimport cython
-from .math_compatibility cimport isnan, isfinite, INFINITY
+from cython.parallel import prange
+from libc.math cimport sqrt
+from libc.stdlib cimport malloc, free
+from .math_compatibility cimport isnan, isfinite
 
 import numpy
 
+from ..utils._openmp import get_num_threads
+
+
+cdef int MAX_NUM_THREADS = 4
+# Maximum number of threads used by default for the computation
+
+cdef Py_ssize_t MIN_CHUNK_SIZE = 65536
+"""Minimum number of elements processed by each thread"""
+
 
 # All supported types
 ctypedef fused _number:
@@ -61,6 +79,18 @@ ctypedef fused _floating:
     long double
 
 
+# Partial result of the reduction of a chunk of data
+ctypedef struct _ChunkResult:
+    Py_ssize_t count  # Number of values taken into account
+    Py_ssize_t nan_count
+    Py_ssize_t argmin  # -1 if count is 0
+    Py_ssize_t argmax  # -1 if count is 0
+    Py_ssize_t argmin_positive  # -1 if no strictly positive value
+    double shift  # Offset subtracted to the values to compute the moments
+    double sum  # Sum of the shifted values
+    double sum_squares  # Sum of the squares of the shifted values
+
+
 class _MinMaxResult(object):
     """Object storing result from :func:`min_max`"""
 
@@ -110,158 +140,281 @@ class _MinMaxResult(object):
             raise IndexError("Index out of range")
 
 
+class _StatisticsResult(_MinMaxResult):
+    """Object storing result from :func:`statistics`"""
+
+    def __init__(self, minimum, min_pos, maximum,
+                 argmin, argmin_pos, argmax,
+                 count, nan_count, sum_, mean, std):
+        super(_StatisticsResult, self).__init__(
+            minimum, min_pos, maximum, argmin, argmin_pos, argmax)
+        self._count = count
+        self._nan_count = nan_count
+        self._sum = sum_
+        self._mean = mean
+        self._std = std
+
+    count = property(
+        lambda self: self._count,
+        doc="Number of values taken into account")
+    nan_count = property(
+        lambda self: self._nan_count,
+        doc="Number of NaNs in the array")
+
+    sum = property(
+        lambda self: self._sum,
+        doc="""Sum of the values as a float
+
+        It is None if it was not computed or if no value is taken into account.
+        """)
+    mean = property(
+        lambda self: self._mean,
+        doc="""Mean of the values as a float
+
+        It is None if it was not computed or if no value is taken into account.
+        """)
+    std = property(
+        lambda self: self._std,
+        doc="""Standard deviation of the values as a float
+
+        It is None if it was not computed or if no value is taken into account.
+        """)
+
+
 @cython.initializedcheck(False)
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def _min_max(_number[::1] data, bint min_positive=False):
-    """:func:`min_max` implementation including infinite values
-
-    See :func:`min_max` for documentation.
+cdef inline void _reduce_chunk(const _number *data,
+                               Py_ssize_t start,
+                               Py_ssize_t end,
+                               bint min_positive,
+                               bint finite,
+                               bint moments,
+                               _ChunkResult *result) noexcept nogil:
+    """Reduce data[start:end] and store the partial result in result.
+
+    NaNs are skipped. If finite is True, infinite values are skipped as well.
+    Indices are the ones of the first occurrences.
+    count and nan_count are only computed if moments is True.
+
+    This function is inlined with constant flags by :func:`_chunk_statistics`
+    so that the compiler generates a loop for each case.
     """
     cdef:
-        _number value, minimum, min_pos, maximum
-        unsigned int length
-        unsigned int index = 0
-        unsigned int min_index = 0
-        unsigned int min_pos_index = 0
-        unsigned int max_index = 0
-
-    length = len(data)
-
-    if length == 0:
-        raise ValueError('Zero-size array')
-
-    with nogil:
-        # Init starting values
-        value = data[0]
+        _number value, minimum, maximum, min_pos
+        Py_ssize_t index, count = 0, nan_count = 0
+        Py_ssize_t min_index = -1, max_index = -1, min_pos_index = -1
+        double shift = 0., delta, sum_ = 0., sum_squares = 0.
+
+    min_pos = 0
+    # Loop until the first value to take into account
+    for index in range(start, end):
+        value = data[index]
+        if _number in _floating:
+            if isnan(value):
+                nan_count += 1
+                continue
+            if finite and not isfinite(value):
+                continue
         minimum = value
         maximum = value
-        if min_positive and value > 0:
-            min_pos = value
-        else:
-            min_pos = 0
+        min_index = index
+        max_index = index
+        if isfinite(<double> value):
+            # Shift values by the first one for a better precision
+            shift = <double> value
+        break
+    else:
+        index = end
 
+    # Process this first value again to take it into account for all fields
+    for index in range(index, end):
+        value = data[index]
         if _number in _floating:
-            # For floating, loop until first not NaN value
-            for index in range(length):
-                value = data[index]
-                if not isnan(value):
-                    minimum = value
-                    min_index = index
-                    maximum = value
-                    max_index = index
-                    break
-
-        if not min_positive:
-            for index in range(index, length):
-                value = data[index]
-                if value > maximum:
-                    maximum = value
-                    max_index = index
-                elif value < minimum:
-                    minimum = value
-                    min_index = index
+            if moments and isnan(value):
+                nan_count += 1
+                continue
+            # Comparisons with NaN are false: NaN are skipped below
+            if finite and not isfinite(value):
+                continue
+
+        if value > maximum:
+            maximum = value
+            max_index = index
+        elif value < minimum:
+            minimum = value
+            min_index = index
 
+        if min_positive and value > 0:
+            if value < min_pos or min_pos_index == -1:
+                min_pos = value
+                min_pos_index = index
+
+        if moments:
+            count += 1
+            delta = <double> value - shift
+            sum_ += delta
+            sum_squares += delta * delta
+
+    result.count = count
+    result.nan_count = nan_count
+    result.argmin = min_index
+    result.argmax = max_index
+    result.argmin_positive = min_pos_index
+    result.shift = shift
+    result.sum = sum_
+    result.sum_squares = sum_squares
+
+
+cdef void _chunk_statistics(const _number *data,
+                            Py_ssize_t start,
+                            Py_ssize_t end,
+                            bint min_positive,
+                            bint finite,
+                            bint moments,
+                            _ChunkResult *result) noexcept nogil:
+    """Dispatch to a specialization of :func:`_reduce_chunk`"""
+    if moments:
+        if min_positive:
+            if finite:
+                _reduce_chunk(data, start, end, True, True, True, result)
+            else:
+                _reduce_chunk(data, start, end, True, False, True, result)
+        else:
+            if finite:
+                _reduce_chunk(data, start, end, False, True, True, result)
+            else:
+                _reduce_chunk(data, start, end, False, False, True, result)
+    else:
+        if min_positive:
+            if finite:
+                _reduce_chunk(data, start, end, True, True, False, result)
+            else:
+                _reduce_chunk(data, start, end, True, False, False, result)
         else:
-            # Loop until min_pos is defined
-            for index in range(index, length):
-                value = data[index]
-                if value > maximum:
-                    maximum = value
-                    max_index = index
-                elif value < minimum:
-                    minimum = value
-                    min_index = index
-
-                if value > 0:
-                    min_pos = value
-                    min_pos_index = index
-                    break
-
-            # Loop until the end
-            for index in range(index + 1, length):
-                value = data[index]
-                if value > maximum:
-                    maximum = value
-                    max_index = index
-                else:
-                    if value < minimum:
-                        minimum = value
-                        min_index = index
-
-                    if 0 < value < min_pos:
-                        min_pos = value
-                        min_pos_index = index
-
-    return _MinMaxResult(minimum,
-                         min_pos if min_pos > 0 else None,
-                         maximum,
-                         min_index,
-                         min_pos_index if min_pos > 0 else None,
-                         max_index)
+            if finite:
+                _reduce_chunk(data, start, end, False, True, False, result)
+            else:
+                _reduce_chunk(data, start, end, False, False, False, result)
 
 
 @cython.initializedcheck(False)
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def _finite_min_max(_floating[::1] data, bint min_positive=False):
-    """:func:`min_max` implementation for floats skipping infinite values
-
-    See :func:`min_max` for documentation.
+def _statistics(_number[::1] data,
+                bint min_positive=False,
+                bint finite=False,
+                bint moments=False,
+                int num_threads=1):
+    """:func:`statistics` implementation
+
+    See :func:`statistics` for documentation.
     """
     cdef:
-        _floating value, minimum, min_pos, maximum
-        unsigned int length
-        unsigned int index = 0
-        unsigned int min_index = 0
-        unsigned int min_pos_index = 0
-        unsigned int max_index = 0
-
-    length = len(data)
+        Py_ssize_t length = data.shape[0]
+        Py_ssize_t chunk, nb_chunks, chunk_size
+        _ChunkResult *chunks
+        _ChunkResult *partial
+        Py_ssize_t count = 0, nan_count = 0
+        Py_ssize_t min_index = -1, max_index = -1, min_pos_index = -1
+        double total_count, chunk_mean, delta
+        double mean = 0., m2 = 0., sum_ = 0.
 
     if length == 0:
         raise ValueError('Zero-size array')
 
-    with nogil:
-        minimum = INFINITY
-        maximum = -INFINITY
-        min_pos = INFINITY
-
-        if not min_positive:
-            for index in range(length):
-                value = data[index]
-                if isfinite(value):
-                    if value > maximum:
-                        maximum = value
-                        max_index = index
-                    if value < minimum:
-                        minimum = value
-                        min_index = index
+    num_threads = max(1, min(num_threads, length // MIN_CHUNK_SIZE))
+    nb_chunks = num_threads
+    chunk_size = (length + nb_chunks - 1) // nb_chunks
 
+    chunks = <_ChunkResult *> malloc(nb_chunks * sizeof(_ChunkResult))
+    if chunks == NULL:
+        raise MemoryError()
+
+    try:
+        if num_threads == 1:
+            with nogil:
+                _chunk_statistics(&data[0], 0, length,
+                                  min_positive, finite, moments, chunks)
         else:
-            for index in range(index, length):
-                value = data[index]
-                if isfinite(value):
-                    if value > maximum:
-                        maximum = value
-                        max_index = index
-                    if value < minimum:
-                        minimum = value
-                        min_index = index
-
-                    if 0. < value < min_pos:
-                        min_pos = value
-                        min_pos_index = index
-
-    return _MinMaxResult(minimum if isfinite(minimum) else None,
-                         min_pos if isfinite(min_pos) else None,
-                         maximum if isfinite(maximum) else None,
-                         min_index if isfinite(minimum) else None,
-                         min_pos_index if isfinite(min_pos) else None,
-                         max_index if isfinite(maximum) else None)
-
-
-def min_max(data not None, bint min_positive=False, bint finite=False):
+            with nogil:
+                for chunk in prange(nb_chunks, num_threads=num_threads,
+                                    schedule='static'):
+                    _chunk_statistics(&data[0],
+                                      chunk * chunk_size,
+                                      min(length, (chunk + 1) * chunk_size),
+                                      min_positive, finite, moments,
+                                      &chunks[chunk])
+
+        # Merge partial results in chunk order to keep first occurrences
+        for chunk in range(nb_chunks):
+            partial = &chunks[chunk]
+            nan_count += partial.nan_count
+            if partial.argmin == -1:  # No value taken into account
+                continue
+
+            if min_index == -1 or data[partial.argmin] < data[min_index]:
+                min_index = partial.argmin
+            if max_index == -1 or data[partial.argmax] > data[max_index]:
+                max_index = partial.argmax
+            if partial.argmin_positive != -1 and (
+                    min_pos_index == -1 or
+                    data[partial.argmin_positive] < data[min_pos_index]):
+                min_pos_index = partial.argmin_positive
+
+            if moments:
+                # Parallel variance algorithm from Chan et al.
+                chunk_mean = partial.shift + partial.sum / partial.count
+                total_count = <double> (count + partial.count)
+                delta = chunk_mean - mean
+                m2 += (partial.sum_squares -
+                       partial.sum * partial.sum / partial.count +
+                       delta * delta * count * partial.count / total_count)
+                mean += delta * partial.count / total_count
+                sum_ += partial.shift * partial.count + partial.sum
+            count += partial.count
+    finally:
+        free(chunks)
+
+    if min_index == -1:
+        if finite or _number not in _floating:
+            result = None, None, None, None, None, None
+        else:  # All data is NaN
+            result = data[0], None, data[0], 0, None, 0
+    else:
+        result = (data[min_index],
+                  data[min_pos_index] if min_pos_index != -1 else None,
+                  data[max_index],
+                  min_index,
+                  min_pos_index if min_pos_index != -1 else None,
+                  max_index)
+
+    if not moments:
+        return _MinMaxResult(*result)
+
+    if count == 0:
+        return _StatisticsResult(*result, 0, nan_count, None, None, None)
+
+    if m2 < 0.:  # Rounding errors
+        m2 = 0.
+    return _StatisticsResult(*result, count, nan_count, sum_, mean, sqrt(m2 / count))
+
+
+def _as_native_contiguous(data):
+    """Returns data as a native, flat and contiguous array.
+
+    16-bits floating-point data is converted to 32-bits floating-point.
+    """
+    data = numpy.asarray(data)
+    native_endian_dtype = data.dtype.newbyteorder('N')
+    if native_endian_dtype.kind == 'f' and native_endian_dtype.itemsize == 2:
+        # Use native float32 instead of float16
+        native_endian_dtype = "=f4"
+    return numpy.ascontiguousarray(data, dtype=native_endian_dtype).ravel()
+
+
+def min_max(data not None, bint min_positive=False, bint finite=False,
+            num_threads=None):
     """Returns min, max and optionally strictly positive min of data.
 
     It also computes the indices of first occurrence of min/max.
@@ -308,6 +461,9 @@ def min_max(data not None, bint min_positive=False, bint finite=False):
                               Default: False.
     :param bool finite: True to compute min/max from finite data only
                         Default: False.
+    :param Union[int,None] num_threads:
+        Maximum number of threads to use for large arrays.
+        Default: OMP_NUM_THREADS or the number of available CPUs, up to 4
     :returns: An object with minimum, maximum and min_positive attributes
               and the indices of first occurrence in the flattened data:
               argmin, argmax and argmin_positive attributes.
@@ -315,13 +471,51 @@ def min_max(data not None, bint min_positive=False, bint finite=False):
               min_positive and argmin_positive are None.
     :raises: ValueError if data is empty
     """
-    data = numpy.asarray(data)
-    native_endian_dtype = data.dtype.newbyteorder('N')
-    if native_endian_dtype.kind == 'f' and native_endian_dtype.itemsize == 2:
-        # Use native float32 instead of float16
-        native_endian_dtype = "=f4"
-    data = numpy.ascontiguousarray(data, dtype=native_endian_dtype).ravel()
-    if finite and data.dtype.kind == 'f':
-        return _finite_min_max(data, min_positive)
-    else:
-        return _min_max(data, min_positive)
+    return _statistics(_as_native_contiguous(data),
+                       min_positive,
+                       finite,
+                       False,
+                       get_num_threads(num_threads, MAX_NUM_THREADS))
+
+
+def statistics(data not None, bint min_positive=False, bint finite=False,
+               num_threads=None):
+    """Returns min/max information along with the sum, mean and standard
+    deviation of data, all computed in a single pass.
+
+    It provides the same information as :func:`min_max` and also:
+
+    - count: The number of values taken into account
+    - nan_count: The number of NaNs
+    - sum, mean and std: The sum, the mean and the (population) standard
+      deviation of the values taken into account, as floats.
+
+    NaNs are always ignored. If *finite* is True, infinite values are
+    ignored as well, which is equivalent to `numpy.nanmean` and
+    `numpy.nanstd` of the data with infinite values replaced by NaNs.
+
+    >>> import numpy
+    >>> result = statistics(numpy.array((1., numpy.nan, 3.)))
+    >>> result.minimum, result.maximum, result.mean, result.std
+    1.0, 3.0, 2.0, 1.0
+    >>> result.count, result.nan_count
+    2, 1
+
+    :param data: Array-like dataset
+    :param bool min_positive: True to compute the positive min and argmin
+                              Default: False.
+    :param bool finite: True to compute statistics from finite data only
+                        Default: False.
+    :param Union[int,None] num_threads:
+        Maximum number of threads to use for large arrays.
+        Default: OMP_NUM_THREADS or the number of available CPUs, up to 4
+    :returns: An object with the attributes of the object returned by
+        :func:`min_max` and count, nan_count, sum, mean and std attributes.
+        sum, mean and std are None if no value is taken into account.
+    :raises: ValueError if data is empty
+    """
+    return _statistics(_as_native_contiguous(data),
+                       min_positive,
+                       finite,
+                       True,
+                       get_num_threads(num_threads, MAX_NUM_THREADS))
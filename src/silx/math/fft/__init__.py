@@ -4,4 +4,4 @@ __authors__ = ["P. Paleo"]
 __license__ = "MIT"
 __date__ = "12/12/2018"
 
-from .fft import FFT
+from .fft import FFT, get_fft, clear_plan_cache, set_plan_cache_size, set_wisdom_file
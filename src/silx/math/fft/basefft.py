@@ -143,6 +143,72 @@ class BaseFFT(object):
                 name="data_out",
             )
 
+    def _check_stack(self, frames, frame_shape):
+        """Check the shape of a stack of frames.
+
+        :returns: Number of frames
+        """
+        if len(frames) != 0 and tuple(frames[0].shape) != tuple(frame_shape):
+            raise ValueError(
+                "Invalid frame shape: expected %s, got %s"
+                % (tuple(frame_shape), tuple(frames[0].shape))
+            )
+        return len(frames)
+
+    def _allocate_stack_output(self, output, n_frames, frame_shape, dtype):
+        """Returns the array where to store the transform of a stack."""
+        shape = (n_frames,) + tuple(frame_shape)
+        if output is None:
+            return np.empty(shape, dtype=dtype)
+        if output.shape != shape or output.dtype != dtype:
+            raise ValueError(
+                "Invalid output: expected shape %s and dtype %s, got %s and %s"
+                % (shape, np.dtype(dtype), output.shape, output.dtype)
+            )
+        return output
+
+    def _transform_stack(self, transform, frames, output):
+        n_frames = len(frames)
+        for index in range(n_frames):
+            result = transform(frames[index])
+            if output is None:
+                output = np.empty((n_frames,) + result.shape, dtype=result.dtype)
+            output[index] = result
+        return output
+
+    def fft_stack(self, frames, output=None):
+        """
+        Perform the (forward) Fast Fourier Transform of each frame of a stack
+        with this plan.
+
+        :param frames:
+            Stack of frames, i.e., an array-like of shape (N,) + shape
+            where shape is the input shape of this plan.
+        :param numpy.ndarray output:
+            Optional array of shape (N,) + output shape where to store
+            the result.
+        :returns: The transformed frames
+        :rtype: numpy.ndarray
+        """
+        self._check_stack(frames, self.shape)
+        return self._transform_stack(self.fft, frames, output)
+
+    def ifft_stack(self, frames, output=None):
+        """
+        Perform the (inverse) Fast Fourier Transform of each frame of a stack
+        with this plan.
+
+        :param frames:
+            Stack of frames in the Fourier domain, i.e., an array-like of shape
+            (N,) + output shape of this plan.
+        :param numpy.ndarray output:
+            Optional array of shape (N,) + shape where to store the result.
+        :returns: The transformed frames
+        :rtype: numpy.ndarray
+        """
+        self._check_stack(frames, self.shape_out)
+        return self._transform_stack(self.ifft, frames, output)
+
     def fft(self, array, **kwargs):
         raise ValueError("This should be implemented by back-end FFT")
 
@@ -22,10 +22,27 @@
 # THE SOFTWARE.
 #
 # ###########################################################################*/
+import collections
+import logging
+import os
+import threading
+
+import numpy as np
+
+from . import fftw
 from .fftw import FFTW
 from .npfft import NPFFT
 
 
+_logger = logging.getLogger(__name__)
+
+_BACKEND_ALIASES = {
+    "np": "numpy",
+    "clfft": "opencl",
+    "cufft": "cuda",
+}
+
+
 def FFT(
     shape=None,
     dtype=None,
@@ -97,3 +114,195 @@ def FFT(
         **kwargs,
     )
     return F
+
+
+class PlanCache(object):
+    """Size-bounded cache of FFT plans.
+
+    Plans are stored by (backend, shape, dtype, shape_out, axes, normalize)
+    and backend-specific arguments, and the least recently used plan is
+    discarded when the cache is full.
+
+    A plan owns its buffers: a cached plan must not be used concurrently by
+    several threads.
+
+    :param int max_size: Maximum number of plans kept in the cache
+    :param Union[str,None] wisdom_file:
+        Path of a file where FFTW wisdom is loaded from and saved to,
+        so that FFTW plans are computed faster the next time.
+    """
+
+    def __init__(self, max_size=16, wisdom_file=None):
+        self.max_size = max_size
+        self.wisdom_file = wisdom_file
+        self.__plans = collections.OrderedDict()
+        self.__lock = threading.RLock()
+        self.__wisdom_loaded = None
+
+    def __len__(self):
+        return len(self.__plans)
+
+    def resize(self, max_size):
+        """Set the maximum number of plans, discarding the oldest ones.
+
+        :param int max_size: 0 to disable the cache
+        """
+        with self.__lock:
+            self.max_size = max(0, int(max_size))
+            while len(self.__plans) > self.max_size:
+                self.__plans.popitem(last=False)
+
+    def clear(self):
+        """Remove all the plans from the cache."""
+        with self.__lock:
+            self.__plans.clear()
+
+    @staticmethod
+    def _get_key(backend, shape, dtype, template, shape_out, axes, normalize, kwargs):
+        """Returns the key of a plan, or None if it can't be cached"""
+        if template is not None:
+            shape, dtype = template.shape, template.dtype
+        key = (
+            _BACKEND_ALIASES.get(backend.lower(), backend.lower()),
+            None if shape is None else tuple(shape),
+            None if dtype is None else np.dtype(dtype).str,
+            # numpy backend uses real transforms only from a real template
+            template is not None and np.isrealobj(template),
+            None if shape_out is None else tuple(shape_out),
+            None if axes is None else tuple(axes),
+            normalize,
+            tuple(sorted(kwargs.items())),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def __load_wisdom(self):
+        if self.__wisdom_loaded == self.wisdom_file:
+            return
+        self.__wisdom_loaded = self.wisdom_file
+        if os.path.isfile(self.wisdom_file):
+            try:
+                fftw.import_wisdom(self.wisdom_file, on_mismatch="ignore")
+            except Exception:
+                _logger.warning(
+                    "Failed to load FFTW wisdom from %s", self.wisdom_file
+                )
+                _logger.debug("Backtrace", exc_info=True)
+
+    def __save_wisdom(self):
+        try:
+            fftw.export_wisdom(self.wisdom_file, on_existing="overwrite")
+        except Exception:
+            _logger.warning("Failed to save FFTW wisdom to %s", self.wisdom_file)
+            _logger.debug("Backtrace", exc_info=True)
+
+    def get(
+        self,
+        shape=None,
+        dtype=None,
+        template=None,
+        shape_out=None,
+        axes=None,
+        normalize="rescale",
+        backend="numpy",
+        **kwargs,
+    ):
+        """Returns a FFT plan, from the cache if available.
+
+        See :func:`FFT` for the arguments.
+        """
+        key = self._get_key(
+            backend, shape, dtype, template, shape_out, axes, normalize, kwargs
+        )
+        with self.__lock:
+            if key is not None and key in self.__plans:
+                self.__plans.move_to_end(key)
+                return self.__plans[key]
+
+            is_fftw = backend.lower() == "fftw" and fftw.__have_fftw__
+            if is_fftw and self.wisdom_file is not None:
+                self.__load_wisdom()
+            plan = FFT(
+                shape=shape,
+                dtype=dtype,
+                template=template,
+                shape_out=shape_out,
+                axes=axes,
+                normalize=normalize,
+                backend=backend,
+                **kwargs,
+            )
+            if is_fftw and self.wisdom_file is not None:
+                self.__save_wisdom()
+
+            if key is not None and self.max_size > 0:
+                self.__plans[key] = plan
+                while len(self.__plans) > self.max_size:
+                    self.__plans.popitem(last=False)
+            return plan
+
+
+_PLAN_CACHE = PlanCache()
+
+
+def get_fft(
+    shape=None,
+    dtype=None,
+    template=None,
+    shape_out=None,
+    axes=None,
+    normalize="rescale",
+    backend="numpy",
+    **kwargs,
+):
+    """
+    Returns a FFT plan from a global cache, creating it if needed.
+
+    The arguments are the same as for :func:`FFT`.
+    A cached plan owns its buffers: it must not be used concurrently by
+    several threads.
+
+    Example to transform a stack of frames with a single plan:
+
+    >>> plan = get_fft(shape=frames.shape[1:], dtype=frames.dtype, backend="fftw")
+    >>> spectra = plan.fft_stack(frames)
+    """
+    return _PLAN_CACHE.get(
+        shape=shape,
+        dtype=dtype,
+        template=template,
+        shape_out=shape_out,
+        axes=axes,
+        normalize=normalize,
+        backend=backend,
+        **kwargs,
+    )
+
+
+def clear_plan_cache():
+    """Remove all plans from the cache used by :func:`get_fft`."""
+    _PLAN_CACHE.clear()
+
+
+def set_plan_cache_size(max_size):
+    """Set the maximum number of plans cached by :func:`get_fft`.
+
+    :param int max_size: 0 to disable the cache
+    """
+    _PLAN_CACHE.resize(max_size)
+
+
+def set_wisdom_file(fname):
+    """Set the file where FFTW wisdom is persisted by :func:`get_fft`.
+
+    Wisdom is loaded from this file before computing the first FFTW plan,
+    and the file is updated each time a new FFTW plan is computed.
+
+    :param Union[str,None] fname:
+        Path of the file, e.g., from :func:`silx.math.fft.fftw.get_wisdom_file`,
+        or None to disable wisdom persistence.
+    """
+    _PLAN_CACHE.wisdom_file = fname
@@ -258,6 +258,60 @@ class FFTW(BaseFFT):
         self.plan_inverse.update_arrays(self.refs["data_out"], self.refs["data_in"])
         return data_out
 
+    def fft_stack(self, frames, output=None):
+        """
+        Perform the (forward) Fast Fourier Transform of each frame of a stack.
+
+        Frames are copied in the aligned buffers of this plan, so that no
+        memory is allocated per frame.
+
+        :param frames:
+            Stack of frames, i.e., an array-like of shape (N,) + shape.
+        :param numpy.ndarray output:
+            Optional array of shape (N,) + output shape.
+        :rtype: numpy.ndarray
+        """
+        n_frames = self._check_stack(frames, self.shape)
+        output = self._allocate_stack_output(
+            output, n_frames, self.shape_out, self.dtype_out
+        )
+        data_in, data_out = self.refs["data_in"], self.refs["data_out"]
+        for index in range(n_frames):
+            data_in[...] = frames[index]
+            # Without argument, the internal arrays are used
+            self.plan_forward(
+                ortho=self.fftw_norm_mode[0]["ortho"],
+                normalise_idft=self.fftw_norm_mode[0]["normalise_idft"],
+            )
+            output[index] = data_out
+        return output
+
+    def ifft_stack(self, frames, output=None):
+        """
+        Perform the (inverse) Fast Fourier Transform of each frame of a stack.
+
+        Frames are copied in the aligned buffers of this plan, so that no
+        memory is allocated per frame.
+
+        :param frames:
+            Stack of frames, i.e., an array-like of shape (N,) + output shape.
+        :param numpy.ndarray output:
+            Optional array of shape (N,) + shape.
+        :rtype: numpy.ndarray
+        """
+        n_frames = self._check_stack(frames, self.shape_out)
+        output = self._allocate_stack_output(output, n_frames, self.shape, self.dtype_in)
+        data_in, data_out = self.refs["data_in"], self.refs["data_out"]
+        for index in range(n_frames):
+            # c2r transforms overwrite their input: data_out is refilled each time
+            data_out[...] = frames[index]
+            self.plan_inverse(
+                ortho=self.fftw_norm_mode[1]["ortho"],
+                normalise_idft=self.fftw_norm_mode[1]["normalise_idft"],
+            )
+            output[index] = data_in
+        return output
+
 
 def get_wisdom_metadata():
     """
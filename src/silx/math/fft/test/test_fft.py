@@ -38,7 +38,7 @@ try:
 except ImportError:
     __have_scipy = False
 from silx.utils.testutils import ParametricTestCase
-from silx.math.fft.fft import FFT
+from silx.math.fft.fft import FFT, PlanCache
 from silx.math.fft.clfft import __have_clfft__
 from silx.math.fft.cufft import __have_cufft__
 from silx.math.fft.fftw import (
@@ -418,3 +418,71 @@ def test_fftw_wisdom():
         export_wisdom(fname)
         assert path.isfile(fname)
         import_wisdom(fname)
+
+
+def test_plan_cache():
+    """Test PlanCache reuses plans and discards the least recently used"""
+    cache = PlanCache(max_size=2)
+    plan = cache.get(shape=(16, 16), dtype=np.complex64, backend="numpy")
+    assert cache.get(shape=(16, 16), dtype=np.complex64, backend="np") is plan
+    other = cache.get(shape=(16, 16), dtype=np.complex64, normalize="ortho")
+    assert other is not plan
+    cache.get(shape=(16,), dtype=np.complex64)
+    assert len(cache) == 2
+    # plan was the least recently used
+    assert cache.get(shape=(16, 16), dtype=np.complex64) is not plan
+    assert cache.get(shape=(16,), dtype=np.complex64, normalize="ortho") is not None
+
+    cache.resize(1)
+    assert len(cache) == 1
+    cache.clear()
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.complex128])
+def test_fft_stack_numpy(dtype):
+    """Test batched transform of a stack of frames"""
+    rng = np.random.default_rng(0)
+    frames = rng.random((5, 32, 30)).astype(dtype)
+    plan = FFT(template=frames[0], backend="numpy")
+    np_fft, np_ifft = (
+        (np.fft.rfft2, np.fft.irfft2)
+        if np.isrealobj(frames)
+        else (np.fft.fft2, np.fft.ifft2)
+    )
+
+    result = plan.fft_stack(frames)
+    assert np.allclose(result, np_fft(frames))
+    inverse = plan.ifft_stack(result)
+    assert np.allclose(inverse, np_ifft(np_fft(frames)))
+
+    with pytest.raises(ValueError):
+        plan.fft_stack(frames[:, :16])
+
+
+@pytest.mark.skipif(not (__have_fftw__), reason="Need fftw/pyfftw for this test")
+@pytest.mark.parametrize("dtype", [np.float32, np.complex64])
+def test_fft_stack_fftw(dtype):
+    """Test batched transform of a stack of frames with FFTW"""
+    rng = np.random.default_rng(0)
+    frames = rng.random((5, 32, 30)).astype(dtype)
+    plan = FFT(template=frames[0], backend="fftw")
+
+    output = np.zeros((5,) + plan.shape_out, dtype=plan.dtype_out)
+    result = plan.fft_stack(frames, output=output)
+    assert result is output
+    for frame, expected in zip(frames, result):
+        assert np.allclose(plan.fft(frame), expected)
+    assert np.allclose(plan.ifft_stack(result), frames, atol=1e-5)
+
+
+@pytest.mark.skipif(not (__have_fftw__), reason="Need fftw/pyfftw for this test")
+def test_plan_cache_wisdom():
+    """Test FFTW wisdom persistence of PlanCache"""
+    with TemporaryDirectory(prefix="test_fftw_wisdom") as dname:
+        fname = path.join(dname, "wisdom.npz")
+        cache = PlanCache(wisdom_file=fname)
+        cache.get(shape=(64, 64), dtype=np.complex64, backend="fftw")
+        assert path.isfile(fname)
+        cache = PlanCache(wisdom_file=fname)
+        cache.get(shape=(64, 64), dtype=np.complex64, backend="fftw")
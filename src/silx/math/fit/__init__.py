@@ -26,7 +26,7 @@ __license__ = "MIT"
 __date__ = "22/06/2016"
 
 
-from .leastsq import leastsq, chisq_alpha_beta
+from .leastsq import leastsq, leastsq_batch, chisq_alpha_beta
 from .leastsq import CFREE, CPOSITIVE, CQUOTED, CFIXED, CFACTOR, CDELTA, CSUM
 
 from .functions import *
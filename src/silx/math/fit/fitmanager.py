@@ -53,7 +53,7 @@ from . import bgtheories
 
 __authors__ = ["V.A. Sole", "P. Knobel"]
 __license__ = "MIT"
-__date__ = "16/01/2017"
+__date__ = "18/10/2026"
 
 _logger = logging.getLogger(__name__)
 
@@ -875,6 +875,15 @@ class FitManager(object):
         ywork = self.ydata[self._finite_mask]
         xwork = self.xdata[self._finite_mask]
 
+        # Ignored parameters are not provided to the model but they are
+        # provided to its derivative
+        if self.theories[self.selectedtheory].derivative is None or any(
+            param["code"] in ["IGNORE", 7] for param in self.fit_results
+        ):
+            model_deriv = None
+        else:
+            model_deriv = self.fitderivative
+
         try:
             params, covariance_matrix, infodict = leastsq(
                 self.fitfunction,  # bg + actual model function
@@ -883,7 +892,7 @@ class FitManager(object):
                 param_val,
                 sigma=self.sigmay,
                 constraints=param_constraints,
-                model_deriv=self.theories[self.selectedtheory].derivative,
+                model_deriv=model_deriv,
                 full_output=True,
                 left_derivative=True,
             )
@@ -939,6 +948,42 @@ class FitManager(object):
 
         return result
 
+    def fitderivative(self, x, pars, index):
+        """Derivative of :meth:`fitfunction` with respect to ``pars[index]``.
+
+        The derivatives with respect to the parameters of the fit model are
+        provided by the :attr:`FitTheory.derivative` function of the selected
+        theory. The derivatives with respect to the background parameters
+        are computed with finite differences of the background function
+        only.
+
+        :param x: Independent variable where the derivative is calculated.
+        :param pars: Sequence of all fit parameters, as for
+            :meth:`fitfunction`.
+        :param int index: Index of the parameter in ``pars``
+        :return: Derivative of the fit function at each ``x`` coordinate.
+        """
+        if self.selectedbg is not None:
+            nb_bg_pars = len(self.bgtheories[self.selectedbg].parameters)
+        else:
+            nb_bg_pars = 0
+
+        if index >= nb_bg_pars:
+            derivative = self.theories[self.selectedtheory].derivative
+            return derivative(x, pars[nb_bg_pars:], index - nb_bg_pars)
+
+        bgfun = self.bgtheories[self.selectedbg].function
+        bg_pars = numpy.array(pars[0:nb_bg_pars], dtype=numpy.float64)
+        value = bg_pars[index]
+        delta = (value + numpy.equal(value, 0.0)) * numpy.sqrt(
+            numpy.finfo(numpy.float64).eps
+        )
+        bg_pars[index] = value + delta
+        f1 = bgfun(x, self.ydata, *bg_pars)
+        bg_pars[index] = value - delta
+        f2 = bgfun(x, self.ydata, *bg_pars)
+        return (f1 - f2) / (2.0 * delta)
+
     def estimate_bkg(self, x, y):
         """Estimate background parameters using the function defined in
         the current fit configuration.
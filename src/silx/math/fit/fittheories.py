@@ -88,7 +88,7 @@ _logger = logging.getLogger(__name__)
 
 __authors__ = ["V.A. Sole", "P. Knobel"]
 __license__ = "MIT"
-__date__ = "15/05/2017"
+__date__ = "18/10/2026"
 
 
 DEFAULT_CONFIG = {
@@ -209,6 +209,30 @@ class FitTheories(object):
         p = numpy.poly1d(pars)
         return p(x)
 
+    def ahypermet_derivative(self, x, pars, index):
+        """
+        Wrapping of :func:`silx.math.fit.functions.sum_ahypermet_derivative`
+        using the same tail flags as :meth:`ahypermet`.
+        """
+        g_term = self.config["HypermetTails"] & 1
+        st_term = (self.config["HypermetTails"] >> 1) & 1
+        lt_term = (self.config["HypermetTails"] >> 2) & 1
+        step_term = (self.config["HypermetTails"] >> 3) & 1
+        return functions.sum_ahypermet_derivative(
+            x,
+            pars,
+            index,
+            gaussian_term=g_term,
+            st_term=st_term,
+            lt_term=lt_term,
+            step_term=step_term,
+        )
+
+    def poly_derivative(self, x, pars, index):
+        """Derivative of :meth:`poly` with respect to the coefficient
+        ``pars[index]``."""
+        return numpy.power(numpy.asarray(x, dtype=numpy.float64), len(pars) - 1 - index)
+
     @staticmethod
     def estimate_poly(x, y, n=2):
         """Estimate polynomial coefficients for a degree n polynomial."""
@@ -412,6 +436,7 @@ class FitTheories(object):
                 xw,
                 yw,
                 param,
+                model_deriv=functions.sum_gauss_derivative,
                 max_iter=4,
                 constraints=cons.tolist(),
                 full_output=True,
@@ -1327,6 +1352,7 @@ THEORY = dict(
                 parameters=("Height", "Position", "FWHM"),
                 estimate=fitfuns.estimate_height_position_fwhm,
                 configure=fitfuns.configure,
+                derivative=functions.sum_gauss_derivative,
             ),
         ),
         (
@@ -1337,6 +1363,7 @@ THEORY = dict(
                 parameters=("Height", "Position", "FWHM"),
                 estimate=fitfuns.estimate_height_position_fwhm,
                 configure=fitfuns.configure,
+                derivative=functions.sum_lorentz_derivative,
             ),
         ),
         (
@@ -1347,6 +1374,7 @@ THEORY = dict(
                 parameters=("Area", "Position", "FWHM"),
                 estimate=fitfuns.estimate_agauss,
                 configure=fitfuns.configure,
+                derivative=functions.sum_agauss_derivative,
             ),
         ),
         (
@@ -1357,6 +1385,7 @@ THEORY = dict(
                 parameters=("Area", "Position", "FWHM"),
                 estimate=fitfuns.estimate_alorentz,
                 configure=fitfuns.configure,
+                derivative=functions.sum_alorentz_derivative,
             ),
         ),
         (
@@ -1367,6 +1396,7 @@ THEORY = dict(
                 parameters=("Height", "Position", "FWHM", "Eta"),
                 estimate=fitfuns.estimate_pvoigt,
                 configure=fitfuns.configure,
+                derivative=functions.sum_pvoigt_derivative,
             ),
         ),
         (
@@ -1377,6 +1407,7 @@ THEORY = dict(
                 parameters=("Area", "Position", "FWHM", "Eta"),
                 estimate=fitfuns.estimate_apvoigt,
                 configure=fitfuns.configure,
+                derivative=functions.sum_apvoigt_derivative,
             ),
         ),
         (
@@ -1387,6 +1418,7 @@ THEORY = dict(
                 parameters=("Height", "Position", "LowFWHM", "HighFWHM"),
                 estimate=fitfuns.estimate_splitgauss,
                 configure=fitfuns.configure,
+                derivative=functions.sum_splitgauss_derivative,
             ),
         ),
         (
@@ -1397,6 +1429,7 @@ THEORY = dict(
                 parameters=("Height", "Position", "LowFWHM", "HighFWHM"),
                 estimate=fitfuns.estimate_splitgauss,
                 configure=fitfuns.configure,
+                derivative=functions.sum_splitlorentz_derivative,
             ),
         ),
         (
@@ -1407,6 +1440,7 @@ THEORY = dict(
                 parameters=("Height", "Position", "LowFWHM", "HighFWHM", "Eta"),
                 estimate=fitfuns.estimate_splitpvoigt,
                 configure=fitfuns.configure,
+                derivative=functions.sum_splitpvoigt_derivative,
             ),
         ),
         (
@@ -1424,6 +1458,7 @@ THEORY = dict(
                 ),
                 estimate=fitfuns.estimate_splitpvoigt2,
                 configure=fitfuns.configure,
+                derivative=functions.sum_splitpvoigt2_derivative,
             ),
         ),
         (
@@ -1434,6 +1469,7 @@ THEORY = dict(
                 parameters=("Height", "Position", "FWHM"),
                 estimate=fitfuns.estimate_stepdown,
                 configure=fitfuns.configure,
+                derivative=functions.sum_stepdown_derivative,
             ),
         ),
         (
@@ -1444,6 +1480,7 @@ THEORY = dict(
                 parameters=("Height", "Position", "FWHM"),
                 estimate=fitfuns.estimate_stepup,
                 configure=fitfuns.configure,
+                derivative=functions.sum_stepup_derivative,
             ),
         ),
         (
@@ -1454,6 +1491,7 @@ THEORY = dict(
                 parameters=("Height", "Position", "FWHM", "BeamFWHM"),
                 estimate=fitfuns.estimate_slit,
                 configure=fitfuns.configure,
+                derivative=functions.sum_slit_derivative,
             ),
         ),
         (
@@ -1464,6 +1502,7 @@ THEORY = dict(
                 parameters=("Height", "Position", "Width"),
                 estimate=fitfuns.estimate_stepup,
                 configure=fitfuns.configure,
+                derivative=functions.atan_stepup_derivative,
             ),
         ),
         (
@@ -1483,6 +1522,7 @@ THEORY = dict(
                 ),
                 estimate=fitfuns.estimate_ahypermet,
                 configure=fitfuns.configure,
+                derivative=fitfuns.ahypermet_derivative,
             ),
         ),
         # ('Periodic Gaussians',
@@ -1498,6 +1538,7 @@ THEORY = dict(
                 function=fitfuns.poly,
                 parameters=["a", "b", "c"],
                 estimate=fitfuns.estimate_quadratic,
+                derivative=fitfuns.poly_derivative,
             ),
         ),
         (
@@ -1507,6 +1548,7 @@ THEORY = dict(
                 function=fitfuns.poly,
                 parameters=["a", "b", "c", "d"],
                 estimate=fitfuns.estimate_cubic,
+                derivative=fitfuns.poly_derivative,
             ),
         ),
         (
@@ -1517,6 +1559,7 @@ THEORY = dict(
                 function=fitfuns.poly,
                 parameters=["a", "b", "c", "d", "e"],
                 estimate=fitfuns.estimate_quartic,
+                derivative=fitfuns.poly_derivative,
             ),
         ),
         (
@@ -1527,6 +1570,7 @@ THEORY = dict(
                 function=fitfuns.poly,
                 parameters=["a", "b", "c", "d", "e", "f"],
                 estimate=fitfuns.estimate_quintic,
+                derivative=fitfuns.poly_derivative,
             ),
         ),
     )
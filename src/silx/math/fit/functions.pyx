@@ -46,6 +46,32 @@ List of fit functions:
     - :func:`sum_ahypermet`
     - :func:`sum_fastahypermet`
 
+List of derivative functions:
+-----------------------------
+
+The analytic derivatives of the fit functions follow the
+``model_deriv(x, params, index)`` signature of :func:`silx.math.fit.leastsq`.
+
+    - :func:`sum_gauss_derivative`
+    - :func:`sum_agauss_derivative`
+    - :func:`sum_splitgauss_derivative`
+
+    - :func:`sum_apvoigt_derivative`
+    - :func:`sum_pvoigt_derivative`
+    - :func:`sum_splitpvoigt_derivative`
+    - :func:`sum_splitpvoigt2_derivative`
+
+    - :func:`sum_lorentz_derivative`
+    - :func:`sum_alorentz_derivative`
+    - :func:`sum_splitlorentz_derivative`
+
+    - :func:`sum_stepdown_derivative`
+    - :func:`sum_stepup_derivative`
+    - :func:`sum_slit_derivative`
+
+    - :func:`sum_ahypermet_derivative`
+    - :func:`atan_stepup_derivative`
+
 Full documentation:
 -------------------
 
@@ -53,7 +79,7 @@ Full documentation:
 
 __authors__ = ["P. Knobel"]
 __license__ = "MIT"
-__date__ = "16/08/2017"
+__date__ = "18/10/2026"
 
 import logging
 import numpy
@@ -977,6 +1003,508 @@ def periodic_gauss(x, *params):
     return sum_gauss(x, newpars)
 
 
+# Analytic derivatives of the fit functions
+#
+# The derivative functions follow the ``model_deriv(x, params, index)``
+# signature of :func:`silx.math.fit.leastsq`. As the fit functions are sums
+# of independent peaks, only the peak holding ``params[index]`` is computed.
+
+_INV_TWO_SQRT_TWO_LOG2 = 1.0 / (2.0 * numpy.sqrt(2.0 * numpy.log(2.0)))
+_SQRT2 = numpy.sqrt(2.0)
+_SQRT2PI = numpy.sqrt(2.0 * numpy.pi)
+_TWO_OVER_SQRTPI = 2.0 / numpy.sqrt(numpy.pi)
+
+
+def _derivative_parameters(x, params, index, multiple):
+    """Return x as a 1D float64 array, the parameters of the function
+    holding ``params[index]`` and the position of this parameter in them.
+    """
+    _validate_parameters(params, multiple)
+    index = int(index)
+    if not 0 <= index < len(params):
+        raise IndexError("Parameter index %d out of range" % index)
+    first = index - index % multiple
+    peak_params = [float(p) for p in params[first:first + multiple]]
+    x = numpy.asarray(x, dtype=numpy.float64)
+    return x.reshape(-1), peak_params, index % multiple
+
+
+def _gauss_partial(dx, amplitude, fwhm, param, cutoff, is_area=False):
+    """Partial derivative of a gaussian defined by its height (or area if
+    `is_area`), with respect to parameter number `param` of
+    *(amplitude, centroid, fwhm)*"""
+    sigma = fwhm * _INV_TWO_SQRT_TWO_LOG2
+    u = dx / sigma
+    g = numpy.exp(-0.5 * u * u)
+    g[u > cutoff] = 0.0
+    if is_area:
+        g /= sigma * _SQRT2PI
+    if param == 0:
+        return g
+    if param == 1:
+        return amplitude * g * u / sigma
+    if is_area:
+        return amplitude * g * (u * u - 1.0) / fwhm
+    return amplitude * g * u * u / fwhm
+
+
+def _lorentz_partial(dx, amplitude, fwhm, param, is_area=False):
+    """Partial derivative of a Lorentzian defined by its height (or area if
+    `is_area`), with respect to parameter number `param` of
+    *(amplitude, centroid, fwhm)*"""
+    v = dx / (0.5 * fwhm)
+    inv_denominator = 1.0 / (1.0 + v * v)
+    lor = inv_denominator / (0.5 * numpy.pi * fwhm) if is_area else inv_denominator
+    if param == 0:
+        return lor
+    if param == 1:
+        return amplitude * lor * inv_denominator * 4.0 * v / fwhm
+    result = amplitude * lor * 2.0 * v * v * inv_denominator / fwhm
+    if is_area:
+        result -= amplitude * lor / fwhm
+    return result
+
+
+def _pvoigt_partial(dx, amplitude, fwhm, eta, param, is_area=False):
+    """Partial derivative of a pseudo-Voigt with respect to parameter
+    number `param` of *(amplitude, centroid, fwhm, eta)*"""
+    if param == 3:
+        return amplitude * (
+            _lorentz_partial(dx, amplitude, fwhm, 0, is_area)
+            - _gauss_partial(dx, amplitude, fwhm, 0, 35, is_area)
+        )
+    return eta * _lorentz_partial(dx, amplitude, fwhm, param, is_area) + (
+        1.0 - eta
+    ) * _gauss_partial(dx, amplitude, fwhm, param, 35, is_area)
+
+
+def _split_partial(partial, dx, left, right):
+    """Combine the partial derivatives of the left (``x <= centroid``) and
+    the right (``x > centroid``) sides of a split function.
+
+    :param callable partial: ``partial(dx, param, side_params)``
+    :param tuple left: ``(param, side_params)`` for the left side, where
+        param is the index of the parameter in the parameters of the side,
+        or None if the parameter does not belong to this side
+    :param tuple right: ``(param, side_params)`` for the right side
+    """
+    result = numpy.zeros(dx.shape, dtype=numpy.float64)
+    for mask, (side_param, side_params) in ((dx <= 0, left), (dx > 0, right)):
+        if side_param is not None:
+            result[mask] = partial(dx[mask], side_param, side_params)
+    return result
+
+
+def _erf_partial(z):
+    """Derivative of erf at z"""
+    return _TWO_OVER_SQRTPI * numpy.exp(-z * z)
+
+
+def sum_gauss_derivative(x, params, index):
+    """Return the derivative of :func:`sum_gauss` with respect to
+    ``params[index]``.
+
+    :param x: Independent variable where the derivative is calculated
+    :type x: numpy.ndarray
+    :param params: Array of gaussian parameters (length must be a multiple
+        of 3): *(height1, centroid1, fwhm1, height2, centroid2, fwhm2,...)*
+    :param int index: Index of the parameter in ``params``
+    :return: Array of derivatives at each ``x`` coordinate
+    """
+    x_1d, (height, centroid, fwhm), param = _derivative_parameters(
+        x, params, index, 3)
+    result = _gauss_partial(x_1d - centroid, height, fwhm, param, 20)
+    return result.reshape(numpy.shape(x))
+
+
+def sum_agauss_derivative(x, params, index):
+    """Return the derivative of :func:`sum_agauss` with respect to
+    ``params[index]``.
+
+    :param x: Independent variable where the derivative is calculated
+    :type x: numpy.ndarray
+    :param params: Array of gaussian parameters (length must be a multiple
+        of 3): *(area1, centroid1, fwhm1, area2, centroid2, fwhm2,...)*
+    :param int index: Index of the parameter in ``params``
+    :return: Array of derivatives at each ``x`` coordinate
+    """
+    x_1d, (area, centroid, fwhm), param = _derivative_parameters(
+        x, params, index, 3)
+    result = _gauss_partial(x_1d - centroid, area, fwhm, param, 35,
+                            is_area=True)
+    return result.reshape(numpy.shape(x))
+
+
+def sum_splitgauss_derivative(x, params, index):
+    """Return the derivative of :func:`sum_splitgauss` with respect to
+    ``params[index]``.
+
+    :param x: Independent variable where the derivative is calculated
+    :type x: numpy.ndarray
+    :param params: Array of gaussian parameters (length must be a multiple
+        of 4): *(height1, centroid1, fwhm11, fwhm21,...)*
+    :param int index: Index of the parameter in ``params``
+    :return: Array of derivatives at each ``x`` coordinate
+    """
+    x_1d, (height, centroid, fwhm1, fwhm2), param = _derivative_parameters(
+        x, params, index, 4)
+    # (height, centroid, fwhm) parameter of each side
+    left_param = {0: 0, 1: 1, 2: 2, 3: None}[param]
+    right_param = {0: 0, 1: 1, 2: None, 3: 2}[param]
+    result = _split_partial(
+        lambda dx, p, fwhm: _gauss_partial(dx, height, fwhm, p, 20),
+        x_1d - centroid,
+        (left_param, fwhm1),
+        (right_param, fwhm2),
+    )
+    return result.reshape(numpy.shape(x))
+
+
+def sum_lorentz_derivative(x, params, index):
+    """Return the derivative of :func:`sum_lorentz` with respect to
+    ``params[index]``.
+
+    :param x: Independent variable where the derivative is calculated
+    :type x: numpy.ndarray
+    :param params: Array of Lorentz parameters (length must be a multiple
+        of 3): *(height1, centroid1, fwhm1,...)*
+    :param int index: Index of the parameter in ``params``
+    :return: Array of derivatives at each ``x`` coordinate
+    """
+    x_1d, (height, centroid, fwhm), param = _derivative_parameters(
+        x, params, index, 3)
+    result = _lorentz_partial(x_1d - centroid, height, fwhm, param)
+    return result.reshape(numpy.shape(x))
+
+
+def sum_alorentz_derivative(x, params, index):
+    """Return the derivative of :func:`sum_alorentz` with respect to
+    ``params[index]``.
+
+    :param x: Independent variable where the derivative is calculated
+    :type x: numpy.ndarray
+    :param params: Array of Lorentz parameters (length must be a multiple
+        of 3): *(area1, centroid1, fwhm1,...)*
+    :param int index: Index of the parameter in ``params``
+    :return: Array of derivatives at each ``x`` coordinate
+    """
+    x_1d, (area, centroid, fwhm), param = _derivative_parameters(
+        x, params, index, 3)
+    result = _lorentz_partial(x_1d - centroid, area, fwhm, param, is_area=True)
+    return result.reshape(numpy.shape(x))
+
+
+def sum_splitlorentz_derivative(x, params, index):
+    """Return the derivative of :func:`sum_splitlorentz` with respect to
+    ``params[index]``.
+
+    :param x: Independent variable where the derivative is calculated
+    :type x: numpy.ndarray
+    :param params: Array of Lorentz parameters (length must be a multiple
+        of 4): *(height1, centroid1, fwhm11, fwhm21...)*
+    :param int index: Index of the parameter in ``params``
+    :return: Array of derivatives at each ``x`` coordinate
+    """
+    x_1d, (height, centroid, fwhm1, fwhm2), param = _derivative_parameters(
+        x, params, index, 4)
+    # (height, centroid, fwhm) parameter of each side
+    left_param = {0: 0, 1: 1, 2: 2, 3: None}[param]
+    right_param = {0: 0, 1: 1, 2: None, 3: 2}[param]
+    result = _split_partial(
+        lambda dx, p, fwhm: _lorentz_partial(dx, height, fwhm, p),
+        x_1d - centroid,
+        (left_param, fwhm1),
+        (right_param, fwhm2),
+    )
+    return result.reshape(numpy.shape(x))
+
+
+def sum_pvoigt_derivative(x, params, index):
+    """Return the derivative of :func:`sum_pvoigt` with respect to
+    ``params[index]``.
+
+    :param x: Independent variable where the derivative is calculated
+    :type x: numpy.ndarray
+    :param params: Array of pseudo-Voigt parameters (length must be a
+        multiple of 4): *(height1, centroid1, fwhm1, eta1,...)*
+    :param int index: Index of the parameter in ``params``
+    :return: Array of derivatives at each ``x`` coordinate
+    """
+    x_1d, (height, centroid, fwhm, eta), param = _derivative_parameters(
+        x, params, index, 4)
+    result = _pvoigt_partial(x_1d - centroid, height, fwhm, eta, param)
+    return result.reshape(numpy.shape(x))
+
+
+def sum_apvoigt_derivative(x, params, index):
+    """Return the derivative of :func:`sum_apvoigt` with respect to
+    ``params[index]``.
+
+    :param x: Independent variable where the derivative is calculated
+    :type x: numpy.ndarray
+    :param params: Array of pseudo-Voigt parameters (length must be a
+        multiple of 4): *(area1, centroid1, fwhm1, eta1,...)*
+    :param int index: Index of the parameter in ``params``
+    :return: Array of derivatives at each ``x`` coordinate
+    """
+    x_1d, (area, centroid, fwhm, eta), param = _derivative_parameters(
+        x, params, index, 4)
+    result = _pvoigt_partial(x_1d - centroid, area, fwhm, eta, param,
+                             is_area=True)
+    return result.reshape(numpy.shape(x))
+
+
+def sum_splitpvoigt_derivative(x, params, index):
+    """Return the derivative of :func:`sum_splitpvoigt` with respect to
+    ``params[index]``.
+
+    :param x: Independent variable where the derivative is calculated
+    :type x: numpy.ndarray
+    :param params: Array of pseudo-Voigt parameters (length must be a
+        multiple of 5): *(height1, centroid1, fwhm11, fwhm21, eta1,...)*
+    :param int index: Index of the parameter in ``params``
+    :return: Array of derivatives at each ``x`` coordinate
+    """
+    x_1d, (height, centroid, fwhm1, fwhm2, eta), param = _derivative_parameters(
+        x, params, index, 5)
+    # (height, centroid, fwhm, eta) parameter of each side
+    left_param = {0: 0, 1: 1, 2: 2, 3: None, 4: 3}[param]
+    right_param = {0: 0, 1: 1, 2: None, 3: 2, 4: 3}[param]
+    result = _split_partial(
+        lambda dx, p, fwhm: _pvoigt_partial(dx, height, fwhm, eta, p),
+        x_1d - centroid,
+        (left_param, fwhm1),
+        (right_param, fwhm2),
+    )
+    return result.reshape(numpy.shape(x))
+
+
+def sum_splitpvoigt2_derivative(x, params, index):
+    """Return the derivative of :func:`sum_splitpvoigt2` with respect to
+    ``params[index]``.
+
+    :param x: Independent variable where the derivative is calculated
+    :type x: numpy.ndarray
+    :param params: Array of pseudo-Voigt parameters (length must be a
+        multiple of 6): *(height1, centroid1, fwhm11, fwhm21, eta11, eta21,...)*
+    :param int index: Index of the parameter in ``params``
+    :return: Array of derivatives at each ``x`` coordinate
+    """
+    (x_1d, (height, centroid, fwhm1, fwhm2, eta1, eta2),
+     param) = _derivative_parameters(x, params, index, 6)
+    # (height, centroid, fwhm, eta) parameter of each side
+    left_param = {0: 0, 1: 1, 2: 2, 3: None, 4: 3, 5: None}[param]
+    right_param = {0: 0, 1: 1, 2: None, 3: 2, 4: None, 5: 3}[param]
+    result = _split_partial(
+        lambda dx, p, side: _pvoigt_partial(dx, height, side[0], side[1], p),
+        x_1d - centroid,
+        (left_param, (fwhm1, eta1)),
+        (right_param, (fwhm2, eta2)),
+    )
+    return result.reshape(numpy.shape(x))
+
+
+def sum_stepdown_derivative(x, params, index):
+    """Return the derivative of :func:`sum_stepdown` with respect to
+    ``params[index]``.
+
+    :param x: Independent variable where the derivative is calculated
+    :type x: numpy.ndarray
+    :param params: Array of stepdown parameters (length must be a multiple
+        of 3): *(height1, centroid1, fwhm1,...)*
+    :param int index: Index of the parameter in ``params``
+    :return: Array of derivatives at each ``x`` coordinate
+    """
+    x_1d, (height, centroid, fwhm), param = _derivative_parameters(
+        x, params, index, 3)
+    if param == 0:
+        result = sum_stepdown(x_1d, 1.0, centroid, fwhm)
+        return result.reshape(numpy.shape(x))
+    # stepdown(x) = height - stepup(x)
+    return -sum_stepup_derivative(x, params, index)
+
+
+def sum_stepup_derivative(x, params, index):
+    """Return the derivative of :func:`sum_stepup` with respect to
+    ``params[index]``.
+
+    :param x: Independent variable where the derivative is calculated
+    :type x: numpy.ndarray
+    :param params: Array of stepup parameters (length must be a multiple
+        of 3): *(height1, centroid1, fwhm1,...)*
+    :param int index: Index of the parameter in ``params``
+    :return: Array of derivatives at each ``x`` coordinate
+    """
+    x_1d, (height, centroid, fwhm), param = _derivative_parameters(
+        x, params, index, 3)
+    if param == 0:
+        result = sum_stepup(x_1d, 1.0, centroid, fwhm)
+        return result.reshape(numpy.shape(x))
+    width = fwhm * _INV_TWO_SQRT_TWO_LOG2 * _SQRT2
+    z = (x_1d - centroid) / width
+    result = 0.5 * height * _erf_partial(z)
+    if param == 1:
+        result *= -1.0 / width
+    else:
+        result *= -z / fwhm
+    return result.reshape(numpy.shape(x))
+
+
+def sum_slit_derivative(x, params, index):
+    """Return the derivative of :func:`sum_slit` with respect to
+    ``params[index]``.
+
+    :param x: Independent variable where the derivative is calculated
+    :type x: numpy.ndarray
+    :param params: Array of slit parameters (length must be a multiple
+        of 4): *(height1, centroid1, fwhm1, beamfwhm1,...)*
+    :param int index: Index of the parameter in ``params``
+    :return: Array of derivatives at each ``x`` coordinate
+    """
+    x_1d, (height, position, fwhm, beamfwhm), param = _derivative_parameters(
+        x, params, index, 4)
+    if param == 0:
+        result = sum_slit(x_1d, 1.0, position, fwhm, beamfwhm)
+        return result.reshape(numpy.shape(x))
+    width = beamfwhm * _INV_TWO_SQRT_TWO_LOG2 * _SQRT2
+    z1 = (x_1d - position + 0.5 * fwhm) / width
+    z2 = (x_1d - position - 0.5 * fwhm) / width
+    # partial derivatives with respect to z1 and z2
+    d_z1 = 0.25 * height * _erf_partial(z1) * erfc(z2)
+    d_z2 = -0.25 * height * (1.0 + erf(z1)) * _erf_partial(z2)
+    if param == 1:
+        result = -(d_z1 + d_z2) / width
+    elif param == 2:
+        result = 0.5 * (d_z1 - d_z2) / width
+    else:
+        result = -(d_z1 * z1 + d_z2 * z2) / beamfwhm
+    return result.reshape(numpy.shape(x))
+
+
+def _ahypermet_tail_partial(dx, sigma, area, area_r, slope_r, param):
+    """Partial derivatives of a hypermet tail term with respect to
+    the position offset ``dx``, ``sigma``, the area ratio and the slope
+    ratio (`param` 0 to 3)"""
+    q = dx / (sigma * _SQRT2) + 0.5 * sigma * _SQRT2 / slope_r
+    e = 0.5 * (sigma / slope_r) ** 2 + dx / slope_r
+    value = (area * area_r * 0.5 / slope_r) * erfc(q) * numpy.exp(e)
+    if param == 2:
+        return value / area_r
+    # derivative with respect to q, using exp(e - q**2) = exp(-dx**2/2sigma**2)
+    d_q = -(area * area_r / (slope_r * numpy.sqrt(numpy.pi))) * numpy.exp(
+        -0.5 * (dx / sigma) ** 2
+    )
+    if param == 0:
+        return d_q / (sigma * _SQRT2) + value / slope_r
+    if param == 1:
+        return (d_q * (-dx / (sigma * sigma * _SQRT2) + 1.0 / (_SQRT2 * slope_r))
+                + value * sigma / slope_r ** 2)
+    return (d_q * (-sigma / (_SQRT2 * slope_r ** 2))
+            + value * (-sigma * sigma / slope_r ** 3 - dx / slope_r ** 2
+                       - 1.0 / slope_r))
+
+
+def sum_ahypermet_derivative(x, params, index,
+                             gaussian_term=True, st_term=True,
+                             lt_term=True, step_term=True):
+    """Return the derivative of :func:`sum_ahypermet` with respect to
+    ``params[index]``.
+
+    :param x: Independent variable where the derivative is calculated
+    :type x: numpy.ndarray
+    :param params: Array of hypermet parameters (length must be a multiple
+        of 8): *(area1, position1, fwhm1, st_area_r1, st_slope_r1, lt_area_r1,
+        lt_slope_r1, step_height_r1...)*
+    :param int index: Index of the parameter in ``params``
+    :param gaussian_term: If ``True``, enable gaussian term. Default ``True``
+    :param st_term: If ``True``, enable short tail term. Default ``True``
+    :param lt_term: If ``True``, enable long tail term. Default ``True``
+    :param step_term: If ``True``, enable step term. Default ``True``
+    :return: Array of derivatives at each ``x`` coordinate
+    """
+    x_1d, peak_params, param = _derivative_parameters(x, params, index, 8)
+    (area, position, fwhm, st_area_r, st_slope_r,
+     lt_area_r, lt_slope_r, step_height_r) = peak_params
+    if fwhm == 0:
+        raise ValueError("fwhm must not be equal to 0")
+
+    if param == 0:
+        # All the terms are proportional to the area
+        result = sum_ahypermet(
+            x_1d, 1.0, *peak_params[1:], gaussian_term=gaussian_term,
+            st_term=st_term, lt_term=lt_term, step_term=step_term)
+        return result.reshape(numpy.shape(x))
+
+    epsilon = 0.00000000001
+    sigma = fwhm * _INV_TWO_SQRT_TWO_LOG2
+    dx = x_1d - position
+    result = numpy.zeros(x_1d.shape, dtype=numpy.float64)
+
+    tails = []
+    if st_term and abs(st_slope_r) > epsilon:
+        tails.append((3, st_area_r, st_slope_r))
+    if lt_term and abs(lt_slope_r) > epsilon:
+        tails.append((5, lt_area_r, lt_slope_r))
+
+    if param in (1, 2):
+        # derivatives with respect to dx, then sigma
+        variable = param - 1
+        gauss = numpy.exp(-0.5 * (dx / sigma) ** 2) * area / (sigma * _SQRT2PI)
+        if gaussian_term:
+            if variable == 0:
+                result += -gauss * dx / sigma ** 2
+            else:
+                result += gauss * ((dx / sigma) ** 2 - 1.0) / sigma
+        if step_term:
+            if variable == 0:
+                result += -step_height_r * gauss / (sigma * _SQRT2PI)
+            else:
+                step = step_height_r * area / (sigma * _SQRT2PI) * 0.5 * erfc(
+                    dx / (sigma * _SQRT2))
+                result += -step / sigma + step_height_r * gauss * dx / (
+                    sigma * sigma * _SQRT2PI)
+        for _, area_r, slope_r in tails:
+            result += _ahypermet_tail_partial(
+                dx, sigma, area, area_r, slope_r, variable)
+        if param == 1:
+            result *= -1.0
+        else:
+            result *= _INV_TWO_SQRT_TWO_LOG2
+    elif param == 7:
+        if step_term:
+            result += area / (sigma * _SQRT2PI) * 0.5 * erfc(dx / (sigma * _SQRT2))
+    else:
+        for first, area_r, slope_r in tails:
+            if param == first:
+                result += _ahypermet_tail_partial(
+                    dx, sigma, area, area_r, slope_r, 2)
+            elif param == first + 1:
+                result += _ahypermet_tail_partial(
+                    dx, sigma, area, area_r, slope_r, 3)
+    return result.reshape(numpy.shape(x))
+
+
+def atan_stepup_derivative(x, params, index):
+    """Return the derivative of :func:`atan_stepup` with respect to
+    ``params[index]``.
+
+    :param x: Independent variable where the derivative is calculated
+    :type x: numpy.ndarray
+    :param params: Sequence of the 3 parameters *(a, b, c)*
+    :param int index: Index of the parameter in ``params``
+    :return: Array of derivatives at each ``x`` coordinate
+    """
+    x_1d, (a, b, c), param = _derivative_parameters(x, params, index, 3)
+    z = (x_1d - b) / c
+    if param == 0:
+        result = 0.5 + numpy.arctan(z) / numpy.pi
+    elif param == 1:
+        result = -a / (numpy.pi * c * (1.0 + z * z))
+    else:
+        result = -a * z / (numpy.pi * c * (1.0 + z * z))
+    return result.reshape(numpy.shape(x))
+
+
 def _validate_parameters(params, multiple):
     if len(params) == 0:
         raise IndexError("No parameters specified.")
@@ -29,11 +29,14 @@ If scipy dependency is not an issue, and no constraints are applied to the fitti
 parameters, there is no real gain compared to the use of scipy.optimize.curve_fit
 other than a more conservative calculation of uncertainties on fitted parameters.
 
+:func:`leastsq_batch` fits the same model to many curves at once (e.g. the
+spectra of the pixels of an image), with array operations over the curves.
+
 This module is a refactored version of PyMca Gefit.py module.
 """
 __authors__ = ["V.A. Sole"]
 __license__ = "MIT"
-__date__ = "15/05/2017"
+__date__ = "18/10/2026"
 __copyright__ = "European Synchrotron Radiation Facility, Grenoble, France"
 
 import numpy
@@ -41,6 +44,7 @@ from numpy.linalg import inv, LinAlgError
 import time
 import logging
 import copy
+from concurrent.futures import ProcessPoolExecutor
 
 _logger = logging.getLogger(__name__)
 
@@ -132,6 +136,8 @@ def leastsq(
         It will be called as model_deriv(xdata, parameters, index) where parameters is a sequence with the current
         values of the fitting parameters, index is the fitting parameter index for which the the derivative has
         to be provided in the supplied array of xdata points.
+        The derivatives with respect to parameters tied by FACTOR, DELTA or SUM constraints are
+        added by this function.
     :type model_deriv: *optional*, None or callable
 
 
@@ -304,41 +310,7 @@ def leastsq(
         epsfcn = max(epsfcn, numpy.finfo(numpy.float64).eps)
 
     # check if constraints have been passed as text
-    constrained_fit = False
-    if constraints is not None:
-        # make sure we work with a list of lists
-        input_constraints = constraints
-        tmp_constraints = [None] * len(input_constraints)
-        for i in range(nparameters):
-            tmp_constraints[i] = list(input_constraints[i])
-        constraints = tmp_constraints
-        for i in range(nparameters):
-            if hasattr(constraints[i][0], "upper"):
-                txt = constraints[i][0].upper()
-                if txt == "FREE":
-                    constraints[i][0] = CFREE
-                elif txt == "POSITIVE":
-                    constraints[i][0] = CPOSITIVE
-                elif txt == "QUOTED":
-                    constraints[i][0] = CQUOTED
-                elif txt == "FIXED":
-                    constraints[i][0] = CFIXED
-                elif txt == "FACTOR":
-                    constraints[i][0] = CFACTOR
-                    constraints[i][1] = int(constraints[i][1])
-                elif txt == "DELTA":
-                    constraints[i][0] = CDELTA
-                    constraints[i][1] = int(constraints[i][1])
-                elif txt == "SUM":
-                    constraints[i][0] = CSUM
-                    constraints[i][1] = int(constraints[i][1])
-                elif txt in ["IGNORED", "IGNORE"]:
-                    constraints[i][0] = CIGNORED
-                else:
-                    # I should raise an exception
-                    raise ValueError("Unknown constraint %s" % constraints[i][0])
-            if constraints[i][0] > 0:
-                constrained_fit = True
+    constraints, constrained_fit = _parse_constraints(constraints, nparameters)
     if constrained_fit:
         if full_output is None:
             _logger.info(
@@ -601,6 +573,8 @@ def chisq_alpha_beta(
         It will be called as model_deriv(xdata, parameters, index) where parameters is a sequence with the current
         values of the fitting parameters, index is the fitting parameter index for which the the derivative has
         to be provided in the supplied array of xdata points.
+        The derivatives with respect to parameters tied by FACTOR, DELTA or SUM constraints are
+        added by this function.
     :type model_deriv: *optional*, None or callable
 
 
@@ -736,6 +710,9 @@ def chisq_alpha_beta(
             # help0 = numpy.resize(help0, (1, nr))
         else:
             help0 = model_deriv(x, pwork, free_index[i])
+            # the parameters tied to this one also vary with it
+            for j, factor in _get_tied_parameters(constraints, free_index[i]):
+                help0 = help0 + factor * model_deriv(x, pwork, j)
             help0 = help0 * derivfactor[i]
 
         if i == 0:
@@ -785,6 +762,55 @@ def chisq_alpha_beta(
         return chisq, alpha, beta
 
 
+def _parse_constraints(constraints, nparameters):
+    """
+    Convert the constraints into a list of lists using the numerical codes.
+
+    :param constraints: None or 2D sequence of dimension (n_parameters, 3)
+        using numerical codes or their names (e.g. "FREE", "QUOTED")
+    :param int nparameters: Number of parameters
+    :return: The converted constraints (or None) and a flag telling if at
+        least one parameter is constrained
+    """
+    constrained_fit = False
+    if constraints is None:
+        return None, constrained_fit
+    # make sure we work with a list of lists
+    input_constraints = constraints
+    tmp_constraints = [None] * len(input_constraints)
+    for i in range(nparameters):
+        tmp_constraints[i] = list(input_constraints[i])
+    constraints = tmp_constraints
+    for i in range(nparameters):
+        if hasattr(constraints[i][0], "upper"):
+            txt = constraints[i][0].upper()
+            if txt == "FREE":
+                constraints[i][0] = CFREE
+            elif txt == "POSITIVE":
+                constraints[i][0] = CPOSITIVE
+            elif txt == "QUOTED":
+                constraints[i][0] = CQUOTED
+            elif txt == "FIXED":
+                constraints[i][0] = CFIXED
+            elif txt == "FACTOR":
+                constraints[i][0] = CFACTOR
+                constraints[i][1] = int(constraints[i][1])
+            elif txt == "DELTA":
+                constraints[i][0] = CDELTA
+                constraints[i][1] = int(constraints[i][1])
+            elif txt == "SUM":
+                constraints[i][0] = CSUM
+                constraints[i][1] = int(constraints[i][1])
+            elif txt in ["IGNORED", "IGNORE"]:
+                constraints[i][0] = CIGNORED
+            else:
+                # I should raise an exception
+                raise ValueError("Unknown constraint %s" % constraints[i][0])
+        if constraints[i][0] > 0:
+            constrained_fit = True
+    return constraints, constrained_fit
+
+
 def _get_parameters(parameters, constraints):
     """
     Apply constraints to input parameters.
@@ -830,6 +856,29 @@ def _get_parameters(parameters, constraints):
     return newparam
 
 
+def _get_tied_parameters(constraints, index):
+    """
+    Returns the parameters depending on the parameter `index` through a
+    FACTOR, DELTA or SUM constraint.
+
+    :return: List of (parameter index, derivative of the parameter with
+        respect to the parameter `index`)
+    """
+    if constraints is None:
+        return []
+    tied = []
+    for i in range(len(constraints)):
+        if constraints[i][0] in (CFACTOR, CDELTA, CSUM):
+            if int(constraints[i][1]) == index:
+                if constraints[i][0] == CFACTOR:
+                    tied.append((i, constraints[i][2]))
+                elif constraints[i][0] == CDELTA:
+                    tied.append((i, 1.0))
+                else:
+                    tied.append((i, -1.0))
+    return tied
+
+
 def _get_sigma_parameters(parameters, sigma0, constraints):
     """
     Internal function propagating the uncertainty on the actually fitted parameters and related parameters to the
@@ -880,6 +929,569 @@ def _get_sigma_parameters(parameters, sigma0, constraints):
     return sigma_par
 
 
+def leastsq_batch(
+    model,
+    xdata,
+    ydata,
+    p0,
+    sigma=None,
+    constraints=None,
+    model_deriv=None,
+    vectorized=False,
+    epsfcn=None,
+    deltachi=None,
+    full_output=False,
+    check_finite=True,
+    left_derivative=False,
+    max_iter=100,
+    chunk_size=None,
+    max_workers=None,
+):
+    """
+    Fit the same model to many curves sharing the same independent variable,
+    using the Levenberg-Marquardt algorithm of :func:`leastsq` for each curve.
+
+    All the curves are processed together: the model is evaluated for all the
+    curves at once, the derivatives, the curvature matrices and the parameter
+    steps are computed with array operations, and each curve converges on its
+    own. Curves are processed by chunks to bound the memory, and the chunks
+    can be distributed over a pool of processes.
+
+    :param model: callable
+        The model function, f(x, ...). It must take the independent
+        variable as the first argument and the parameters to fit as
+        separate remaining arguments.
+        If `vectorized` is False, it is called for each curve and returns a
+        one dimensional array of floats.
+        If `vectorized` is True, each parameter is given as an array of
+        shape (n_curves, 1) and the model must return an array of shape
+        (n_curves, M), which is the case for models written with numpy
+        operations.
+        To use a pool of processes, the model has to be picklable (e.g. a
+        function defined at the top level of a module).
+
+    :param xdata: An M-length sequence.
+        The independent variable where the data is measured, shared by all
+        the curves.
+
+    :param ydata: 2D array of shape (n_curves, M)
+        The dependent data, one curve per row.
+
+    :param p0: N-length sequence or 2D array of shape (n_curves, N)
+        Initial guess for the parameters, shared by all the curves or given
+        for each curve.
+
+    :param sigma: None, M-length sequence or 2D array of shape (n_curves, M)
+        The uncertainties in the ydata array, see :func:`leastsq`.
+
+    :param constraints: None or 2D sequence of dimension (n_parameters, 3)
+        The constraints applied to the parameters of all the curves, see
+        :func:`leastsq`. The initial values of QUOTED parameters are clipped
+        to their limits.
+
+    :param model_deriv:
+        None (default) or function providing the derivatives of the fitting
+        function respect to the fitted parameters, see :func:`leastsq`.
+        If `vectorized` is True, the parameters are given as a sequence of
+        arrays of shape (n_curves, 1) and it must return an array of shape
+        (n_curves, M).
+
+    :param bool vectorized: True if the model (and model_deriv) can evaluate
+        all the curves at once, see above. Default is False.
+
+    :param epsfcn: float, see :func:`leastsq`
+    :param deltachi: float, see :func:`leastsq`
+    :param bool full_output: If True, returns also a dictionary of additional
+        outputs.
+    :param bool check_finite: If True, raise a ValueError if the input arrays
+        contain NaNs or infs. Else, the non-finite points of ydata and sigma
+        are ignored in the fit of their curve.
+    :param bool left_derivative: see :func:`leastsq`
+    :param int max_iter: Maximum number of iterations for each curve
+    :param int chunk_size: Number of curves processed together. Default is
+        computed to use about 128 MB for the derivatives.
+    :param int max_workers: Number of processes used to fit the chunks of
+        curves. If None or lower than 2 (default), the curves are fitted in
+        the calling process.
+
+    :return: Returns a tuple of length 3 (or 4 if full_ouput is True) with
+        the content:
+
+         ``popt``: 2D array of shape (n_curves, N)
+           Optimal values of the parameters for each curve
+         ``uncertainties``: 2D array of shape (n_curves, N)
+           Uncertainties on the parameters for each curve, following error
+           propagation of the actually fitted parameters. It is NaN for the
+           curves where the curvature matrix is singular.
+         ``chisq``: 1D array of n_curves elements
+           The chi square of each curve
+         ``infodict``: dict
+           a dictionary of optional outputs with the keys:
+
+            ``reduced_chisq``
+                The chi square divided by the number of degrees of freedom of
+                each curve
+            ``covariance``
+                The covariance matrices of the actually fitted parameters,
+                of shape (n_curves, n_free, n_free)
+            ``niter``
+                The number of iterations performed for each curve
+    """
+    if deltachi is None:
+        deltachi = 0.001
+    if epsfcn is None:
+        epsfcn = numpy.finfo(numpy.float64).eps
+    else:
+        epsfcn = max(epsfcn, numpy.finfo(numpy.float64).eps)
+
+    xdata = numpy.asarray(xdata)
+    ydata = numpy.array(ydata, dtype=numpy.float64, ndmin=2)
+    if ydata.ndim != 2:
+        raise ValueError("ydata must be a 2D array of curves")
+    n_curves, npoints = ydata.shape
+
+    if numpy.isscalar(p0):
+        p0 = [p0]
+    parameters = numpy.array(p0, dtype=numpy.float64, ndmin=1)
+    if parameters.ndim == 1:
+        parameters = numpy.tile(parameters, (n_curves, 1))
+    elif parameters.shape[0] != n_curves:
+        raise ValueError("p0 must have one row per curve")
+    nparameters = parameters.shape[1]
+
+    if sigma is None:
+        sigma = numpy.ones((n_curves, npoints), dtype=numpy.float64)
+    else:
+        sigma = numpy.array(
+            numpy.broadcast_to(sigma, (n_curves, npoints)), dtype=numpy.float64
+        )
+
+    if check_finite:
+        for array in (xdata, ydata, sigma, parameters):
+            if not numpy.all(numpy.isfinite(array)):
+                raise ValueError("array must not contain infs or NaNs")
+    weight = 1.0 / (sigma + numpy.equal(sigma, 0))
+    weight = weight * weight
+    # Non-finite points are ignored
+    invalid = ~(numpy.isfinite(ydata) & numpy.isfinite(sigma))
+    weight[invalid] = 0
+    ydata[invalid] = 0
+
+    constraints, _ = _parse_constraints(constraints, nparameters)
+    free_index, noigno, quoted = _get_batch_free_parameters(
+        parameters, constraints
+    )
+    n_free = len(free_index)
+    if n_free == 0:
+        raise ValueError("No free parameters to fit")
+
+    if chunk_size is None:
+        # about 128 MB of derivatives
+        chunk_size = max(1, 2**24 // (npoints * (n_free + 2)))
+    chunks = [
+        slice(start, min(start + chunk_size, n_curves))
+        for start in range(0, n_curves, chunk_size)
+    ]
+
+    options = dict(
+        model=model,
+        model_deriv=model_deriv,
+        vectorized=vectorized,
+        constraints=constraints,
+        epsfcn=epsfcn,
+        deltachi=deltachi,
+        left_derivative=left_derivative,
+        max_iter=max_iter,
+    )
+    if max_workers is None or max_workers < 2 or len(chunks) < 2:
+        results = [
+            _leastsq_batch_chunk(
+                xdata, ydata[s], weight[s], parameters[s], **options
+            )
+            for s in chunks
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    _leastsq_batch_chunk,
+                    xdata,
+                    ydata[s],
+                    weight[s],
+                    parameters[s],
+                    **options,
+                )
+                for s in chunks
+            ]
+            results = [future.result() for future in futures]
+
+    fittedpar = numpy.concatenate([r[0] for r in results])
+    uncertainties = numpy.concatenate([r[1] for r in results])
+    chisq = numpy.concatenate([r[2] for r in results])
+    if not full_output:
+        return fittedpar, uncertainties, chisq
+
+    n_valid = numpy.count_nonzero(~invalid, axis=1)
+    ddict = {}
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        ddict["reduced_chisq"] = chisq / (n_valid - n_free)
+    ddict["covariance"] = numpy.concatenate([r[3] for r in results])
+    ddict["niter"] = numpy.concatenate([r[4] for r in results])
+    return fittedpar, uncertainties, chisq, ddict
+
+
+def _get_batch_free_parameters(parameters, constraints):
+    """
+    Returns the parameters fitted by :func:`leastsq_batch`.
+
+    The initial values of the QUOTED parameters are clipped in place to their
+    limits, so that the same parameters are fitted for all the curves.
+
+    :param parameters: 2D array of the initial parameters of the curves
+    :param constraints: Parsed constraints
+    :return: indices of the free parameters, indices of the parameters which
+        are not ignored, and a dictionary of the (A, B) factors of the quoted
+        parameters
+    """
+    nparameters = parameters.shape[1]
+    if constraints is None:
+        return list(range(nparameters)), list(range(nparameters)), {}
+    free_index = []
+    noigno = []
+    quoted = {}
+    for i in range(nparameters):
+        if constraints[i][0] != CIGNORED:
+            noigno.append(i)
+        if constraints[i][0] in (CFREE, CPOSITIVE):
+            free_index.append(i)
+        elif constraints[i][0] == CQUOTED:
+            pmax = max(constraints[i][1], constraints[i][2])
+            pmin = min(constraints[i][1], constraints[i][2])
+            if (pmax - pmin) > 0:
+                numpy.clip(parameters[:, i], pmin, pmax, out=parameters[:, i])
+                quoted[i] = 0.5 * (pmax + pmin), 0.5 * (pmax - pmin)
+                free_index.append(i)
+    return free_index, noigno, quoted
+
+
+def _get_batch_parameters(parameters, constraints):
+    """
+    Apply constraints to the parameters of many curves, as
+    :func:`_get_parameters`.
+
+    :param parameters: 2D array with the parameters of a curve per row
+    """
+    newparam = numpy.array(parameters, dtype=numpy.float64)
+    if constraints is None:
+        return newparam
+    for i in range(len(constraints)):
+        if constraints[i][0] == CPOSITIVE:
+            newparam[:, i] = abs(parameters[:, i])
+    for i in range(len(constraints)):
+        if constraints[i][0] == CFACTOR:
+            newparam[:, i] = constraints[i][2] * newparam[:, int(constraints[i][1])]
+        elif constraints[i][0] == CDELTA:
+            newparam[:, i] = constraints[i][2] + newparam[:, int(constraints[i][1])]
+        elif constraints[i][0] == CIGNORED:
+            newparam[:, i] = 0
+        elif constraints[i][0] == CSUM:
+            newparam[:, i] = constraints[i][2] - newparam[:, int(constraints[i][1])]
+    return newparam
+
+
+def _get_batch_sigma_parameters(parameters, sigma0, constraints, free_index):
+    """
+    Propagate the uncertainties of the fitted parameters of many curves, as
+    :func:`_get_sigma_parameters`.
+    """
+    if constraints is None:
+        return sigma0
+    sigma_par = numpy.zeros(parameters.shape, numpy.float64)
+    for n, i in enumerate(free_index):
+        if constraints[i][0] == CQUOTED:
+            B = 0.5 * abs(constraints[i][2] - constraints[i][1])
+            sigma_par[:, i] = abs(B * numpy.cos(parameters[:, i]) * sigma0[:, n])
+        else:
+            sigma_par[:, i] = sigma0[:, n]
+    for i in range(len(constraints)):
+        if i in free_index:
+            continue
+        if constraints[i][0] in (CQUOTED, CFIXED):
+            sigma_par[:, i] = parameters[:, i]
+    for i in range(len(constraints)):
+        if constraints[i][0] == CFACTOR:
+            sigma_par[:, i] = constraints[i][2] * sigma_par[:, int(constraints[i][1])]
+        elif constraints[i][0] in (CDELTA, CSUM):
+            sigma_par[:, i] = sigma_par[:, int(constraints[i][1])]
+    return sigma_par
+
+
+def _evaluate_batch(model, x, parameters, vectorized):
+    """Evaluate the model for each row of parameters.
+
+    :rtype: 2D array of shape (n_curves, M)
+    """
+    if vectorized:
+        columns = [p[:, numpy.newaxis] for p in parameters.T]
+        result = numpy.asarray(model(x, *columns), dtype=numpy.float64)
+        shape = len(parameters), x.size
+        return numpy.array(numpy.broadcast_to(result.reshape(shape[0], -1), shape))
+    return numpy.array(
+        [numpy.ravel(model(x, *p)) for p in parameters], dtype=numpy.float64
+    ).reshape(len(parameters), -1)
+
+
+def _evaluate_batch_deriv(model_deriv, x, parameters, index, vectorized):
+    """Evaluate the derivatives of the model with respect to a parameter for
+    each row of parameters.
+
+    :rtype: 2D array of shape (n_curves, M)
+    """
+    if vectorized:
+        columns = [p[:, numpy.newaxis] for p in parameters.T]
+        result = numpy.asarray(model_deriv(x, columns, index), dtype=numpy.float64)
+        shape = len(parameters), x.size
+        return numpy.array(numpy.broadcast_to(result.reshape(shape[0], -1), shape))
+    return numpy.array(
+        [numpy.ravel(model_deriv(x, p, index)) for p in parameters],
+        dtype=numpy.float64,
+    ).reshape(len(parameters), -1)
+
+
+def _batch_chisq_alpha_beta(
+    model,
+    model_deriv,
+    vectorized,
+    parameters,
+    x,
+    y,
+    weight,
+    last_evaluation,
+    constraints,
+    free_index,
+    noigno,
+    quoted,
+    epsfcn,
+    left_derivative,
+):
+    """
+    Get chi square, the curvature matrix alpha and the vector beta of many
+    curves, as :func:`chisq_alpha_beta`.
+
+    :return: chisq of shape (n_curves,), alpha of shape
+        (n_curves, n_free, n_free) and beta of shape (n_curves, n_free)
+    """
+    n_curves, npoints = y.shape
+    n_free = len(free_index)
+    fitparam = parameters[:, free_index]
+    derivfactor = numpy.ones(fitparam.shape, numpy.float64)
+    if constraints is not None:
+        for n, i in enumerate(free_index):
+            if constraints[i][0] == CPOSITIVE:
+                fitparam[:, n] = abs(fitparam[:, n])
+            elif constraints[i][0] == CQUOTED:
+                A, B = quoted[i]
+                derivfactor[:, n] = B * numpy.cos(
+                    numpy.arcsin(numpy.clip((fitparam[:, n] - A) / B, -1, 1))
+                )
+    delta = (fitparam + numpy.equal(fitparam, 0.0)) * numpy.sqrt(epsfcn)
+
+    pwork = numpy.array(parameters)
+    pwork[:, free_index] = fitparam
+    deriv = numpy.empty((n_curves, n_free, npoints), numpy.float64)
+    for n, i in enumerate(free_index):
+        if model_deriv is None:
+            pwork[:, i] = fitparam[:, n] + delta[:, n]
+            newpar = _get_batch_parameters(pwork, constraints)[:, noigno]
+            f1 = _evaluate_batch(model, x, newpar, vectorized)
+            if left_derivative:
+                pwork[:, i] = fitparam[:, n] - delta[:, n]
+                newpar = _get_batch_parameters(pwork, constraints)[:, noigno]
+                f2 = _evaluate_batch(model, x, newpar, vectorized)
+                help0 = (f1 - f2) / (2.0 * delta[:, n, numpy.newaxis])
+            else:
+                help0 = (f1 - last_evaluation) / delta[:, n, numpy.newaxis]
+            pwork[:, i] = fitparam[:, n]
+        else:
+            help0 = _evaluate_batch_deriv(model_deriv, x, pwork, i, vectorized)
+            # the parameters tied to this one also vary with it
+            for j, factor in _get_tied_parameters(constraints, i):
+                help0 += factor * _evaluate_batch_deriv(
+                    model_deriv, x, pwork, j, vectorized
+                )
+        deriv[:, n] = help0 * derivfactor[:, n, numpy.newaxis]
+
+    deltay = y - last_evaluation
+    help0 = weight * deltay
+    beta = numpy.einsum("kfm,km->kf", deriv, help0)
+    alpha = numpy.matmul(deriv * weight[:, numpy.newaxis, :], deriv.transpose(0, 2, 1))
+    chisq = (help0 * deltay).sum(axis=1)
+    return chisq, alpha, beta
+
+
+def _batch_solve(alpha, beta):
+    """Solve the linear systems alpha . x = beta of many curves.
+
+    :return: The solutions, NaN for the singular systems
+    """
+    try:
+        return numpy.linalg.solve(alpha, beta[..., numpy.newaxis])[..., 0]
+    except LinAlgError:
+        # At least one singular matrix, solve one by one
+        result = numpy.full(beta.shape, numpy.nan)
+        for k in range(len(alpha)):
+            try:
+                result[k] = numpy.linalg.solve(alpha[k], beta[k])
+            except LinAlgError:
+                pass
+        return result
+
+
+def _batch_inv(alpha):
+    """Invert the matrices of many curves.
+
+    :return: The inverted matrices, NaN for the singular ones
+    """
+    try:
+        return inv(alpha)
+    except LinAlgError:
+        result = numpy.full(alpha.shape, numpy.nan)
+        for k in range(len(alpha)):
+            try:
+                result[k] = inv(alpha[k])
+            except LinAlgError:
+                pass
+        return result
+
+
+def _leastsq_batch_chunk(
+    xdata,
+    ydata,
+    weight,
+    parameters,
+    model,
+    model_deriv,
+    vectorized,
+    constraints,
+    epsfcn,
+    deltachi,
+    left_derivative,
+    max_iter,
+):
+    """Fit a chunk of curves with the Levenberg-Marquardt algorithm.
+
+    :return: fitted parameters, uncertainties, chisq, covariance matrices and
+        number of iterations of the curves
+    """
+    n_curves, npoints = ydata.shape
+    free_index, noigno, quoted = _get_batch_free_parameters(
+        parameters, constraints
+    )
+    n_free = len(free_index)
+    x = xdata
+
+    fittedpar = numpy.array(parameters, dtype=numpy.float64)
+    last_evaluation = _evaluate_batch(
+        model, x, _get_batch_parameters(fittedpar, constraints)[:, noigno], vectorized
+    )
+    flambda = numpy.full(n_curves, 0.001)
+    remaining_iter = numpy.full(n_curves, max_iter)
+    iteration_counter = numpy.zeros(n_curves, dtype=numpy.int64)
+    active = numpy.ones(n_curves, dtype=bool)
+    need_alpha = numpy.ones(n_curves, dtype=bool)
+    chisq0 = numpy.zeros(n_curves, numpy.float64)
+    alpha0 = numpy.zeros((n_curves, n_free, n_free), numpy.float64)
+    beta = numpy.zeros((n_curves, n_free), numpy.float64)
+    identity = numpy.identity(n_free)
+
+    while numpy.any(active):
+        # Curvature matrices at the current parameters
+        idx = numpy.nonzero(active & need_alpha)[0]
+        if len(idx) > 0:
+            iteration_counter[idx] += 1
+            chisq0[idx], alpha0[idx], beta[idx] = _batch_chisq_alpha_beta(
+                model,
+                model_deriv,
+                vectorized,
+                fittedpar[idx],
+                x,
+                ydata[idx],
+                weight[idx],
+                last_evaluation[idx],
+                constraints,
+                free_index,
+                noigno,
+                quoted,
+                epsfcn,
+                left_derivative,
+            )
+            need_alpha[idx] = False
+
+        # Levenberg-Marquardt step
+        idx = numpy.nonzero(active)[0]
+        damping = flambda[idx, numpy.newaxis, numpy.newaxis] * identity
+        alpha = alpha0[idx] * (1.0 + damping)
+        deltapar = _batch_solve(alpha, beta[idx])
+        singular = ~numpy.all(numpy.isfinite(deltapar), axis=1)
+        if numpy.any(singular):
+            active[idx[singular]] = False
+            idx = idx[~singular]
+            deltapar = deltapar[~singular]
+            if len(idx) == 0:
+                continue
+
+        newpar = numpy.array(fittedpar[idx])
+        for n, i in enumerate(free_index):
+            if i in quoted:
+                A, B = quoted[i]
+                newpar[:, i] = A + B * numpy.sin(
+                    numpy.arcsin(numpy.clip((newpar[:, i] - A) / B, -1, 1))
+                    + deltapar[:, n]
+                )
+            elif constraints is not None and constraints[i][0] == CPOSITIVE:
+                newpar[:, i] = abs(newpar[:, i]) + deltapar[:, n]
+            else:
+                newpar[:, i] = newpar[:, i] + deltapar[:, n]
+        newpar = _get_batch_parameters(newpar, constraints)
+        yfit = _evaluate_batch(model, x, newpar[:, noigno], vectorized)
+        chisq = (weight[idx] * pow(ydata[idx] - yfit, 2)).sum(axis=1)
+        absdeltachi = chisq0[idx] - chisq
+
+        # Rejected steps: increase lambda
+        rejected = ~(absdeltachi >= 0)
+        ridx = idx[rejected]
+        flambda[ridx] *= 10.0
+        active[ridx[flambda[ridx] > 1000]] = False
+
+        # Accepted steps
+        accepted = ~rejected
+        aidx = idx[accepted]
+        fittedpar[aidx] = newpar[accepted]
+        last_evaluation[aidx] = yfit[accepted]
+        chisq = chisq[accepted]
+        absdeltachi = absdeltachi[accepted]
+        lastdeltachi = 100 * (absdeltachi / (chisq + (chisq == 0)))
+        # ignore any limit at first iteration, the fit *has* to be improved
+        converged = (iteration_counter[aidx] >= 2) & (
+            (lastdeltachi < deltachi) | (absdeltachi < numpy.sqrt(epsfcn))
+        )
+        active[aidx[converged]] = False
+        chisq0[aidx] = chisq
+        flambda[aidx] /= 10.0
+        need_alpha[aidx] = True
+
+        remaining_iter[idx] -= 1
+        active[remaining_iter <= 0] = False
+
+    # covariance matrices of the actually fitted parameters
+    cov0 = _batch_inv(alpha0)
+    sigma0 = numpy.sqrt(abs(numpy.diagonal(cov0, axis1=1, axis2=2)))
+    uncertainties = _get_batch_sigma_parameters(
+        fittedpar, sigma0, constraints, free_index
+    )
+    return fittedpar, uncertainties, chisq0, cov0, iteration_counter
+
+
 def main(argv=None):
     if argv is None:
         npoints = 10000
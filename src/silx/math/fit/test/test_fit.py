@@ -263,6 +263,29 @@ class Test_leastsq(unittest.TestCase):
                 )
             self.assertTrue(test_condition, msg)
 
+    def testAnalyticalDerivativeTiedParameters(self):
+        """Test that the derivatives with respect to parameters tied by
+        FACTOR and DELTA constraints are accounted for"""
+        parameters_actual = [10.5, 2, 1000.0, 20.0, 15, 2000.0, 30.0, 15]
+        x = numpy.arange(10000.0)
+        y = self.gauss(x, *parameters_actual)
+        parameters_estimate = [0.0, 1.0, 900.0, 25.0, 10, 1500.0, 35.0, 10]
+        constraints = [[0, 0, 0]] * 6 + [[5, 3, 10.0], [4, 4, 1.0]]
+
+        expected, _ = self.instance(
+            self.gauss, x, y, parameters_estimate, constraints=constraints
+        )
+        fittedpar, _ = self.instance(
+            self.gauss,
+            x,
+            y,
+            parameters_estimate,
+            constraints=constraints,
+            model_deriv=self.gauss_derivative,
+        )
+        numpy.testing.assert_allclose(fittedpar, parameters_actual, rtol=1e-5)
+        numpy.testing.assert_allclose(fittedpar, expected, rtol=1e-5)
+
     @testutils.validate_logging(fitlogger.name, warning=2)
     def testBadlyShapedData(self):
         parameters_actual = [10.5, 2, 1000.0, 20.0, 15]
@@ -408,3 +431,125 @@ class Test_leastsq(unittest.TestCase):
             if i % 2:
                 # test that all FIXED parameters have 100% uncertainty
                 self.assertAlmostEqual(uncertainties[i], parameters_estimate[i])
+
+
+def _gaussian_model(x, height, center, fwhm, background):
+    """Model used to test leastsq_batch, defined at module level to be
+    picklable"""
+    dummy = 2.3548200450309493 * (x - center) / fwhm
+    return background + height * numpy.exp(-0.5 * dummy * dummy)
+
+
+class Test_leastsq_batch(unittest.TestCase):
+    """
+    Unit tests of the leastsq_batch function.
+    """
+
+    def setUp(self):
+        self.x = numpy.linspace(0.0, 100.0, 201)
+        self.parameters_actual = numpy.array(
+            [
+                [1000.0 + 10 * i, 45.0 + 0.5 * i, 10.0 + 0.2 * i, 10.0 + i]
+                for i in range(20)
+            ]
+        )
+        self.y = numpy.array(
+            [_gaussian_model(self.x, *p) for p in self.parameters_actual]
+        )
+        # deterministic noise
+        self.y += 5 * numpy.sin(numpy.arange(self.y.size)).reshape(self.y.shape)
+        self.parameters_estimate = [900.0, 50.0, 12.0, 0.0]
+
+    def assertSameAsLeastsq(self, result, **kwargs):
+        from silx.math.fit import leastsq
+
+        fittedpar, uncertainties, chisq = result
+        for i, y in enumerate(self.y):
+            expected, _, infodict = leastsq(
+                _gaussian_model,
+                self.x,
+                y,
+                self.parameters_estimate,
+                full_output=True,
+                **kwargs,
+            )
+            numpy.testing.assert_allclose(fittedpar[i], expected, rtol=1e-6)
+            numpy.testing.assert_allclose(
+                uncertainties[i], infodict["uncertainties"], rtol=1e-4
+            )
+            numpy.testing.assert_allclose(chisq[i], infodict["chisq"], rtol=1e-6)
+
+    def testUnconstrainedFit(self):
+        from silx.math.fit import leastsq_batch
+
+        result = leastsq_batch(
+            _gaussian_model, self.x, self.y, self.parameters_estimate
+        )
+        self.assertEqual(result[0].shape, self.parameters_actual.shape)
+        self.assertSameAsLeastsq(result)
+        numpy.testing.assert_allclose(result[0], self.parameters_actual, rtol=0.05)
+
+    def testVectorizedModel(self):
+        from silx.math.fit import leastsq_batch
+
+        result = leastsq_batch(
+            _gaussian_model,
+            self.x,
+            self.y,
+            self.parameters_estimate,
+            vectorized=True,
+            chunk_size=7,
+        )
+        self.assertSameAsLeastsq(result)
+
+    def testConstrainedFit(self):
+        from silx.math.fit import leastsq_batch, CFIXED, CPOSITIVE, CQUOTED
+
+        constraints = [[CPOSITIVE, 0, 0], [CQUOTED, 40, 60], [0, 0, 0], [CFIXED, 0, 0]]
+        result = leastsq_batch(
+            _gaussian_model,
+            self.x,
+            self.y,
+            self.parameters_estimate,
+            constraints=constraints,
+            vectorized=True,
+        )
+        self.assertSameAsLeastsq(result, constraints=constraints)
+        self.assertTrue(numpy.all(result[0][:, 3] == 0))
+
+    def testDataWithNaN(self):
+        from silx.math.fit import leastsq, leastsq_batch
+
+        y = numpy.array(self.y)
+        y[3, 50] = numpy.nan
+        with self.assertRaises(ValueError):
+            leastsq_batch(_gaussian_model, self.x, y, self.parameters_estimate)
+
+        fittedpar, _, _, infodict = leastsq_batch(
+            _gaussian_model,
+            self.x,
+            y,
+            self.parameters_estimate,
+            check_finite=False,
+            full_output=True,
+        )
+        valid = numpy.isfinite(y[3])
+        expected, _ = leastsq(
+            _gaussian_model, self.x[valid], y[3][valid], self.parameters_estimate
+        )
+        numpy.testing.assert_allclose(fittedpar[3], expected, rtol=1e-6)
+        self.assertEqual(infodict["niter"].shape, (len(y),))
+        self.assertTrue(numpy.all(numpy.isfinite(infodict["reduced_chisq"])))
+
+    def testProcessPool(self):
+        from silx.math.fit import leastsq_batch
+
+        result = leastsq_batch(
+            _gaussian_model,
+            self.x,
+            self.y,
+            self.parameters_estimate,
+            chunk_size=5,
+            max_workers=2,
+        )
+        self.assertSameAsLeastsq(result)
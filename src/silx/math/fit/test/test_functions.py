@@ -32,7 +32,7 @@ from silx.math.fit import functions
 
 __authors__ = ["P. Knobel"]
 __license__ = "MIT"
-__date__ = "21/07/2016"
+__date__ = "18/10/2026"
 
 
 class Test_functions(unittest.TestCase):
@@ -267,6 +267,54 @@ class Test_functions(unittest.TestCase):
         index_min_deriv = numpy.argmin(deriv0)
         self.assertLess(abs(index_min_deriv - (center + fwhm / 2)), 1)
 
+    def testDerivatives(self):
+        """Compare the analytic derivatives with finite differences"""
+        x = numpy.linspace(0, 100, 501)
+        tests = {
+            "gauss": (functions.sum_gauss, [100, 40, 10, 50, 60, 5]),
+            "agauss": (functions.sum_agauss, [100, 40, 10, 50, 60, 5]),
+            "splitgauss": (functions.sum_splitgauss, [100, 40.1, 10, 6]),
+            "lorentz": (functions.sum_lorentz, [100, 40, 10, 50, 60, 5]),
+            "alorentz": (functions.sum_alorentz, [100, 40, 10]),
+            "splitlorentz": (functions.sum_splitlorentz, [100, 40.1, 10, 6]),
+            "pvoigt": (functions.sum_pvoigt, [100, 40, 10, 0.3]),
+            "apvoigt": (functions.sum_apvoigt, [100, 40, 10, 0.3]),
+            "splitpvoigt": (functions.sum_splitpvoigt, [100, 40.1, 10, 6, 0.3]),
+            "splitpvoigt2": (
+                functions.sum_splitpvoigt2,
+                [100, 40.1, 10, 6, 0.3, 0.6],
+            ),
+            "stepdown": (functions.sum_stepdown, [100, 40, 10]),
+            "stepup": (functions.sum_stepup, [100, 40, 10]),
+            "slit": (functions.sum_slit, [100, 40, 20, 5]),
+            "ahypermet": (
+                functions.sum_ahypermet,
+                [1000, 40, 5, 0.05, 0.7, 0.05, 20, 0.002],
+            ),
+            "atan_stepup": (functions.atan_stepup, [100, 40, 10]),
+        }
+        for name, (function, params) in tests.items():
+            derivative = getattr(functions, function.__name__ + "_derivative")
+            for index in range(len(params)):
+                with self.subTest(function=name, index=index):
+                    delta = 1e-6 * max(abs(params[index]), 1)
+                    params_plus = list(params)
+                    params_plus[index] += delta
+                    params_minus = list(params)
+                    params_minus[index] -= delta
+                    expected = (
+                        function(x, *params_plus) - function(x, *params_minus)
+                    ) / (2 * delta)
+                    result = derivative(x, params, index)
+                    self.assertEqual(result.shape, x.shape)
+                    numpy.testing.assert_allclose(
+                        result, expected, atol=1e-6 * abs(expected).max()
+                    )
+
+        with self.assertRaises(IndexError):
+            functions.sum_gauss_derivative(x, [100, 40, 10], 3)
+
+
 
 def _numerical_derivative(f, x, params=[], delta_factor=0.0001):
     """Compute the numerical derivative of ``f`` for all values of ``x``.
@@ -71,6 +71,14 @@ or even:
 
 >>> histo, w_histo, edges = histo_obj
 
+Histogramnd can also accumulate data read by blocks, for instance from a HDF5
+dataset which does not fit in memory. Blocks are histogrammed in parallel
+threads:
+
+>>> import h5py
+>>> with h5py.File("events.h5", "r") as h5file:
+...     histo_obj.accumulate_stream(h5file["sample"], weights=h5file["weights"])
+
 Accumulating histograms (LUT)
 -----------------------------
 In some situations we need to compute the weighted histogram of several
@@ -139,7 +147,12 @@ bins ranges will be :
 
 __authors__ = ["D. Naudet"]
 __license__ = "MIT"
-__date__ = "02/10/2017"
+__date__ = "18/10/2026"
+
+import itertools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from .chistogramnd import chistogramnd as _chistogramnd  # noqa
@@ -147,6 +160,73 @@ from .chistogramnd_lut import histogramnd_get_lut as _histo_get_lut
 from .chistogramnd_lut import histogramnd_from_lut as _histo_from_lut
 
 
+_STREAM_BLOCK_SIZE = 2**20
+"""Default number of samples per block read by
+:meth:`Histogramnd.accumulate_stream`"""
+
+
+def _default_max_workers():
+    """Returns the default number of threads (up to 4)"""
+    if hasattr(os, "sched_getaffinity"):
+        return min(4, len(os.sched_getaffinity(0)))
+    return min(4, os.cpu_count() or 1)
+
+
+def _is_array_like(data):
+    """Returns True if data supports slicing along its first dimension
+    (e.g., numpy.ndarray, h5py.Dataset), False for iterables of chunks."""
+    return hasattr(data, "shape") and hasattr(data, "__getitem__")
+
+
+def _stream_blocks(sample, weights, block_size):
+    """Generates blocks of (sample, weights) for streaming histograms.
+
+    For HDF5 datasets, the blocks are aligned on the chunks of the sample
+    dataset along the first dimension.
+
+    :param sample: Array-like or iterable of sample chunks
+    :param weights: None, array-like or iterable of weights chunks
+    :param int block_size: Number of samples per block for array-like data
+    """
+    if not _is_array_like(sample):
+        if weights is None:
+            for sample_block in sample:
+                yield sample_block, None
+            return
+
+        if _is_array_like(weights):
+            raise ValueError(
+                "<weights> must be an iterable of chunks if <sample> is one."
+            )
+        missing = object()
+        for sample_block, weights_block in itertools.zip_longest(
+            sample, weights, fillvalue=missing
+        ):
+            if sample_block is missing or weights_block is missing:
+                raise ValueError(
+                    "<sample> and <weights> must have the same number of chunks."
+                )
+            yield sample_block, weights_block
+        return
+
+    if weights is not None:
+        if not _is_array_like(weights):
+            raise ValueError("<weights> must be an array if <sample> is one.")
+        if len(weights) != len(sample):
+            raise ValueError(
+                "<weights> must be an array whose length "
+                "is equal to the number of samples."
+            )
+
+    chunks = getattr(sample, "chunks", None)
+    if chunks:  # Align blocks on HDF5 chunks
+        block_size = max(1, block_size // chunks[0]) * chunks[0]
+
+    for start in range(0, len(sample), block_size):
+        end = start + block_size
+        yield sample[start:end], None if weights is None else weights[start:end]
+
+
 class Histogramnd(object):
     """
     Computes the multidimensional histogram of some data.
@@ -162,6 +242,7 @@ class Histogramnd(object):
         weight_max=None,
         last_bin_closed=False,
         wh_dtype=None,
+        num_threads=None,
     ):
         """
         :param sample:
@@ -232,12 +313,19 @@ class Histogramnd(object):
             of type numpy.double. Allowed values are : `numpy.double` and
             `numpy.float32`
         :type wh_dtype: *optional*, numpy data type
+
+        :param num_threads:
+            Default number of threads used to compute the histograms.
+            Each thread accumulates private histograms which are summed at
+            the end. Default: 1 (no multithreading).
+        :type num_threads: *optional*, int
         """
 
         self.__histo_range = histo_range
         self.__n_bins = n_bins
         self.__last_bin_closed = last_bin_closed
         self.__wh_dtype = wh_dtype
+        self.__num_threads = num_threads
 
         if sample is None:
             self.__data = [None, None, None]
@@ -251,6 +339,7 @@ class Histogramnd(object):
                 weight_max=weight_max,
                 last_bin_closed=self.__last_bin_closed,
                 wh_dtype=self.__wh_dtype,
+                num_threads=self.__num_threads,
             )
 
     def __getitem__(self, key):
@@ -267,7 +356,9 @@ class Histogramnd(object):
         """
         return self.__data[key]
 
-    def accumulate(self, sample, weights=None, weight_min=None, weight_max=None):
+    def accumulate(
+        self, sample, weights=None, weight_min=None, weight_max=None, num_threads=None
+    ):
         """
         Computes the multidimensional histogram of some data and accumulates it
         into the histogram held by this instance of Histogramnd.
@@ -314,7 +405,14 @@ class Histogramnd(object):
             .. note:: This value will be cast to the same type
                 as *weights*.
         :type weight_max: *optional*, scalar
+
+        :param num_threads:
+            Number of threads used to compute the histogram.
+            Default: the value given at initialization.
+        :type num_threads: *optional*, int
         """
+        if num_threads is None:
+            num_threads = self.__num_threads
         result = _chistogramnd(
             sample,
             self.__histo_range,
@@ -326,12 +424,118 @@ class Histogramnd(object):
             histo=self.__data[0],
             weighted_histo=self.__data[1],
             wh_dtype=self.__wh_dtype,
+            num_threads=num_threads,
         )
         if self.__data[0] is None:
             self.__data = result
         elif self.__data[1] is None and result[1] is not None:
             self.__data = result
 
+    def accumulate_stream(
+        self,
+        sample,
+        weights=None,
+        weight_min=None,
+        weight_max=None,
+        block_size=None,
+        max_workers=None,
+    ):
+        """
+        Computes the multidimensional histogram of data processed by blocks
+        and accumulates it into the histogram held by this instance.
+
+        Blocks are histogrammed in parallel threads, each thread accumulating
+        its own partial histograms which are summed at the end.
+        Only one block per thread is in memory at a time: non C-contiguous
+        arrays are copied block by block.
+
+        :param sample:
+            Either an array-like supporting slicing along its first dimension
+            (e.g., :class:`numpy.ndarray` or :class:`h5py.Dataset`) of shape
+            (N,) or (N,D), or an iterable of such arrays (chunks).
+            See :meth:`accumulate` for supported dtypes.
+            For chunked HDF5 datasets, blocks are aligned on the chunks.
+
+        :param weights:
+            Either None, an array-like of N elements if sample is an
+            array-like, or an iterable of chunks of the same lengths as the
+            chunks of sample.
+            See :meth:`accumulate`.
+
+        :param weight_min: See :meth:`accumulate`
+        :type weight_min: *optional*, scalar
+
+        :param weight_max: See :meth:`accumulate`
+        :type weight_max: *optional*, scalar
+
+        :param block_size:
+            Number of samples per block for array-like sample.
+            For chunked HDF5 datasets, it is rounded to a multiple of the
+            size of a chunk along the first dimension.
+            Default: 2**20
+        :type block_size: *optional*, int
+
+        :param max_workers:
+            Number of threads, default: up to 4.
+            If lower than 2, blocks are processed in the calling thread.
+        :type max_workers: *optional*, int
+        """
+        if block_size is None:
+            block_size = _STREAM_BLOCK_SIZE
+        if max_workers is None:
+            max_workers = _default_max_workers()
+
+        blocks = _stream_blocks(sample, weights, max(1, int(block_size)))
+        lock = threading.Lock()
+        failed = threading.Event()
+
+        def worker():
+            histo, weighted_histo, edges = None, None, None
+            try:
+                while not failed.is_set():
+                    with lock:  # Read one block at a time
+                        block = next(blocks, None)
+                    if block is None:
+                        break
+                    histo, weighted_histo, edges = _chistogramnd(
+                        np.asarray(block[0]),
+                        self.__histo_range,
+                        self.__n_bins,
+                        weights=None if block[1] is None else np.asarray(block[1]),
+                        weight_min=weight_min,
+                        weight_max=weight_max,
+                        last_bin_closed=self.__last_bin_closed,
+                        histo=histo,
+                        weighted_histo=weighted_histo,
+                        wh_dtype=self.__wh_dtype,
+                    )
+            except BaseException:
+                failed.set()
+                raise
+            return histo, weighted_histo, edges
+
+        if max_workers < 2:
+            results = [worker()]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(worker) for _ in range(max_workers)]
+            results = [future.result() for future in futures]
+
+        # Reduce the partial histograms
+        total_histo, total_weighted_histo, total_edges = self.__data
+        for histo, weighted_histo, edges in results:
+            if histo is None:
+                continue
+            if total_histo is None:
+                total_histo, total_edges = histo, edges
+            else:
+                total_histo += histo
+            if total_weighted_histo is None:
+                total_weighted_histo = weighted_histo
+            elif weighted_histo is not None:
+                total_weighted_histo += weighted_histo
+        self.__data = [total_histo, total_weighted_histo, total_edges]
+
     histo = property(lambda self: self[0])
     """ Histogram array, or None if this instance was initialized without
         <sample> and accumulate has not been called yet.
@@ -473,7 +677,7 @@ class HistogramndLut(object):
         """
         return self.__last_bin_closed
 
-    def accumulate(self, weights, weight_min=None, weight_max=None):
+    def accumulate(self, weights, weight_min=None, weight_max=None, num_threads=None):
         """
         Computes the multidimensional histogram of some data and adds it to
         the current histogram stored by this instance. The results can be
@@ -502,6 +706,12 @@ class HistogramndLut(object):
                 as *weights*.
 
         :type weight_max: *optional*, scalar
+
+        :param num_threads:
+            Number of threads used to compute the histogram. Each thread
+            accumulates private histograms which are summed at the end.
+            Default: 1 (no multithreading).
+        :type num_threads: *optional*, int
         """
         if self.__dtype is None:
             self.__dtype = weights.dtype
@@ -515,6 +725,7 @@ class HistogramndLut(object):
             dtype=self.__dtype,
             weight_min=weight_min,
             weight_max=weight_max,
+            num_threads=num_threads,
         )
 
         if self.__histo is None:
@@ -524,7 +735,13 @@ class HistogramndLut(object):
             self.__weighted_histo = w_histo
 
     def apply_lut(
-        self, weights, histo=None, weighted_histo=None, weight_min=None, weight_max=None
+        self,
+        weights,
+        histo=None,
+        weighted_histo=None,
+        weight_min=None,
+        weight_max=None,
+        num_threads=None,
     ):
         """
         Computes the multidimensional histogram of some data and returns the
@@ -568,6 +785,11 @@ class HistogramndLut(object):
             .. note:: This value will be cast to the same type
                 as *weights*.
         :type weight_max: *optional*, scalar
+
+        :param num_threads:
+            Number of threads used to compute the histogram.
+            Default: 1 (no multithreading).
+        :type num_threads: *optional*, int
         """
         histo, w_histo = _histo_from_lut(
             weights,
@@ -578,6 +800,7 @@ class HistogramndLut(object):
             dtype=self.__dtype,
             weight_min=weight_min,
             weight_max=weight_max,
+            num_threads=num_threads,
         )
         self.__dtype = w_histo.dtype
         return histo, w_histo
@@ -60,7 +60,8 @@ int histogramnd_double_double_double(double *i_sample,
                                      double *o_bin_edges,
                                      int i_opt_flags,
                                      double i_weight_min,
-                                     double i_weight_max);
+                                     double i_weight_max,
+                                     int i_n_threads);
 
 int histogramnd_double_float_double(double *i_sample,
                                     float *i_weigths,
@@ -73,7 +74,8 @@ int histogramnd_double_float_double(double *i_sample,
                                     double *o_bin_edges,
                                     int i_opt_flags,
                                     float i_weight_min,
-                                    float i_weight_max);
+                                    float i_weight_max,
+                                    int i_n_threads);
 
 int histogramnd_double_int32_t_double(double *i_sample,
                                       int32_t *i_weigths,
@@ -86,7 +88,8 @@ int histogramnd_double_int32_t_double(double *i_sample,
                                       double *o_bin_edges,
                                       int i_opt_flags,
                                       int32_t i_weight_min,
-                                      int32_t i_weight_max);
+                                      int32_t i_weight_max,
+                                      int i_n_threads);
 
 /*=====================
  * float sample, double cumul
@@ -103,7 +106,8 @@ int histogramnd_float_double_double(float *i_sample,
                                     double *o_bin_edges,
                                     int i_opt_flags,
                                     double i_weight_min,
-                                    double i_weight_max);
+                                    double i_weight_max,
+                                    int i_n_threads);
 
 int histogramnd_float_float_double(float *i_sample,
                                    float *i_weigths,
@@ -116,7 +120,8 @@ int histogramnd_float_float_double(float *i_sample,
                                    double *o_bin_edges,
                                    int i_opt_flags,
                                    float i_weight_min,
-                                   float i_weight_max);
+                                   float i_weight_max,
+                                   int i_n_threads);
 
 int histogramnd_float_int32_t_double(float *i_sample,
                                      int32_t *i_weigths,
@@ -129,7 +134,8 @@ int histogramnd_float_int32_t_double(float *i_sample,
                                      double *o_bin_edges,
                                      int i_opt_flags,
                                      int32_t i_weight_min,
-                                     int32_t i_weight_max);
+                                     int32_t i_weight_max,
+                                     int i_n_threads);
 
 /*=====================
  * int32_t sample, double cumul
@@ -146,7 +152,8 @@ int histogramnd_int32_t_double_double(int32_t *i_sample,
                                       double *o_bin_edges,
                                       int i_opt_flags,
                                       double i_weight_min,
-                                      double i_weight_max);
+                                      double i_weight_max,
+                                      int i_n_threads);
 
 int histogramnd_int32_t_float_double(int32_t *i_sample,
                                      float *i_weigths,
@@ -159,7 +166,8 @@ int histogramnd_int32_t_float_double(int32_t *i_sample,
                                      double *o_bin_edges,
                                      int i_opt_flags,
                                      float i_weight_min,
-                                     float i_weight_max);
+                                     float i_weight_max,
+                                     int i_n_threads);
 
 int histogramnd_int32_t_int32_t_double(int32_t *i_sample,
                                        int32_t *i_weigths,
@@ -172,7 +180,8 @@ int histogramnd_int32_t_int32_t_double(int32_t *i_sample,
                                        double *o_bin_edges,
                                        int i_opt_flags,
                                        int32_t i_weight_min,
-                                       int32_t i_weight_max);
+                                       int32_t i_weight_max,
+                                       int i_n_threads);
 
 /*=====================
  * double sample, float cumul
@@ -190,7 +199,8 @@ int histogramnd_double_double_float(double *i_sample,
                                      double *o_bin_edges,
                                      int i_opt_flags,
                                      double i_weight_min,
-                                     double i_weight_max);
+                                     double i_weight_max,
+                                     int i_n_threads);
 
 int histogramnd_double_float_float(double *i_sample,
                                     float *i_weigths,
@@ -203,7 +213,8 @@ int histogramnd_double_float_float(double *i_sample,
                                     double *o_bin_edges,
                                     int i_opt_flags,
                                     float i_weight_min,
-                                    float i_weight_max);
+                                    float i_weight_max,
+                                    int i_n_threads);
 
 int histogramnd_double_int32_t_float(double *i_sample,
                                       int32_t *i_weigths,
@@ -216,7 +227,8 @@ int histogramnd_double_int32_t_float(double *i_sample,
                                       double *o_bin_edges,
                                       int i_opt_flags,
                                       int32_t i_weight_min,
-                                      int32_t i_weight_max);
+                                      int32_t i_weight_max,
+                                      int i_n_threads);
 
 /*=====================
  * float sample, float cumul
@@ -233,7 +245,8 @@ int histogramnd_float_double_float(float *i_sample,
                                     double *o_bin_edges,
                                     int i_opt_flags,
                                     double i_weight_min,
-                                    double i_weight_max);
+                                    double i_weight_max,
+                                    int i_n_threads);
 
 int histogramnd_float_float_float(float *i_sample,
                                    float *i_weigths,
@@ -246,7 +259,8 @@ int histogramnd_float_float_float(float *i_sample,
                                    double *o_bin_edges,
                                    int i_opt_flags,
                                    float i_weight_min,
-                                   float i_weight_max);
+                                   float i_weight_max,
+                                   int i_n_threads);
 
 int histogramnd_float_int32_t_float(float *i_sample,
                                      int32_t *i_weigths,
@@ -259,7 +273,8 @@ int histogramnd_float_int32_t_float(float *i_sample,
                                      double *o_bin_edges,
                                      int i_opt_flags,
                                      int32_t i_weight_min,
-                                     int32_t i_weight_max);
+                                     int32_t i_weight_max,
+                                     int i_n_threads);
 
 /*=====================
  * int32_t sample, double cumul
@@ -276,7 +291,8 @@ int histogramnd_int32_t_double_float(int32_t *i_sample,
                                       double *o_bin_edges,
                                       int i_opt_flags,
                                       double i_weight_min,
-                                      double i_weight_max);
+                                      double i_weight_max,
+                                      int i_n_threads);
 
 int histogramnd_int32_t_float_float(int32_t *i_sample,
                                      float *i_weigths,
@@ -289,7 +305,8 @@ int histogramnd_int32_t_float_float(int32_t *i_sample,
                                      double *o_bin_edges,
                                      int i_opt_flags,
                                      float i_weight_min,
-                                     float i_weight_max);
+                                     float i_weight_max,
+                                     int i_n_threads);
 
 int histogramnd_int32_t_int32_t_float(int32_t *i_sample,
                                        int32_t *i_weigths,
@@ -302,6 +319,7 @@ int histogramnd_int32_t_int32_t_float(int32_t *i_sample,
                                        double *o_bin_edges,
                                        int i_opt_flags,
                                        int32_t i_weight_min,
-                                       int32_t i_weight_max);
+                                       int32_t i_weight_max,
+                                       int i_n_threads);
 
 #endif /* #define HISTOGRAMND_C_H */
@@ -28,114 +28,57 @@
 #include <math.h>
 #include <stdarg.h>
 
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+
+/* Minimum number of elements to use several threads */
+#ifndef HISTO_OMP_MIN_ELEM
+#define HISTO_OMP_MIN_ELEM 65536
+#endif
+
+/* Maximum total number of bins of the per-thread private histograms.
+ * Above, threads accumulate in the shared histograms with atomic adds.
+ */
+#ifndef HISTO_OMP_MAX_PRIVATE_BINS
+#define HISTO_OMP_MAX_PRIVATE_BINS (1 << 24)
+#endif
+
 #ifdef HISTO_SAMPLE_T
 #ifdef HISTO_WEIGHT_T
 #ifdef HISTO_CUMUL_T
 
-int TEMPLATE(histogramnd, HISTO_SAMPLE_T, HISTO_WEIGHT_T, HISTO_CUMUL_T)
+/* Accumulates the histogram of i_n_elem elements.
+ * If i_atomic is not 0, o_histo and o_cumul are updated with atomic adds.
+ */
+static void TEMPLATE(histogramnd_range, HISTO_SAMPLE_T, HISTO_WEIGHT_T, HISTO_CUMUL_T)
                         (HISTO_SAMPLE_T *i_sample,
                          HISTO_WEIGHT_T *i_weights,
                          int i_n_dim,
                          size_t i_n_elem,
-                         double *i_bin_ranges,
+                         double *g_min,
+                         double *g_max,
+                         double *range,
                          int *i_n_bins,
                          uint32_t *o_histo,
                          HISTO_CUMUL_T *o_cumul,
-                         double *o_bin_edges,
-                         int i_opt_flags,
+                         int filt_min_weight,
+                         int filt_max_weight,
+                         int last_bin_closed,
                          HISTO_WEIGHT_T i_weight_min,
-                         HISTO_WEIGHT_T i_weight_max)
+                         HISTO_WEIGHT_T i_weight_max,
+                         int i_atomic)
 {
     /* some counters */
-    int i = 0, j = 0;
+    int i = 0;
     size_t elem_idx = 0;
 
-    HISTO_WEIGHT_T * weight_ptr = 0;
+    HISTO_WEIGHT_T * weight_ptr = i_weights;
     HISTO_SAMPLE_T elem_coord = 0.;
 
     /* computed bin index (i_sample -> grid) */
     long bin_idx = 0;
 
-    double * g_min = 0;
-    double * g_max = 0;
-    double * range = 0;
-
-    /* ================================
-     * Parsing options, if any.
-     * ================================
-     */
-
-    int filt_min_weight = 0;
-    int filt_max_weight = 0;
-    int last_bin_closed = 0;
-
-    /* Testing the option flags */
-    if(i_opt_flags & HISTO_WEIGHT_MIN)
-    {
-        filt_min_weight = 1;
-    }
-
-    if(i_opt_flags & HISTO_WEIGHT_MAX)
-    {
-        filt_max_weight = 1;
-    }
-
-    if(i_opt_flags & HISTO_LAST_BIN_CLOSED)
-    {
-        last_bin_closed = 1;
-    }
-
-    /* storing the min & max bin coordinates in their own arrays because
-     * i_bin_ranges = [[min0, max0], [min1, max1], ...]
-     * (mostly for the sake of clarity)
-     * (maybe faster access too?)
-     */
-    g_min = (double *) malloc(i_n_dim *sizeof(double));
-    g_max = (double *) malloc(i_n_dim * sizeof(double));
-    /* range used to convert from i_coords to bin indices in the grid */
-    range = (double *) malloc(i_n_dim * sizeof(double));
-
-    if(!g_min || !g_max || !range)
-    {
-        free(g_min);
-        free(g_max);
-        free(range);
-        return HISTO_ERR_ALLOC;
-    }
-
-    j = 0;
-    for(i=0; i<i_n_dim; i++)
-    {
-        g_min[i] = i_bin_ranges[i*2];
-        g_max[i] = i_bin_ranges[i*2+1];
-        range[i] = g_max[i]-g_min[i];
-
-        for(bin_idx=0; bin_idx<i_n_bins[i]; j++, bin_idx++)
-        {
-            o_bin_edges[j] = g_min[i] +
-                            bin_idx * (range[i] / i_n_bins[i]);
-        }
-        o_bin_edges[j++] = g_max[i];
-    }
-
-    weight_ptr = i_weights;
-
-    if(!i_weights)
-    {
-        /* if weights are not provided there no point in trying to filter them
-         * (!! careful if you change this, some code below relies on it !!)
-         */
-        filt_min_weight = 0;
-        filt_max_weight = 0;
-
-        /* If the weights array is not provided then there is no point
-         * updating the weighted histogram, only the bin counts (o_histo)
-         * will be filled.
-         * (!! careful if you change this, some code below relies on it !!)
-         */
-        o_cumul = 0;
-    }
-
     /* tried to use pointers instead of indices here, but it didn't
      * seem any faster (probably because the compiler
      * optimizes stuff anyway),
@@ -230,6 +173,25 @@ int TEMPLATE(histogramnd, HISTO_SAMPLE_T, HISTO_WEIGHT_T, HISTO_CUMUL_T)
             continue;
         }
 
+        if(i_atomic)
+        {
+            if(o_histo)
+            {
+#ifdef _OPENMP
+                #pragma omp atomic
+#endif
+                o_histo[bin_idx] += 1;
+            }
+            if(o_cumul)
+            {
+#ifdef _OPENMP
+                #pragma omp atomic
+#endif
+                o_cumul[bin_idx] += (HISTO_CUMUL_T) *weight_ptr;
+            }
+            continue;
+        }
+
         if(o_histo)
         {
             o_histo[bin_idx] += 1;
@@ -243,6 +205,212 @@ int TEMPLATE(histogramnd, HISTO_SAMPLE_T, HISTO_WEIGHT_T, HISTO_CUMUL_T)
         }
 
     } /* for(elem_idx=0; elem_idx<i_n_elem*i_n_dim; elem_idx+=i_n_dim) */
+}
+
+int TEMPLATE(histogramnd, HISTO_SAMPLE_T, HISTO_WEIGHT_T, HISTO_CUMUL_T)
+                        (HISTO_SAMPLE_T *i_sample,
+                         HISTO_WEIGHT_T *i_weights,
+                         int i_n_dim,
+                         size_t i_n_elem,
+                         double *i_bin_ranges,
+                         int *i_n_bins,
+                         uint32_t *o_histo,
+                         HISTO_CUMUL_T *o_cumul,
+                         double *o_bin_edges,
+                         int i_opt_flags,
+                         HISTO_WEIGHT_T i_weight_min,
+                         HISTO_WEIGHT_T i_weight_max,
+                         int i_n_threads)
+{
+    /* some counters */
+    int i = 0, j = 0;
+
+    /* computed bin index (i_sample -> grid) */
+    long bin_idx = 0;
+
+    double * g_min = 0;
+    double * g_max = 0;
+    double * range = 0;
+
+#ifdef _OPENMP
+    /* per-thread private histograms */
+    long n_bins_total = 1;
+    long bin = 0;
+    int thread = 0;
+    int atomic = 0;
+    uint32_t * histos = 0;
+    HISTO_CUMUL_T * cumuls = 0;
+#endif
+
+    /* ================================
+     * Parsing options, if any.
+     * ================================
+     */
+
+    int filt_min_weight = 0;
+    int filt_max_weight = 0;
+    int last_bin_closed = 0;
+
+    /* Testing the option flags */
+    if(i_opt_flags & HISTO_WEIGHT_MIN)
+    {
+        filt_min_weight = 1;
+    }
+
+    if(i_opt_flags & HISTO_WEIGHT_MAX)
+    {
+        filt_max_weight = 1;
+    }
+
+    if(i_opt_flags & HISTO_LAST_BIN_CLOSED)
+    {
+        last_bin_closed = 1;
+    }
+
+    /* storing the min & max bin coordinates in their own arrays because
+     * i_bin_ranges = [[min0, max0], [min1, max1], ...]
+     * (mostly for the sake of clarity)
+     * (maybe faster access too?)
+     */
+    g_min = (double *) malloc(i_n_dim *sizeof(double));
+    g_max = (double *) malloc(i_n_dim * sizeof(double));
+    /* range used to convert from i_coords to bin indices in the grid */
+    range = (double *) malloc(i_n_dim * sizeof(double));
+
+    if(!g_min || !g_max || !range)
+    {
+        free(g_min);
+        free(g_max);
+        free(range);
+        return HISTO_ERR_ALLOC;
+    }
+
+    j = 0;
+    for(i=0; i<i_n_dim; i++)
+    {
+        g_min[i] = i_bin_ranges[i*2];
+        g_max[i] = i_bin_ranges[i*2+1];
+        range[i] = g_max[i]-g_min[i];
+
+        for(bin_idx=0; bin_idx<i_n_bins[i]; j++, bin_idx++)
+        {
+            o_bin_edges[j] = g_min[i] +
+                            bin_idx * (range[i] / i_n_bins[i]);
+        }
+        o_bin_edges[j++] = g_max[i];
+    }
+
+    if(!i_weights)
+    {
+        /* if weights are not provided there no point in trying to filter them
+         * (!! careful if you change this, some code below relies on it !!)
+         */
+        filt_min_weight = 0;
+        filt_max_weight = 0;
+
+        /* If the weights array is not provided then there is no point
+         * updating the weighted histogram, only the bin counts (o_histo)
+         * will be filled.
+         * (!! careful if you change this, some code below relies on it !!)
+         */
+        o_cumul = 0;
+    }
+
+#ifdef _OPENMP
+    if(i_n_threads > 1 && i_n_elem >= HISTO_OMP_MIN_ELEM)
+    {
+        for(i=0; i<i_n_dim; i++)
+        {
+            n_bins_total *= i_n_bins[i];
+        }
+
+        /* Use private histograms if they fit in memory, else atomic adds */
+        atomic = (n_bins_total * i_n_threads > HISTO_OMP_MAX_PRIVATE_BINS);
+        if(!atomic)
+        {
+            histos = (uint32_t *) calloc(n_bins_total * i_n_threads,
+                                         sizeof(uint32_t));
+            if(o_cumul)
+            {
+                cumuls = (HISTO_CUMUL_T *) calloc(n_bins_total * i_n_threads,
+                                                  sizeof(HISTO_CUMUL_T));
+            }
+            if(!histos || (o_cumul && !cumuls))
+            {
+                free(histos);
+                free(cumuls);
+                histos = 0;
+                cumuls = 0;
+                atomic = 1;
+            }
+        }
+
+        #pragma omp parallel num_threads(i_n_threads)
+        {
+            int n_threads = omp_get_num_threads();
+            int thread_idx = omp_get_thread_num();
+            size_t first = (i_n_elem * thread_idx) / n_threads;
+            size_t last = (i_n_elem * (thread_idx + 1)) / n_threads;
+
+            TEMPLATE(histogramnd_range, HISTO_SAMPLE_T, HISTO_WEIGHT_T, HISTO_CUMUL_T)(
+                i_sample + first * i_n_dim,
+                i_weights ? i_weights + first : 0,
+                i_n_dim,
+                last - first,
+                g_min,
+                g_max,
+                range,
+                i_n_bins,
+                atomic ? o_histo : histos + thread_idx * n_bins_total,
+                atomic ? o_cumul : (cumuls ? cumuls + thread_idx * n_bins_total : 0),
+                filt_min_weight,
+                filt_max_weight,
+                last_bin_closed,
+                i_weight_min,
+                i_weight_max,
+                atomic);
+        }
+
+        if(!atomic)
+        {
+            /* Reduce the private histograms */
+            #pragma omp parallel for private(thread) num_threads(i_n_threads)
+            for(bin=0; bin<n_bins_total; bin++)
+            {
+                for(thread=0; thread<i_n_threads; thread++)
+                {
+                    o_histo[bin] += histos[thread * n_bins_total + bin];
+                    if(cumuls)
+                    {
+                        o_cumul[bin] += cumuls[thread * n_bins_total + bin];
+                    }
+                }
+            }
+            free(histos);
+            free(cumuls);
+        }
+    }
+    else
+#endif
+    {
+        TEMPLATE(histogramnd_range, HISTO_SAMPLE_T, HISTO_WEIGHT_T, HISTO_CUMUL_T)(
+            i_sample,
+            i_weights,
+            i_n_dim,
+            i_n_elem,
+            g_min,
+            g_max,
+            range,
+            i_n_bins,
+            o_histo,
+            o_cumul,
+            filt_min_weight,
+            filt_max_weight,
+            last_bin_closed,
+            i_weight_min,
+            i_weight_max,
+            0);
+    }
 
     free(g_min);
     free(g_max);
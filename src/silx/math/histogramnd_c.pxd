@@ -54,7 +54,8 @@ cdef extern from "histogramnd_c.h":
                                          double * bin_edges,
                                          int i_opt_flags,
                                          double i_weight_min,
-                                         double i_weight_max) nogil
+                                         double i_weight_max,
+                                         int i_n_threads) nogil
 
     int histogramnd_double_float_double(double *i_sample,
                                         float *i_weigths,
@@ -67,7 +68,8 @@ cdef extern from "histogramnd_c.h":
                                         double * bin_edges,
                                         int i_opt_flags,
                                         float i_weight_min,
-                                        float i_weight_max) nogil
+                                        float i_weight_max,
+                                        int i_n_threads) nogil
 
     int histogramnd_double_int32_t_double(double *i_sample,
                                           int32_t *i_weigths,
@@ -80,7 +82,8 @@ cdef extern from "histogramnd_c.h":
                                           double * bin_edges,
                                           int i_opt_flags,
                                           int32_t i_weight_min,
-                                          int32_t i_weight_max) nogil
+                                          int32_t i_weight_max,
+                                          int i_n_threads) nogil
 
     # =====================
     # float sample, double cumul
@@ -97,7 +100,8 @@ cdef extern from "histogramnd_c.h":
                                         double * bin_edges,
                                         int i_opt_flags,
                                         double i_weight_min,
-                                        double i_weight_max) nogil
+                                        double i_weight_max,
+                                        int i_n_threads) nogil
 
     int histogramnd_float_float_double(float *i_sample,
                                        float *i_weigths,
@@ -110,7 +114,8 @@ cdef extern from "histogramnd_c.h":
                                        double * bin_edges,
                                        int i_opt_flags,
                                        float i_weight_min,
-                                       float i_weight_max) nogil
+                                       float i_weight_max,
+                                       int i_n_threads) nogil
 
     int histogramnd_float_int32_t_double(float *i_sample,
                                          int32_t *i_weigths,
@@ -123,7 +128,8 @@ cdef extern from "histogramnd_c.h":
                                          double * bin_edges,
                                          int i_opt_flags,
                                          int32_t i_weight_min,
-                                         int32_t i_weight_max) nogil
+                                         int32_t i_weight_max,
+                                         int i_n_threads) nogil
 
     # =====================
     # numpy.int32_t sample, double cumul
@@ -140,7 +146,8 @@ cdef extern from "histogramnd_c.h":
                                           double * bin_edges,
                                           int i_opt_flags,
                                           double i_weight_min,
-                                          double i_weight_max) nogil
+                                          double i_weight_max,
+                                          int i_n_threads) nogil
 
     int histogramnd_int32_t_float_double(int32_t *i_sample,
                                          float *i_weigths,
@@ -153,7 +160,8 @@ cdef extern from "histogramnd_c.h":
                                          double * bin_edges,
                                          int i_opt_flags,
                                          float i_weight_min,
-                                         float i_weight_max) nogil
+                                         float i_weight_max,
+                                         int i_n_threads) nogil
 
     int histogramnd_int32_t_int32_t_double(int32_t *i_sample,
                                            int32_t *i_weigths,
@@ -166,7 +174,8 @@ cdef extern from "histogramnd_c.h":
                                            double * bin_edges,
                                            int i_opt_flags,
                                            int32_t i_weight_min,
-                                           int32_t i_weight_max) nogil
+                                           int32_t i_weight_max,
+                                           int i_n_threads) nogil
 
     # =====================
     # double sample, float cumul
@@ -183,7 +192,8 @@ cdef extern from "histogramnd_c.h":
                                         double * bin_edges,
                                         int i_opt_flags,
                                         double i_weight_min,
-                                        double i_weight_max) nogil
+                                        double i_weight_max,
+                                        int i_n_threads) nogil
 
     int histogramnd_double_float_float(double *i_sample,
                                        float *i_weigths,
@@ -196,7 +206,8 @@ cdef extern from "histogramnd_c.h":
                                        double * bin_edges,
                                        int i_opt_flags,
                                        float i_weight_min,
-                                       float i_weight_max) nogil
+                                       float i_weight_max,
+                                       int i_n_threads) nogil
 
     int histogramnd_double_int32_t_float(double *i_sample,
                                          int32_t *i_weigths,
@@ -209,7 +220,8 @@ cdef extern from "histogramnd_c.h":
                                          double * bin_edges,
                                          int i_opt_flags,
                                          int32_t i_weight_min,
-                                         int32_t i_weight_max) nogil
+                                         int32_t i_weight_max,
+                                         int i_n_threads) nogil
 
     # =====================
     # float sample, float cumul
@@ -226,7 +238,8 @@ cdef extern from "histogramnd_c.h":
                                        double * bin_edges,
                                        int i_opt_flags,
                                        double i_weight_min,
-                                       double i_weight_max) nogil
+                                       double i_weight_max,
+                                       int i_n_threads) nogil
 
     int histogramnd_float_float_float(float *i_sample,
                                       float *i_weigths,
@@ -239,7 +252,8 @@ cdef extern from "histogramnd_c.h":
                                       double * bin_edges,
                                       int i_opt_flags,
                                       float i_weight_min,
-                                      float i_weight_max) nogil
+                                      float i_weight_max,
+                                      int i_n_threads) nogil
 
     int histogramnd_float_int32_t_float(float *i_sample,
                                         int32_t *i_weigths,
@@ -252,7 +266,8 @@ cdef extern from "histogramnd_c.h":
                                         double * bin_edges,
                                         int i_opt_flags,
                                         int32_t i_weight_min,
-                                        int32_t i_weight_max) nogil
+                                        int32_t i_weight_max,
+                                        int i_n_threads) nogil
 
     # =====================
     # numpy.int32_t sample, float cumul
@@ -269,7 +284,8 @@ cdef extern from "histogramnd_c.h":
                                          double * bin_edges,
                                          int i_opt_flags,
                                          double i_weight_min,
-                                         double i_weight_max) nogil
+                                         double i_weight_max,
+                                         int i_n_threads) nogil
 
     int histogramnd_int32_t_float_float(int32_t *i_sample,
                                         float *i_weigths,
@@ -282,7 +298,8 @@ cdef extern from "histogramnd_c.h":
                                         double * bin_edges,
                                         int i_opt_flags,
                                         float i_weight_min,
-                                        float i_weight_max) nogil
+                                        float i_weight_max,
+                                        int i_n_threads) nogil
 
     int histogramnd_int32_t_int32_t_float(int32_t *i_sample,
                                           int32_t *i_weigths,
@@ -295,4 +312,5 @@ cdef extern from "histogramnd_c.h":
                                           double * bin_edges,
                                           int i_opt_flags,
                                           int32_t i_weight_min,
-                                          int32_t i_weight_max) nogil
+                                          int32_t i_weight_max,
+                                          int i_n_threads) nogil
@@ -21,18 +21,21 @@
 # THE SOFTWARE.
 #
 # ############################################################################*/
-"""This module provides :func:`interp3d` to perform trilinear interpolation.
+"""This module provides :func:`interp3d` and :func:`interp3d_grid` to perform
+trilinear interpolation.
 """
 
 __authors__ = ["T. Vincent"]
 __license__ = "MIT"
-__date__ = "11/07/2019"
+__date__ = "18/10/2026"
 
 
 import cython
 from cython.parallel import prange
 import numpy
 
+from ..utils._openmp import get_num_threads
+
 cimport cython
 from libc.math cimport floor
 
@@ -45,6 +48,11 @@ ctypedef fused _floating_pts:
     float
     double
 
+ctypedef fused _floating_out:
+    float
+    double
+
+
 
 @cython.initializedcheck(False)
 @cython.boundscheck(False)
@@ -114,12 +122,105 @@ cdef inline double trilinear_interpolation(
     return c
 
 
+@cython.initializedcheck(False)
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _interp3d_points(_floating[:, :, :] values,
+                     _floating_pts[:, :] xi,
+                     _floating_out[::1] result,
+                     double fill_value,
+                     int num_threads):
+    """Interpolates values at points xi and stores the result in result"""
+    cdef Py_ssize_t index, npoints = xi.shape[0]
+
+    if num_threads <= 1:
+        with nogil:
+            for index in range(npoints):
+                result[index] = < _floating_out > trilinear_interpolation(
+                    values, xi[index, 0], xi[index, 1], xi[index, 2], fill_value)
+    else:
+        for index in prange(npoints, nogil=True, num_threads=num_threads):
+            result[index] = < _floating_out > trilinear_interpolation(
+                values, xi[index, 0], xi[index, 1], xi[index, 2], fill_value)
+
+
+@cython.initializedcheck(False)
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def interp3d(_floating[:, :, :] values not None,
-             _floating_pts[:, :] xi not None,
+def _interp3d_grid(_floating[:, :, :] values,
+                   double[::1] origin,
+                   double[::1] step0,
+                   double[::1] step1,
+                   _floating_out[:, ::1] result,
+                   double fill_value,
+                   int num_threads):
+    """Interpolates values on the grid origin + i * step0 + j * step1
+    and stores it in result[i, j]"""
+    cdef:
+        Py_ssize_t row, column
+        Py_ssize_t nrows = result.shape[0]
+        Py_ssize_t ncolumns = result.shape[1]
+        double pos0, pos1, pos2
+
+    for row in prange(nrows, nogil=True, num_threads=max(1, num_threads)):
+        for column in range(ncolumns):
+            pos0 = origin[0] + row * step0[0] + column * step1[0]
+            pos1 = origin[1] + row * step0[1] + column * step1[1]
+            pos2 = origin[2] + row * step0[2] + column * step1[2]
+            result[row, column] = < _floating_out > trilinear_interpolation(
+                values, pos0, pos1, pos2, fill_value)
+
+
+def _get_num_threads(method, num_threads):
+    """Returns the number of threads to use for the given method.
+
+    :param str method: Interpolation method: 'linear' or 'linear_omp'
+    :param Union[int,None] num_threads:
+        The requested number of threads or None for the default
+    :rtype: int
+    """
+    if method not in ('linear', 'linear_omp'):
+        raise ValueError("Unsupported method: %s" % method)
+    if method == 'linear' and num_threads is None:
+        return 1
+    return get_num_threads(num_threads)
+
+
+def _get_output(output, dtype, shape, values):
+    """Returns the array where to store the interpolated values.
+
+    :raise ValueError: If output is not compatible
+    """
+    if output is None:
+        if dtype is None:
+            # Unsupported values are rejected by the interpolation function
+            dtype = getattr(values, 'dtype', numpy.float64)
+            if dtype not in (numpy.float32, numpy.float64):
+                dtype = numpy.float64
+        dtype = numpy.dtype(dtype)
+        if dtype not in (numpy.float32, numpy.float64):
+            raise ValueError("Unsupported output dtype: %s" % dtype)
+        return numpy.empty(shape, dtype=dtype)
+
+    if (not isinstance(output, numpy.ndarray) or
+            output.shape != shape or
+            output.dtype not in (numpy.float32, numpy.float64) or
+            (dtype is not None and output.dtype != dtype) or
+            not output.flags.c_contiguous or
+            not output.flags.writeable):
+        raise ValueError(
+            "output must be a writable C-contiguous float32 or float64 array of shape %s" %
+            (shape,))
+    return output
+
+
+def interp3d(values not None,
+             xi not None,
              str method='linear',
-             double fill_value=numpy.nan):
+             double fill_value=numpy.nan,
+             num_threads=None,
+             output=None,
+             dtype=None):
     """Trilinear interpolation in a regular grid.
 
     Perform trilinear interpolation of the 3D dataset at given points
@@ -131,33 +232,75 @@ def interp3d(_floating[:, :, :] values not None,
         - 'linear_omp': Trilinear interpolation with OpenMP parallelism
     :param float fill_value:
         Value to use for points outside the volume (default: nan)
+    :param Union[int,None] num_threads:
+        Number of threads to use.
+        Default: 1 for 'linear' and the number of available CPUs
+        (or OMP_NUM_THREADS) for 'linear_omp'.
+    :param Union[numpy.ndarray,None] output:
+        Optional C-contiguous float32 or float64 array of shape (N,)
+        where to store the result
+    :param Union[numpy.dtype,None] dtype:
+        Type of the result (float32 or float64) when output is not provided.
+        Default: The type of values
     :return: Values evaluated at given input points.
     :rtype: numpy.ndarray
+    :raise ValueError:
+        If method is not supported or output is not compatible
     """
-    if _floating is float:
-        dtype = numpy.float32
-    elif _floating is double:
-        dtype = numpy.float64
-    else:  # This should not happen
-        raise ValueError("Unsupported input dtype")
+    num_threads = _get_num_threads(method, num_threads)
+    output = _get_output(output, dtype, (len(xi),), values)
+    _interp3d_points(values, xi, output, fill_value, num_threads)
+    return output
 
-    cdef:
-        int npoints = xi.shape[0]
-        _floating[:] result = numpy.empty((npoints,), dtype=dtype)
-        int index
-        double c_fill_value = fill_value
 
-    if method == 'linear':
-        with nogil:
-            for index in range(npoints):
-                result[index] = < _floating > trilinear_interpolation(
-                    values, xi[index, 0], xi[index, 1], xi[index, 2], c_fill_value)
+def interp3d_grid(values not None,
+                  origin,
+                  step0,
+                  step1,
+                  shape,
+                  str method='linear',
+                  double fill_value=numpy.nan,
+                  num_threads=None,
+                  output=None,
+                  dtype=None):
+    """Trilinear interpolation of a 3D dataset on a 2D structured grid.
 
-    elif method == 'linear_omp':
-        for index in prange(npoints, nogil=True):
-            result[index] = < _floating > trilinear_interpolation(
-                values, xi[index, 0], xi[index, 1], xi[index, 2], c_fill_value)
-    else:
-        raise ValueError("Unsupported method: %s" % method)
+    The value at index (i, j) of the result is interpolated at position
+    ``origin + i * step0 + j * step1`` (e.g., a rotated slice through
+    the volume) without creating the array of positions.
+
+    :param numpy.ndarray values: 3D dataset of floating point values
+    :param origin: 3 coordinates of the first point of the grid
+    :param step0: 3 coordinates of the step between two rows of the grid
+    :param step1: 3 coordinates of the step between two columns of the grid
+    :param List[int] shape: Number of (rows, columns) of the grid
+    :param str method: Interpolation method to use, see :func:`interp3d`
+    :param float fill_value:
+        Value to use for points outside the volume (default: nan)
+    :param Union[int,None] num_threads:
+        Number of threads to use, see :func:`interp3d`
+    :param Union[numpy.ndarray,None] output:
+        Optional C-contiguous float32 or float64 array of the given shape
+        where to store the result
+    :param Union[numpy.dtype,None] dtype:
+        Type of the result (float32 or float64) when output is not provided.
+        Default: The type of values
+    :return: Values evaluated on the grid.
+    :rtype: numpy.ndarray
+    :raise ValueError:
+        If method is not supported or arguments are not compatible
+    """
+    vectors = []
+    for name, vector in (('origin', origin), ('step0', step0), ('step1', step1)):
+        vector = numpy.ascontiguousarray(vector, dtype=numpy.float64)
+        if vector.shape != (3,):
+            raise ValueError("%s must be 3 coordinates" % name)
+        vectors.append(vector)
+    shape = tuple(int(length) for length in shape)
+    if len(shape) != 2:
+        raise ValueError("shape must be (rows, columns)")
 
-    return numpy.array(result, copy=False)
\ No newline at end of file
+    num_threads = _get_num_threads(method, num_threads)
+    output = _get_output(output, dtype, shape, values)
+    _interp3d_grid(values, *vectors, output, fill_value, num_threads)
+    return output
@@ -23,7 +23,7 @@
 # ###########################################################################*/
 // __authors__ = ["H. Payno"]
 // __license__ = "MIT"
-// __date__ = "10/02/2017"
+// __date__ = "18/10/2026"
 
 #ifndef MEDIAN_FILTER
 #define MEDIAN_FILTER
@@ -35,6 +35,7 @@
 #include <iostream>
 #include <cmath>
 #include <cfloat>
+#include <stdint.h>
 
 /* Needed for pytohn2.7 on Windows... */
 #ifndef INFINITY
@@ -281,4 +282,283 @@ void median_filter(
     }
 }
 
+
+// return the index into 0, (length_max - 1) of a coordinate according to the
+// mode, or -1 if the coordinate is outside in shrink and constant modes
+inline int border_index(int index, int length_max, MODE mode){
+    if(index >= 0 && index < length_max){
+        return index;
+    }
+    switch(mode){
+        case NEAREST:
+            return std::min(std::max(index, 0), length_max - 1);
+        case REFLECT:
+            return reflect(index, length_max);
+        case MIRROR:
+            // deal with dimensions of size 1
+            return (length_max == 1) ? 0 : mirror(index, length_max);
+        default: // SHRINK and CONSTANT
+            return -1;
+    }
+}
+
+
+// Minimum number of elements of the kernel to use the sliding histogram
+#define HISTOGRAM_MIN_KERNEL_SIZE 64
+
+// Provide histogram bin indices for the types supported by the sliding
+// histogram (i.e., 16 bits integers)
+template<typename T>
+struct HistogramTraits {
+    static const bool enabled = false;
+    static inline int index(T value) { return 0; }
+    static inline T value(int index) { return 0; }
+};
+
+template<>
+struct HistogramTraits<uint16_t> {
+    static const bool enabled = true;
+    static inline int index(uint16_t value) { return value; }
+    static inline uint16_t value(int index) { return static_cast<uint16_t>(index); }
+};
+
+template<>
+struct HistogramTraits<int16_t> {
+    static const bool enabled = true;
+    static inline int index(int16_t value) { return static_cast<int>(value) + 32768; }
+    static inline int16_t value(int index) { return static_cast<int16_t>(index - 32768); }
+};
+
+
+// Histogram of 16 bits values with a coarse level of 256 bins to find the
+// median in at most 512 steps
+template<typename T>
+class SlidingHistogram {
+public:
+    SlidingHistogram(): count(0), fine(65536, 0), coarse(256, 0) {}
+
+    inline void add(T value){
+        int index = HistogramTraits<T>::index(value);
+        fine[index]++;
+        coarse[index >> 8]++;
+        count++;
+    }
+
+    inline void remove(T value){
+        int index = HistogramTraits<T>::index(value);
+        fine[index]--;
+        coarse[index >> 8]--;
+        count--;
+    }
+
+    // The highest of the 2 central values for an even count, as median()
+    T median() const {
+        return this->rank(count / 2);
+    }
+
+    T min() const {
+        return this->rank(0);
+    }
+
+    T max() const {
+        return this->rank(count - 1);
+    }
+
+    long count;
+
+private:
+    // Returns the value of the given rank (0-based) in sorted order
+    T rank(long rank) const {
+        long cumul = 0;
+        int block = 0;
+        while(cumul + coarse[block] <= rank){
+            cumul += coarse[block];
+            block++;
+        }
+        int index = block << 8;
+        while(cumul + fine[index] <= rank){
+            cumul += fine[index];
+            index++;
+        }
+        return HistogramTraits<T>::value(index);
+    }
+
+    std::vector<uint32_t> fine;
+    std::vector<uint32_t> coarse;
+};
+
+
+// Process the row (z_pixel, y_pixel) of a 3D volume with a sliding histogram:
+// Moving the window along x only removes and adds a column of the window
+template<typename T>
+void median_filter_3d_histogram(
+    const T* input,
+    T* output,
+    int* kernel_dim,        // three values : 0:depth, 1:height, 2:width
+    int* image_dim,         // three values : 0:depth, 1:height, 2:width
+    int z_pixel,
+    int y_pixel,
+    bool conditional,
+    int pMode,
+    T cval) {
+
+    MODE mode = static_cast<MODE>(pMode);
+    int halfKernel_x = (kernel_dim[2] - 1) / 2;
+    int halfKernel_y = (kernel_dim[1] - 1) / 2;
+    int halfKernel_z = (kernel_dim[0] - 1) / 2;
+
+    // Offsets of the lines of the window, -1 for lines outside the volume
+    std::vector<long> line_offsets;
+    for(int win_z=z_pixel-halfKernel_z; win_z<=z_pixel+halfKernel_z; win_z++){
+        int index_z = border_index(win_z, image_dim[0], mode);
+        for(int win_y=y_pixel-halfKernel_y; win_y<=y_pixel+halfKernel_y; win_y++){
+            int index_y = border_index(win_y, image_dim[1], mode);
+            if(index_z < 0 || index_y < 0){
+                line_offsets.push_back(-1);
+            }else{
+                line_offsets.push_back(
+                    ((long) index_z * image_dim[1] + index_y) * image_dim[2]);
+            }
+        }
+    }
+
+    SlidingHistogram<T> histogram;
+    const long row_offset = ((long) z_pixel * image_dim[1] + y_pixel) * image_dim[2];
+
+    for(int x_pixel=-2*halfKernel_x; x_pixel<image_dim[2]; x_pixel++){
+        // Add the column entering the window
+        int win_x = x_pixel + halfKernel_x;
+        int index_x = border_index(win_x, image_dim[2], mode);
+        for(size_t line=0; line<line_offsets.size(); line++){
+            if(line_offsets[line] >= 0 && index_x >= 0){
+                histogram.add(input[line_offsets[line] + index_x]);
+            }else if(mode == CONSTANT){
+                histogram.add(cval);
+            }
+        }
+        if(x_pixel < 0){
+            continue;  // Filling the first window
+        }
+
+        const T currentPixelValue = input[row_offset + x_pixel];
+        if(conditional == false ||
+                currentPixelValue == histogram.min() ||
+                currentPixelValue == histogram.max()){
+            output[row_offset + x_pixel] = histogram.median();
+        }else{
+            output[row_offset + x_pixel] = currentPixelValue;
+        }
+
+        // Remove the column leaving the window
+        win_x = x_pixel - halfKernel_x;
+        index_x = border_index(win_x, image_dim[2], mode);
+        for(size_t line=0; line<line_offsets.size(); line++){
+            if(line_offsets[line] >= 0 && index_x >= 0){
+                histogram.remove(input[line_offsets[line] + index_x]);
+            }else if(mode == CONSTANT){
+                histogram.remove(cval);
+            }
+        }
+    }
+}
+
+
+// Process the row (z_pixel, y_pixel) of a 3D volume
+template<typename T>
+void median_filter_3d(
+    const T* input,
+    T* output,
+    int* kernel_dim,        // three values : 0:depth, 1:height, 2:width
+    int* image_dim,         // three values : 0:depth, 1:height, 2:width
+    int z_pixel,
+    int y_pixel,
+    bool conditional,
+    int pMode,
+    T cval) {
+
+    assert(kernel_dim[0] > 0);
+    assert(kernel_dim[1] > 0);
+    assert(kernel_dim[2] > 0);
+    assert(z_pixel >= 0 && z_pixel < image_dim[0]);
+    assert(y_pixel >= 0 && y_pixel < image_dim[1]);
+
+    if(HistogramTraits<T>::enabled &&
+            kernel_dim[0] * kernel_dim[1] * kernel_dim[2] >= HISTOGRAM_MIN_KERNEL_SIZE){
+        median_filter_3d_histogram<T>(input, output, kernel_dim, image_dim,
+                                      z_pixel, y_pixel, conditional, pMode, cval);
+        return;
+    }
+
+    MODE mode = static_cast<MODE>(pMode);
+    int halfKernel_x = (kernel_dim[2] - 1) / 2;
+    int halfKernel_y = (kernel_dim[1] - 1) / 2;
+    int halfKernel_z = (kernel_dim[0] - 1) / 2;
+
+    // Offsets of the lines of the window, -1 for lines outside the volume
+    std::vector<long> line_offsets;
+    for(int win_z=z_pixel-halfKernel_z; win_z<=z_pixel+halfKernel_z; win_z++){
+        int index_z = border_index(win_z, image_dim[0], mode);
+        for(int win_y=y_pixel-halfKernel_y; win_y<=y_pixel+halfKernel_y; win_y++){
+            int index_y = border_index(win_y, image_dim[1], mode);
+            if(index_z < 0 || index_y < 0){
+                line_offsets.push_back(-1);
+            }else{
+                line_offsets.push_back(
+                    ((long) index_z * image_dim[1] + index_y) * image_dim[2]);
+            }
+        }
+    }
+
+    // init buffer
+    std::vector<T> window_values(line_offsets.size() * kernel_dim[2]);
+    const long row_offset = ((long) z_pixel * image_dim[1] + y_pixel) * image_dim[2];
+
+    for(int x_pixel=0; x_pixel<image_dim[2]; x_pixel++){
+        typename std::vector<T>::iterator it = window_values.begin();
+        // fill the vector
+        for(size_t line=0; line<line_offsets.size(); line++){
+            for(int win_x=x_pixel-halfKernel_x; win_x<=x_pixel+halfKernel_x; win_x++){
+                int index_x = border_index(win_x, image_dim[2], mode);
+                T value = 0;
+                if(line_offsets[line] >= 0 && index_x >= 0){
+                    value = input[line_offsets[line] + index_x];
+                }else if(mode == CONSTANT){
+                    value = cval;
+                }else{
+                    continue;  // SHRINK
+                }
+                if (value == value) {  // Ignore NaNs
+                    *it = value;
+                    ++it;
+                }
+            }
+        }
+
+        //window_size can be smaller than kernel size in shrink mode or if there is NaNs
+        int window_size = std::distance(window_values.begin(), it);
+
+        if (window_size == 0) {
+            // Window is empty, this is the case when all values are NaNs
+            output[row_offset + x_pixel] = NotANumber<T>();
+        } else {
+            // apply the median value if needed for this pixel
+            const T currentPixelValue = input[row_offset + x_pixel];
+            if (conditional == true){
+                typename std::vector<T>::iterator window_end = window_values.begin() + window_size;
+                T min = 0;
+                T max = 0;
+                getMinMax(window_values, min, max, window_end);
+                // NaNs are propagated through unchanged
+                if ((currentPixelValue == max) || (currentPixelValue == min)){
+                    output[row_offset + x_pixel] = median<T>(window_values, window_size);
+                }else{
+                    output[row_offset + x_pixel] = currentPixelValue;
+                }
+            }else{
+                output[row_offset + x_pixel] = median<T>(window_values, window_size);
+            }
+        }
+    }
+}
+
 #endif // MEDIAN_FILTER
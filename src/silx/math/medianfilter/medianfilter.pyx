@@ -26,7 +26,7 @@
 
 __authors__ = ["H. Payno", "J. Kieffer"]
 __license__ = "MIT"
-__date__ = "02/05/2017"
+__date__ = "18/10/2026"
 
 
 from cython.parallel import prange
@@ -42,6 +42,20 @@ from libc.stdint cimport int16_t, uint16_t, int32_t, uint32_t, int64_t, uint64_t
 
 MODES = {'nearest': 0, 'reflect': 1, 'mirror': 2, 'shrink': 3, 'constant': 4}
 
+ctypedef fused _median_types:
+    float
+    double
+    int64_t
+    uint64_t
+    int32_t
+    uint32_t
+    int16_t
+    uint16_t
+
+_SUPPORTED_DTYPES = tuple(numpy.dtype(t) for t in (
+    numpy.float32, numpy.float64, numpy.int64, numpy.uint64,
+    numpy.int32, numpy.uint32, numpy.int16, numpy.uint16))
+
 
 def medfilt1d(data,
               kernel_size=3,
@@ -107,6 +121,75 @@ def medfilt2d(image,
     return medfilt(image, kernel_size, conditional, mode, cval)
 
 
+def medfilt3d(data,
+              kernel_size=3,
+              bool conditional=False,
+              mode='nearest',
+              cval=0):
+    """Function computing the 3D median filter of the given input.
+
+    Not-a-Number (NaN) float values are ignored.
+    If the window only contains NaNs, it evaluates to NaN.
+
+    In event of an even number of valid values in the window (either
+    because of NaN values or on volume border in shrink mode),
+    the highest of the 2 central sorted values is taken.
+
+    For 16 bits integer data and kernels of at least 64 elements, a sliding
+    histogram is used so that the cost per voxel grows with the area of the
+    kernel rather than with its volume.
+
+    :param numpy.ndarray data: the array for which we want to apply
+        the median filter. Should be 3d.
+    :param kernel_size: the dimension of the kernel.
+    :type kernel_size: int or a tuple or a list of
+        (kernel_depth, kernel_height, kernel_width)
+    :param bool conditional: True if we want to apply a conditional median
+        filtering.
+    :param str mode: the algorithm used to determine how values at borders
+        are determined: 'nearest', 'reflect', 'mirror', 'shrink', 'constant'
+    :param cval: Value used outside borders in 'constant' mode
+
+    :returns: the array with the median value for each voxel.
+    """
+    if data.ndim != 3:
+        raise ValueError(
+            "Invalid data shape. Dimension of the array should be 3")
+    return medfilt(data, kernel_size, conditional, mode, cval)
+
+
+def medfilt2d_stack(stack,
+                    kernel_size=3,
+                    bool conditional=False,
+                    mode='nearest',
+                    cval=0):
+    """Function computing the 2D median filter of each image of a stack.
+
+    This is the same as calling :func:`medfilt2d` on each image, but all
+    images are processed at once in parallel.
+
+    :param numpy.ndarray stack: 3d array of images.
+    :param kernel_size: the dimension of the kernel.
+    :type kernel_size: int or a tuple or a list of
+        (kernel_height, kernel_width)
+    :param bool conditional: True if we want to apply a conditional median
+        filtering.
+    :param str mode: the algorithm used to determine how values at borders
+        are determined: 'nearest', 'reflect', 'mirror', 'shrink', 'constant'
+    :param cval: Value used outside borders in 'constant' mode
+
+    :returns: the stack of filtered images.
+    """
+    if stack.ndim != 3:
+        raise ValueError(
+            "Invalid data shape. Dimension of the array should be 3")
+    if isinstance(kernel_size, numbers.Integral):
+        kernel_size = [kernel_size] * 2
+    if len(kernel_size) != 2:
+        raise ValueError("kernel_size must be (kernel_height, kernel_width)")
+    return medfilt(stack, [1] + list(kernel_size), conditional, mode, cval)
+
+
 def medfilt(data,
             kernel_size=3,
             bool conditional=False,
@@ -124,10 +207,11 @@ def medfilt(data,
     the highest of the 2 central sorted values is taken.
 
     :param numpy.ndarray data: the array for which we want to apply
-        the median filter. Should be 1d or 2d.
+        the median filter. Should be 1d, 2d or 3d.
     :param kernel_size: the dimension of the kernel.
     :type kernel_size: For 1D should be an int for 2D should be a tuple or
-        a list of (kernel_height, kernel_width)
+        a list of (kernel_height, kernel_width), for 3D a tuple or a list of
+        (kernel_depth, kernel_height, kernel_width)
     :param bool conditional: True if we want to apply a conditional median
         filtering.
     :param str mode: the algorithm used to determine how values at borders
@@ -140,9 +224,9 @@ def medfilt(data,
         err = 'Requested mode %s is unknown.' % mode
         raise ValueError(err)
 
-    if data.ndim > 2:
+    if data.ndim > 3:
         raise ValueError(
-            "Invalid data shape. Dimension of the array should be 1 or 2")
+            "Invalid data shape. Dimension of the array should be 1, 2 or 3")
 
     # Handle case of scalar kernel size
     if isinstance(kernel_size, numbers.Integral):
@@ -163,6 +247,18 @@ def medfilt(data,
 
     ker_dim = numpy.array(kernel_size, dtype=numpy.int32)
 
+    if data.ndim == 3:
+        if data.dtype not in _SUPPORTED_DTYPES:
+            raise ValueError(
+                "%s type is not managed by the median filter" % data.dtype)
+        _median_filter_3d(data,
+                          output_buffer,
+                          ker_dim,
+                          conditional,
+                          MODES[mode],
+                          data.dtype.type(cval))
+        return output_buffer
+
     if data.dtype == numpy.float64:
         medfilterfc = _median_filter_float64
     elif data.dtype == numpy.float32:
@@ -204,11 +300,11 @@ def check(input_buffer, output_buffer):
     if (output_buffer.flags['C_CONTIGUOUS'] is False):
         raise ValueError('<output_buffer> must be a C_CONTIGUOUS numpy array.')
 
-    if not (len(input_buffer.shape) <= 2):
-        raise ValueError('<input_buffer> dimension must mo higher than 2.')
+    if not (len(input_buffer.shape) <= 3):
+        raise ValueError('<input_buffer> dimension must mo higher than 3.')
 
-    if not (len(output_buffer.shape) <= 2):
-        raise ValueError('<output_buffer> dimension must mo higher than 2.')
+    if not (len(output_buffer.shape) <= 3):
+        raise ValueError('<output_buffer> dimension must mo higher than 3.')
 
     if not(input_buffer.dtype == output_buffer.dtype):
         raise ValueError('input buffer and output_buffer must be of the same type')
@@ -490,3 +586,39 @@ def _median_filter_uint16(
                                                   conditional,
                                                   mode,
                                                   cval)
+
+
+@cython.cdivision(True)
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.initializedcheck(False)
+def _median_filter_3d(_median_types[:, :, ::1] input_buffer not None,
+                      _median_types[:, :, ::1] output_buffer not None,
+                      int32_t[::1] kernel_size not None,
+                      bool conditional,
+                      int mode,
+                      _median_types cval):
+    """Apply the median filter to a volume, processing all the rows of all
+    the images in a single parallel loop"""
+    cdef:
+        int row = 0
+        int n_rows = input_buffer.shape[0] * input_buffer.shape[1]
+        int[3] buffer_shape
+    buffer_shape[0] = input_buffer.shape[0]
+    buffer_shape[1] = input_buffer.shape[1]
+    buffer_shape[2] = input_buffer.shape[2]
+
+    if input_buffer.shape[2] == 0:
+        return
+
+    for row in prange(n_rows, nogil=True):
+        median_filter.median_filter_3d(
+            & input_buffer[0, 0, 0],
+            & output_buffer[0, 0, 0],
+            <int*>&kernel_size[0],
+            <int*>buffer_shape,
+            row // buffer_shape[1],
+            row % buffer_shape[1],
+            conditional,
+            mode,
+            cval)
@@ -24,11 +24,11 @@
 
 __authors__ = ["H. Payno"]
 __license__ = "MIT"
-__date__ = "17/01/2018"
+__date__ = "18/10/2026"
 
 import unittest
 import numpy
-from silx.math.medianfilter import medfilt2d, medfilt1d
+from silx.math.medianfilter import medfilt2d, medfilt1d, medfilt3d, medfilt2d_stack
 from silx.math.medianfilter.medianfilter import reflect, mirror
 from silx.math.medianfilter.medianfilter import MODES as silx_mf_modes
 from silx.utils.testutils import ParametricTestCase
@@ -731,3 +731,56 @@ class TestVsScipy(ParametricTestCase):
                     )
 
                     self.assertTrue(numpy.array_equal(resScipy, resSilx))
+
+    def test3D(self):
+        """Test medfilt3d vs scipy, including the sliding histogram"""
+        rng = numpy.random.default_rng(0)
+        volume = rng.random((7, 12, 15)) * 1000
+        kernels = [(3, 3, 3), (3, 5, 1), (5, 5, 5), (1, 9, 9)]
+        modesToTest = _getScipyAndSilxCommonModes()
+        for dtype in (numpy.float32, numpy.uint16, numpy.int16):
+            data = volume.astype(dtype)
+            for kernel in kernels:
+                for mode in modesToTest:
+                    with self.subTest(dtype=dtype, kernel=kernel, mode=mode):
+                        resScipy = scipy.ndimage.median_filter(
+                            input=data, size=kernel, mode=mode, cval=3
+                        )
+                        resSilx = medfilt3d(
+                            data, kernel_size=kernel, mode=mode, cval=3
+                        )
+                        self.assertTrue(numpy.array_equal(resScipy, resSilx))
+
+
+class TestMedianFilterStack(ParametricTestCase):
+    """Test medfilt2d_stack vs medfilt2d on each image"""
+
+    def testStack(self):
+        rng = numpy.random.default_rng(0)
+        stack = rng.random((4, 10, 13)) * 1000
+        float_stack = stack.copy()
+        float_stack[0, 2, 3] = numpy.nan
+        for data in (float_stack, stack.astype(numpy.uint16)):
+            dtype = data.dtype
+            for kernel in ((3, 3), (9, 11)):
+                for mode in silx_mf_modes:
+                    for conditional in (False, True):
+                        with self.subTest(
+                            dtype=dtype, kernel=kernel, mode=mode, cond=conditional
+                        ):
+                            result = medfilt2d_stack(
+                                data, kernel, conditional=conditional, mode=mode
+                            )
+                            expected = numpy.array(
+                                [
+                                    medfilt2d(image, kernel, conditional, mode)
+                                    for image in data
+                                ]
+                            )
+                            numpy.testing.assert_array_equal(result, expected)
+
+    def testInvalid(self):
+        with self.assertRaises(ValueError):
+            medfilt2d_stack(numpy.ones((10, 10)))
+        with self.assertRaises(ValueError):
+            medfilt2d_stack(numpy.ones((2, 10, 10)), kernel_size=(3, 3, 3))
@@ -24,11 +24,12 @@
 histogramnd benchmarks, vs numpy.histogramdd (bin counts and weights).
 """
 
-import numpy as np
-
+import os
 import time
 
-from silx.math import histogramnd
+import numpy as np
+
+from silx.math.chistogramnd import chistogramnd as histogramnd
 
 
 def print_times(t0s, t1s, t2s, t3s):
@@ -58,7 +59,8 @@ def commpare_results(
         hits_cmp = None
 
     if result_np_w and result_c[1] is not None:
-        weights_cmp = np.array_equal(result_c[1], result_np_w[0])
+        # Summation order differs when using several threads
+        weights_cmp = np.allclose(result_c[1], result_np_w[0])
     else:
         weights_cmp = None
 
@@ -100,6 +102,7 @@ def benchmark(
     dtype=np.double,
     do_weights=True,
     do_numpy=True,
+    num_threads=1,
 ):
     int_min = 0
     int_max = 100000
@@ -114,7 +117,7 @@ def benchmark(
 
     if do_weights:
         weights = np.random.randint(
-            int_min, high=int_max, size=(ssetup.pyample_shape[0],)
+            int_min, high=int_max, size=(sample_shape[0],)
         )
         weights = weights.astype(np.double)
         weights = weights_rng[0] + (weights - int_min) * (
@@ -138,6 +141,7 @@ def benchmark(
             weight_min=weight_min,
             weight_max=weight_max,
             last_bin_closed=last_bin_closed,
+            num_threads=num_threads,
         )
         t1s.append(time.time())
         if do_numpy:
@@ -166,7 +170,7 @@ def benchmark(
     print_times(np.array(t0s), np.array(t1s), np.array(t2s), np.array(t3s))
 
 
-def run_benchmark(dtype=np.double, do_weights=True, do_numpy=True):
+def run_benchmark(dtype=np.double, do_weights=True, do_numpy=True, num_threads=1):
     n_loops = 5
 
     weights_rng = [0.0, 100.0]
@@ -183,7 +187,7 @@ def run_benchmark(dtype=np.double, do_weights=True, do_numpy=True):
     # ====================================================
 
     print("==========================")
-    print(" 1D [{0}]".format(dtype))
+    print(" 1D [{0}] ({1} threads)".format(dtype, num_threads))
     print("==========================")
     sample_shape = (10**7,)
     histo_range = [[0.0, 100.0]]
@@ -202,6 +206,7 @@ def run_benchmark(dtype=np.double, do_weights=True, do_numpy=True):
         dtype=dtype,
         do_weights=True,
         do_numpy=do_numpy,
+        num_threads=num_threads,
     )
 
     # ====================================================
@@ -211,7 +216,7 @@ def run_benchmark(dtype=np.double, do_weights=True, do_numpy=True):
     # ====================================================
 
     print("==========================")
-    print(" 2D [{0}]".format(dtype))
+    print(" 2D [{0}] ({1} threads)".format(dtype, num_threads))
     print("==========================")
     sample_shape = (10**7, 2)
     histo_range = [[0.0, 100.0], [0.0, 100.0]]
@@ -230,6 +235,7 @@ def run_benchmark(dtype=np.double, do_weights=True, do_numpy=True):
         dtype=dtype,
         do_weights=True,
         do_numpy=do_numpy,
+        num_threads=num_threads,
     )
 
     # ====================================================
@@ -239,7 +245,7 @@ def run_benchmark(dtype=np.double, do_weights=True, do_numpy=True):
     # ====================================================
 
     print("==========================")
-    print(" 3D [{0}]".format(dtype))
+    print(" 3D [{0}] ({1} threads)".format(dtype, num_threads))
     print("==========================")
     sample_shape = (10**7, 3)
     histo_range = np.array([[0.0, 100.0], [0.0, 100.0], [0.0, 100.0]])
@@ -258,6 +264,7 @@ def run_benchmark(dtype=np.double, do_weights=True, do_numpy=True):
         dtype=dtype,
         do_weights=True,
         do_numpy=do_numpy,
+        num_threads=num_threads,
     )
 
 
@@ -268,5 +275,8 @@ if __name__ == "__main__":
         np.float32,
     )
 
+    n_threads = sorted({1, len(os.sched_getaffinity(0))})
+
     for t in types:
-        run_benchmark(t, do_weights=True, do_numpy=True)
+        for num_threads in n_threads:
+            run_benchmark(t, do_weights=True, do_numpy=True, num_threads=num_threads)
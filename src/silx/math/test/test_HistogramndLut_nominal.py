@@ -516,3 +516,29 @@ class TestHistogramndLut_nominal_2d(_TestHistogramndLut_nominal):
 class TestHistogramndLut_nominal_3d(_TestHistogramndLut_nominal):
     __test__ = True  # because _TestHistogramndLut_nominal is ignored
     ndims = 3
+
+
+class TestHistogramndLut_multithreading(unittest.TestCase):
+    """Tests of HistogramndLut with several threads"""
+
+    def test_accumulate(self):
+        rng = np.random.default_rng(0)
+        sample = rng.random((200001, 2)) * 100
+        weights = (rng.random(200001) * 100).astype(np.float32)
+
+        reference = HistogramndLut(sample, [[0, 100], [10, 90]], (7, 11))
+        reference.accumulate(weights, weight_min=10)
+
+        for num_threads in (2, 5):
+            with self.subTest(num_threads=num_threads):
+                instance = HistogramndLut(sample, [[0, 100], [10, 90]], (7, 11))
+                instance.accumulate(weights, weight_min=10, num_threads=num_threads)
+                instance.accumulate(weights, weight_min=10, num_threads=num_threads)
+                np.testing.assert_array_equal(
+                    instance.histo(), 2 * reference.histo()
+                )
+                np.testing.assert_allclose(
+                    instance.weighted_histo(),
+                    2 * reference.weighted_histo(),
+                    rtol=1e-5,
+                )
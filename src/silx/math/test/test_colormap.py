@@ -25,7 +25,7 @@
 
 __authors__ = ["T. Vincent"]
 __license__ = "MIT"
-__date__ = "16/05/2018"
+__date__ = "18/10/2026"
 
 
 import logging
@@ -304,3 +304,55 @@ def test_normalize(data, expected_data, expected_vmin, expected_vmax):
         result.data,
         numpy.asarray(expected_data, dtype=numpy.uint8),
     )
+
+
+@pytest.mark.parametrize("norm", ["linear", "log", "sqrt", "arcsinh", "gamma"])
+def test_autoscale_percentile_histogram(norm):
+    """Test histogram-based percentile autoscale against numpy percentiles"""
+    data = numpy.random.lognormal(3, 0.5, (100, 1000))
+    data[0, :10] = numpy.nan, numpy.inf, -numpy.inf, 0, -1, 0, 0, 0, 0, 0
+    normalizer = colormap._get_normalizer(norm, 2.0)
+    vmin, vmax = normalizer.autoscale(data, "percentile_1_99_histogram")
+    expected = normalizer.autoscale(data, "percentile_1_99")
+    assert numpy.allclose((vmin, vmax), expected, rtol=1e-2)
+
+
+def test_autoscale_cache():
+    """Test autoscale cache is used and invalidated"""
+    data = numpy.arange(10000, dtype=numpy.float64)
+    normalizer = colormap.LinearNormalization()
+    assert normalizer.autoscale(data, "minmax", cache=True) == (0, 9999)
+
+    entry = colormap._AUTOSCALE_CACHE.get(data)
+    assert entry[(colormap.LinearNormalization, "minmax")] == (0, 9999)
+    assert "statistics" in entry
+    assert colormap._AUTOSCALE_CACHE.get(data) is entry
+
+    # Statistics are shared across normalizations and modes
+    entry["statistics"] = colormap._statistics(numpy.array((1.0, 2.0, 3.0)))
+    log_normalizer = colormap.LogarithmicNormalization()
+    assert log_normalizer.autoscale(data, "minmax", cache=True) == (1, 3)
+
+    # In-place modification
+    data[::2] = 1
+    assert colormap._AUTOSCALE_CACHE.get(data) is not entry
+    assert normalizer.autoscale(data, "minmax", cache=True) == (1, 9999)
+
+    # Garbage collected array
+    data = numpy.arange(10)
+    normalizer.autoscale(data, "minmax", cache=True)
+    key = id(data)
+    assert key in colormap._AUTOSCALE_CACHE._entries
+    del data
+    assert key not in colormap._AUTOSCALE_CACHE._entries
+
+
+def test_autoscale_no_cache():
+    """Test autoscale does not use the cache by default"""
+    data = numpy.zeros((2000, 2000))
+    data[0, 0] = 1
+    assert colormap.normalize(data, cache=True).vmax == 1
+    # In-place modification which is not sampled by the cache
+    data[1000, 1001] = 50
+    assert colormap.normalize(data).vmax == 50
+    assert colormap.LinearNormalization().autoscale(data, "minmax") == (0, 50)
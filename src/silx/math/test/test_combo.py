@@ -24,14 +24,14 @@
 
 __authors__ = ["T. Vincent"]
 __license__ = "MIT"
-__date__ = "17/01/2018"
+__date__ = "18/10/2026"
 
 
 import numpy
 
 from silx.utils.testutils import ParametricTestCase
 
-from silx.math.combo import min_max
+from silx.math.combo import min_max, statistics
 
 
 class TestMinMax(ParametricTestCase):
@@ -199,3 +199,96 @@ class TestMinMax(ParametricTestCase):
                 with self.subTest(dtype=dtype, data=data):
                     data = numpy.array(data, dtype=dtype)
                     self._test_min_max(data, min_positive=True, finite=True)
+
+    def test_multithreading(self):
+        """Test min_max of large arrays processed by chunks in parallel"""
+        size = 1000000
+        for dtype in ("float32", "float64", "uint8", "int64"):
+            data = numpy.ones(size, dtype=dtype)
+            # Same values in different chunks to check first occurrences
+            data[[size // 3, size // 2, size - 1]] = 0
+            data[[size // 4, size // 2 + 1]] = 2
+            for num_threads in (1, 3, 4):
+                with self.subTest(dtype=dtype, num_threads=num_threads):
+                    result = min_max(data, min_positive=True, num_threads=num_threads)
+                    self.assertEqual(result.argmin, size // 3)
+                    self.assertEqual(result.argmax, size // 4)
+                    self.assertEqual(result.argmin_positive, 0)
+
+
+class TestStatistics(ParametricTestCase):
+    """Tests of statistics combo"""
+
+    def _test_statistics(self, data, finite, num_threads=None):
+        """Compare statistics with numpy for the given dataset"""
+        result = statistics(data, min_positive=True, finite=finite,
+                            num_threads=num_threads)
+
+        reference = min_max(data, min_positive=True, finite=finite)
+        for name in ("minimum", "maximum", "min_positive",
+                     "argmin", "argmax", "argmin_positive"):
+            self.assertEqual(
+                str(getattr(result, name)), str(getattr(reference, name)))
+
+        data = numpy.asarray(data)
+        if data.dtype.kind == "f":
+            nan_count = numpy.count_nonzero(numpy.isnan(data))
+            if finite:
+                data = data[numpy.isfinite(data)]
+            else:
+                data = data[numpy.logical_not(numpy.isnan(data))]
+        else:
+            nan_count = 0
+        self.assertEqual(result.nan_count, nan_count)
+        self.assertEqual(result.count, data.size)
+
+        if data.size == 0:
+            self.assertIsNone(result.sum)
+            self.assertIsNone(result.mean)
+            self.assertIsNone(result.std)
+        elif numpy.all(numpy.isfinite(data)):
+            data = data.astype(numpy.float64)
+            numpy.testing.assert_allclose(result.sum, numpy.sum(data))
+            numpy.testing.assert_allclose(result.mean, numpy.mean(data))
+            numpy.testing.assert_allclose(result.std, numpy.std(data), atol=1e-10)
+
+    def test_datasets(self):
+        """Test statistics against numpy"""
+        tests = {
+            "arange": numpy.arange(-10, 1000),
+            "random": numpy.random.random(1000) * 100,
+            "constant": numpy.full(10, 5.0),
+            "nan": (1.0, numpy.nan, 3.0, numpy.nan),
+            "inf": (numpy.inf, 1.0, numpy.nan, -2.0, -numpy.inf),
+            "all nan": (numpy.nan, numpy.nan),
+        }
+        for name, data in tests.items():
+            for finite in (True, False):
+                with self.subTest(data=name, finite=finite):
+                    self._test_statistics(numpy.array(data), finite)
+
+    def test_precision(self):
+        """Test standard deviation of data with a large offset"""
+        data = 1e8 + numpy.random.random(1000000)
+        for num_threads in (1, 4):
+            with self.subTest(num_threads=num_threads):
+                result = statistics(data, num_threads=num_threads)
+                numpy.testing.assert_allclose(result.mean, numpy.mean(data))
+                numpy.testing.assert_allclose(result.std, numpy.std(data))
+
+    def test_multithreading(self):
+        """Test statistics of large arrays processed by chunks in parallel"""
+        data = numpy.random.random(1000000).astype(numpy.float32)
+        data[::1000] = numpy.nan
+        data[10] = numpy.inf
+        for num_threads in (1, 3, 4):
+            for finite in (True, False):
+                with self.subTest(num_threads=num_threads, finite=finite):
+                    self._test_statistics(data, finite, num_threads)
+
+    def test_nodata(self):
+        """Test statistics with None and empty array"""
+        with self.assertRaises(TypeError):
+            statistics(None)
+        with self.assertRaises(ValueError):
+            statistics(numpy.array((), dtype=numpy.float64))
@@ -24,8 +24,12 @@
 Nominal tests of the histogramnd function.
 """
 
+import os
+import shutil
+import tempfile
 import unittest
 
+import h5py
 import numpy as np
 
 from silx.math.chistogramnd import chistogramnd as histogramnd
@@ -910,3 +914,126 @@ class Test_Histogramnd_nominal_2d(_Test_Histogramnd_nominal):
 class Test_Histogramnd_nominal_3d(_Test_Histogramnd_nominal):
     __test__ = True  # because _Test_chistogramnd_nominal is ignored
     ndims = 3
+
+
+class Test_Histogramnd_stream(unittest.TestCase):
+    """Tests of Histogramnd.accumulate_stream"""
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.sample = rng.random((10000, 3)) * 100
+        self.weights = rng.random(10000)
+        self.histo_range = [[0, 100], [10, 90], [0, 50]]
+        self.reference = Histogramnd(
+            self.sample, self.histo_range, 7, weights=self.weights
+        )
+
+    def assertHistogram(self, histo_obj, weighted=True):
+        np.testing.assert_array_equal(histo_obj.histo, self.reference.histo)
+        if weighted:
+            np.testing.assert_allclose(
+                histo_obj.weighted_histo, self.reference.weighted_histo
+            )
+        else:
+            self.assertIsNone(histo_obj.weighted_histo)
+        for edges, expected in zip(histo_obj.edges, self.reference.edges):
+            np.testing.assert_array_equal(edges, expected)
+
+    def test_array(self):
+        for max_workers in (1, 3):
+            with self.subTest(max_workers=max_workers):
+                histo_obj = Histogramnd(None, self.histo_range, 7)
+                histo_obj.accumulate_stream(
+                    np.asfortranarray(self.sample),
+                    weights=self.weights,
+                    block_size=999,
+                    max_workers=max_workers,
+                )
+                self.assertHistogram(histo_obj)
+
+    def test_iterator(self):
+        histo_obj = Histogramnd(self.sample[:1000], self.histo_range, 7)
+        histo_obj.accumulate_stream(
+            self.sample[i : i + 700] for i in range(1000, len(self.sample), 700)
+        )
+        self.assertHistogram(histo_obj, weighted=False)
+
+        histo_obj = Histogramnd(None, self.histo_range, 7)
+        histo_obj.accumulate_stream(
+            np.array_split(self.sample, 7), weights=np.array_split(self.weights, 7)
+        )
+        self.assertHistogram(histo_obj)
+
+        with self.assertRaises(ValueError):
+            histo_obj.accumulate_stream(
+                np.array_split(self.sample, 7), weights=np.array_split(self.weights, 6)
+            )
+
+    def test_hdf5(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            filename = os.path.join(tmpdir, "histo.h5")
+            with h5py.File(filename, "w") as h5file:
+                h5file.create_dataset("sample", data=self.sample, chunks=(300, 3))
+                h5file.create_dataset("weights", data=self.weights, chunks=(500,))
+
+            with h5py.File(filename, "r") as h5file:
+                histo_obj = Histogramnd(None, self.histo_range, 7)
+                histo_obj.accumulate_stream(
+                    h5file["sample"], weights=h5file["weights"], block_size=1000
+                )
+            self.assertHistogram(histo_obj)
+        finally:
+            shutil.rmtree(tmpdir)
+
+
+class Test_Histogramnd_multithreading(unittest.TestCase):
+    """Tests of the multithreaded histogramnd"""
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.sample = (rng.random((200001, 3)) * 100).astype(np.float32)
+        self.sample[::1000] = 100  # values on the last bin edge
+        self.weights = rng.random(200001) * 100
+        self.histo_range = np.array([[0, 100], [10, 90], [0, 50]])
+
+    def test_chistogramnd(self):
+        for last_bin_closed in (False, True):
+            reference = histogramnd(
+                self.sample,
+                self.histo_range,
+                (7, 11, 13),
+                weights=self.weights,
+                weight_min=10,
+                weight_max=90,
+                last_bin_closed=last_bin_closed,
+            )
+            for num_threads in (1, 2, 5):
+                with self.subTest(
+                    last_bin_closed=last_bin_closed, num_threads=num_threads
+                ):
+                    histo, w_histo, edges = histogramnd(
+                        self.sample,
+                        self.histo_range,
+                        (7, 11, 13),
+                        weights=self.weights,
+                        weight_min=10,
+                        weight_max=90,
+                        last_bin_closed=last_bin_closed,
+                        num_threads=num_threads,
+                    )
+                    np.testing.assert_array_equal(histo, reference[0])
+                    np.testing.assert_allclose(w_histo, reference[1])
+                    for edge, expected in zip(edges, reference[2]):
+                        np.testing.assert_array_equal(edge, expected)
+
+    def test_accumulate(self):
+        reference = Histogramnd(self.sample, self.histo_range, 7)
+        reference.accumulate(self.sample[:100000], weights=self.weights[:100000])
+
+        histo_obj = Histogramnd(self.sample, self.histo_range, 7, num_threads=3)
+        histo_obj.accumulate(
+            self.sample[:100000], weights=self.weights[:100000], num_threads=2
+        )
+        np.testing.assert_array_equal(histo_obj.histo, reference.histo)
+        np.testing.assert_allclose(histo_obj.weighted_histo, reference.weighted_histo)
@@ -25,7 +25,7 @@
 
 __authors__ = ["T. Vincent"]
 __license__ = "MIT"
-__date__ = "11/07/2019"
+__date__ = "18/10/2026"
 
 
 import unittest
@@ -121,3 +121,57 @@ class TestInterp3d(ParametricTestCase):
             with self.subTest(method=method):
                 result = interpolate.interp3d(data, points, method=method)
                 self.assertTrue(numpy.allclose(ref_result, result))
+
+    def test_num_threads_output(self):
+        """Test interp3d with num_threads, dtype and output arguments"""
+        data = numpy.random.random((16, 16, 16))
+        points = numpy.random.random((1000, 3)) * 15
+        ref_result = self.ref_interp3d(data, points)
+
+        for num_threads in (1, 3):
+            with self.subTest(num_threads=num_threads):
+                result = interpolate.interp3d(
+                    data, points, num_threads=num_threads, dtype=numpy.float32
+                )
+                self.assertEqual(result.dtype, numpy.float32)
+                self.assertTrue(numpy.allclose(ref_result, result))
+
+        output = numpy.empty((1000,), dtype=numpy.float32)
+        result = interpolate.interp3d(data, points, method="linear_omp", output=output)
+        self.assertIs(result, output)
+        self.assertTrue(numpy.allclose(ref_result, result))
+
+        for output in (
+            numpy.empty((999,), dtype=numpy.float64),
+            numpy.empty((1000,), dtype=numpy.int32),
+            numpy.empty((2000,), dtype=numpy.float64)[::2],
+        ):
+            with self.subTest(output=output):
+                with self.assertRaises(ValueError):
+                    interpolate.interp3d(data, points, output=output)
+
+    def test_grid(self):
+        """Test interp3d_grid against interp3d"""
+        data = numpy.random.random((16, 17, 18)).astype(numpy.float32)
+        origin = numpy.array((1.0, -1.0, 2.0))
+        step0 = numpy.array((0.5, 0.2, 0.0))
+        step1 = numpy.array((0.1, 0.3, 0.4))
+        rows, columns = numpy.mgrid[:20, :30]
+        points = (
+            origin
+            + rows.reshape(-1, 1) * step0
+            + columns.reshape(-1, 1) * step1
+        )
+        ref_result = interpolate.interp3d(data, points, fill_value=-1)
+
+        for method in ("linear", "linear_omp"):
+            with self.subTest(method=method):
+                result = interpolate.interp3d_grid(
+                    data, origin, step0, step1, (20, 30), method=method, fill_value=-1
+                )
+                self.assertEqual(result.shape, (20, 30))
+                self.assertEqual(result.dtype, numpy.float32)
+                self.assertTrue(numpy.allclose(ref_result.reshape(20, 30), result))
+
+        with self.assertRaises(ValueError):
+            interpolate.interp3d_grid(data, (0, 0), step0, step1, (20, 30))
@@ -61,6 +61,8 @@ def __getattr__(name):
         "mf",
         "release_cl_buffers",
         "allocate_cl_buffers",
+        "get_buffer_pool",
+        "trim_buffer_pools",
         "measure_workgroup_size",
         "kernel_workgroup_size",
     ]:
@@ -26,9 +26,10 @@
 
 __authors__ = ["A. Mirone, P. Paleo"]
 __license__ = "MIT"
-__date__ = "25/01/2019"
+__date__ = "18/10/2026"
 
 import logging
+import time
 import numpy as np
 
 from .common import pyopencl
@@ -116,6 +117,9 @@ class Backprojection(OpenclProcessing):
             profile=profile,
         )
 
+        self._batch = None  # resources of backprojection_stack
+        self.stack_stats = None
+        """Statistics of the last call to :meth:`backprojection_stack`"""
         self._init_geometry(
             sino_shape, slice_shape, angles, axis_position, extra_options
         )
@@ -386,3 +390,182 @@ class Backprojection(OpenclProcessing):
         return res
 
     __call__ = filtered_backprojection
+
+    def _get_batch_size(self, n_slices=None):
+        """Returns the number of slices processed per kernel launch, from the
+        memory available on the device.
+
+        :param Union[int,None] n_slices: Number of slices to reconstruct
+        """
+        max_batch_size = 64
+        if n_slices is not None:
+            max_batch_size = max(1, min(max_batch_size, n_slices))
+        sino_size = int(self.num_projs) * int(self.num_bins)
+        padded_sino_size = int(self.num_projs) * int(self.sino_filter.dwidth_padded)
+        # sinogram, filtering buffers and slice, in float32
+        slice_bytes = 4 * (
+            2 * sino_size + 2 * padded_sino_size + int(np.prod(self.dimrec_shape))
+        )
+        return int(np.clip(self.device.memory // 4 // slice_bytes, 1, max_batch_size))
+
+    def _init_batch(self, batch_size, filtered):
+        """Allocate the resources to reconstruct `batch_size` slices per
+        kernel launch.
+
+        :param int batch_size: Number of slices per kernel launch
+        :param bool filtered: True if the sinograms are filtered
+        """
+        if self._batch is None or self._batch["size"] != batch_size:
+            # Sinograms of the stack are filtered as a single tall sinogram
+            sino_shape = (batch_size * int(self.num_projs), int(self.num_bins))
+            slice_shape = (batch_size,) + tuple(self.dimrec_shape)
+            self._batch = {
+                "size": batch_size,
+                "h_sino": np.zeros(sino_shape, dtype=np.float32),
+                "d_sino": parray.zeros(
+                    self.queue, sino_shape, np.float32, allocator=self.buffer_pool
+                ),
+                "d_slice": parray.zeros(
+                    self.queue, slice_shape, np.float32, allocator=self.buffer_pool
+                ),
+                "filter": None,
+            }
+        if filtered and self._batch["filter"] is None:
+            sino_filter = SinoFilter(
+                self._batch["h_sino"].shape,
+                ctx=self.ctx,
+                filter_name=self.filter_name,
+                extra_options=self.extra_options,
+            )
+            # Use the normalization of the single sinogram filter
+            sino_filter.set_filter(self.sino_filter.filter_f.copy(), normalize=False)
+            self._batch["filter"] = sino_filter
+
+    def _backproject_batch(self, sinos, filtered):
+        """Reconstruct a batch of slices.
+
+        :param numpy.ndarray sinos: Stack of at most `batch_size` sinograms
+        :param bool filtered: True to filter the sinograms
+        :return: The reconstructed slices
+        :rtype: numpy.ndarray
+        """
+        batch = self._batch
+        n_slices = len(sinos)
+        h_sino = batch["h_sino"]
+        h_sino[: n_slices * self.num_projs] = sinos.reshape(-1, self.num_bins)
+        h_sino[n_slices * self.num_projs :] = 0
+        if filtered:
+            batch["filter"](h_sino, output=batch["d_sino"])
+        else:
+            batch["d_sino"].set(h_sino)
+
+        kernel_args = list(self._backproj_kernel_args)
+        kernel_args[3] = batch["d_slice"].data
+        kernel_args[4] = batch["d_sino"].data
+        kernel_args[-1] = self._get_local_mem()
+        evt = self.kernels.backproj_cpu_kernel(
+            self.queue,
+            tuple(self.ndrange) + (n_slices,),
+            tuple(self.wg) + (1,),
+            *kernel_args,
+        )
+        if self.profile:
+            self.events.append(EventDescription("backprojection stack", evt))
+        res = batch["d_slice"][:n_slices].get()
+        return res[:, : self.slice_shape[0], : self.slice_shape[1]]
+
+    def backprojection_stack(self, sinos, output=None, batch_size=None, filtered=True):
+        """Reconstruct a stack of slices, processing several slices per kernel
+        launch.
+
+        The number of reconstructed slices per second is logged and stored in
+        :attr:`stack_stats`.
+
+        :param sinos: Stack of sinograms with the shape
+            (n_slices, n_projections, n_bins): a 3D `numpy.ndarray`, a
+            `h5py.Dataset` or any iterable of 2D sinograms
+        :param output: Optional, array-like of shape
+            (n_slices,) + slice_shape where the slices are written, for
+            example a 3D `numpy.ndarray` or a `h5py.Dataset`.
+            If nothing is provided, a new numpy array is returned.
+        :param Union[int,None] batch_size: Number of slices per kernel launch.
+            Default is computed from the memory of the device.
+        :param bool filtered: True (default) for a filtered backprojection
+        :return: The reconstructed volume
+        """
+        sino_shape = (int(self.num_projs), int(self.num_bins))
+        slice_shape = tuple(int(i) for i in self.slice_shape)
+        shape = getattr(sinos, "shape", None)
+        if shape is not None:
+            if len(shape) != 3 or tuple(shape[1:]) != sino_shape:
+                raise ValueError(
+                    "Expected a stack of sinograms of shape %s, got %s"
+                    % (sino_shape, shape)
+                )
+            n_slices = int(shape[0])
+        else:
+            n_slices = None
+        if output is not None and n_slices is not None:
+            if tuple(output.shape) != (n_slices,) + slice_shape:
+                raise ValueError(
+                    "Expected output of shape %s, got %s"
+                    % ((n_slices,) + slice_shape, output.shape)
+                )
+        if batch_size is None:
+            batch_size = self._get_batch_size(n_slices)
+
+        def iter_batches():
+            if n_slices is not None:
+                # Read the stack (or the dataset) by chunks
+                for start in range(0, n_slices, batch_size):
+                    yield sinos[start : start + batch_size]
+            else:
+                chunk = []
+                for sino in sinos:
+                    chunk.append(sino)
+                    if len(chunk) == batch_size:
+                        yield chunk
+                        chunk = []
+                if chunk:
+                    yield chunk
+
+        t0 = time.perf_counter()
+        results = []
+        start = 0
+        with self.sem:
+            self._init_batch(batch_size, filtered)
+            for chunk in iter_batches():
+                chunk = np.asarray(chunk, dtype=np.float32)
+                if chunk.shape[1:] != sino_shape:
+                    raise ValueError(
+                        "Expected sinograms of shape %s, got %s"
+                        % (sino_shape, chunk.shape[1:])
+                    )
+                res = self._backproject_batch(chunk, filtered)
+                stop = start + len(res)
+                if output is None:
+                    results.append(res)
+                elif n_slices is None and stop > len(output):
+                    raise ValueError("Too many sinograms for the output")
+                else:
+                    output[start:stop] = res
+                start = stop
+        elapsed = time.perf_counter() - t0
+
+        self.stack_stats = {
+            "slices": start,
+            "batch_size": batch_size,
+            "time": elapsed,
+            "slices_per_second": start / elapsed if elapsed > 0 else float("inf"),
+        }
+        logger.info(
+            "Reconstructed %d slices in %.3fs (%.1f slices/s)",
+            start,
+            elapsed,
+            self.stack_stats["slices_per_second"],
+        )
+        if output is not None:
+            return output
+        if results:
+            return np.concatenate(results)
+        return np.zeros((0,) + slice_shape, dtype=np.float32)
@@ -34,7 +34,7 @@ __authors__ = ["Jérôme Kieffer"]
 __contact__ = "jerome.kieffer@esrf.eu"
 __license__ = "MIT"
 __copyright__ = "European Synchrotron Radiation Facility, Grenoble, France"
-__date__ = "09/11/2022"
+__date__ = "18/10/2026"
 __status__ = "production"
 
 
@@ -42,7 +42,13 @@ import os
 import struct
 import numpy
 from ..common import ocl, pyopencl, kernel_workgroup_size
-from ..processing import BufferDescription, EventDescription, OpenclProcessing
+from ..processing import (
+    BufferDescription,
+    EventDescription,
+    OpenclProcessing,
+    StreamPipeline,
+    allocate_pinned_array,
+)
 
 import logging
 
@@ -152,7 +158,10 @@ class BitshuffleLz4(OpenclProcessing):
                     self.cmp_size = len_raw
                     logger.info("increase cmp buffer size to %s", self.cmp_size)
                     self.cl_mem["cmp"] = pyopencl.array.empty(
-                        self.queue, self.cmp_size, dtype=numpy.uint8
+                        self.queue,
+                        self.cmp_size,
+                        dtype=numpy.uint8,
+                        allocator=self.buffer_pool,
                     )
                 evt = pyopencl.enqueue_copy(
                     self.queue, self.cl_mem["cmp"].data, raw, is_blocking=False
@@ -171,7 +180,10 @@ class BitshuffleLz4(OpenclProcessing):
                         (dest_size + self.LZ4_BLOCK_SIZE - 1) // self.LZ4_BLOCK_SIZE
                     )
                     self.cl_mem["dec"] = pyopencl.array.empty(
-                        self.queue, dest_size, self.dec_dtype
+                        self.queue,
+                        dest_size,
+                        self.dec_dtype,
+                        allocator=self.buffer_pool,
                     )
                     self.dec_size = dest_size // self.dec_dtype.itemsize
                 else:
@@ -212,3 +224,116 @@ class BitshuffleLz4(OpenclProcessing):
         return out
 
     __call__ = decompress
+
+    def process_stream(self, iterable, depth=None):
+        """Decompress a stream of chunks, overlapping the transfers with the
+        computation (see :class:`~silx.opencl.processing.StreamPipeline`).
+
+        :param iterable: Compressed chunks as 1D numpy arrays of char or bytes
+        :param Union[int,None] depth: Number of chunks in flight
+        :return: Iterator over the decompressed data as 1D numpy arrays
+        """
+        wg = int(self.block_size)
+
+        def get_buffer(queue, buffers, name, size, dtype, pinned=False):
+            """Returns a buffer of the slot, growing it if needed"""
+            buffer = buffers.get(name)
+            if buffer is None or buffer.size < size:
+                if pinned:
+                    buffer = allocate_pinned_array(queue, size, dtype)
+                else:
+                    buffer = pyopencl.array.empty(
+                        queue, size, dtype, allocator=self.buffer_pool
+                    )
+                buffers[name] = buffer
+            return buffer
+
+        def add_event(desc, evt):
+            # Events are still running: keep them for log_profile
+            if self.profile:
+                self.events.append(EventDescription(desc, evt))
+
+        def upload(queue, slot, wait_for):
+            raw = slot.frame
+            if isinstance(raw, (bytes, bytearray)):
+                raw = numpy.frombuffer(raw, dtype=numpy.uint8)
+            else:
+                raw = numpy.ascontiguousarray(raw).ravel().view(numpy.uint8)
+            len_raw = raw.size
+            dest_size = struct.unpack(">Q", raw[:8].tobytes())[0]
+            num_blocks = (dest_size + self.LZ4_BLOCK_SIZE - 1) // self.LZ4_BLOCK_SIZE
+            slot.data["len_raw"] = numpy.uint64(len_raw)
+            slot.data["num_blocks"] = numpy.uint32(num_blocks)
+            slot.data["dec_size"] = dest_size // self.dec_dtype.itemsize
+
+            buffers = slot.buffers
+            get_buffer(queue, buffers, "cmp", len_raw, numpy.uint8)
+            get_buffer(queue, buffers, "block_position", num_blocks, numpy.uint64)
+            get_buffer(queue, buffers, "nb_blocks", 1, numpy.uint32)
+            get_buffer(queue, buffers, "dec", slot.data["dec_size"], self.dec_dtype)
+            get_buffer(
+                queue,
+                buffers,
+                "host_dec",
+                slot.data["dec_size"],
+                self.dec_dtype,
+                pinned=True,
+            )
+            host_cmp = get_buffer(
+                queue, buffers, "host_cmp", len_raw, numpy.uint8, pinned=True
+            )
+            host_cmp = host_cmp[:len_raw]
+            host_cmp[...] = raw
+            evt = pyopencl.enqueue_copy(
+                queue, buffers["cmp"].data, host_cmp, is_blocking=False
+            )
+            add_event("copy raw H -> D", evt)
+            return evt
+
+        def decompress(queue, slot, wait_for):
+            buffers = slot.buffers
+            num_blocks = slot.data["num_blocks"]
+            evt = self.program.lz4_unblock(
+                queue,
+                (1,),
+                (1,),
+                buffers["cmp"].data,
+                slot.data["len_raw"],
+                buffers["block_position"].data,
+                num_blocks,
+                buffers["nb_blocks"].data,
+                wait_for=wait_for,
+            )
+            add_event("LZ4 unblock", evt)
+            evt = self.program.bslz4_decompress_block(
+                queue,
+                (int(num_blocks) * wg,),
+                (wg,),
+                buffers["cmp"].data,
+                buffers["dec"].data,
+                buffers["block_position"].data,
+                buffers["nb_blocks"].data,
+                numpy.uint8(self.dec_dtype.itemsize),
+            )
+            add_event("LZ4 decompress", evt)
+            return evt
+
+        def download(queue, slot, wait_for):
+            host_dec = slot.buffers["host_dec"][: slot.data["dec_size"]]
+            evt = pyopencl.enqueue_copy(
+                queue,
+                host_dec,
+                slot.buffers["dec"].data,
+                wait_for=wait_for,
+                is_blocking=False,
+            )
+            add_event("copy dec D -> H", evt)
+            return evt
+
+        def finish(slot):
+            return slot.buffers["host_dec"][: slot.data["dec_size"]].copy()
+
+        pipeline = StreamPipeline(
+            self.ctx, [upload, decompress, download], finish, depth, self.profile
+        )
+        return pipeline.process(iterable)
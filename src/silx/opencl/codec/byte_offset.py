@@ -34,7 +34,7 @@ __authors__ = ["Jérôme Kieffer"]
 __contact__ = "jerome.kieffer@esrf.eu"
 __license__ = "MIT"
 __copyright__ = "European Synchrotron Radiation Facility, Grenoble, France"
-__date__ = "11/10/2018"
+__date__ = "18/10/2026"
 __status__ = "production"
 
 
@@ -42,7 +42,13 @@ import functools
 import os
 import numpy
 from ..common import ocl, pyopencl
-from ..processing import BufferDescription, EventDescription, OpenclProcessing
+from ..processing import (
+    BufferDescription,
+    EventDescription,
+    OpenclProcessing,
+    StreamPipeline,
+    allocate_pinned_array,
+)
 
 import logging
 
@@ -178,128 +184,234 @@ class ByteOffset(OpenclProcessing):
         with self.sem:
             len_raw = numpy.int32(len(raw))
             if len_raw > self.padded_raw_size:
-                wg = self.block_size
                 self.raw_size = int(len(raw))
-                self.padded_raw_size = (self.raw_size + wg - 1) & ~(wg - 1)
+                self.padded_raw_size = self._get_padded_raw_size(self.raw_size)
                 logger.info("increase raw buffer size to %s", self.padded_raw_size)
                 buffers = {
-                    "raw": pyopencl.array.empty(
-                        self.queue, self.padded_raw_size, dtype=numpy.int8
+                    "raw": self._empty(self.queue, self.padded_raw_size, numpy.int8),
+                    "mask": self._empty(self.queue, self.padded_raw_size, numpy.int32),
+                    "exceptions": self._empty(
+                        self.queue, self.padded_raw_size, numpy.int32
                     ),
-                    "mask": pyopencl.array.empty(
-                        self.queue, self.padded_raw_size, dtype=numpy.int32
-                    ),
-                    "exceptions": pyopencl.array.empty(
-                        self.queue, self.padded_raw_size, dtype=numpy.int32
-                    ),
-                    "values": pyopencl.array.empty(
-                        self.queue, self.padded_raw_size, dtype=numpy.int32
+                    "values": self._empty(
+                        self.queue, self.padded_raw_size, numpy.int32
                     ),
                 }
                 self.cl_mem.update(buffers)
-            else:
-                wg = self.block_size
 
             evt = pyopencl.enqueue_copy(
                 self.queue, self.cl_mem["raw"].data, raw, is_blocking=False
             )
             events.append(EventDescription("copy raw H -> D", evt))
-            evt = self.kernels.fill_int_mem(
-                self.queue,
-                (self.padded_raw_size,),
-                (wg,),
-                self.cl_mem["mask"].data,
-                numpy.int32(self.padded_raw_size),
-                numpy.int32(0),
-                numpy.int32(0),
+            if out is None:
+                if as_float:
+                    out = self.cl_mem["data_float"]
+                else:
+                    out = self.cl_mem["data_int"]
+            events += self._enqueue_decode(
+                self.queue, self.cl_mem, len_raw, self.raw_size, out
             )
-            events.append(EventDescription("memset mask", evt))
-            evt = self.kernels.fill_int_mem(
-                self.queue,
-                (1,),
+            if self.profile:
+                self.events += events
+        return out
+
+    def _empty(self, queue, size, dtype):
+        """Allocate an array from the buffer pool of the context"""
+        return pyopencl.array.empty(queue, size, dtype, allocator=self.buffer_pool)
+
+    def _get_padded_raw_size(self, raw_size):
+        """Returns the size of the buffers for a raw stream of `raw_size`.
+
+        It is rounded up to the size class of the buffer pool, so that
+        slightly larger streams do not trigger a new allocation.
+        """
+        wg = self.block_size
+        padded_raw_size = self.buffer_pool.bin_size(raw_size)
+        return (padded_raw_size + wg - 1) & ~(wg - 1)
+
+    def _enqueue_decode(self, queue, buffers, len_raw, full_size, out, wait_for=None):
+        """Enqueue the decompression of a compressed stream already on device.
+
+        The number of exceptions is read back, so this call blocks until the
+        stream is analysed.
+
+        :param queue: OpenCL command queue to use
+        :param dict buffers: Device arrays "raw", "mask", "values",
+            "exceptions" and "counter"
+        :param numpy.int32 len_raw: Size of the compressed stream
+        :param int full_size: Size of the stream buffer which is reset
+        :param pyopencl.array out: Array in which to place the result
+        :param wait_for: Events to wait for before reading the stream
+        :return: List of EventDescription, the last one is the final one
+        """
+        wg = self.block_size
+        padded_raw_size = buffers["raw"].size
+        events = []
+        evt = self.kernels.fill_int_mem(
+            queue,
+            (padded_raw_size,),
+            (wg,),
+            buffers["mask"].data,
+            numpy.int32(padded_raw_size),
+            numpy.int32(0),
+            numpy.int32(0),
+        )
+        events.append(EventDescription("memset mask", evt))
+        evt = self.kernels.fill_int_mem(
+            queue,
+            (1,),
+            (1,),
+            buffers["counter"].data,
+            numpy.int32(1),
+            numpy.int32(0),
+            numpy.int32(0),
+        )
+        events.append(EventDescription("memset counter", evt))
+        evt = self.kernels.mark_exceptions(
+            queue,
+            (padded_raw_size,),
+            (wg,),
+            buffers["raw"].data,
+            len_raw,
+            numpy.int32(full_size),
+            buffers["mask"].data,
+            buffers["values"].data,
+            buffers["counter"].data,
+            buffers["exceptions"].data,
+            wait_for=wait_for,
+        )
+        events.append(EventDescription("mark exceptions", evt))
+        nb_exceptions = numpy.empty(1, dtype=numpy.int32)
+        evt = pyopencl.enqueue_copy(
+            queue,
+            nb_exceptions,
+            buffers["counter"].data,
+            is_blocking=False,
+        )
+        events.append(EventDescription("copy counter D -> H", evt))
+        evt.wait()
+        nbexc = int(nb_exceptions[0])
+        if nbexc == 0:
+            logger.info("nbexc %i", nbexc)
+        else:
+            evt = self.kernels.treat_exceptions(
+                queue,
+                (nbexc,),
                 (1,),
-                self.cl_mem["counter"].data,
-                numpy.int32(1),
-                numpy.int32(0),
-                numpy.int32(0),
-            )
-            events.append(EventDescription("memset counter", evt))
-            evt = self.kernels.mark_exceptions(
-                self.queue,
-                (self.padded_raw_size,),
-                (wg,),
-                self.cl_mem["raw"].data,
+                buffers["raw"].data,
                 len_raw,
-                numpy.int32(self.raw_size),
-                self.cl_mem["mask"].data,
-                self.cl_mem["values"].data,
-                self.cl_mem["counter"].data,
-                self.cl_mem["exceptions"].data,
+                buffers["mask"].data,
+                buffers["exceptions"].data,
+                buffers["values"].data,
             )
-            events.append(EventDescription("mark exceptions", evt))
-            nb_exceptions = numpy.empty(1, dtype=numpy.int32)
-            evt = pyopencl.enqueue_copy(
-                self.queue,
-                nb_exceptions,
-                self.cl_mem["counter"].data,
-                is_blocking=False,
-            )
-            events.append(EventDescription("copy counter D -> H", evt))
-            evt.wait()
-            nbexc = int(nb_exceptions[0])
-            if nbexc == 0:
-                logger.info("nbexc %i", nbexc)
+            events.append(EventDescription("treat_exceptions", evt))
+
+        evt = self.kernels.scan(
+            buffers["values"],
+            buffers["mask"],
+            queue=queue,
+            size=int(len_raw),
+            wait_for=(evt,),
+        )
+        events.append(EventDescription("double scan", evt))
+        if out.dtype == numpy.float32:
+            copy_results = self.kernels.copy_result_float
+        else:
+            copy_results = self.kernels.copy_result_int
+        evt = copy_results(
+            queue,
+            (padded_raw_size,),
+            (wg,),
+            buffers["values"].data,
+            buffers["mask"].data,
+            len_raw,
+            self.dec_size,
+            out.data,
+        )
+        events.append(EventDescription("copy_results", evt))
+        return events
+
+    def process_stream(self, iterable, as_float=False, depth=None):
+        """Decompress a stream of frames, overlapping the transfers with the
+        computation (see :class:`~silx.opencl.processing.StreamPipeline`).
+
+        :param iterable: Compressed frames as 1D numpy arrays of char
+        :param bool as_float: True to decompress as float32,
+                              False (default) to decompress as int32
+        :param Union[int,None] depth: Number of frames in flight
+        :return: Iterator over the decompressed images as numpy arrays
+        """
+        assert (
+            self.dec_size is not None
+        ), "dec_size is a mandatory ByteOffset init argument for decompression"
+        dtype = numpy.float32 if as_float else numpy.int32
+
+        def upload(queue, slot, wait_for):
+            raw = slot.frame
+            if isinstance(raw, (bytes, bytearray)):
+                raw = numpy.frombuffer(raw, dtype=numpy.int8)
             else:
-                evt = self.kernels.treat_exceptions(
-                    self.queue,
-                    (nbexc,),
-                    (1,),
-                    self.cl_mem["raw"].data,
-                    len_raw,
-                    self.cl_mem["mask"].data,
-                    self.cl_mem["exceptions"].data,
-                    self.cl_mem["values"].data,
+                raw = numpy.ascontiguousarray(raw).ravel().view(numpy.int8)
+            len_raw = raw.size
+            buffers = slot.buffers
+            if "raw" not in buffers or buffers["raw"].size < len_raw:
+                padded_raw_size = self._get_padded_raw_size(len_raw)
+                padded_raw_size = max(self.padded_raw_size, padded_raw_size)
+                buffers["raw"] = self._empty(queue, padded_raw_size, numpy.int8)
+                for name in ("mask", "values", "exceptions"):
+                    buffers[name] = self._empty(queue, padded_raw_size, numpy.int32)
+                buffers["host_raw"] = allocate_pinned_array(
+                    queue, padded_raw_size, numpy.int8
+                )
+            if "counter" not in buffers:
+                buffers["counter"] = self._empty(queue, 1, numpy.int32)
+                buffers["output"] = self._empty(queue, self.dec_size, dtype)
+                buffers["host_output"] = allocate_pinned_array(
+                    queue, self.dec_size, dtype
                 )
-                events.append(EventDescription("treat_exceptions", evt))
-
-            # self.cl_mem["copy_values"] = self.cl_mem["values"].copy()
-            # self.cl_mem["copy_mask"] = self.cl_mem["mask"].copy()
-            evt = self.kernels.scan(
-                self.cl_mem["values"],
-                self.cl_mem["mask"],
-                queue=self.queue,
-                size=int(len_raw),
-                wait_for=(evt,),
+            host_raw = buffers["host_raw"][:len_raw]
+            host_raw[...] = raw
+            slot.data["len_raw"] = numpy.int32(len_raw)
+            evt = pyopencl.enqueue_copy(
+                queue, buffers["raw"].data, host_raw, is_blocking=False
             )
-            events.append(EventDescription("double scan", evt))
-            # evt.wait()
-            if out is not None:
-                if out.dtype == numpy.float32:
-                    copy_results = self.kernels.copy_result_float
-                else:
-                    copy_results = self.kernels.copy_result_int
-            else:
-                if as_float:
-                    out = self.cl_mem["data_float"]
-                    copy_results = self.kernels.copy_result_float
-                else:
-                    out = self.cl_mem["data_int"]
-                    copy_results = self.kernels.copy_result_int
-            evt = copy_results(
-                self.queue,
-                (self.padded_raw_size,),
-                (wg,),
-                self.cl_mem["values"].data,
-                self.cl_mem["mask"].data,
-                len_raw,
-                self.dec_size,
-                out.data,
+            if self.profile:
+                self.events.append(EventDescription("copy raw H -> D", evt))
+            return evt
+
+        def decode(queue, slot, wait_for):
+            buffers = slot.buffers
+            events = self._enqueue_decode(
+                queue,
+                buffers,
+                slot.data["len_raw"],
+                buffers["raw"].size,
+                buffers["output"],
+                wait_for=wait_for,
             )
-            events.append(EventDescription("copy_results", evt))
-            # evt.wait()
             if self.profile:
                 self.events += events
-        return out
+            return events[-1].event
+
+        def download(queue, slot, wait_for):
+            evt = pyopencl.enqueue_copy(
+                queue,
+                slot.buffers["host_output"],
+                slot.buffers["output"].data,
+                wait_for=wait_for,
+                is_blocking=False,
+            )
+            if self.profile:
+                self.events.append(EventDescription("copy output D -> H", evt))
+            return evt
+
+        def finish(slot):
+            return slot.buffers["host_output"].copy()
+
+        pipeline = StreamPipeline(
+            self.ctx, [upload, decode, download], finish, depth, self.profile
+        )
+        return pipeline.process(iterable)
 
     __call__ = decode
 
@@ -414,8 +526,8 @@ class ByteOffset(OpenclProcessing):
                     logger.info("increase data input buffer size to %s", data.size)
                     self.cl_mem.update(
                         {
-                            "data_input": pyopencl.array.empty(
-                                self.queue, data.size, dtype=numpy.int32
+                            "data_input": self._empty(
+                                self.queue, data.size, numpy.int32
                             )
                         }
                     )
@@ -435,8 +547,8 @@ class ByteOffset(OpenclProcessing):
                 logger.info("increase compressed buffer size to %s", compressed_size)
                 self.cl_mem.update(
                     {
-                        "compressed": pyopencl.array.empty(
-                            self.queue, compressed_size, dtype=numpy.int8
+                        "compressed": self._empty(
+                            self.queue, compressed_size, numpy.int8
                         )
                     }
                 )
@@ -124,3 +124,16 @@ class TestBitshuffleLz4:
 
         res = bs.decompress(array).get()
         assert numpy.array_equal(res, ref.ravel()), "Checks decompression works"
+
+    @pytest.mark.parametrize("dtype", ["uint32", "int16"])
+    def test_process_stream(self, dtype):
+        """Test the decompression of a stream of chunks of various sizes"""
+        data = [
+            self._create_test_data(shape=shape, dtype=dtype)
+            for shape in ((101, 103), (211, 223), (11, 13), (101, 103))
+        ]
+        bs = BitshuffleLz4(0, 1, dtype=dtype)
+        results = list(bs.process_stream(raw for _, raw in data))
+        assert len(results) == len(data)
+        for (ref, _), res in zip(data, results):
+            assert numpy.array_equal(res, ref.ravel()), "Checks decompression works"
@@ -34,7 +34,7 @@ __authors__ = ["Jérôme Kieffer"]
 __contact__ = "jerome.kieffer@esrf.eu"
 __license__ = "MIT"
 __copyright__ = "2013 European Synchrotron Radiation Facility, Grenoble, France"
-__date__ = "02/03/2021"
+__date__ = "18/10/2026"
 
 import sys
 import time
@@ -163,6 +163,37 @@ class TestByteOffset(unittest.TestCase):
             )
         bo.log_profile(stats=True)
 
+    def test_process_stream(self):
+        """
+        tests the byte offset decompression of a stream of images
+        """
+        shape = (91, 97)
+        size = numpy.prod(shape)
+        data = [
+            self._create_test_data(shape=shape, nexcept=nexcept)
+            for nexcept in (0, 229, 10, 1000, 3)
+        ]
+        try:
+            bo = byte_offset.ByteOffset(dec_size=size)
+        except (RuntimeError, pyopencl.RuntimeError) as err:
+            logger.warning(err)
+            if sys.platform == "darwin":
+                raise unittest.SkipTest(
+                    "Byte-offset decompression is known to be buggy on MacOS-CPU"
+                )
+            else:
+                raise err
+        results = list(bo.process_stream(raw for _, raw in data))
+        self.assertEqual(len(results), len(data))
+        for (ref, _), result in zip(data, results):
+            self.assertEqual(result.dtype, numpy.int32)
+            self.assertEqual(abs(ref.ravel() - result).max(), 0)
+
+        results = bo.process_stream([raw for _, raw in data], as_float=True, depth=1)
+        for (ref, _), result in zip(data, results):
+            self.assertEqual(result.dtype, numpy.float32)
+            self.assertEqual(abs(ref.ravel() - result).max(), 0)
+
     def test_encode(self):
         """Test byte offset compression"""
         ref, raw = self._create_test_data(shape=(2713, 2719), nexcept=2729)
@@ -33,11 +33,13 @@ __author__ = "Jerome Kieffer"
 __contact__ = "Jerome.Kieffer@ESRF.eu"
 __license__ = "MIT"
 __copyright__ = "2012-2017 European Synchrotron Radiation Facility, Grenoble, France"
-__date__ = "22/03/2024"
+__date__ = "18/10/2026"
 __status__ = "stable"
 
 import os
 import logging
+import threading
+import weakref
 import numpy
 from .utils import get_opencl_code
 
@@ -67,6 +69,7 @@ else:
 
 if pyopencl is not None:
     import pyopencl.array as array
+    import pyopencl.tools
 
     mf = pyopencl.mem_flags
 else:
@@ -682,6 +685,151 @@ def __getattr__(name):
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
+class BufferPool(object):
+    """Pool of device memory shared by all the users of an OpenCL context.
+
+    Requested sizes are rounded up to size classes (bins). Released blocks are
+    kept by the pool and reused for following requests of the same class,
+    instead of being returned to the driver.
+
+    Buffers provided by the pool are released to the pool with their
+    `release` method or when they are garbage collected. The pool can also be
+    used as the `allocator` of :mod:`pyopencl.array` functions.
+
+    :param ctx: OpenCL context
+    :param Union[int,None] high_water_mark: Maximum number of bytes managed by
+        the pool. Above, the blocks kept for reuse are released.
+        None (default) for no limit.
+    """
+
+    def __init__(self, ctx, high_water_mark=None):
+        self.ctx = ctx
+        self.high_water_mark = high_water_mark
+        self._lock = threading.Lock()
+        # Allocate immediately to get memory errors at allocation time
+        allocator = pyopencl.tools.ImmediateAllocator(pyopencl.CommandQueue(ctx))
+        self._pool = pyopencl.tools.MemoryPool(allocator)
+        self._allocations = 0
+        self._requested_bytes = 0
+        self._peak_bytes = 0
+        self._trims = 0
+
+    def bin_size(self, size):
+        """Returns the number of bytes actually reserved for a request.
+
+        :param int size: Requested number of bytes
+        :rtype: int
+        """
+        return int(self._pool.alloc_size(self._pool.bin_number(max(1, int(size)))))
+
+    def allocate(self, size):
+        """Allocate a buffer from the pool.
+
+        :param int size: Number of bytes
+        :rtype: pyopencl.tools.PooledBuffer
+        """
+        size = max(1, int(size))
+        buffer = self._pool.allocate(size)
+        with self._lock:
+            self._allocations += 1
+            self._requested_bytes += size
+            managed_bytes = self.managed_bytes
+            if managed_bytes is not None:
+                self._peak_bytes = max(self._peak_bytes, managed_bytes)
+                if (
+                    self.high_water_mark is not None
+                    and managed_bytes > self.high_water_mark
+                ):
+                    self._trim()
+        return buffer
+
+    __call__ = allocate
+
+    def _trim(self):
+        self._pool.free_held()
+        self._trims += 1
+
+    def trim(self):
+        """Release the blocks kept for reuse to the driver"""
+        with self._lock:
+            self._trim()
+
+    @property
+    def managed_bytes(self):
+        """Number of bytes managed by the pool, in use or kept for reuse.
+
+        None if not provided by this version of pyopencl.
+        """
+        return getattr(self._pool, "managed_bytes", None)
+
+    @property
+    def active_bytes(self):
+        """Number of bytes in use, None if not provided by this version of
+        pyopencl.
+        """
+        return getattr(self._pool, "active_bytes", None)
+
+    def get_stats(self):
+        """Returns the usage statistics of the pool.
+
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                "allocations": self._allocations,
+                "requested_bytes": self._requested_bytes,
+                "active_blocks": self._pool.active_blocks,
+                "held_blocks": self._pool.held_blocks,
+                "active_bytes": self.active_bytes,
+                "managed_bytes": self.managed_bytes,
+                "peak_bytes": self._peak_bytes,
+                "high_water_mark": self.high_water_mark,
+                "trims": self._trims,
+            }
+
+
+# key: context pointer, value: BufferPool.
+# Pools are referenced by their users: they are released with their blocks and
+# their context once the last user goes away.
+_buffer_pools = weakref.WeakValueDictionary()
+_buffer_pools_lock = threading.Lock()
+
+
+def get_buffer_pool(ctx):
+    """Returns the buffer pool shared by all the users of an OpenCL context.
+
+    The pool is only referenced weakly: the caller must keep a reference to it
+    as long as it is used.
+
+    :param ctx: OpenCL context
+    :rtype: BufferPool
+    """
+    with _buffer_pools_lock:
+        # The pool keeps a reference to the context: the pointer can't be
+        # reused by another context as long as the entry exists
+        pool = _buffer_pools.get(ctx.int_ptr)
+        if pool is None:
+            pool = _buffer_pools[ctx.int_ptr] = BufferPool(ctx)
+        return pool
+
+
+def trim_buffer_pools():
+    """Release the blocks kept for reuse by all the buffer pools"""
+    with _buffer_pools_lock:
+        pools = list(_buffer_pools.values())
+    for pool in pools:
+        pool.trim()
+
+
+def _is_poolable(flags):
+    """True if a buffer created with these memory flags can come from a
+    :class:`BufferPool`"""
+    if not flags:
+        return True
+    access_flags = mf.READ_WRITE | mf.READ_ONLY | mf.WRITE_ONLY
+    return (int(flags) & ~int(access_flags)) == 0
+
+
 def release_cl_buffers(cl_buffers):
     """
     :param cl_buffers: the buffer you want to release
@@ -705,12 +853,16 @@ def release_cl_buffers(cl_buffers):
     return cl_buffers
 
 
-def allocate_cl_buffers(buffers, device=None, context=None):
+def allocate_cl_buffers(buffers, device=None, context=None, pool=None):
     """
     :param buffers: the buffers info use to create the pyopencl.Buffer
     :type buffers: list(std, flag, numpy.dtype, int)
     :param device: one of the context device
     :param context: opencl contextdevice
+    :param Union[BufferPool,None] pool: the pool of the context from which
+        buffers without host memory flags are taken (e.g.,
+        `OpenclProcessing.buffer_pool`). The caller keeps it alive to reuse
+        buffers across calls. Default: no pool
     :return: a dict containing the instanciated pyopencl.Buffer
     :rtype: dict(str, pyopencl.Buffer)
 
@@ -738,9 +890,11 @@ def allocate_cl_buffers(buffers, device=None, context=None):
     # do the allocation
     try:
         for name, flag, dtype, size in buffers:
-            mem[name] = pyopencl.Buffer(
-                context, flag, numpy.dtype(dtype).itemsize * size
-            )
+            nbytes = numpy.dtype(dtype).itemsize * size
+            if pool is not None and _is_poolable(flag):
+                mem[name] = pool.allocate(nbytes)
+            else:
+                mem[name] = pyopencl.Buffer(context, flag, nbytes)
     except pyopencl.MemoryError as error:
         release_cl_buffers(mem)
         raise MemoryError(error)
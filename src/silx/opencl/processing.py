@@ -37,20 +37,26 @@ __author__ = "Jerome Kieffer"
 __contact__ = "Jerome.Kieffer@ESRF.eu"
 __license__ = "MIT"
 __copyright__ = "European Synchrotron Radiation Facility, Grenoble, France"
-__date__ = "09/11/2022"
+__date__ = "18/10/2026"
 __status__ = "stable"
 
 import sys
 import os
 import logging
 import gc
-from collections import namedtuple
+import glob
+import hashlib
+import tempfile
+from collections import namedtuple, deque
 import numpy
 import threading
+import weakref
 from .common import (
     ocl,
     pyopencl,
     release_cl_buffers,
+    get_buffer_pool,
+    _is_poolable,
     query_kernel_info,
     allocate_texture,
     check_textures_availability,
@@ -67,6 +73,353 @@ ProfileDescription = namedtuple("ProfileDescription", ["name", "start", "stop"])
 logger = logging.getLogger(__name__)
 
 
+def _get_default_cache_dir():
+    """Returns the directory used to store the program binaries.
+
+    It can be set with the `SILX_OPENCL_CACHE_DIR` environment variable,
+    an empty value or "0" disables the on-disk cache.
+
+    :rtype: Union[str,None]
+    """
+    cache_dir = os.environ.get("SILX_OPENCL_CACHE_DIR")
+    if cache_dir is not None:
+        if cache_dir.strip().lower() in ("", "0", "false", "no", "off"):
+            return None
+        return cache_dir
+    base_dir = os.environ.get("XDG_CACHE_HOME")
+    if not base_dir:
+        base_dir = os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base_dir, "silx", "opencl")
+
+
+class ProgramCache(object):
+    """Cache of the OpenCL programs built by
+    :meth:`OpenclProcessing.compile_kernels`.
+
+    Built programs are shared in memory by all the processing objects using
+    the same context, source code and compilation options. Programs are only
+    referenced weakly: they are dropped from memory, together with their
+    context, once no processing object uses them anymore.
+    Program binaries are also stored on disk, so that following sessions skip
+    the compilation. They are keyed on the platform, the device, its driver
+    version, the source code and the compilation options.
+
+    :param Union[str,None] cache_dir: Directory where binaries are stored,
+        None to disable the on-disk cache
+    """
+
+    def __init__(self, cache_dir=None):
+        self._lock = threading.RLock()
+        self._programs = weakref.WeakValueDictionary()
+        self.cache_dir = cache_dir
+        self.stats = {"memory": 0, "disk": 0, "build": 0}
+        """Number of programs retrieved from memory, from disk or built"""
+
+    def __len__(self):
+        with self._lock:
+            return len(self._programs)
+
+    @staticmethod
+    def _normalize_options(options):
+        if options is None:
+            return ""
+        if isinstance(options, str):
+            return options
+        return " ".join(str(i) for i in options)
+
+    @staticmethod
+    def _get_binary_key(ctx, source, options):
+        """Returns the key of a program binary, None if it can't be stored."""
+        if len(ctx.devices) != 1:
+            return None
+        device = ctx.devices[0]
+        key = hashlib.sha256()
+        for info in (
+            device.platform.name,
+            device.platform.version,
+            device.name,
+            device.version,
+            device.driver_version,
+            pyopencl.VERSION_TEXT,
+            options,
+        ):
+            key.update(info.strip().encode("utf-8", "replace"))
+            key.update(b"\0")
+        key.update(source.encode("utf-8"))
+        return key.hexdigest()
+
+    def _load_binary(self, ctx, binary_key, options):
+        """Returns a program built from a binary stored on disk, else None."""
+        filename = os.path.join(self.cache_dir, binary_key + ".bin")
+        if not os.path.exists(filename):
+            return None
+        try:
+            with open(filename, "rb") as f:
+                binary = f.read()
+            program = pyopencl.Program(ctx, ctx.devices, [binary])
+            return program.build(options=options)
+        except (OSError, pyopencl.Error) as error:
+            logger.warning("Cached binary %s can't be used: %s", filename, error)
+            logger.debug("Backtrace", exc_info=True)
+            return None
+
+    def _save_binary(self, program, binary_key):
+        """Store the binary of a program on disk."""
+        try:
+            binaries = program.get_info(pyopencl.program_info.BINARIES)
+        except pyopencl.Error:
+            logger.debug("Backtrace", exc_info=True)
+            return
+        if len(binaries) != 1 or not binaries[0]:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write into a temporary file first for concurrent processes
+            fd, tmp_filename = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(bytes(binaries[0]))
+            os.replace(tmp_filename, os.path.join(self.cache_dir, binary_key + ".bin"))
+        except OSError as error:
+            logger.warning("Program binary can't be cached: %s", error)
+            logger.debug("Backtrace", exc_info=True)
+
+    def get_program(self, ctx, source, options=None):
+        """Returns a built program, compiling it only if not cached.
+
+        :param ctx: OpenCL context
+        :param str source: Source code of the program
+        :param options: Compilation options as a string or a list of strings
+        :rtype: pyopencl.Program
+        """
+        options = self._normalize_options(options)
+        source_key = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        key = ctx.int_ptr, source_key, options
+        with self._lock:
+            program = self._programs.get(key)
+            if program is not None:
+                self.stats["memory"] += 1
+                return program
+
+            program = None
+            binary_key = None
+            if self.cache_dir is not None:
+                binary_key = self._get_binary_key(ctx, source, options)
+            if binary_key is not None:
+                program = self._load_binary(ctx, binary_key, options)
+            if program is not None:
+                self.stats["disk"] += 1
+            else:
+                program = pyopencl.Program(ctx, source).build(options=options)
+                self.stats["build"] += 1
+                if binary_key is not None:
+                    self._save_binary(program, binary_key)
+
+            # The program keeps a reference to the context: the pointer can't
+            # be reused by another context as long as the entry exists
+            self._programs[key] = program
+            return program
+
+    def clear(self, disk=False):
+        """Remove the programs kept in memory.
+
+        :param bool disk: True to also remove the binaries stored on disk
+        """
+        with self._lock:
+            self._programs.clear()
+            if disk and self.cache_dir is not None:
+                for filename in glob.glob(os.path.join(self.cache_dir, "*.bin")):
+                    try:
+                        os.remove(filename)
+                    except OSError:
+                        logger.debug("Backtrace", exc_info=True)
+
+
+program_cache = ProgramCache(cache_dir=_get_default_cache_dir())
+"""Process-wide cache used by :meth:`OpenclProcessing.compile_kernels`"""
+
+
+def clear_program_cache(disk=False):
+    """Remove the programs cached by :meth:`OpenclProcessing.compile_kernels`.
+
+    :param bool disk: True to also remove the binaries stored on disk
+    """
+    program_cache.clear(disk=disk)
+
+
+def allocate_pinned_array(queue, shape, dtype):
+    """Allocate a host array in page-locked memory.
+
+    Transfers between such arrays and the device are performed by DMA and
+    do not block the host, which allows them to overlap with computation.
+
+    :param queue: OpenCL command queue used to map the memory
+    :param shape: Shape of the array
+    :param dtype: Data type of the array
+    :rtype: numpy.ndarray
+    """
+    dtype = numpy.dtype(dtype)
+    size = int(numpy.prod(shape)) * dtype.itemsize
+    flags = pyopencl.mem_flags.READ_WRITE | pyopencl.mem_flags.ALLOC_HOST_PTR
+    buffer = pyopencl.Buffer(queue.context, flags, max(1, size))
+    # The mapped array keeps a reference to the buffer
+    array, _event = pyopencl.enqueue_map_buffer(
+        queue,
+        buffer,
+        pyopencl.map_flags.READ | pyopencl.map_flags.WRITE,
+        0,
+        shape,
+        dtype,
+        is_blocking=True,
+    )
+    return array
+
+
+class PipelineSlot(object):
+    """Resources used by a frame going through a :class:`StreamPipeline`.
+
+    Slots are recycled: `buffers` is kept from one frame to the next and can
+    store the device and pinned host buffers of the slot.
+    """
+
+    def __init__(self, index):
+        self.index = index
+        self.buffers = {}
+        """Buffers of the slot, kept from one frame to the next"""
+        self.data = {}
+        """Data of the current frame, shared by the stages"""
+        self.frame = None
+        """Current frame, as provided by the input stream"""
+        self.position = None
+        """Position of the current frame in the stream"""
+        self.stage = 0
+        """Index of the next stage to run"""
+        self.wait_for = []
+        """Events of the last stage run"""
+
+    def reset(self, position, frame):
+        self.position = position
+        self.frame = frame
+        self.data = {}
+        self.stage = 0
+        self.wait_for = []
+
+
+class StreamPipeline(object):
+    """Process a stream of frames through a chain of stages, overlapping
+    host/device transfers and computation.
+
+    Each stage has its own command queue and stages are chained with events,
+    so that with the default depth the upload of frame N+1, the computation
+    of frame N and the download of frame N-1 run concurrently.
+
+    Each stage is a callable `stage(queue, slot, wait_for)` which enqueues its
+    work on `queue` once the events of `wait_for` are completed, and returns
+    an event, a list of events or None. The frame to process is available
+    as `slot.frame`, and `slot.buffers` holds the per-slot buffers, which
+    are reused every `depth` frames.
+
+    Once the events of the last stage are completed, `finish(slot)` is
+    called on the host and its result is yielded by :meth:`process`.
+    It must not return data stored in the buffers of the slot without
+    copying it.
+
+    .. code-block:: python
+
+        pipeline = StreamPipeline(ctx, [upload, compute, download], finish)
+        for result in pipeline.process(frames):
+            ...
+
+    :param ctx: OpenCL context
+    :param List[callable] stages: Stages run in order on each frame
+    :param Union[callable,None] finish: Callable returning the result of a
+        slot, default to the frame itself
+    :param Union[int,None] depth: Number of frames in flight, default to the
+        number of stages
+    :param bool profile: Enable profiling on the command queues
+    """
+
+    def __init__(self, ctx, stages, finish=None, depth=None, profile=False):
+        self.stages = list(stages)
+        if not self.stages:
+            raise ValueError("At least one stage is expected")
+        self.finish = finish
+        if depth is None:
+            depth = len(self.stages)
+        if profile:
+            properties = pyopencl.command_queue_properties.PROFILING_ENABLE
+        else:
+            properties = None
+        self.queues = [
+            pyopencl.CommandQueue(ctx, properties=properties) for _ in self.stages
+        ]
+        self.slots = [PipelineSlot(i) for i in range(max(1, int(depth)))]
+
+    def _run_stage(self, slot):
+        index = slot.stage
+        events = self.stages[index](self.queues[index], slot, slot.wait_for)
+        if events is None:
+            events = []
+        elif not isinstance(events, (list, tuple)):
+            events = [events]
+        slot.wait_for = list(events)
+        slot.stage += 1
+
+    def _finish(self, slot):
+        if slot.wait_for:
+            pyopencl.wait_for_events(slot.wait_for)
+        if self.finish is None:
+            return slot.frame
+        return self.finish(slot)
+
+    def process(self, iterable):
+        """Process the frames of `iterable`.
+
+        :param iterable: Stream of frames
+        :return: Iterator over the results, in the order of the stream
+        """
+        nb_stages = len(self.stages)
+        free_slots = deque(self.slots)
+        in_flight = deque()
+        frames = enumerate(iterable)
+        exhausted = False
+        try:
+            while in_flight or not exhausted:
+                new_slot = None
+                if free_slots and not exhausted:
+                    try:
+                        position, frame = next(frames)
+                    except StopIteration:
+                        exhausted = True
+                    else:
+                        new_slot = free_slots.popleft()
+                        new_slot.reset(position, frame)
+                        # Enqueue the upload before a stage which may block
+                        self._run_stage(new_slot)
+                        in_flight.append(new_slot)
+
+                for slot in in_flight:
+                    if slot is not new_slot and slot.stage < nb_stages:
+                        self._run_stage(slot)
+
+                if not in_flight:
+                    continue
+                oldest = in_flight[0]
+                if oldest.stage == nb_stages and (exhausted or not free_slots):
+                    in_flight.popleft()
+                    result = self._finish(oldest)
+                    oldest.reset(None, None)
+                    free_slots.append(oldest)
+                    yield result
+        finally:
+            # Do not release buffers which are still in use
+            for slot in in_flight:
+                if slot.wait_for:
+                    pyopencl.wait_for_events(slot.wait_for)
+                slot.reset(None, None)
+            for queue in self.queues:
+                queue.finish()
+
+
 class KernelContainer(object):
     """Those object holds a copy of all kernels accessible as attributes"""
 
@@ -173,6 +526,7 @@ class OpenclProcessing(object):
         platform = ocl.get_platform(platform_name)
         self.device = platform.get_device(device_name)
         self.cl_kernel_args = {}  # dict with all kernel arguments
+        self.buffer_pool = get_buffer_pool(self.ctx)  # shared by the context
 
         self.set_profiling(profile)
         self.block_size = block_size
@@ -187,9 +541,10 @@ class OpenclProcessing(object):
         try:
             self.reset_log()
             self.free_kernels()
-            self.free_buffers()
             if self.queue is not None:
+                # Buffers are reused by the pool once released
                 self.queue.finish()
+            self.free_buffers()
         except Exception as err:
             logger.warning("%s: %s", type(err), err)
         self.queue = None
@@ -206,6 +561,10 @@ class OpenclProcessing(object):
         :param use_array: allocate memory as pyopencl.array.Array
                             instead of pyopencl.Buffer
 
+        Buffers without host memory flags are taken from the
+        :class:`~silx.opencl.common.BufferPool` of the context, so that their
+        memory is reused once released.
+
         Note that an OpenCL context also requires some memory, as well
         as Event and other OpenCL functionalities which cannot and are
         not taken into account here.  The memory required by a context
@@ -244,12 +603,17 @@ class OpenclProcessing(object):
                 if use_array:
                     for buf in buffers:
                         mem[buf.name] = pyopencl.array.empty(
-                            self.queue, buf.size, buf.dtype
+                            self.queue, buf.size, buf.dtype, allocator=self.buffer_pool
                         )
                 else:
                     for buf in buffers:
                         size = numpy.dtype(buf.dtype).itemsize * numpy.prod(buf.size)
-                        mem[buf.name] = pyopencl.Buffer(self.ctx, buf.flags, int(size))
+                        if _is_poolable(buf.flags):
+                            mem[buf.name] = self.buffer_pool.allocate(int(size))
+                        else:
+                            mem[buf.name] = pyopencl.Buffer(
+                                self.ctx, buf.flags, int(size)
+                            )
             except pyopencl.MemoryError as error:
                 release_cl_buffers(mem)
                 raise MemoryError(error)
@@ -289,12 +653,17 @@ class OpenclProcessing(object):
                             logger.error("Error while freeing buffer %s", key)
                     self.cl_mem[key] = None
 
-    def compile_kernels(self, kernel_files=None, compile_options=None):
+    def compile_kernels(self, kernel_files=None, compile_options=None, cached=True):
         """Call the OpenCL compiler
 
+        Programs are retrieved from :data:`program_cache` when possible, so
+        that objects sharing the same context share the same program and the
+        compilation is skipped in following sessions.
+
         :param kernel_files: list of path to the kernel
             (by default use the one declared in the class)
         :param compile_options: string of compile options
+        :param bool cached: False to bypass the program cache
         """
         # concatenate all needed source files into a single openCL module
         kernel_files = kernel_files or self.kernel_files
@@ -303,9 +672,14 @@ class OpenclProcessing(object):
         compile_options = compile_options or self.get_compiler_options()
         logger.info("Compiling file %s with options %s", kernel_files, compile_options)
         try:
-            self.program = pyopencl.Program(self.ctx, kernel_src).build(
-                options=compile_options
-            )
+            if cached:
+                self.program = program_cache.get_program(
+                    self.ctx, kernel_src, compile_options
+                )
+            else:
+                self.program = pyopencl.Program(self.ctx, kernel_src).build(
+                    options=compile_options
+                )
         except (pyopencl.MemoryError, pyopencl.LogicError) as error:
             raise MemoryError(error)
         else:
@@ -30,7 +30,7 @@ large data where numpy is not very efficient.
 
 __author__ = "Jerome Kieffer"
 __license__ = "MIT"
-__date__ = "19/05/2021"
+__date__ = "18/10/2026"
 __copyright__ = "2012-2019, ESRF, Grenoble"
 __contact__ = "jerome.kieffer@esrf.fr"
 
@@ -40,7 +40,13 @@ from collections import namedtuple
 from math import sqrt
 
 from .common import pyopencl
-from .processing import EventDescription, OpenclProcessing, BufferDescription
+from .processing import (
+    EventDescription,
+    OpenclProcessing,
+    BufferDescription,
+    StreamPipeline,
+    allocate_pinned_array,
+)
 from .utils import concatenate_cl_kernel
 
 if pyopencl:
@@ -238,20 +244,9 @@ class Statistics(OpenclProcessing):
         size = data.size
         assert size <= self.size, "size is OK"
         events = []
-        if comp is True:
-            comp = "comp"
-        elif comp is False:
-            comp = "single"
-        else:
-            comp = comp.lower()
+        comp, reduction = self._get_reduction(comp)
         with self.sem:
             self.send_buffer(data, "converted")
-            if comp in ("single", "fp32", "float32"):
-                reduction = self.reduction_simple
-            elif comp in ("double", "fp64", "float64"):
-                reduction = self.reduction_double
-            else:
-                reduction = self.reduction_comp
             res_d, evt = reduction(
                 self.cl_mem["converted"][: self.size],
                 queue=self.queue,
@@ -261,6 +256,29 @@ class Statistics(OpenclProcessing):
             if self.profile:
                 self.events += events
             res_h = res_d.get()
+        return self._to_results(res_h)
+
+    __call__ = process
+
+    def _get_reduction(self, comp):
+        """Returns the name and the reduction kernel of a precision mode"""
+        if comp is True:
+            comp = "comp"
+        elif comp is False:
+            comp = "single"
+        else:
+            comp = comp.lower()
+        if comp in ("single", "fp32", "float32"):
+            reduction = self.reduction_simple
+        elif comp in ("double", "fp64", "float64"):
+            reduction = self.reduction_double
+        else:
+            reduction = self.reduction_comp
+        return comp, reduction
+
+    @staticmethod
+    def _to_results(res_h):
+        """Convert the result of the reduction to StatResults"""
         min_ = 1.0 * res_h["s0"]
         max_ = 1.0 * res_h["s1"]
         count = 1.0 * res_h["s2"] + res_h["s3"]
@@ -270,4 +288,91 @@ class Statistics(OpenclProcessing):
         res = StatResults(min_, max_, count, sum_, sum_ / count, var, sqrt(var))
         return res
 
-    __call__ = process
+    def process_stream(self, iterable, comp=True, depth=None):
+        """Calculate the statistics on a stream of frames, overlapping the
+        transfers with the computation
+        (see :class:`~silx.opencl.processing.StreamPipeline`).
+
+        :param iterable: Stream of numpy arrays
+        :param comp: use Kahan compensated arithmetics for the calculation
+        :param Union[int,None] depth: Number of frames in flight
+        :return: Iterator over the Statistics named tuples
+        """
+        comp, reduction = self._get_reduction(comp)
+
+        def upload(queue, slot, wait_for):
+            data = numpy.asarray(slot.frame).ravel()
+            size = data.size
+            assert size <= self.size, "size is OK"
+            buffers = slot.buffers
+            if not buffers:
+                # Enough room for 32 bits data
+                buffers["host"] = allocate_pinned_array(
+                    queue, 4 * self.size, numpy.uint8
+                )
+                buffers["raw"] = pyopencl.array.empty(queue, self.size, numpy.float32)
+                buffers["converted"] = pyopencl.array.empty(
+                    queue, self.size, numpy.float32
+                )
+            cast = self.mapping.get(data.dtype.type)
+            if cast is None:
+                data = data.astype(numpy.float32, copy=False)
+                dest = buffers["converted"]
+            else:
+                dest = buffers["raw"]
+            host = buffers["host"][: data.nbytes].view(data.dtype)
+            host[...] = data
+            slot.data["size"] = size
+            slot.data["cast"] = cast
+            evt = pyopencl.enqueue_copy(queue, dest.data, host, is_blocking=False)
+            if self.profile:
+                self.events.append(EventDescription("copy H->D", evt))
+            return evt
+
+        def compute(queue, slot, wait_for):
+            buffers = slot.buffers
+            size = slot.data["size"]
+            if slot.data["cast"] is not None:
+                kernel = getattr(self.program, slot.data["cast"])
+                evt = kernel(
+                    queue,
+                    (size,),
+                    None,
+                    buffers["raw"].data,
+                    buffers["converted"].data,
+                    wait_for=wait_for,
+                )
+                if self.profile:
+                    self.events.append(EventDescription("cast to float", evt))
+                wait_for = [evt]
+            res_d, evt = reduction(
+                buffers["converted"][:size],
+                queue=queue,
+                wait_for=wait_for,
+                return_event=True,
+            )
+            if self.profile:
+                self.events.append(
+                    EventDescription(f"statistical reduction {comp}", evt)
+                )
+            slot.data["result"] = res_d
+            return evt
+
+        def download(queue, slot, wait_for):
+            res_h = numpy.empty(1, dtype=float8)
+            slot.data["host_result"] = res_h
+            return pyopencl.enqueue_copy(
+                queue,
+                res_h,
+                slot.data["result"].data,
+                wait_for=wait_for,
+                is_blocking=False,
+            )
+
+        def finish(slot):
+            return self._to_results(slot.data["host_result"][0])
+
+        pipeline = StreamPipeline(
+            self.ctx, [upload, compute, download], finish, depth, self.profile
+        )
+        return pipeline.process(iterable)
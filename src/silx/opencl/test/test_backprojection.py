@@ -27,7 +27,7 @@
 __authors__ = ["Pierre paleo"]
 __license__ = "MIT"
 __copyright__ = "2013-2017 European Synchrotron Radiation Facility, Grenoble, France"
-__date__ = "19/01/2018"
+__date__ = "18/10/2026"
 
 
 import time
@@ -215,3 +215,34 @@ class TestFBP(unittest.TestCase):
         self.assertLess(
             errmax, 1.0e-1, "Something wrong with FBP on odd-sized sinogram"
         )
+
+    @unittest.skipUnless(ocl and mako, "pyopencl is missing")
+    def test_fbp_stack(self):
+        """
+        Test the reconstruction of a stack of sinograms
+        """
+        sinos = np.stack([self.sino, 2 * self.sino, self.sino[::-1]])
+        ref = np.stack([self.fbp.filtered_backprojection(sino) for sino in sinos])
+        # The stack is always backprojected without textures
+        rtol = 1e-2 if self.fbp._use_textures else 1e-4
+        tol = rtol * abs(ref).max()
+
+        res = self.fbp.backprojection_stack(sinos, batch_size=2)
+        self.assertEqual(res.shape, ref.shape)
+        self.assertLess(np.max(np.abs(res - ref)), tol)
+        self.assertEqual(self.fbp.stack_stats["slices"], len(sinos))
+        self.assertGreater(self.fbp.stack_stats["slices_per_second"], 0)
+
+        # Iterator input, caller-provided output
+        output = np.zeros_like(ref)
+        res = self.fbp.backprojection_stack(iter(sinos), output=output)
+        self.assertIs(res, output)
+        self.assertLess(np.max(np.abs(output - ref)), tol)
+
+        # Without filtering
+        ref = np.stack([self.fbp.backprojection(sino) for sino in sinos])
+        res = self.fbp.backprojection_stack(sinos, batch_size=3, filtered=False)
+        self.assertLess(np.max(np.abs(res - ref)), rtol * abs(ref).max())
+
+        with self.assertRaises(ValueError):
+            self.fbp.backprojection_stack(sinos[:, :10])
@@ -0,0 +1,261 @@
+#!/usr/bin/env python
+#
+#    Project: Sift implementation in Python + OpenCL
+#             https://github.com/silx-kit/silx
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+
+"""
+Test of the caches and streaming utilities of OpenclProcessing
+"""
+__license__ = "MIT"
+__copyright__ = "2026 European Synchrotron Radiation Facility, Grenoble, France"
+__date__ = "18/10/2026"
+
+import gc
+import os
+import shutil
+import tempfile
+import unittest
+import weakref
+
+import numpy
+
+from ..common import (
+    ocl,
+    BufferPool,
+    allocate_cl_buffers,
+    get_buffer_pool,
+    release_cl_buffers,
+)
+
+if ocl:
+    import pyopencl
+    import pyopencl.array
+    import pyopencl.tools
+    from ..processing import (
+        OpenclProcessing,
+        ProgramCache,
+        StreamPipeline,
+        allocate_pinned_array,
+    )
+from ..utils import get_opencl_code
+
+
+@unittest.skipUnless(ocl, "PyOpenCl is missing")
+class TestProgramCache(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.ctx = ocl.create_context()
+        self.source = get_opencl_code("addition")
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        self.ctx = None
+
+    def test_memory(self):
+        cache = ProgramCache(cache_dir=None)
+        program1 = cache.get_program(self.ctx, self.source)
+        program2 = cache.get_program(self.ctx, self.source)
+        self.assertIs(program1, program2)
+        program3 = cache.get_program(self.ctx, self.source, "-D DUMMY=1")
+        self.assertIsNot(program1, program3)
+        self.assertEqual(cache.stats, {"memory": 1, "disk": 0, "build": 2})
+        self.assertEqual(len(cache), 2)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_released_context(self):
+        """Programs no longer used do not keep their context alive"""
+        cache = ProgramCache(cache_dir=None)
+        ctx = ocl.create_context(cached=False)
+        ctx_ref = weakref.ref(ctx)
+        program = cache.get_program(ctx, self.source)
+        self.assertEqual(len(cache), 1)
+        program = ctx = None
+        gc.collect()
+        self.assertEqual(len(cache), 0)
+        self.assertIsNone(ctx_ref())
+
+    def test_disk(self):
+        cache = ProgramCache(cache_dir=self.cache_dir)
+        program = cache.get_program(self.ctx, self.source)
+        if not os.listdir(self.cache_dir):
+            self.skipTest("Program binaries are not available on this platform")
+        cache.clear()
+        program = cache.get_program(self.ctx, self.source)
+        self.assertEqual(cache.stats, {"memory": 0, "disk": 1, "build": 1})
+        self.assertIn("addition", [k.function_name for k in program.all_kernels()])
+        cache.clear(disk=True)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_shared_program(self):
+        processing1 = OpenclProcessing(ctx=self.ctx)
+        processing2 = OpenclProcessing(ctx=self.ctx)
+        processing1.compile_kernels(["addition"])
+        processing2.compile_kernels(["addition"])
+        self.assertIs(processing1.program, processing2.program)
+        self.assertIsNot(processing1.kernels.addition, processing2.kernels.addition)
+        processing2.compile_kernels(["addition"], cached=False)
+        self.assertIsNot(processing1.program, processing2.program)
+
+
+@unittest.skipUnless(ocl, "PyOpenCl is missing")
+class TestStreamPipeline(unittest.TestCase):
+    def setUp(self):
+        self.ctx = ocl.create_context()
+        self.processing = OpenclProcessing(ctx=self.ctx)
+        self.processing.compile_kernels(["addition"])
+
+    def tearDown(self):
+        self.processing = None
+        self.ctx = None
+
+    def test_process(self):
+        size = 1024
+        frames = [numpy.random.random(size).astype(numpy.float32) for _ in range(7)]
+        queue = pyopencl.CommandQueue(self.ctx)
+        offset = pyopencl.array.empty(queue, size, numpy.float32)
+        offset.fill(-5)
+        queue.finish()
+        kernels = self.processing.kernels
+
+        def upload(queue, slot, wait_for):
+            if not slot.buffers:
+                slot.buffers["host_in"] = allocate_pinned_array(queue, size, "float32")
+                slot.buffers["host_out"] = allocate_pinned_array(queue, size, "float32")
+                slot.buffers["in"] = pyopencl.array.empty(queue, size, numpy.float32)
+                slot.buffers["out"] = pyopencl.array.empty(queue, size, numpy.float32)
+            slot.buffers["host_in"][...] = slot.frame
+            return pyopencl.enqueue_copy(
+                queue, slot.buffers["in"].data, slot.buffers["host_in"]
+            )
+
+        def compute(queue, slot, wait_for):
+            return kernels.addition(
+                queue,
+                (size,),
+                None,
+                slot.buffers["in"].data,
+                offset.data,
+                slot.buffers["out"].data,
+                numpy.int32(size),
+                wait_for=wait_for,
+            )
+
+        def download(queue, slot, wait_for):
+            return pyopencl.enqueue_copy(
+                queue,
+                slot.buffers["host_out"],
+                slot.buffers["out"].data,
+                wait_for=wait_for,
+                is_blocking=False,
+            )
+
+        def finish(slot):
+            return slot.position, slot.buffers["host_out"].copy()
+
+        for depth in (None, 1, 5):
+            pipeline = StreamPipeline(
+                self.ctx, [upload, compute, download], finish, depth=depth
+            )
+            results = list(pipeline.process(frames))
+            self.assertEqual([r[0] for r in results], list(range(len(frames))))
+            for frame, (_, result) in zip(frames, results):
+                self.assertTrue(numpy.allclose(result, frame - 5))
+
+
+@unittest.skipUnless(ocl, "PyOpenCl is missing")
+class TestBufferPool(unittest.TestCase):
+    def setUp(self):
+        self.ctx = ocl.create_context()
+
+    def tearDown(self):
+        self.ctx = None
+
+    def test_reuse(self):
+        pool = BufferPool(self.ctx)
+        self.assertGreaterEqual(pool.bin_size(1000), 1000)
+        buffer = pool.allocate(1000)
+        buffer.release()
+        stats = pool.get_stats()
+        self.assertEqual(stats["allocations"], 1)
+        self.assertEqual(stats["held_blocks"], 1)
+        self.assertEqual(stats["active_blocks"], 0)
+        buffer = pool.allocate(999)
+        self.assertEqual(pool.get_stats()["held_blocks"], 0)
+        buffer.release()
+        pool.trim()
+        stats = pool.get_stats()
+        self.assertEqual(stats["held_blocks"], 0)
+        self.assertEqual(stats["trims"], 1)
+
+    def test_array(self):
+        pool = BufferPool(self.ctx)
+        queue = pyopencl.CommandQueue(self.ctx)
+        array = pyopencl.array.zeros(queue, 100, numpy.float32, allocator=pool)
+        self.assertEqual(array.get().sum(), 0)
+        self.assertEqual(pool.get_stats()["active_blocks"], 1)
+
+    def test_high_water_mark(self):
+        pool = BufferPool(self.ctx, high_water_mark=4096)
+        if pool.managed_bytes is None:
+            self.skipTest("Memory pool statistics not provided by pyopencl")
+        pool.allocate(2048).release()
+        buffer = pool.allocate(8192)
+        stats = pool.get_stats()
+        self.assertEqual(stats["held_blocks"], 0)
+        self.assertGreaterEqual(stats["peak_bytes"], 8192)
+        buffer.release()
+
+    def test_allocate_cl_buffers(self):
+        pool = get_buffer_pool(self.ctx)
+        buffers = [
+            ("pooled", pyopencl.mem_flags.READ_WRITE, numpy.float32, 100),
+            ("host", pyopencl.mem_flags.ALLOC_HOST_PTR, numpy.float32, 100),
+        ]
+        for _ in range(2):
+            mem = allocate_cl_buffers(buffers, context=self.ctx, pool=pool)
+            self.assertIsInstance(mem["pooled"], pyopencl.tools.PooledBuffer)
+            self.assertNotIsInstance(mem["host"], pyopencl.tools.PooledBuffer)
+            release_cl_buffers(mem)
+        stats = pool.get_stats()
+        self.assertEqual(stats["allocations"], 2)
+        self.assertEqual(stats["held_blocks"], 1)
+
+    def test_shared(self):
+        processing1 = OpenclProcessing(ctx=self.ctx)
+        processing2 = OpenclProcessing(ctx=self.ctx)
+        self.assertIs(processing1.buffer_pool, processing2.buffer_pool)
+        self.assertIs(processing1.buffer_pool, get_buffer_pool(self.ctx))
+
+    def test_released_context(self):
+        """The pool and its context are released with their last user"""
+        ctx = ocl.create_context(cached=False)
+        ctx_ref = weakref.ref(ctx)
+        processing = OpenclProcessing(ctx=ctx)
+        pool_ref = weakref.ref(processing.buffer_pool)
+        processing.buffer_pool.allocate(1000).release()
+        self.assertEqual(processing.buffer_pool.get_stats()["held_blocks"], 1)
+        del processing, ctx
+        gc.collect()
+        self.assertIsNone(pool_ref())
+        self.assertIsNone(ctx_ref())
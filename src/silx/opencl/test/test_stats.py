@@ -126,3 +126,20 @@ class TestStatistics(unittest.TestCase):
                                 False,
                                 f"Stat calculation failed on {platform},{device} in mode {comp}",
                             )
+
+    def test_process_stream(self):
+        """
+        tests the statistics of a stream of frames
+        """
+        s = Statistics(template=self.data)
+        frames = [self.data, self.data.astype(numpy.float32), self.data] * 2
+        for comp in ("single", "comp"):
+            results = list(s.process_stream(frames, comp=comp))
+            self.assertEqual(len(results), len(frames))
+            for res in results:
+                self.assertTrue(self.validate(res), f"Stream failed in mode {comp}")
+        # Frames smaller than the template
+        half = self.data[: self.size // 2]
+        res = next(s.process_stream([half]))
+        self.assertEqual(res.cnt, half.size)
+        self.assertEqual(res.max, half.max())
@@ -137,6 +137,10 @@ static float linear_interpolation(float2 vals,
  *
  *  Same kernel as backproj_kernel, but targets the CPU (no texture)
  *
+ *  A stack of sinograms can be backprojected in a single launch using the
+ *  third dimension of the ndrange as the slice index: sinograms and slices
+ *  are then stored contiguously in d_sino and d_SLICE.
+ *
 **/
 kernel void backproj_cpu_kernel(
     int num_proj,
@@ -156,6 +160,11 @@ kernel void backproj_cpu_kernel(
     const int tidy = get_local_id(1); //threadIdx.y;
     const int bidy = get_group_id(1); //blockIdx.y;
 
+    // Slice of the stack, 0 for a 2D ndrange
+    const size_t slice_idx = get_global_id(2);
+    d_SLICE += slice_idx * (32 * get_num_groups(0)) * (32 * get_num_groups(1));
+    d_sino += slice_idx * num_proj * num_bins;
+
     local float sh_cos[256];
     local float sh_sin[256];
     local float sh_axis[256];
@@ -0,0 +1,55 @@
+# /*##########################################################################
+# Copyright (C) 2026 European Synchrotron Radiation Facility
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# ############################################################################*/
+"""Number of threads used by the OpenMP parallelized functions."""
+
+__license__ = "MIT"
+__date__ = "18/10/2026"
+
+
+import os
+
+
+if hasattr(os, "sched_getaffinity"):
+    DEFAULT_NUM_THREADS = len(os.sched_getaffinity(0))
+elif os.cpu_count() is not None:
+    DEFAULT_NUM_THREADS = os.cpu_count()
+else:  # Fallback
+    DEFAULT_NUM_THREADS = 1
+"""Number of threads used by default (as OpenMP default)"""
+
+
+def get_num_threads(num_threads=None, max_threads=None):
+    """Returns the number of threads to use.
+
+    :param Union[int,None] num_threads: Requested number of threads,
+        None to use OMP_NUM_THREADS or the number of available CPUs
+    :param Union[int,None] max_threads:
+        Maximum number of threads used when num_threads is None.
+        Default: No limit
+    :rtype: int
+    """
+    if num_threads is None:
+        num_threads = int(os.environ.get("OMP_NUM_THREADS", DEFAULT_NUM_THREADS))
+        if max_threads is not None:
+            num_threads = min(num_threads, max_threads)
+    return max(1, int(num_threads))
@@ -0,0 +1,92 @@
+# /*##########################################################################
+# Copyright (C) 2026 European Synchrotron Radiation Facility
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# ############################################################################*/
+"""
+This module provides helpers to overlap I/O bound tasks using threads.
+
+    >>> from silx.utils.concurrency import prefetch
+    >>> for image in prefetch(fabio.open, filenames, max_workers=4):
+    ...     process(image)
+"""
+
+__license__ = "MIT"
+__date__ = "18/10/2026"
+
+
+import collections
+import itertools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+
+_logger = logging.getLogger(__name__)
+
+
+def prefetch(function, iterable, max_workers=4, window=None, discard=None):
+    """Iterate over the results of `function` applied to each item of
+    `iterable`, computing them in advance in a pool of threads.
+
+    The results are yielded in the order of `iterable`. At most `window`
+    results are computed in advance, which bounds the memory used.
+
+    :param callable function: Function called with each item
+    :param iterable: Items to process
+    :param int max_workers: Number of threads. If lower than 2, the items are
+        processed sequentially in the calling thread.
+    :param Union[int,None] window: Maximum number of results computed in
+        advance (default: twice the number of workers)
+    :param Union[callable,None] discard: Function called with the results
+        which were computed in advance but never yielded, for example if the
+        iteration is stopped. It can be used to release resources.
+    """
+    if max_workers is None or max_workers < 2:
+        for item in iterable:
+            yield function(item)
+        return
+
+    if window is None:
+        window = 2 * max_workers
+    window = max(1, window)
+
+    items = iter(iterable)
+    futures = collections.deque()
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        for item in itertools.islice(items, window):
+            futures.append(executor.submit(function, item))
+        while futures:
+            result = futures.popleft().result()
+            for item in itertools.islice(items, 1):
+                futures.append(executor.submit(function, item))
+            yield result
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+        if discard is not None:
+            for future in futures:
+                if future.cancelled() or future.exception() is not None:
+                    continue
+                try:
+                    discard(future.result())
+                except Exception:
+                    _logger.debug("Backtrace", exc_info=True)
@@ -26,7 +26,7 @@
 
 __authors__ = ["V. Valls"]
 __license__ = "MIT"
-__date__ = "05/06/2018"
+__date__ = "18/10/2026"
 
 import numpy
 import re
@@ -157,3 +157,75 @@ def min_numerical_convertible_type(string, check_accuracy=True):
             )
 
     return numpy_type
+
+
+def min_numerical_convertible_types(strings, check_accuracy=True):
+    """
+    Returns the set of the smallest numerical types to use for a safe
+    conversion of each string of a sequence.
+
+    The result is the set of the types returned by
+    :func:`min_numerical_convertible_type` for each string, but the
+    floating-point checks are done on all the strings at once, which is much
+    faster for long sequences of values.
+
+    :param Iterable[str] strings: Representations of floats/integers with text
+    :param bool check_accuracy: If true, a warning is pushed on the logger
+        in case there is a loss of accuracy.
+    :raise ValueError: When a string is not a numerical value
+    :rtype: Set[type]
+    """
+    types = set()
+    floats = []
+    precision_digits = []
+    for string in set(strings):
+        if string == "":
+            raise ValueError("Not a numerical value")
+        match = _parse_numeric_value.match(string)
+        if match is None:
+            raise ValueError("Not a numerical value")
+        _number, decimal, exponent = match.groups()
+        if decimal is None and exponent is None:
+            # It's an integer
+            types.add(numpy.min_scalar_type(int(string)).type)
+            continue
+        floats.append(string)
+        if decimal is None:
+            decimal = ""
+        if exponent is None:
+            exponent = "0"
+        precision_digits.append(int(exponent) - len(decimal) - 1)
+
+    if len(floats) == 0:
+        return types
+
+    try:
+        values = numpy.array(floats, dtype=_biggest_float)
+    except ValueError:
+        raise ValueError("Not a numerical value")
+
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", "overflow encountered", RuntimeWarning)
+        precisions = (
+            numpy.power(_biggest_float(10), numpy.array(precision_digits)) * 1.2
+        )
+        # Index in _float_types of the type used by each value
+        type_indices = numpy.zeros(len(values), dtype=numpy.int8)
+        candidates = numpy.ones(len(values), dtype=bool)
+        for type_index, numpy_type in enumerate(_float_types[1:], 1):
+            reduced_values = values.astype(numpy_type)
+            candidates &= numpy.isfinite(reduced_values)
+            candidates &= numpy.abs(values - reduced_values) <= precisions
+            if not numpy.any(candidates):
+                break
+            type_indices[candidates] = type_index
+
+    for type_index in numpy.unique(type_indices):
+        types.add(_float_types[type_index])
+
+    if check_accuracy and _float_types[0] in types:
+        # Rare case, use the scalar implementation to check the accuracy
+        for index in numpy.nonzero(type_indices == 0)[0]:
+            min_numerical_convertible_type(floats[index], check_accuracy=True)
+
+    return types
@@ -0,0 +1,89 @@
+# /*##########################################################################
+# Copyright (C) 2024 European Synchrotron Radiation Facility
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# ############################################################################*/
+"""Tests for concurrency utilities"""
+
+import threading
+import time
+
+import pytest
+
+from ..concurrency import prefetch
+
+
+@pytest.mark.parametrize("max_workers", [0, 1, 4])
+def test_prefetch_order(max_workers):
+    def function(value):
+        # Make the first items the slowest
+        time.sleep(0.001 * (10 - value))
+        return value * 2
+
+    result = list(prefetch(function, range(10), max_workers=max_workers))
+    assert result == [v * 2 for v in range(10)]
+
+
+def test_prefetch_window():
+    lock = threading.Lock()
+    started = []
+
+    def function(value):
+        with lock:
+            started.append(value)
+        return value
+
+    iterator = prefetch(function, range(100), max_workers=2, window=3)
+    assert next(iterator) == 0
+    time.sleep(0.05)
+    # The first item was consumed, at most 3 items are computed in advance
+    assert len(started) <= 4
+    iterator.close()
+
+
+def test_prefetch_discard():
+    lock = threading.Lock()
+    computed = []
+    discarded = []
+
+    def function(value):
+        with lock:
+            computed.append(value)
+        return value
+
+    iterator = prefetch(
+        function, range(10), max_workers=2, window=4, discard=discarded.append
+    )
+    assert next(iterator) == 0
+    iterator.close()
+    # Results computed in advance and never consumed are discarded
+    assert sorted(discarded) == sorted(computed)[1:]
+
+
+def test_prefetch_exception():
+    def function(value):
+        if value == 3:
+            raise ValueError()
+        return value
+
+    iterator = prefetch(function, range(10), max_workers=2)
+    assert [next(iterator) for _ in range(3)] == [0, 1, 2]
+    with pytest.raises(ValueError):
+        next(iterator)
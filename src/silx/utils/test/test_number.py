@@ -156,6 +156,20 @@ class TestConversionTypes(testutils.ParametricTestCase):
         dtype = func(value)
         self.assertIn(dtype, (numpy.longdouble,))
 
+    def testMinTypes(self):
+        values = ["1", "-10", "300", "1.5", "0.1", "1465803236.495412", "1e400"]
+        expected = set(number.min_numerical_convertible_type(v) for v in values)
+        self.assertEqual(number.min_numerical_convertible_types(values), expected)
+        types = number.min_numerical_convertible_types(["1", "2"])
+        self.assertEqual(types, {numpy.uint8})
+        self.assertEqual(number.min_numerical_convertible_types([]), set())
+
+    def testMinTypesFail(self):
+        with self.assertRaises(ValueError):
+            number.min_numerical_convertible_types(["1", "1.0", "foo"])
+        with self.assertRaises(ValueError):
+            number.min_numerical_convertible_types(["1.0", ""])
+
     def testMillisecondEpochTime(self):
         datetimes = [
             "1465803236.495412",